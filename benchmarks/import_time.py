@@ -0,0 +1,144 @@
+#!/usr/bin/python3
+"""Cold import cost of the integration package.
+
+Every sample runs in a fresh interpreter with `-X importtime`, so nothing is
+cached in sys.modules. The working tree is always measured; with --ref the
+same package is exported from that git revision into a temp dir and measured
+too, which gives a before/after comparison.
+
+usage:
+  python3 benchmarks/import_time.py
+  python3 benchmarks/import_time.py --ref baseline --runs 10
+  python3 benchmarks/import_time.py --module custom_components.tcl_home_unofficial.aws_iot
+
+Needs homeassistant (and, for the old tree, boto3) importable by the python
+used to run it.
+"""
+
+import argparse
+import io
+import json
+import logging
+import pathlib
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent
+DEFAULT_MODULE = "custom_components.tcl_home_unofficial"
+HEAVY_MODULES = ("boto3", "botocore")
+
+PROBE = """
+import sys, time, json
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+print("IMPORT_RESULT " + json.dumps({{
+    "seconds": elapsed,
+    "heavy": [m for m in {heavy!r} if m in sys.modules],
+    "modules": len(sys.modules),
+}}))
+"""
+
+
+def run_once(root: pathlib.Path, module: str) -> dict:
+    code = PROBE.format(module=module, heavy=HEAVY_MODULES)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=root,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    sample = None
+    for line in result.stdout.splitlines():
+        if line.startswith("IMPORT_RESULT "):
+            sample = json.loads(line[len("IMPORT_RESULT "):])
+
+    # -X importtime: "import time: self [us] | cumulative | imported package"
+    heavy_us = 0
+    for line in result.stderr.splitlines():
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) == 3 and parts[2] in HEAVY_MODULES:
+            heavy_us += int(parts[1])
+    sample["heavy_seconds"] = heavy_us / 1_000_000
+    return sample
+
+
+def measure(root: pathlib.Path, module: str, runs: int) -> dict:
+    samples = [run_once(root, module) for _ in range(runs)]
+    seconds = [s["seconds"] for s in samples]
+    return {
+        "runs": runs,
+        "median_ms": round(statistics.median(seconds) * 1000, 1),
+        "min_ms": round(min(seconds) * 1000, 1),
+        "max_ms": round(max(seconds) * 1000, 1),
+        "heavy_sdk_ms": round(statistics.median(s["heavy_seconds"] for s in samples) * 1000, 1),
+        "heavy_sdk_loaded": samples[-1]["heavy"],
+        "modules_loaded": samples[-1]["modules"],
+    }
+
+
+def export_ref(ref: str, target: pathlib.Path) -> None:
+    archive = subprocess.run(
+        ["git", "archive", "--format=tar", ref, "custom_components"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        check=True,
+    ).stdout
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(target, filter="data")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default=DEFAULT_MODULE)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--ref", help="git revision to compare against")
+    parser.add_argument("--json", action="store_true", help="print JSON only")
+    args = parser.parse_args()
+
+    report = {"module": args.module, "python": sys.version.split()[0]}
+    try:
+        report["current"] = measure(REPO_ROOT, args.module, args.runs)
+        if args.ref:
+            with tempfile.TemporaryDirectory() as tmp:
+                export_ref(args.ref, pathlib.Path(tmp))
+                report[args.ref] = measure(pathlib.Path(tmp), args.module, args.runs)
+    except RuntimeError as e:
+        logging.error("Import failed: %s", e)
+        return 1
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+
+    for name in [args.ref, "current"]:
+        if name is None:
+            continue
+        r = report[name]
+        logging.info(
+            "%-10s median %7.1f ms (min %.1f, max %.1f) | boto3/botocore %.1f ms %s | %d modules",
+            name,
+            r["median_ms"],
+            r["min_ms"],
+            r["max_ms"],
+            r["heavy_sdk_ms"],
+            r["heavy_sdk_loaded"] or "",
+            r["modules_loaded"],
+        )
+    if args.ref:
+        delta = report["current"]["median_ms"] - report[args.ref]["median_ms"]
+        logging.info("delta      %+7.1f ms", delta)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
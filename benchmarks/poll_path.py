@@ -0,0 +1,439 @@
+#!/usr/bin/python3
+"""Coordinator poll path at fleet scale.
+
+Runs IotDeviceCoordinator.async_update_data and the entity updates that
+follow it for synthetic fleets built from notes/*.txt (through the fleet
+model of tools/cloud_simulator.py, in-process, no HTTP). The cloud client and
+the per-device Store are stubbed; everything else (Device.__init__,
+getSupportedFeatures, change detection, every platform's entities and
+their state rendering) is the integration's own code.
+
+Reported per fleet size:
+  cold poll          first poll, all devices are new
+  wall / cpu ms      median of the steady-state polls
+  alloc KiB          tracemalloc peak and retained size of one steady poll
+  writes / poll      async_write_ha_state calls (state is rendered for each)
+  Device() us        Device.__init__ per device
+  features us        getSupportedFeatures per device
+  catalog us         the same features through DeviceShapeCatalog.resolve
+
+usage:
+  python3 benchmarks/poll_path.py
+  python3 benchmarks/poll_path.py --sizes 1 10 100 1000 --polls 10 --save benchmarks/poll_path.json
+  python3 benchmarks/poll_path.py --compare benchmarks/poll_path.json --max-regression 0.2
+
+Needs homeassistant importable by the python used to run it.
+"""
+
+import argparse
+import asyncio
+import datetime
+import importlib
+import importlib.util
+import json
+import logging
+import pathlib
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+from types import SimpleNamespace
+from unittest.mock import patch
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent
+SIMULATOR_PATH = REPO_ROOT / "tools" / "cloud_simulator.py"
+PACKAGE = "custom_components.tcl_home_unofficial"
+PLATFORMS = (
+    "binary_sensor",
+    "sensor",
+    "switch",
+    "select",
+    "number",
+    "button",
+    "remote",
+    "climate",
+    "humidifier",
+    "text",
+)
+# compared by --compare; lower is better for all of them
+COMPARED_METRICS = ("wall_ms", "cpu_ms", "alloc_peak_kib", "writes_per_poll")
+RENDERED_PROPERTIES = ("state", "available", "icon", "extra_state_attributes")
+
+
+def load_simulator():
+    # loaded by path: tools/ is not a package
+    spec = importlib.util.spec_from_file_location("cloud_simulator", SIMULATOR_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["cloud_simulator"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_integration():
+    sys.path.insert(0, str(REPO_ROOT))
+    logging.getLogger(PACKAGE).setLevel(logging.CRITICAL)
+    return SimpleNamespace(
+        aws_iot=importlib.import_module(f"{PACKAGE}.aws_iot"),
+        config_entry=importlib.import_module(f"{PACKAGE}.config_entry"),
+        coordinator=importlib.import_module(f"{PACKAGE}.coordinator"),
+        device=importlib.import_module(f"{PACKAGE}.device"),
+        device_features=importlib.import_module(f"{PACKAGE}.device_features"),
+        device_shape_catalog=importlib.import_module(f"{PACKAGE}.device_shape_catalog"),
+        metrics=importlib.import_module(f"{PACKAGE}.metrics"),
+        tcl=importlib.import_module(f"{PACKAGE}.tcl"),
+    )
+
+
+def git_revision() -> str:
+    result = subprocess.run(
+        ["git", "describe", "--always", "--dirty"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    return result.stdout.strip() or "unknown"
+
+
+class StubAwsIot:
+    """The AwsIot surface the coordinator and the entities use, served from the fleet model."""
+
+    def __init__(self, integration, cloud) -> None:
+        self.integration = integration
+        self.cloud = cloud
+        self.hass = None
+        self.metrics = integration.metrics.MetricsRecorder(enabled=False)
+        self.config_data = integration.config_entry.ConfigData(
+            username="benchmark",
+            password="",
+            app_login_url="",
+            cloud_urls="",
+            app_id="",
+            verbose_device_logging=False,
+            verbose_session_logging=False,
+            verbose_setup_logging=False,
+        )
+
+    def get_session_manager(self):
+        return self
+
+    def get_config_data(self):
+        return self.config_data
+
+    def is_verbose_device_logging(self) -> bool:
+        return False
+
+    def get_metrics(self):
+        return self.metrics
+
+    async def get_all_things(self):
+        things = [dict(device.tcl_thing) for device in self.cloud.devices.values()]
+        return self.integration.tcl.GetThingsResponse(
+            {"code": 0, "message": "benchmark", "data": things}
+        )
+
+    async def async_get_thing(self, device_id: str, *args, **kwargs) -> dict:
+        response = self.cloud.get_shadow(self.session_token, device_id)
+        # the real client hands over a freshly parsed document every poll
+        return json.loads(json.dumps(response.body))
+
+    async def get_extra_tcl_data(self, device_storage: dict, device_id: str) -> dict:
+        # the real implementation: with power / work time disabled in storage it makes no calls
+        AwsIot = self.integration.aws_iot.AwsIot
+        return await AwsIot.get_extra_tcl_data(self, device_storage, device_id)
+
+    async def async_set_desired_state(self, device_id: str, desired_state: dict, *args, **kwargs):
+        self.cloud.publish(
+            self.session_token,
+            f"$aws/things/{device_id}/shadow/update",
+            json.dumps({"state": {"desired": desired_state}}).encode("utf-8"),
+        )
+
+    @property
+    def session_token(self) -> str:
+        token = getattr(self, "_session_token", None)
+        if token is None:
+            token, _ = self.cloud.issue_token(24 * 3600, jwt=False)
+            self._session_token = token
+        return token
+
+
+def make_storage() -> dict:
+    return {
+        "non_user_config": {
+            "power_consumption": {"enabled": False},
+            "work_time": {"enabled": False},
+        },
+        "user_config": {},
+    }
+
+
+class WriteCounter:
+    """Replaces async_write_ha_state: counts the write and renders the state like HA does."""
+
+    def __init__(self) -> None:
+        self.writes = 0
+        self.render_errors = 0
+
+    def bind(self, entity) -> None:
+        def write() -> None:
+            self.writes += 1
+            for name in RENDERED_PROPERTIES:
+                try:
+                    getattr(entity, name)
+                except Exception:  # noqa: BLE001
+                    self.render_errors += 1
+
+        entity.async_write_ha_state = write
+
+
+async def build_entities(config_entry, hass) -> tuple[list, list[str]]:
+    entities = []
+    failed = []
+    for name in PLATFORMS:
+        module = importlib.import_module(f"{PACKAGE}.{name}")
+        added = []
+
+        def add_entities(new_entities, update_before_add=False, added=added):
+            added.extend(new_entities)
+
+        try:
+            await module.async_setup_entry(hass, config_entry, add_entities)
+        except Exception as e:  # noqa: BLE001
+            failed.append(f"{name}: {e}")
+            continue
+        entities.extend(added)
+    return entities, failed
+
+
+async def poll(coordinator, entities) -> None:
+    coordinator.data = await coordinator.async_update_data()
+    for entity in entities:
+        entity._handle_coordinator_update()
+
+
+async def bench_fleet(integration, simulator, templates, size: int, polls: int, drift_rate: float) -> dict:
+    cloud = simulator.SimulatedCloud(
+        simulator.SimulatorConfig(
+            port=0, devices=size, drift_rate=drift_rate, report_delay_seconds=0
+        ),
+        templates,
+    )
+    aws_iot = StubAwsIot(integration, cloud)
+    storages = {device_id: make_storage() for device_id in cloud.devices}
+
+    async def get_stored_data(hass, device_id):
+        return storages[device_id]
+
+    async def save_shape_catalog(hass, catalog):
+        catalog.dirty = False
+
+    shape_catalog = integration.device_shape_catalog.DeviceShapeCatalog()
+    shape_catalog.load(integration.device_shape_catalog.load_builtin_shapes(), discovered=False)
+
+    IotDeviceCoordinator = integration.coordinator.IotDeviceCoordinator
+    # skip DataUpdateCoordinator.__init__: no event loop scheduling, no refresh timer
+    coordinator = IotDeviceCoordinator.__new__(IotDeviceCoordinator)
+    coordinator.hass = None
+    coordinator.aws_iot = aws_iot
+    coordinator.shape_catalog = shape_catalog
+    coordinator.data = None
+
+    hass = SimpleNamespace(data={})
+    counter = WriteCounter()
+    result = {"devices": size}
+    with (
+        patch.object(integration.coordinator, "get_stored_data", get_stored_data),
+        patch.object(integration.coordinator, "async_save_device_shape_catalog", save_shape_catalog),
+    ):
+        started_wall, started_cpu = time.perf_counter(), time.process_time()
+        await poll(coordinator, [])
+        result["cold_poll_ms"] = round((time.perf_counter() - started_wall) * 1000, 2)
+        result["cold_poll_cpu_ms"] = round((time.process_time() - started_cpu) * 1000, 2)
+
+        config_entry = SimpleNamespace(
+            entry_id="benchmark",
+            devices=list(coordinator.data.devices),
+            non_implemented_devices=[],
+            runtime_data=SimpleNamespace(coordinator=coordinator),
+        )
+        entities, failed = await build_entities(config_entry, hass)
+        for entity in entities:
+            entity.hass = hass
+            counter.bind(entity)
+        result["entities"] = len(entities)
+        result["platform_setup_failures"] = failed
+
+        walls, cpus, writes = [], [], []
+        for _ in range(polls):
+            before = counter.writes
+            started_wall, started_cpu = time.perf_counter(), time.process_time()
+            await poll(coordinator, entities)
+            walls.append(time.perf_counter() - started_wall)
+            cpus.append(time.process_time() - started_cpu)
+            writes.append(counter.writes - before)
+
+        tracemalloc.start()
+        baseline_size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        await poll(coordinator, entities)
+        current_size, peak_size = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    result["wall_ms"] = round(statistics.median(walls) * 1000, 3)
+    result["cpu_ms"] = round(statistics.median(cpus) * 1000, 3)
+    result["alloc_peak_kib"] = round((peak_size - baseline_size) / 1024, 1)
+    result["alloc_retained_kib"] = round((current_size - baseline_size) / 1024, 1)
+    result["writes_per_poll"] = statistics.median(writes)
+    result["render_errors"] = counter.render_errors
+
+    # per device costs, on the same documents the poll used
+    Device = integration.device.Device
+    things = (await aws_iot.get_all_things()).data
+    inputs = [(thing, await aws_iot.async_get_thing(thing.device_id)) for thing in things]
+    storage = make_storage()
+    number = max(1, 2000 // size)
+    elapsed = min(
+        timeit.repeat(
+            lambda: [
+                Device(tcl_thing=thing, aws_thing=shadow, device_storage=storage, shape_catalog=shape_catalog)
+                for thing, shadow in inputs
+            ],
+            number=number,
+            repeat=3,
+        )
+    )
+    result["device_init_us"] = round(elapsed / number / size * 1e6, 2)
+
+    getSupportedFeatures = integration.device_features.getSupportedFeatures
+    feature_inputs = [
+        (device.device_type, device.aws_thing["state"]["reported"])
+        for device in coordinator.data.devices
+        if device.aws_thing is not None
+    ]
+    elapsed = min(
+        timeit.repeat(
+            lambda: [
+                getSupportedFeatures(device_type, reported, storage)
+                for device_type, reported in feature_inputs
+            ],
+            number=number,
+            repeat=3,
+        )
+    )
+    result["supported_features_us"] = round(elapsed / number / max(1, len(feature_inputs)) * 1e6, 2)
+
+    elapsed = min(
+        timeit.repeat(
+            lambda: [
+                shape_catalog.resolve(device_type, reported, storage)
+                for device_type, reported in feature_inputs
+            ],
+            number=number,
+            repeat=3,
+        )
+    )
+    result["shape_catalog_us"] = round(elapsed / number / max(1, len(feature_inputs)) * 1e6, 2)
+    result["shape_catalog"] = shape_catalog.snapshot()
+    return result
+
+
+def compare(results: list[dict], baseline: dict, max_regression: float) -> bool:
+    by_size = {r["devices"]: r for r in baseline.get("results", [])}
+    logging.info("")
+    logging.info("vs %s (%s)", baseline.get("revision"), baseline.get("created"))
+    regressed = False
+    for result in results:
+        old = by_size.get(result["devices"])
+        if old is None:
+            continue
+        deltas = []
+        for metric in COMPARED_METRICS:
+            if not old.get(metric):
+                continue
+            change = (result[metric] - old[metric]) / old[metric]
+            flag = ""
+            if metric in ("wall_ms", "cpu_ms") and change > max_regression:
+                regressed = True
+                flag = " !"
+            deltas.append(f"{metric} {change:+.0%}{flag}")
+        logging.info("%8d  %s", result["devices"], "  ".join(deltas))
+    return regressed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--polls", type=int, default=5, help="steady-state polls per size")
+    parser.add_argument("--drift-rate", type=float, default=0.1, help="share of devices whose sensors move per poll")
+    parser.add_argument("--notes", type=pathlib.Path, help="notes directory (default: notes/)")
+    parser.add_argument("--save", type=pathlib.Path, help="write results as a baseline JSON")
+    parser.add_argument("--compare", type=pathlib.Path, help="baseline JSON to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="fail --compare above this wall/cpu increase")
+    parser.add_argument("--json", action="store_true", help="print JSON only")
+    args = parser.parse_args()
+
+    simulator = load_simulator()
+    integration = load_integration()
+    templates = simulator.load_note_templates(args.notes or simulator.NOTES_DIR)
+
+    results = [
+        asyncio.run(
+            bench_fleet(integration, simulator, templates, size, args.polls, args.drift_rate)
+        )
+        for size in args.sizes
+    ]
+    report = {
+        "benchmark": "poll_path",
+        "revision": git_revision(),
+        "created": datetime.datetime.now(datetime.UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "templates": [template.name for template in templates],
+        "polls": args.polls,
+        "drift_rate": args.drift_rate,
+        "results": results,
+    }
+
+    if args.save:
+        args.save.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        logging.info(
+            "%8s %8s %10s %9s %9s %10s %10s %8s %10s %10s %10s",
+            "devices", "entities", "cold ms", "wall ms", "cpu ms", "peak KiB",
+            "kept KiB", "writes", "Device us", "feat us", "catalog us",
+        )
+        for r in results:
+            logging.info(
+                "%8d %8d %10.2f %9.3f %9.3f %10.1f %10.1f %8d %10.2f %10.2f %10.2f",
+                r["devices"],
+                r["entities"],
+                r["cold_poll_ms"],
+                r["wall_ms"],
+                r["cpu_ms"],
+                r["alloc_peak_kib"],
+                r["alloc_retained_kib"],
+                r["writes_per_poll"],
+                r["device_init_us"],
+                r["supported_features_us"],
+                r["shape_catalog_us"],
+            )
+            for failure in r["platform_setup_failures"]:
+                logging.warning("  platform setup failed: %s", failure)
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        if compare(results, baseline, args.max_regression):
+            logging.error("wall/cpu regression above %.0f%%", args.max_regression * 100)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
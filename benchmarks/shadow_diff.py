@@ -0,0 +1,181 @@
+#!/usr/bin/python3
+"""Shadow metadata diff: legacy per-key loop vs flatten + merge pass.
+
+"cold" flattens both documents on every diff, "warm" reuses the flattened
+previous document and its key order (how SelfDiagnostics and the
+coordinator use it) and
+"merge-only" times the merge pass on already flattened sections.
+
+The legacy implementation is the loop SelfDiagnostics.addState used before
+shadow_diff.py existed (nested dict indexing per key, KeyError on keys that
+are missing from one side). Shadows are synthetic, built from the key set of
+a real split AC shadow and padded to the requested size.
+
+usage:
+  python3 benchmarks/shadow_diff.py
+  python3 benchmarks/shadow_diff.py --sizes 100 1000 10000 --changes 5 --repeat 200
+"""
+
+import argparse
+import importlib.util
+import json
+import logging
+import pathlib
+import random
+import sys
+import timeit
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent
+MODULE_PATH = REPO_ROOT / "custom_components" / "tcl_home_unofficial" / "shadow_diff.py"
+IGNORED = ["capabilities", "errorCode", "authFlag"]
+
+
+def load_shadow_diff():
+    # loaded by path: importing the package would pull in homeassistant
+    spec = importlib.util.spec_from_file_location("shadow_diff", MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["shadow_diff"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def build_shadow(size: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    keys = [f"property{i:05d}" for i in range(size)]
+    state = {key: rng.randint(0, 3) for key in keys}
+    metadata = {key: {"timestamp": 1759400000 + rng.randint(0, 1000)} for key in keys}
+    return {
+        "state": {"desired": dict(state), "reported": dict(state)},
+        "metadata": {"desired": dict(metadata), "reported": dict(metadata)},
+        "version": 1,
+    }
+
+
+def mutate(shadow: dict, changes: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    current = json.loads(json.dumps(shadow))
+    keys = list(current["metadata"]["desired"])
+    for key in rng.sample(keys, min(changes, len(keys))):
+        for section in ("desired", "reported"):
+            current["metadata"][section][key] = {"timestamp": 1759500000 + rng.randint(0, 1000)}
+            current["state"][section][key] += 1
+    return current
+
+
+def legacy_diff(prev_state: dict, aws_thing: dict) -> tuple[list, list]:
+    metadata_desired = aws_thing["metadata"]["desired"]
+    metadata_reported = aws_thing["metadata"]["reported"]
+    prev_metadata_desired = prev_state["metadata"]["desired"]
+    prev_metadata_reported = prev_state["metadata"]["reported"]
+    changed_desired_keys = []
+    changed_reported_keys = []
+    for key, value in metadata_desired.items():
+        if key not in IGNORED:
+            ts_d = value.get("timestamp", None)
+            ts_r = metadata_reported[key].get("timestamp", None)
+            prev_ts_d = prev_metadata_desired[key].get("timestamp", None)
+            prev_ts_r = prev_metadata_reported[key].get("timestamp", None)
+            if ts_d != prev_ts_d:
+                changed_desired_keys.append(key)
+            if ts_r != prev_ts_r:
+                changed_reported_keys.append(key)
+    return changed_desired_keys, changed_reported_keys
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 500, 5000, 50000])
+    parser.add_argument("--changes", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--json", action="store_true", help="print JSON only")
+    args = parser.parse_args()
+
+    shadow_diff = load_shadow_diff()
+    ignored = frozenset(IGNORED)
+
+    def engine_diff(prev_state, aws_thing):
+        desired = shadow_diff.diff_metadata(prev_state, aws_thing, "desired", ignored)
+        reported = shadow_diff.diff_metadata(prev_state, aws_thing, "reported", ignored)
+        return desired.changed_or_added(), reported.changed_or_added()
+
+    results = []
+    for size in args.sizes:
+        prev = build_shadow(size, seed=size)
+        current = mutate(prev, args.changes, seed=size + 1)
+        assert sorted(legacy_diff(prev, current)[0]) == engine_diff(prev, current)[0]
+
+        legacy = min(timeit.repeat(lambda: legacy_diff(prev, current), number=args.repeat, repeat=3))
+        engine = min(timeit.repeat(lambda: engine_diff(prev, current), number=args.repeat, repeat=3))
+        # steady state: the previous document was flattened by the previous diff
+        flat_prev_shadow = shadow_diff.FlatShadow(prev, ignored)
+        flat_prev_shadow.section("metadata", "desired")
+        flat_prev_shadow.section("metadata", "reported")
+        engine_warm = min(
+            timeit.repeat(
+                lambda: engine_diff(
+                    flat_prev_shadow,
+                    shadow_diff.FlatShadow(current, ignored, previous=flat_prev_shadow),
+                ),
+                number=args.repeat,
+                repeat=3,
+            )
+        )
+        flat_prev = shadow_diff.flatten_timestamps(prev["metadata"]["desired"], ignored)
+        flat_current = shadow_diff.flatten_timestamps(current["metadata"]["desired"], ignored)
+        merge_only = min(
+            timeit.repeat(
+                lambda: shadow_diff.merge_diff(flat_prev, flat_current),
+                number=args.repeat,
+                repeat=3,
+            )
+        )
+
+        # a key only in desired crashes the legacy loop
+        broken = json.loads(json.dumps(current))
+        broken["metadata"]["desired"]["onlyDesired"] = {"timestamp": 1}
+        try:
+            legacy_diff(prev, broken)
+            legacy_missing_key = "ok"
+        except KeyError:
+            legacy_missing_key = "KeyError"
+        engine_missing_key = "added" if "onlyDesired" in engine_diff(prev, broken)[0] else "missed"
+
+        results.append(
+            {
+                "keys": size,
+                "changes": args.changes,
+                "legacy_us": round(legacy / args.repeat * 1e6, 1),
+                "engine_us": round(engine / args.repeat * 1e6, 1),
+                "engine_warm_us": round(engine_warm / args.repeat * 1e6, 1),
+                "merge_only_us": round(merge_only / args.repeat * 1e6, 1),
+                "legacy_missing_key": legacy_missing_key,
+                "engine_missing_key": engine_missing_key,
+            }
+        )
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    logging.info(
+        "%8s %12s %12s %12s %14s %14s %10s",
+        "keys", "legacy us", "cold us", "warm us", "merge-only us", "legacy gap", "engine gap",
+    )
+    for r in results:
+        logging.info(
+            "%8d %12.1f %12.1f %12.1f %14.1f %14s %10s",
+            r["keys"],
+            r["legacy_us"],
+            r["engine_us"],
+            r["engine_warm_us"],
+            r["merge_only_us"],
+            r["legacy_missing_key"],
+            r["engine_missing_key"],
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+#!/usr/bin/python3
+"""State write cost per entity, by entity class.
+
+Builds every platform's entities for a synthetic fleet (the same fleet,
+stubs and setup as poll_path.py), then times what Home Assistant reads from
+an entity when it writes its state: the properties below, for every entity,
+after each entity was brought up to date with the last poll.
+
+Reported per entity class:
+  entities     entities of that class in the fleet
+  render us    median time to read the state properties of one entity
+  update us    median time to bring one entity up to date with its device
+               (update_attributes where the entities have it, 0 otherwise)
+
+Run it on two revisions with --save / --compare to see the change.
+
+usage:
+  python3 benchmarks/state_write.py
+  python3 benchmarks/state_write.py --devices 100 --repeat 20 --save benchmarks/state_write.json
+  python3 benchmarks/state_write.py --compare benchmarks/state_write.json
+
+Needs homeassistant importable by the python used to run it.
+"""
+
+import argparse
+import asyncio
+import datetime
+import importlib.util
+import json
+import logging
+import pathlib
+import platform
+import statistics
+import sys
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent
+POLL_PATH_PATH = REPO_ROOT / "benchmarks" / "poll_path.py"
+# what Entity._async_calculate_state reads
+STATE_PROPERTIES = (
+    "available",
+    "state",
+    "capability_attributes",
+    "state_attributes",
+    "extra_state_attributes",
+    "unit_of_measurement",
+    "assumed_state",
+    "device_class",
+    "supported_features",
+    "icon",
+    "name",
+)
+
+
+def load_poll_path():
+    # loaded by path: benchmarks/ is not a package
+    spec = importlib.util.spec_from_file_location("poll_path", POLL_PATH_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["poll_path"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def render(entity) -> int:
+    errors = 0
+    for name in STATE_PROPERTIES:
+        try:
+            getattr(entity, name)
+        except Exception:  # noqa: BLE001
+            errors += 1
+    return errors
+
+
+def update(entity) -> None:
+    update_attributes = getattr(entity, "update_attributes", None)
+    if update_attributes is not None:
+        update_attributes()
+
+
+def time_each(entities: list, fn, repeat: int) -> dict[str, list[float]]:
+    timings: dict[str, list[float]] = {}
+    for _ in range(repeat):
+        for entity in entities:
+            started = time.perf_counter()
+            fn(entity)
+            elapsed = time.perf_counter() - started
+            timings.setdefault(type(entity).__name__, []).append(elapsed)
+    return timings
+
+
+async def bench(poll_path, devices: int, repeat: int, drift_rate: float) -> dict:
+    simulator = poll_path.load_simulator()
+    integration = poll_path.load_integration()
+    templates = simulator.load_note_templates(simulator.NOTES_DIR)
+    cloud = simulator.SimulatedCloud(
+        simulator.SimulatorConfig(
+            port=0, devices=devices, drift_rate=drift_rate, report_delay_seconds=0
+        ),
+        templates,
+    )
+    aws_iot = poll_path.StubAwsIot(integration, cloud)
+    storages = {device_id: poll_path.make_storage() for device_id in cloud.devices}
+
+    async def get_stored_data(hass, device_id):
+        return storages[device_id]
+
+    async def save_shape_catalog(hass, catalog):
+        catalog.dirty = False
+
+    shape_catalog = integration.device_shape_catalog.DeviceShapeCatalog()
+    shape_catalog.load(integration.device_shape_catalog.load_builtin_shapes(), discovered=False)
+
+    IotDeviceCoordinator = integration.coordinator.IotDeviceCoordinator
+    coordinator = IotDeviceCoordinator.__new__(IotDeviceCoordinator)
+    coordinator.hass = None
+    coordinator.aws_iot = aws_iot
+    coordinator.shape_catalog = shape_catalog
+    coordinator.data = None
+
+    hass = SimpleNamespace(data={})
+    with (
+        patch.object(integration.coordinator, "get_stored_data", get_stored_data),
+        patch.object(integration.coordinator, "async_save_device_shape_catalog", save_shape_catalog),
+    ):
+        await poll_path.poll(coordinator, [])
+        config_entry = SimpleNamespace(
+            entry_id="benchmark",
+            devices=list(coordinator.data.devices),
+            non_implemented_devices=[],
+            runtime_data=SimpleNamespace(coordinator=coordinator),
+        )
+        entities, failed = await poll_path.build_entities(config_entry, hass)
+        for entity in entities:
+            entity.hass = hass
+            entity.async_write_ha_state = lambda: None
+        # what async_added_to_hass does, then one poll so every entity saw a change
+        for entity in entities:
+            update(entity)
+        coordinator.data = await coordinator.async_update_data()
+        for entity in entities:
+            device = getattr(entity, "device", None)
+            if device is not None:
+                entity.device = coordinator.get_device_by_id(device.device_id) or device
+
+        render_errors = sum(render(entity) for entity in entities)
+        updates = time_each(entities, update, repeat)
+        renders = time_each(entities, render, repeat)
+
+    classes = {}
+    for name, timings in sorted(renders.items()):
+        classes[name] = {
+            "entities": len(timings) // repeat,
+            "render_us": round(statistics.median(timings) * 1e6, 2),
+            "update_us": round(statistics.median(updates[name]) * 1e6, 2),
+        }
+    all_renders = [t for timings in renders.values() for t in timings]
+    all_updates = [t for timings in updates.values() for t in timings]
+    return {
+        "devices": devices,
+        "entities": len(entities),
+        "render_us": round(statistics.median(all_renders) * 1e6, 2),
+        "update_us": round(statistics.median(all_updates) * 1e6, 2),
+        "render_errors": render_errors,
+        "platform_setup_failures": failed,
+        "classes": classes,
+    }
+
+
+def compare(result: dict, baseline: dict) -> None:
+    logging.info("")
+    logging.info("vs %s (%s)", baseline.get("revision"), baseline.get("created"))
+    old_classes = baseline["result"]["classes"]
+    for name, values in result["classes"].items():
+        old = old_classes.get(name)
+        if old is None or not old["render_us"]:
+            continue
+        change = (values["render_us"] - old["render_us"]) / old["render_us"]
+        logging.info("%-48s render %8.2f -> %8.2f us  %+.0f%%", name, old["render_us"], values["render_us"], change * 100)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=10, help="timed passes over all entities")
+    parser.add_argument("--drift-rate", type=float, default=1.0, help="share of devices whose sensors move per poll")
+    parser.add_argument("--save", type=pathlib.Path, help="write results as a baseline JSON")
+    parser.add_argument("--compare", type=pathlib.Path, help="baseline JSON to compare against")
+    parser.add_argument("--json", action="store_true", help="print JSON only")
+    args = parser.parse_args()
+
+    poll_path = load_poll_path()
+    result = asyncio.run(bench(poll_path, args.devices, args.repeat, args.drift_rate))
+    report = {
+        "benchmark": "state_write",
+        "revision": poll_path.git_revision(),
+        "created": datetime.datetime.now(datetime.UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "repeat": args.repeat,
+        "result": result,
+    }
+
+    if args.save:
+        args.save.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        logging.info("%-48s %8s %10s %10s", "entity class", "entities", "render us", "update us")
+        for name, values in result["classes"].items():
+            logging.info(
+                "%-48s %8d %10.2f %10.2f",
+                name,
+                values["entities"],
+                values["render_us"],
+                values["update_us"],
+            )
+        logging.info(
+            "%-48s %8d %10.2f %10.2f",
+            "all",
+            result["entities"],
+            result["render_us"],
+            result["update_us"],
+        )
+        if result["render_errors"]:
+            logging.warning("%d state properties raised", result["render_errors"])
+        for failure in result["platform_setup_failures"]:
+            logging.warning("platform setup failed: %s", failure)
+
+    if args.compare:
+        compare(result, json.loads(args.compare.read_text(encoding="utf-8")))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,23 +4,34 @@ from __future__ import annotations
 
 import logging
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
+from homeassistant.const import CONF_SCAN_INTERVAL
 from homeassistant.core import HomeAssistant
 
 from .aws_iot import AwsIot
+from .bulk_command import async_setup_services, async_unload_services, get_loaded_entries
 from .config_entry import (
+    ConfigData,
     New_NameConfigEntry,
     RuntimeData,
     convertToConfigData,
+    get_reload_required_changes,
     sanitizeConfigData,
 )
+from .const import DEFAULT_SCAN_INTERVAL
 from .coordinator import IotDeviceCoordinator
-from .device import Device, get_device_storage, store_rn_prode_data
+from .device import (
+    Device,
+    async_get_device_shape_catalog,
+    async_save_device_shape_catalog,
+    get_device_storage,
+    store_rn_prode_data,
+)
 from .device_types import is_implemented_by_integration
 from .device_rn_probe import fetch_and_parse_config
 from .data_storage import (
     delete_internal_settings_file,
     delete_session_storage_file,
+    delete_device_shape_catalog_file,
     delete_device_stored_file,
     get_internal_settings,
     safe_set_value,
@@ -28,19 +39,8 @@ from .data_storage import (
     safe_get_value,
     set_stored_data,
 )
-
-_PLATFORMS: list[Platform] = [
-    Platform.BINARY_SENSOR,
-    Platform.SENSOR,
-    Platform.SWITCH,
-    Platform.SELECT,
-    Platform.NUMBER,
-    Platform.BUTTON,
-    Platform.REMOTE,
-    Platform.CLIMATE,
-    Platform.HUMIDIFIER,
-    Platform.TEXT,
-]
+from .platform_planner import get_required_platforms, watch_for_missing_platforms
+from .traffic_capture import async_stop_traffic_capture, start_traffic_capture
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -51,6 +51,22 @@ async def async_setup_entry(
     """Set up TCL Home - Unofficial from a config entry."""
     configData = convertToConfigData(config_entry)
 
+    if configData.capture_traffic:
+        start_traffic_capture(hass)
+    try:
+        return await _async_setup_entry(hass, config_entry, configData)
+    except BaseException:
+        # a failed setup is not unloaded: stop the capture it started
+        if configData.capture_traffic and not is_traffic_capture_used_by_other_entries(
+            hass, config_entry
+        ):
+            await async_stop_traffic_capture(hass)
+        raise
+
+
+async def _async_setup_entry(
+    hass: HomeAssistant, config_entry: New_NameConfigEntry, configData: ConfigData
+) -> bool:
     if configData.verbose_setup_logging:
         _LOGGER.info("Setup.async_setup_entry %s",sanitizeConfigData(configData))
 
@@ -82,6 +98,8 @@ async def async_setup_entry(
     if configData.verbose_setup_logging:
         _LOGGER.info("Setup.async_setup_entry aws_iot.get_all_things result %s", things)
 
+    shape_catalog = await async_get_device_shape_catalog(hass)
+
     for thing in things.data:
         is_implemented = is_implemented_by_integration(thing.device_name)
 
@@ -140,7 +158,8 @@ async def async_setup_entry(
             tcl_thing=thing,
             aws_thing=aws_thing,
             device_storage=storage_data,
-            extra_tcl_data=extra_tcl_data
+            extra_tcl_data=extra_tcl_data,
+            shape_catalog=shape_catalog,
         )
         if configData.verbose_setup_logging:
             _LOGGER.info("_init_.device:%s", device.print_data())
@@ -158,18 +177,49 @@ async def async_setup_entry(
         config_entry.add_update_listener(_async_update_listener)
     )
 
-    coordinator = IotDeviceCoordinator(hass, config_entry, aws_iot)
+    await async_save_device_shape_catalog(hass, shape_catalog)
+
+    coordinator = IotDeviceCoordinator(hass, config_entry, aws_iot, shape_catalog)
     await coordinator.async_config_entry_first_refresh()
-    config_entry.runtime_data = RuntimeData(coordinator, cancel_update_listener)
+    platforms = get_required_platforms(
+        config_entry.devices,
+        config_entry.non_implemented_devices,
+        configData.collect_metrics,
+    )
+    if configData.verbose_setup_logging:
+        _LOGGER.info("Setup.async_setup_entry platforms:%s", platforms)
+    config_entry.runtime_data = RuntimeData(
+        coordinator, cancel_update_listener, platforms=platforms
+    )
 
-    await hass.config_entries.async_forward_entry_setups(config_entry, _PLATFORMS)
+    await hass.config_entries.async_forward_entry_setups(config_entry, platforms)
+    config_entry.async_on_unload(watch_for_missing_platforms(hass, config_entry))
+    async_setup_services(hass)
 
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: New_NameConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, _PLATFORMS)
+    async_unload_services(hass, entry)
+    unloaded = await hass.config_entries.async_unload_platforms(
+        entry, entry.runtime_data.platforms
+    )
+    # a failed unload leaves the entry loaded, still capturing
+    if unloaded and not is_traffic_capture_used_by_other_entries(hass, entry):
+        await async_stop_traffic_capture(hass)
+    return unloaded
+
+
+def is_traffic_capture_used_by_other_entries(
+    hass: HomeAssistant, entry: New_NameConfigEntry
+) -> bool:
+    """The capture is process-wide: keep it while another loaded entry has it enabled."""
+    return any(
+        convertToConfigData(other).capture_traffic
+        for other in get_loaded_entries(hass)
+        if other.entry_id != entry.entry_id
+    )
 
 
 async def async_remove_entry(hass: HomeAssistant, entry: New_NameConfigEntry) -> bool:
@@ -177,12 +227,14 @@ async def async_remove_entry(hass: HomeAssistant, entry: New_NameConfigEntry) ->
     for device in entry.devices:
         await delete_device_stored_file(hass, device.device_id)
     await delete_internal_settings_file(hass)
+    await delete_device_shape_catalog_file(hass)
     await delete_session_storage_file(hass)
 
 async def _async_update_listener(hass: HomeAssistant, config_entry: ConfigEntry):
     """Handle config options update.
 
-    Reload the integration when the options change.
+    Reload the integration when the login, the endpoints or collect_metrics
+    change; apply the other options to the running session and coordinator.
     Called from our listener created above.
     """
     configData = convertToConfigData(config_entry)
@@ -192,7 +244,34 @@ async def _async_update_listener(hass: HomeAssistant, config_entry: ConfigEntry)
             "Setup._async_update_listener %s",
             sanitizeConfigData(configData),
         )
-    await hass.config_entries.async_reload(config_entry.entry_id)
+
+    runtime_data = getattr(config_entry, "runtime_data", None)
+    if runtime_data is None:
+        await hass.config_entries.async_reload(config_entry.entry_id)
+        return
+
+    coordinator = runtime_data.coordinator
+    session_manager = coordinator.get_aws_iot().get_session_manager()
+    previous = session_manager.get_config_data()
+    changes = get_reload_required_changes(previous, configData)
+    if changes:
+        if configData.verbose_setup_logging:
+            _LOGGER.info("Setup._async_update_listener reload for %s", changes)
+        await hass.config_entries.async_reload(config_entry.entry_id)
+        return
+
+    session_manager.set_config_data(configData)
+    if configData.capture_traffic and not previous.capture_traffic:
+        start_traffic_capture(hass)
+    elif (
+        previous.capture_traffic
+        and not configData.capture_traffic
+        and not is_traffic_capture_used_by_other_entries(hass, config_entry)
+    ):
+        await async_stop_traffic_capture(hass)
+    coordinator.set_poll_interval(
+        config_entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+    )
 
 async def internal_settings_setup(hass: HomeAssistant):
     need_save = False
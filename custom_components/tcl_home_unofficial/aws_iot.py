@@ -1,17 +1,28 @@
 """."""
 
+import asyncio
 import datetime
+from enum import StrEnum
 from functools import partial
 import json
 import logging
-
-import boto3
-import boto3.session
+import random
+import time
 
 from homeassistant.core import HomeAssistant
 
+from .command_tracker import CommandTracker
 from .config_entry import New_NameConfigEntry
 from .data_storage import safe_get_value, safe_set_value, set_stored_data
+from .desired_state_planner import DesiredStatePlanner
+from .metrics import MetricOperationEnum, MetricsRecorder
+from .request_governor import (
+    RequestGovernor,
+    RequestPriorityEnum,
+    get_aws_error_code,
+    get_http_status_code,
+    is_throttling_error,
+)
 from .session_manager import SessionManager
 from .tcl import (
     GetThingsResponse, 
@@ -23,11 +34,100 @@ from .tcl import (
     get_day_for_filer,
     get_day_for_data
 )
+from .traffic_capture import get_traffic_recorder, record_exchange
 from .fakes_for_debug import aws_iot_get_all_things, aws_iot_get_thing
 
 _LOGGER = logging.getLogger(__name__)
 
 
+MAX_TRANSIENT_RETRIES = 2
+RETRY_BASE_DELAY_SECONDS = 0.5
+
+CREDENTIAL_ERROR_CODES = {
+    "ExpiredToken",
+    "ExpiredTokenException",
+    "ForbiddenException",
+    "InvalidClientTokenId",
+    "InvalidSignatureException",
+    "RequestExpired",
+    "UnauthorizedException",
+    "UnrecognizedClientException",
+}
+# iot-data reports an expired / revoked session as 403 ForbiddenException
+CREDENTIAL_HTTP_STATUS_CODES = {401, 403}
+
+# client errors a new session cannot fix; any other ClientError gets one rebuild
+PERMANENT_ERROR_CODES = {
+    "ConflictException",
+    "InvalidRequestException",
+    "MethodNotAllowedException",
+    "RequestEntityTooLargeException",
+    "ResourceNotFoundException",
+    "UnsupportedDocumentEncodingException",
+}
+
+# botocore exception class names, matched by name so botocore is not imported here
+TRANSIENT_ERROR_TYPES = {
+    "ConnectionClosedError",
+    "ConnectTimeoutError",
+    "EndpointConnectionError",
+    "ReadTimeoutError",
+    "ConnectionError",
+    "TimeoutError",
+}
+
+
+class AwsErrorKindEnum(StrEnum):
+    CREDENTIALS = "credentials"
+    TRANSIENT = "transient"
+    PERMANENT = "permanent"
+
+
+def classify_aws_error(err: Exception) -> AwsErrorKindEnum:
+    """Decide whether a failed call should rebuild the client, retry or give up."""
+    error_code = get_aws_error_code(err)
+    if error_code in CREDENTIAL_ERROR_CODES:
+        return AwsErrorKindEnum.CREDENTIALS
+    if get_http_status_code(err) in CREDENTIAL_HTTP_STATUS_CODES:
+        return AwsErrorKindEnum.CREDENTIALS
+    if is_throttling_error(err):
+        return AwsErrorKindEnum.TRANSIENT
+    if any(t.__name__ in TRANSIENT_ERROR_TYPES for t in type(err).__mro__):
+        return AwsErrorKindEnum.TRANSIENT
+    if error_code is not None and error_code not in PERMANENT_ERROR_CODES:
+        # unclassified ClientError: rebuild the session once, as before
+        return AwsErrorKindEnum.CREDENTIALS
+    return AwsErrorKindEnum.PERMANENT
+
+
+def get_retry_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter."""
+    return random.uniform(0, RETRY_BASE_DELAY_SECONDS * (2 ** (attempt - 1)))
+
+
+def create_iot_data_client(
+    aws_region: str,
+    aws_access_key_id: str,
+    aws_secret_access_key: str,
+    aws_session_token: str,
+):
+    """Build the boto3 iot-data client.
+
+    Runs in the executor. boto3/botocore are imported here, not at module
+    level, so loading the integration (fakes, config flow, diagnostics) does
+    not pay the SDK import and data-loading cost until a real client is needed.
+    """
+    import boto3.session  # noqa: PLC0415
+
+    boto3Session = boto3.session.Session(
+        region_name=aws_region,
+        aws_access_key_id=aws_access_key_id,
+        aws_secret_access_key=aws_secret_access_key,
+        aws_session_token=aws_session_token,
+    )
+    return boto3Session.client(service_name="iot-data")
+
+
 def getTopic(device_id: str) -> str:
     """Get the topic for the device."""
     return f"$aws/things/{device_id}/shadow/update"
@@ -45,32 +145,56 @@ class AwsIot:
         """Initialize the AWS IoT client."""
         self.hass = hass
         self.session_manager = SessionManager(hass=hass, config_entry=config_entry)
+        self.metrics = self.session_manager.get_metrics()
+        self.governor = self.session_manager.get_request_governor()
+        self.desired_state_planner = DesiredStatePlanner()
+        self.command_tracker = CommandTracker()
         self.client = None
+        self._client_generation = 0
+        self._client_lock = asyncio.Lock()
         self.use_fakes = use_fakes
 
     async def async_setup_client(self) -> None:
         aws_region = await self.session_manager.get_aws_region()
         awsCred = await self.session_manager.async_aws_credentials()
 
-        boto3Session = boto3.session.Session(
-            region_name=aws_region,
-            aws_access_key_id=awsCred.Credentials.access_key_id,
-            aws_secret_access_key=awsCred.Credentials.secret_key,
-            aws_session_token=awsCred.Credentials.session_token,
-        )
-
         self.client = await self.hass.async_add_executor_job(
-            partial(boto3Session.client, service_name="iot-data")
+            partial(
+                create_iot_data_client,
+                aws_region=aws_region,
+                aws_access_key_id=awsCred.Credentials.access_key_id,
+                aws_secret_access_key=awsCred.Credentials.secret_key,
+                aws_session_token=awsCred.Credentials.session_token,
+            )
         )
-        # self.client = boto3Session.client(service_name="iot-data")
+        self._client_generation += 1
 
     async def async_init(self) -> None:
         await self.session_manager.async_load()
+        if self.use_fakes:
+            _LOGGER.warning("AwsIot.async_init FAKES_ENABLED, skipping boto3 client")
+            return
         await self.async_setup_client()
 
     def get_session_manager(self) -> SessionManager:
         return self.session_manager
 
+    def get_metrics(self) -> MetricsRecorder:
+        return self.metrics
+
+    def get_request_governor(self) -> RequestGovernor:
+        return self.governor
+
+    def get_desired_state_planner(self) -> DesiredStatePlanner:
+        return self.desired_state_planner
+
+    def get_command_tracker(self) -> CommandTracker:
+        return self.command_tracker
+
+    def observe_shadow(self, device_id: str, shadow: dict | None) -> None:
+        self.desired_state_planner.observe_shadow(device_id, shadow)
+        self.command_tracker.observe_shadow(device_id, shadow)
+
     async def get_all_things(self) -> GetThingsResponse:
         if self.session_manager.is_verbose_device_logging():
             _LOGGER.info("AwsIot.get_all_things")
@@ -84,13 +208,15 @@ class AwsIot:
 
         clud_urls = await self.session_manager.async_aws_cloud_urls()
 
-        things = await get_things(
-            hass=self.hass,
-            device_url=clud_urls.data.device_url,
-            saas_token=saas_token,
-            country_abbr=authResult.user.country_abbr,
-            verbose_logging=self.session_manager.is_verbose_device_logging(),
-        )
+        async with self.governor.request(RequestPriorityEnum.POLL):
+            with self.metrics.measure(MetricOperationEnum.GET_THINGS):
+                things = await get_things(
+                    hass=self.hass,
+                    device_url=clud_urls.data.device_url,
+                    saas_token=saas_token,
+                    country_abbr=authResult.user.country_abbr,
+                    verbose_logging=self.session_manager.is_verbose_device_logging(),
+                )
 
         return things
     
@@ -105,14 +231,16 @@ class AwsIot:
 
         clud_urls = await self.session_manager.async_aws_cloud_urls()
 
-        response = await get_energy_consumption(
-            hass=self.hass,
-            device_url=clud_urls.data.device_url,
-            saas_token=saas_token,
-            deviceId=device_id,
-            date_filter= f"?week={get_day_for_filer(-1)}-{get_day_for_filer()}",
-            verbose_logging=self.session_manager.is_verbose_device_logging(),
-        )
+        async with self.governor.request(RequestPriorityEnum.BACKGROUND):
+            with self.metrics.measure(MetricOperationEnum.ENERGY_CONSUMPTION):
+                response = await get_energy_consumption(
+                    hass=self.hass,
+                    device_url=clud_urls.data.device_url,
+                    saas_token=saas_token,
+                    deviceId=device_id,
+                    date_filter= f"?week={get_day_for_filer(-1)}-{get_day_for_filer()}",
+                    verbose_logging=self.session_manager.is_verbose_device_logging(),
+                )
 
         return response
 
@@ -128,14 +256,16 @@ class AwsIot:
 
         clud_urls = await self.session_manager.async_aws_cloud_urls()
 
-        response = await get_work_time(
-            hass=self.hass,
-            device_url=clud_urls.data.device_url,
-            saas_token=saas_token,
-            deviceId=device_id,
-            date_filter= f"?week={get_day_for_filer(-1)}-{get_day_for_filer()}",
-            verbose_logging=self.session_manager.is_verbose_device_logging(),
-        )
+        async with self.governor.request(RequestPriorityEnum.BACKGROUND):
+            with self.metrics.measure(MetricOperationEnum.WORK_TIME):
+                response = await get_work_time(
+                    hass=self.hass,
+                    device_url=clud_urls.data.device_url,
+                    saas_token=saas_token,
+                    deviceId=device_id,
+                    date_filter= f"?week={get_day_for_filer(-1)}-{get_day_for_filer()}",
+                    verbose_logging=self.session_manager.is_verbose_device_logging(),
+                )
 
         return response
 
@@ -194,24 +324,63 @@ class AwsIot:
             "yesterday_work_time":yesterday_work_time
         }
 
+    async def rebuild_client(self, failed_generation: int) -> None:
+        """Re-create the boto3 client once per credential expiry.
+
+        Concurrent callers that failed on the same client generation wait on
+        the lock and then reuse the client built by the first one.
+        """
+        async with self._client_lock:
+            if self._client_generation != failed_generation:
+                return
+            self.metrics.increment("client_rebuilds")
+            old_client = self.client
+            await self.session_manager.async_force_aws_credentials()
+            await self.async_setup_client()
+            if old_client is not None:
+                old_client.close()
+
+    async def execute_with_retry(
+        self,
+        function,
+        *args,
+        fromException: bool = False,
+        priority: RequestPriorityEnum = RequestPriorityEnum.POLL,
+    ):
+        credentials_refreshed = fromException
+        transient_retries = MAX_TRANSIENT_RETRIES if not fromException else 0
+        attempt = 0
+        while True:
+            generation = self._client_generation
+            try:
+                async with self.governor.request(priority):
+                    return await self.hass.async_add_executor_job(function, *args)
+            except Exception as e:
+                error_kind = classify_aws_error(e)
+                if error_kind == AwsErrorKindEnum.CREDENTIALS and not credentials_refreshed:
+                    credentials_refreshed = True
+                    self.metrics.increment("retries.credentials")
+                    await self.rebuild_client(generation)
+                    continue
+                if error_kind == AwsErrorKindEnum.TRANSIENT and attempt < transient_retries:
+                    attempt += 1
+                    self.metrics.increment("retries.transient")
+                    await asyncio.sleep(get_retry_delay(attempt))
+                    continue
+                raise
+
     async def execute_and_re_try_call_with_device_id(
         self,
         function,
         device_id: str,
         fromException: bool = False,
+        priority: RequestPriorityEnum = RequestPriorityEnum.POLL,
     ):
         try:
-            return await self.hass.async_add_executor_job(function, device_id)
+            return await self.execute_with_retry(
+                function, device_id, fromException=fromException, priority=priority
+            )
         except Exception as e:
-            # re-try if the error is due to expired credentials
-            if not fromException:
-                self.client.close()
-                await self.async_setup_client()
-                return await self.execute_and_re_try_call_with_device_id(
-                    function=function,
-                    device_id=device_id,
-                    fromException=True,
-                )
             _LOGGER.error(
                 "Aws_iot - Error execute_and_re_try_call_with_device_id %s: %s",
                 device_id,
@@ -225,24 +394,17 @@ class AwsIot:
         device_id: str,
         desired_state: dict[str, any],
         fromException: bool = False,
+        priority: RequestPriorityEnum = RequestPriorityEnum.COMMAND,
     ):
         try:
-            return await self.hass.async_add_executor_job(
-                function, device_id, desired_state
+            return await self.execute_with_retry(
+                function,
+                device_id,
+                desired_state,
+                fromException=fromException,
+                priority=priority,
             )
         except Exception as e:
-            # re-try if the error is due to expired credentials
-            if not fromException:
-                self.client.close()
-                await self.async_setup_client()
-                return (
-                    await self.execute_and_re_try_call_with_device_id_and_desired_state(
-                        function=function,
-                        device_id=device_id,
-                        desired_state=desired_state,
-                        fromException=True,
-                    )
-                )
             _LOGGER.error(
                 "Aws_iot - Error execute_and_re_try_call_with_device_id_and_desired_state %s - %s | %s",
                 device_id,
@@ -252,26 +414,40 @@ class AwsIot:
             raise e
 
     async def async_get_thing(
-        self, device_id: str, fromException: bool = False
+        self,
+        device_id: str,
+        fromException: bool = False,
+        priority: RequestPriorityEnum = RequestPriorityEnum.POLL,
     ) -> dict:
         if self.session_manager.is_verbose_device_logging():
             _LOGGER.info("AwsIot.async_get_thing (%s)", device_id)
         if self.use_fakes:
             _LOGGER.warning("AwsIot.async_get_thing (%s) FAKES_ENABLED", device_id)
             fake_thing = await aws_iot_get_thing(self.hass, device_id)
+            self.observe_shadow(device_id, fake_thing)
             return fake_thing
 
-        return await self.execute_and_re_try_call_with_device_id(
-            self.get_thing, device_id, fromException
+        shadow = await self.execute_and_re_try_call_with_device_id(
+            self.get_thing, device_id, fromException, priority
         )
+        self.observe_shadow(device_id, shadow)
+        return shadow
 
     def get_thing(self, device_id: str) -> dict:
         """List all things in AWS IoT."""
-        response = self.client.get_thing_shadow(thingName=device_id)
-        payload = response["payload"].read().decode("utf-8")
+        started = time.perf_counter()
+        try:
+            with self.metrics.measure(MetricOperationEnum.GET_THING_SHADOW):
+                response = self.client.get_thing_shadow(thingName=device_id)
+                payload = response["payload"].read().decode("utf-8")
+        except Exception as e:
+            self.record_exchange(MetricOperationEnum.GET_THING_SHADOW, device_id, None, started, e)
+            raise
         if self.session_manager.is_verbose_device_logging():
             _LOGGER.info("AwsIot.get_thing (%s): %s", device_id, payload)
-        return json.loads(payload)
+        shadow = json.loads(payload)
+        self.record_exchange(MetricOperationEnum.GET_THING_SHADOW, device_id, None, started, shadow=shadow)
+        return shadow
 
     async def async_set_desired_state(
         self,
@@ -279,9 +455,24 @@ class AwsIot:
         desired_state: dict[str, any],
         fromException: bool = False,
     ) -> None:
+        minimal_desired_state = self.desired_state_planner.plan(device_id, desired_state)
+        dropped_keys = len(desired_state) - len(minimal_desired_state)
+        if dropped_keys:
+            self.metrics.increment("desired_state.keys_dropped", dropped_keys)
+        if not minimal_desired_state:
+            self.metrics.increment("desired_state.publishes_skipped")
+            if self.session_manager.is_verbose_device_logging():
+                _LOGGER.info(
+                    "AwsIot.async_set_desired_state (%s): nothing to change in %s",
+                    device_id,
+                    desired_state,
+                )
+            return
         await self.execute_and_re_try_call_with_device_id_and_desired_state(
-            self.set_desired_state, device_id, desired_state, fromException
+            self.set_desired_state, device_id, minimal_desired_state, fromException
         )
+        self.desired_state_planner.observe_publish(device_id, minimal_desired_state)
+        self.command_tracker.record_publish(device_id, minimal_desired_state)
 
     def set_desired_state(self, device_id: str, desired_state: dict[str, any]) -> None:
         if self.session_manager.is_verbose_device_logging():
@@ -298,5 +489,35 @@ class AwsIot:
             _LOGGER.info("AwsIot.set_desired_state (%s) payload: %s", device_id, payload)
             return
         
-        self.client.publish(topic=getTopic(device_id), qos=1, payload=payload)
+        started = time.perf_counter()
+        try:
+            with self.metrics.measure(MetricOperationEnum.PUBLISH):
+                self.client.publish(topic=getTopic(device_id), qos=1, payload=payload)
+        except Exception as e:
+            self.record_exchange(MetricOperationEnum.PUBLISH, device_id, payload, started, e)
+            raise
+        self.record_exchange(MetricOperationEnum.PUBLISH, device_id, payload, started)
+
+    def record_exchange(
+        self,
+        operation: MetricOperationEnum,
+        device_id: str,
+        payload: str | None,
+        started: float,
+        error: Exception | None = None,
+        shadow: dict | None = None,
+    ) -> None:
+        """Hand a shadow read / publish to the traffic capture, if it is running."""
+        if get_traffic_recorder(self.hass) is None:
+            return
+        if operation == MetricOperationEnum.PUBLISH:
+            method, url = "PUBLISH", getTopic(device_id)
+            request = json.loads(payload)
+        else:
+            method, url = "GET", f"things/{device_id}/shadow"
+            request = None
+        status = 200 if error is None else get_http_status_code(error)
+        record_exchange(
+            self.hass, "aws", operation, method, url, None, request, status, shadow, started, error
+        )
 
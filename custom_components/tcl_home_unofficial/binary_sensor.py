@@ -69,19 +69,15 @@ class BinarySensorHandler(TclEntityBase, BinarySensorEntity):
         self.icon_fn = icon_fn
         self.is_on_fn = is_on_fn
 
-    @property
-    def icon(self):
-        return self.icon_fn(self.device)
+    def update_attributes(self) -> None:
+        super().update_attributes()
+        self._attr_icon = self.icon_fn(self.device)
+        self._attr_is_on = self.is_on_fn(self.device)
 
     @property
     def device_class(self) -> str:
         return BinarySensorDeviceClass.POWER
 
-    @property
-    def is_on(self) -> bool | None:
-        self.device = self.coordinator.get_device_by_id(self.device.device_id)
-        return self.is_on_fn(self.device)
-
 
 class BinarySensorHandlerOccupancy(TclEntityBase, BinarySensorEntity):
     def __init__(
@@ -97,22 +93,20 @@ class BinarySensorHandlerOccupancy(TclEntityBase, BinarySensorEntity):
         self.icon_fn = icon_fn
         self.is_on_fn = is_on_fn
 
-    @property
-    def icon(self):
-        return self.icon_fn(self.device)
+    def update_attributes(self) -> None:
+        super().update_attributes()
+        self._attr_icon = self.icon_fn(self.device)
+        self._attr_is_on = self.is_on_fn(self.device)
 
     @property
     def device_class(self) -> str:
         return BinarySensorDeviceClass.OCCUPANCY
 
-    @property
-    def is_on(self) -> bool | None:
-        self.device = self.coordinator.get_device_by_id(self.device.device_id)
-        return self.is_on_fn(self.device)
-
 class DynamicBinarySensorHandlerNoAutoIsOnlineCheck(
     BinarySensorHandler, BinarySensorEntity
 ):
+    needs_device_data = False
+
     def __init__(
         self,
         coordinator: IotDeviceCoordinator,
@@ -134,6 +128,6 @@ class DynamicBinarySensorHandlerNoAutoIsOnlineCheck(
         )
         self.is_available_fn = is_available_fn
 
-    @property
-    def available(self) -> bool:
-        return self.is_available_fn(self.device)
+    def update_attributes(self) -> None:
+        super().update_attributes()
+        self._attr_available = self.is_available_fn(self.device)
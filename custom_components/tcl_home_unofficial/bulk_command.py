@@ -0,0 +1,165 @@
+"""The bulk_command service: one desired state sent to many devices.
+
+Calling an entity service per device publishes and polls the whole fleet
+once per device. bulk_command selects the devices by id, device type and/or
+room (all given filters must match), publishes the desired state to all of
+them concurrently, at most `concurrency` at a time, and then does one
+confirmation read per config entry.
+
+The desired state is sent as is (after the unchanged keys are dropped, see
+desired_state_planner), e.g. {"powerSwitch": 0} or {"targetTemperature": 22}.
+"""
+
+import asyncio
+from dataclasses import dataclass
+import logging
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+
+from .config_entry import New_NameConfigEntry
+from .const import (
+    BULK_COMMAND_DEFAULT_CONCURRENCY,
+    BULK_COMMAND_MAX_CONCURRENCY,
+    DOMAIN,
+    SERVICE_BULK_COMMAND,
+)
+from .coordinator import IotDeviceCoordinator
+from .device import Device
+from .device_types import DeviceTypeEnum
+
+_LOGGER = logging.getLogger(__name__)
+
+BULK_COMMAND_SCHEMA = vol.Schema(
+    {
+        vol.Optional("device_ids"): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional("device_types"): vol.All(cv.ensure_list, [vol.Coerce(DeviceTypeEnum)]),
+        vol.Optional("rooms"): vol.All(cv.ensure_list, [cv.string]),
+        vol.Required("desired_state"): vol.All(dict, vol.Length(min=1)),
+        vol.Optional("concurrency", default=BULK_COMMAND_DEFAULT_CONCURRENCY): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=BULK_COMMAND_MAX_CONCURRENCY)
+        ),
+    }
+)
+
+
+@dataclass(frozen=True)
+class BulkCommandFilter:
+    device_ids: frozenset[str] | None = None
+    device_types: frozenset[DeviceTypeEnum] | None = None
+    rooms: frozenset[str] | None = None
+
+    @classmethod
+    def from_service_data(cls, data: dict) -> "BulkCommandFilter":
+        def as_set(key: str, normalize=lambda value: value):
+            values = data.get(key)
+            return None if values is None else frozenset(normalize(value) for value in values)
+
+        return cls(
+            device_ids=as_set("device_ids"),
+            device_types=as_set("device_types"),
+            rooms=as_set("rooms", lambda room: room.casefold()),
+        )
+
+    def is_empty(self) -> bool:
+        return self.device_ids is None and self.device_types is None and self.rooms is None
+
+    def matches(self, device: Device) -> bool:
+        if self.device_ids is not None and device.device_id not in self.device_ids:
+            return False
+        if self.device_types is not None and device.device_type not in self.device_types:
+            return False
+        if self.rooms is not None:
+            room = device.tcl_thing.room if device.tcl_thing is not None else None
+            if room is None or room.casefold() not in self.rooms:
+                return False
+        return True
+
+
+def get_loaded_entries(hass: HomeAssistant) -> list[New_NameConfigEntry]:
+    return [
+        entry
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.state == ConfigEntryState.LOADED
+    ]
+
+
+async def async_publish_to_devices(
+    coordinator: IotDeviceCoordinator,
+    devices: list[Device],
+    desired_state: dict,
+    semaphore: asyncio.Semaphore,
+) -> dict[str, str]:
+    aws_iot = coordinator.get_aws_iot()
+
+    async def publish(device: Device) -> str:
+        async with semaphore:
+            try:
+                await aws_iot.async_set_desired_state(device.device_id, dict(desired_state))
+            except Exception as e:  # noqa: BLE001
+                return f"failed: {e}"
+        return "published"
+
+    results = await asyncio.gather(*(publish(device) for device in devices))
+    return {device.device_id: result for device, result in zip(devices, results)}
+
+
+async def async_handle_bulk_command(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    device_filter = BulkCommandFilter.from_service_data(call.data)
+    if device_filter.is_empty():
+        raise ServiceValidationError("bulk_command needs device_ids, device_types or rooms")
+    desired_state = call.data["desired_state"]
+    semaphore = asyncio.Semaphore(call.data["concurrency"])
+
+    results: dict[str, str] = {}
+    published: list[tuple[IotDeviceCoordinator, list[Device], asyncio.Task]] = []
+    for entry in get_loaded_entries(hass):
+        coordinator = entry.runtime_data.coordinator
+        targets = []
+        for device in coordinator.data.devices:
+            if device.device_type is None or not device_filter.matches(device):
+                continue
+            if device.is_online != 1:
+                results[device.device_id] = "offline"
+                continue
+            targets.append(device)
+        if targets:
+            task = hass.async_create_task(
+                async_publish_to_devices(coordinator, targets, desired_state, semaphore)
+            )
+            published.append((coordinator, targets, task))
+
+    for coordinator, targets, task in published:
+        results.update(await task)
+        await coordinator.async_refresh_after_commands([device.device_id for device in targets])
+
+    _LOGGER.info("bulk_command %s: %s", desired_state, results)
+    return {"devices": results}
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    if hass.services.has_service(DOMAIN, SERVICE_BULK_COMMAND):
+        return
+
+    async def handle(call: ServiceCall) -> ServiceResponse:
+        return await async_handle_bulk_command(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BULK_COMMAND,
+        handle,
+        schema=BULK_COMMAND_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+def async_unload_services(hass: HomeAssistant, unloading_entry: New_NameConfigEntry) -> None:
+    """Remove the services with the last loaded config entry."""
+    if not any(
+        entry.entry_id != unloading_entry.entry_id for entry in get_loaded_entries(hass)
+    ):
+        hass.services.async_remove(DOMAIN, SERVICE_BULK_COMMAND)
@@ -122,25 +122,19 @@ class ButtonHandler(TclEntityBase, ButtonEntity):
             deviceFeature=deviceFeature,
             device=self.device,
         )
+        # the name is registered (entity_id) before async_added_to_hass
+        self.refresh_attributes()
 
-    @property
-    def name(self) -> str:
-        self.device = self.coordinator.get_device_by_id(self.device.device_id)
+    def update_attributes(self) -> None:
+        super().update_attributes()
         self.iot_handler.refreshDevice(self.device)
-
-        return self.name_fn(self.device)
+        self._name = self.name_fn(self.device)
+        self._attr_icon = self.icon_fn(self.device)
 
     @property
     def device_class(self) -> str:
         return ButtonDeviceClass.UPDATE
 
-    @property
-    def icon(self):
-        self.device = self.coordinator.get_device_by_id(self.device.device_id)
-        self.iot_handler.refreshDevice(self.device)
-
-        return self.icon_fn(self.device)
-
     async def async_press(self) -> None:
         self.device = self.coordinator.get_device_by_id(self.device.device_id)
         self.iot_handler.refreshDevice(self.device)
@@ -149,7 +143,7 @@ class ButtonHandler(TclEntityBase, ButtonEntity):
             await self.iot_handler.call_button(0)
         else:
             await self.iot_handler.call_button(1)
-        await self.coordinator.async_refresh()
+        await self.coordinator.async_refresh_after_command(self.device.device_id)
 
 
 class Reload_Button(TclNonPollingEntityBase, ButtonEntity):
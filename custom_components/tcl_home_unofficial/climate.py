@@ -13,22 +13,20 @@ from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .composite_operation import CompositeOperation
 from .config_entry import New_NameConfigEntry
 from .coordinator import IotDeviceCoordinator
 from .device import Device
 from .device_enums import (
-    LeftAndRightAirSupplyVectorEnum,
+    LEFT_AND_RIGHT_AIR_SUPPLY_VECTOR_CODEC,
+    UP_AND_DOWN_AIR_SUPPLY_VECTOR_CODEC,
+    WIND_SEED_7_GEAR_CODEC,
+    WIND_SPEED_CODEC,
+    WINDOW_AC_WIND_SEED_CODEC,
+    EnumCodec,
     ModeEnum,
-    PortableWind4ValueSeedEnum,
-    UpAndDownAirSupplyVectorEnum,
-    WindowAcWindSeedEnum,
-    WindSeed7GearEnum,
-    WindSeedEnum,
     getLeftAndRightAirSupplyVector,
-    getPortableWind4ValueSeed,
     getUpAndDownAirSupplyVector,
-    getWindowAcWindSeed,
-    getWindSeed7Gear,
     getWindSpeed,
 )
 from .device_features import DeviceFeatureEnum
@@ -50,31 +48,40 @@ def get_fan_speed_feature(device: Device) -> str:
 
     if DeviceFeatureEnum.SELECT_PORTABLE_WIND_4VALUE_SPEED in device.supported_features:
         return DeviceFeatureEnum.SELECT_PORTABLE_WIND_4VALUE_SPEED
+
+    if DeviceFeatureEnum.SELECT_PORTABLE_WIND_SPEED in device.supported_features:
+        return DeviceFeatureEnum.SELECT_PORTABLE_WIND_SPEED
     return DeviceFeatureEnum.SELECT_WIND_SPEED
 
 
+def get_fan_speed_codec(device: Device) -> EnumCodec:
+    match get_fan_speed_feature(device):
+        case DeviceFeatureEnum.SELECT_WIND_SPEED_7_GEAR:
+            return WIND_SEED_7_GEAR_CODEC
+        case DeviceFeatureEnum.SELECT_WINDOW_AS_WIND_SPEED:
+            return WINDOW_AC_WIND_SEED_CODEC
+        case DeviceFeatureEnum.SELECT_PORTABLE_WIND_4VALUE_SPEED:
+            return device.portable_wind_4value_seed_codec
+        case DeviceFeatureEnum.SELECT_PORTABLE_WIND_SPEED:
+            return device.portable_wind_seed_codec
+    return WIND_SPEED_CODEC
+
+
 def get_current_fan_speed_fn(device: Device) -> str:
-    if DeviceFeatureEnum.SELECT_WIND_SPEED_7_GEAR in device.supported_features:
-        return getWindSeed7Gear(device.data.wind_speed_7_gear)
-    if DeviceFeatureEnum.SELECT_WINDOW_AS_WIND_SPEED in device.supported_features:
-        return getWindowAcWindSeed(device.data.wind_speed)
-    if DeviceFeatureEnum.SELECT_PORTABLE_WIND_4VALUE_SPEED in device.supported_features:
-        return getPortableWind4ValueSeed(device.data.wind_speed)
-    return getWindSpeed(
-        wind_speed=device.data.wind_speed,
-        turbo=device.data.turbo,
-        silence_switch=device.data.silence_switch,
-    )
+    codec = get_fan_speed_codec(device)
+    if codec is WIND_SEED_7_GEAR_CODEC:
+        return codec.decode(device.data.wind_speed_7_gear)
+    if codec is WIND_SPEED_CODEC:
+        return getWindSpeed(
+            wind_speed=device.data.wind_speed,
+            turbo=device.data.turbo,
+            silence_switch=device.data.silence_switch,
+        )
+    return codec.decode(device.data.wind_speed)
 
 
-def get_options_fan_speed(device: Device) -> list[str]:
-    if DeviceFeatureEnum.SELECT_WIND_SPEED_7_GEAR in device.supported_features:
-        return [e.value for e in WindSeed7GearEnum]
-    if DeviceFeatureEnum.SELECT_WINDOW_AS_WIND_SPEED in device.supported_features:
-        return [e.value for e in WindowAcWindSeedEnum]
-    if DeviceFeatureEnum.SELECT_PORTABLE_WIND_4VALUE_SPEED in device.supported_features:
-        return [e.value for e in PortableWind4ValueSeedEnum]
-    return [e.value for e in WindSeedEnum]
+def get_options_fan_speed(device: Device) -> tuple[str, ...]:
+    return get_fan_speed_codec(device).options
 
 
 def get_vertical_air_direction_feature(device: Device) -> str:
@@ -141,12 +148,8 @@ async def async_setup_entry(
                     options_mode=[
                         map_mode_to_hvac_mode(e) for e in device.get_supported_modes()
                     ],
-                    options_vertical_air_direction=[
-                        e.value for e in UpAndDownAirSupplyVectorEnum
-                    ],
-                    options_horizontal_air_direction=[
-                        e.value for e in LeftAndRightAirSupplyVectorEnum
-                    ],
+                    options_vertical_air_direction=UP_AND_DOWN_AIR_SUPPLY_VECTOR_CODEC.options,
+                    options_horizontal_air_direction=LEFT_AND_RIGHT_AIR_SUPPLY_VECTOR_CODEC.options,
                     current_target_temp_fn=lambda device: device.data.target_temperature,
                     current_temp_fn=lambda device: device.data.current_temperature,
                 )
@@ -273,8 +276,7 @@ class ClimateHandler(TclEntityBase, ClimateEntity):
                 device=device,
                 deviceFeature=vertical_air_direction_select_feature,
             )
-            self._current_swing_mode = self.current_vertical_air_direction_fn(device)
-            self._swing_modes = options_vertical_air_direction
+            self._attr_swing_modes = options_vertical_air_direction
 
         if self.horizontal_air_direction_select_feature is not None:
             self._attr_supported_features |= ClimateEntityFeature.SWING_HORIZONTAL_MODE
@@ -286,10 +288,7 @@ class ClimateHandler(TclEntityBase, ClimateEntity):
                 deviceFeature=horizontal_air_direction_select_feature,
             )
 
-            self._current_swing_horizontal_mode = (
-                self.current_horizontal_air_direction_fn(device)
-            )
-            self._swing_horizontal_modes = options_horizontal_air_direction
+            self._attr_swing_horizontal_modes = options_horizontal_air_direction
 
         self._target_humidity = None
         self._unit_of_measurement = UnitOfTemperature.CELSIUS
@@ -297,16 +296,12 @@ class ClimateHandler(TclEntityBase, ClimateEntity):
         self._preset_modes = None
         self._current_humidity = None
 
-        self._current_fan_mode = self.current_fan_speed_fn(device)
-        self._fan_modes = options_fan_speed
-
-        self._hvac_mode = self.current_mode_fn(device)
-        self._hvac_modes = options_mode + [HVACMode.OFF]
+        self._attr_fan_modes = options_fan_speed
+        self._attr_hvac_modes = options_mode + [HVACMode.OFF]
 
         self._hvac_action = None
         self._attr_temperature_unit = UnitOfTemperature.CELSIUS
 
-        self._target_temperature = self.current_target_temp_fn(device)
         self._attr_min_temp = self.device.data.lower_temperature_limit
         self._attr_max_temp = self.device.data.upper_temperature_limit
         self._attr_target_temperature_step = self.device.storage["non_user_config"][
@@ -315,6 +310,9 @@ class ClimateHandler(TclEntityBase, ClimateEntity):
 
     def refresh_device(self) -> None:
         self.device = self.coordinator.get_device_by_id(self.device.device_id)
+        self.refresh_handlers()
+
+    def refresh_handlers(self) -> None:
         self.iot_handler_mode.refreshDevice(self.device)
         self.iot_handler_temp.refreshDevice(self.device)
         self.iot_handler_wind_speed.refreshDevice(self.device)
@@ -324,91 +322,67 @@ class ClimateHandler(TclEntityBase, ClimateEntity):
         if self.horizontal_air_direction_select_feature is not None:
             self.iot_handler_horizontal_air_direction.refreshDevice(self.device)
 
-    @property
-    def current_temperature(self) -> float:
-        self.refresh_device()
-        return float(self.current_temp_fn(self.device))
-
-    @property
-    def target_temperature(self) -> float | None:
-        self.refresh_device()
-        return float(self.current_target_temp_fn(self.device))
-
-    @property
-    def hvac_mode(self) -> HVACMode:
-        self.refresh_device()
-        return self.current_mode_fn(self.device)
-
-    @property
-    def hvac_modes(self) -> list[HVACMode]:
-        return self._hvac_modes
-
-    @property
-    def fan_mode(self) -> str | None:
-        self.refresh_device()
-        return self.current_fan_speed_fn(self.device)
-
-    @property
-    def fan_modes(self) -> list[str]:
-        return self._fan_modes
-
-    @property
-    def swing_mode(self) -> str | None:
-        self.refresh_device()
-        return self.current_vertical_air_direction_fn(self.device)
-
-    @property
-    def swing_modes(self) -> list[str]:
-        return self._swing_modes
+    def update_attributes(self) -> None:
+        super().update_attributes()
+        self.refresh_handlers()
+        self._attr_current_temperature = float(self.current_temp_fn(self.device))
+        self._attr_target_temperature = float(self.current_target_temp_fn(self.device))
+        self._attr_hvac_mode = self.current_mode_fn(self.device)
+        self._attr_fan_mode = self.current_fan_speed_fn(self.device)
+        if self.vertical_air_direction_select_feature is not None:
+            self._attr_swing_mode = self.current_vertical_air_direction_fn(self.device)
+        if self.horizontal_air_direction_select_feature is not None:
+            self._attr_swing_horizontal_mode = self.current_horizontal_air_direction_fn(
+                self.device
+            )
 
-    @property
-    def swing_horizontal_mode(self) -> str | None:
+    def new_operation(self) -> CompositeOperation:
         self.refresh_device()
-        return self.current_horizontal_air_direction_fn(self.device)
-
-    @property
-    def swing_horizontal_modes(self) -> list[str]:
-        return self._swing_horizontal_modes
+        return CompositeOperation(
+            hass=self.hass, coordinator=self.coordinator, device=self.device
+        )
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
-        self.refresh_device()
-
-        value = kwargs.get(ATTR_TEMPERATURE)
-        await self.iot_handler_temp.call_set_number(value)
-        await self.iot_handler_temp.store_target_temp(value)
-        await self.coordinator.async_refresh()
+        operation = self.new_operation()
+        await operation.async_add_target_temperature(
+            self.iot_handler_temp, kwargs.get(ATTR_TEMPERATURE)
+        )
+        await operation.async_execute()
         self.async_write_ha_state()
 
     async def async_set_swing_mode(self, swing_mode: str) -> None:
         if self.vertical_air_direction_select_feature is not None:
             await self.iot_handler_vertical_air_direction.call_select_option(swing_mode)
-            await self.coordinator.async_refresh()
+            await self.coordinator.async_refresh_after_command(self.device.device_id)
 
     async def async_set_swing_horizontal_mode(self, swing_horizontal_mode: str) -> None:
         if self.horizontal_air_direction_select_feature is not None:
             await self.iot_handler_horizontal_air_direction.call_select_option(
                 swing_horizontal_mode
             )
-            await self.coordinator.async_refresh()
+            await self.coordinator.async_refresh_after_command(self.device.device_id)
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         await self.iot_handler_wind_speed.call_select_option(fan_mode)
-        await self.coordinator.async_refresh()
+        await self.coordinator.async_refresh_after_command(self.device.device_id)
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
+        operation = self.new_operation()
         if hvac_mode == HVACMode.OFF:
-            await self.iot_handler_power.call_switch(0)
+            await operation.async_add_power(self.iot_handler_power, 0)
         else:
-            await self.iot_handler_power.call_switch(1)
-            await self.iot_handler_mode.call_select_option(
-                map_hvac_mode_tcl_mode(hvac_mode)
+            await operation.async_add_power(self.iot_handler_power, 1)
+            await operation.async_add_mode(
+                self.iot_handler_mode, map_hvac_mode_tcl_mode(hvac_mode)
             )
-        await self.coordinator.async_refresh()
+        await operation.async_execute()
 
     async def async_turn_on(self) -> None:
-        await self.iot_handler_power.call_switch(1)
-        await self.coordinator.async_refresh()
+        operation = self.new_operation()
+        await operation.async_add_power(self.iot_handler_power, 1)
+        await operation.async_execute()
 
     async def async_turn_off(self) -> None:
-        await self.iot_handler_power.call_switch(0)
-        await self.coordinator.async_refresh()
+        operation = self.new_operation()
+        await operation.async_add_power(self.iot_handler_power, 0)
+        await operation.async_execute()
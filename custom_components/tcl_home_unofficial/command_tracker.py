@@ -0,0 +1,141 @@
+"""When does a device apply a published desired state.
+
+Every published key is kept with its publish time until a shadow read
+reports that value (acknowledged), a later publish of the same key replaces
+it, or COMMAND_TIMEOUT_SECONDS pass (timed out).
+
+The latency of an acknowledged key is taken from the AWS metadata timestamp
+of the reported key (the time the device reported it, 1 s resolution),
+bounded by the time of the shadow read that saw it, so it does not depend
+on how soon after the publish the shadow is read. A value reported before
+the publish (already set, or the 1 s truncation) is acknowledged without a
+latency sample. There is no push channel, acknowledgements are only seen by
+shadow reads; timeouts are also checked on publish and on
+get_confirmation_delay, so keys of a device that is no longer read expire.
+
+The recent latencies give the delay to wait after a command before the
+confirmation read, see get_confirmation_delay.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+import time
+
+from .shadow_diff import get_section
+
+COMMAND_TIMEOUT_SECONDS = 120
+COMMAND_LATENCY_SAMPLES = 50
+MAX_CONFIRMATION_DELAY_SECONDS = 5.0
+
+
+@dataclass
+class PendingCommandKey:
+    value: object
+    published_at: float
+    published_at_epoch: float
+
+
+@dataclass
+class DeviceCommandStats:
+    acknowledged: int = 0
+    timed_out: int = 0
+    superseded: int = 0
+    last_latency: float | None = None
+    latencies: deque = field(default_factory=lambda: deque(maxlen=COMMAND_LATENCY_SAMPLES))
+    pending: dict[str, PendingCommandKey] = field(default_factory=dict)
+
+    def percentile(self, percent: int) -> float | None:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, (len(ordered) * percent) // 100)
+        return ordered[index]
+
+    def as_dict(self) -> dict:
+        return {
+            "acknowledged": self.acknowledged,
+            "timed_out": self.timed_out,
+            "superseded": self.superseded,
+            "pending": len(self.pending),
+            "last_latency_s": self.last_latency,
+            "p50_latency_s": self.percentile(50),
+            "p95_latency_s": self.percentile(95),
+        }
+
+
+def get_reported_timestamp(metadata_reported: dict, key: str) -> float | None:
+    entry = metadata_reported.get(key)
+    if isinstance(entry, dict) and isinstance(entry.get("timestamp"), (int, float)):
+        return float(entry["timestamp"])
+    return None
+
+
+class CommandTracker:
+    """."""
+
+    def __init__(self, timeout_seconds: float = COMMAND_TIMEOUT_SECONDS) -> None:
+        self.timeout_seconds = timeout_seconds
+        self.devices: dict[str, DeviceCommandStats] = {}
+
+    def get_stats(self, device_id: str) -> DeviceCommandStats:
+        stats = self.devices.get(device_id)
+        if stats is None:
+            stats = self.devices[device_id] = DeviceCommandStats()
+        return stats
+
+    def expire_pending(self, stats: DeviceCommandStats, now: float) -> None:
+        for key, pending in list(stats.pending.items()):
+            if now - pending.published_at > self.timeout_seconds:
+                stats.timed_out += 1
+                del stats.pending[key]
+
+    def record_publish(self, device_id: str, desired_state: dict, now: float | None = None) -> None:
+        now = time.monotonic() if now is None else now
+        now_epoch = time.time()
+        stats = self.get_stats(device_id)
+        self.expire_pending(stats, now)
+        for key, value in desired_state.items():
+            if key in stats.pending:
+                stats.superseded += 1
+            stats.pending[key] = PendingCommandKey(value, now, now_epoch)
+
+    def observe_shadow(self, device_id: str, shadow: dict | None, now: float | None = None) -> None:
+        stats = self.devices.get(device_id)
+        if stats is None or not stats.pending or not shadow:
+            return
+        now = time.monotonic() if now is None else now
+        reported = get_section(shadow, "state", "reported")
+        metadata_reported = get_section(shadow, "metadata", "reported")
+        for key, pending in list(stats.pending.items()):
+            observed_latency = now - pending.published_at
+            if key in reported and reported[key] == pending.value:
+                stats.acknowledged += 1
+                del stats.pending[key]
+                latency = observed_latency
+                reported_at = get_reported_timestamp(metadata_reported, key)
+                if reported_at is not None:
+                    if reported_at < pending.published_at_epoch:
+                        # reported before the publish: no latency to learn from
+                        continue
+                    latency = min(observed_latency, reported_at - pending.published_at_epoch)
+                stats.last_latency = round(latency, 3)
+                stats.latencies.append(stats.last_latency)
+            elif observed_latency > self.timeout_seconds:
+                stats.timed_out += 1
+                del stats.pending[key]
+
+    def get_confirmation_delay(self, device_id: str) -> float:
+        """p75 of the recent latencies of the device, 0 when none is known yet."""
+        stats = self.devices.get(device_id)
+        if stats is None:
+            return 0.0
+        self.expire_pending(stats, time.monotonic())
+        latency = stats.percentile(75)
+        if latency is None:
+            return 0.0
+        return min(MAX_CONFIRMATION_DELAY_SECONDS, latency)
+
+    def snapshot(self) -> dict:
+        return {device_id: stats.as_dict() for device_id, stats in self.devices.items()}
@@ -0,0 +1,100 @@
+"""One desired state document per user action of the climate and humidifier entities.
+
+Setting an hvac mode used to publish the power switch, then the mode with
+the memorized temperature / humidity / fan speed of that mode. Setting a
+temperature published, then saved the temperature of the mode. A
+CompositeOperation collects the desired state of every step, publishes once,
+then records the memorized values (in memory, see device_preferences) and
+refreshes once to read the result back.
+"""
+
+from collections.abc import Callable
+import logging
+
+from homeassistant.core import HomeAssistant
+
+from .coordinator import IotDeviceCoordinator
+from .device import Device
+from .device_enums import DehumidifierModeEnum, ModeEnum
+from .device_preferences import DevicePreferences, get_device_preferences
+from .number import DesiredStateHandlerForNumber
+from .select import DesiredStateHandlerForSelect
+from .switch import DesiredStateHandlerForSwitch
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CompositeOperation:
+    """."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: IotDeviceCoordinator,
+        device: Device,
+    ) -> None:
+        self.hass = hass
+        self.coordinator = coordinator
+        self.device = device
+        self.desired_state: dict = {}
+        self.preferences: DevicePreferences | None = None
+        # applied once the publish succeeded
+        self.preference_updates: list[Callable[[DevicePreferences], None]] = []
+
+    async def async_get_preferences(self) -> DevicePreferences:
+        if self.preferences is None:
+            self.preferences = await get_device_preferences(self.hass, self.device.device_id)
+        return self.preferences
+
+    def add(self, desired_state: dict) -> None:
+        self.desired_state.update(desired_state)
+
+    async def async_add_power(
+        self, handler: DesiredStateHandlerForSwitch, value: int
+    ) -> None:
+        preferences = await self.async_get_preferences()
+        self.add(handler.desired_state(value, preferences))
+
+    async def async_add_mode(
+        self,
+        handler: DesiredStateHandlerForSelect,
+        value: ModeEnum | DehumidifierModeEnum,
+    ) -> None:
+        preferences = await self.async_get_preferences()
+        self.add(handler.desired_state(value, preferences))
+
+    async def async_add_target_temperature(
+        self, handler: DesiredStateHandlerForNumber, value: int | float
+    ) -> bool:
+        desired_state = handler.desired_state_for_number(value)
+        if desired_state is None:
+            return False
+        self.add(desired_state)
+        await self.async_get_preferences()
+        self.preference_updates.append(
+            lambda preferences: handler.set_stored_target_temp(preferences, value)
+        )
+        return True
+
+    async def async_add_humidity(
+        self, handler: DesiredStateHandlerForNumber, value: int | float
+    ) -> bool:
+        desired_state = handler.desired_state_for_number(value)
+        if desired_state is None:
+            return False
+        self.add(desired_state)
+        await self.async_get_preferences()
+        self.preference_updates.append(
+            lambda preferences: handler.set_stored_humidity(preferences, value)
+        )
+        return True
+
+    async def async_execute(self) -> None:
+        """Publish, record the memorized values, then refresh."""
+        if self.desired_state:
+            await self.coordinator.get_aws_iot().async_set_desired_state(
+                self.device.device_id, self.desired_state
+            )
+        for update in self.preference_updates:
+            update(self.preferences)
+        await self.coordinator.async_refresh_after_command(self.device.device_id)
@@ -1,10 +1,10 @@
 """."""
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .device import Device
@@ -26,6 +26,9 @@ class ConfigData:
     verbose_device_logging: bool
     verbose_session_logging: bool
     verbose_setup_logging: bool
+    collect_metrics: bool = False
+    diagnostics_live_probe: bool = False
+    capture_traffic: bool = False
 
 
 @dataclass
@@ -35,6 +38,27 @@ class RuntimeData:
     coordinator: DataUpdateCoordinator
     devices: list[Device] | None = None
     non_implemented_devices: list[Device] | None = None
+    # forwarded to, see platform_planner
+    platforms: list[Platform] = field(default_factory=list)
+
+
+# a new login / endpoint needs a new session; collect_metrics adds or removes
+# the metrics sensors. The other fields are applied to the running entry.
+RELOAD_REQUIRED_FIELDS: tuple[str, ...] = (
+    "username",
+    "password",
+    "app_login_url",
+    "cloud_urls",
+    "app_id",
+    "collect_metrics",
+)
+
+
+def get_reload_required_changes(old: ConfigData, new: ConfigData) -> list[str]:
+    """The RELOAD_REQUIRED_FIELDS that differ between old and new."""
+    return [
+        name for name in RELOAD_REQUIRED_FIELDS if getattr(old, name) != getattr(new, name)
+    ]
 
 
 def buildConfigData(data: dict, fallback: dict = {}):
@@ -53,6 +77,15 @@ def buildConfigData(data: dict, fallback: dict = {}):
         verbose_setup_logging=data.get(
             "verbose_setup_logging", fallback["verbose_setup_logging"]
         ),
+        collect_metrics=data.get(
+            "collect_metrics", fallback.get("collect_metrics", False)
+        ),
+        diagnostics_live_probe=data.get(
+            "diagnostics_live_probe", fallback.get("diagnostics_live_probe", False)
+        ),
+        capture_traffic=data.get(
+            "capture_traffic", fallback.get("capture_traffic", False)
+        ),
     )
     return config
 
@@ -67,6 +100,9 @@ def sanitizeConfigData(config: ConfigData) -> None:
         verbose_device_logging=config.verbose_device_logging,
         verbose_session_logging=config.verbose_session_logging,
         verbose_setup_logging=config.verbose_setup_logging,
+        collect_metrics=config.collect_metrics,
+        diagnostics_live_probe=config.diagnostics_live_probe,
+        capture_traffic=config.capture_traffic,
     )
 
 def asDict(config: ConfigData) -> dict:
@@ -80,6 +116,9 @@ def asDict(config: ConfigData) -> dict:
         "verbose_device_logging": config.verbose_device_logging,
         "verbose_session_logging": config.verbose_session_logging,
         "verbose_setup_logging": config.verbose_setup_logging,
+        "collect_metrics": config.collect_metrics,
+        "diagnostics_live_probe": config.diagnostics_live_probe,
+        "capture_traffic": config.capture_traffic,
     }
 
 def convertToConfigData(
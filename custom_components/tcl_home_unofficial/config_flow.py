@@ -13,7 +13,7 @@ from homeassistant.config_entries import (
     OptionsFlow,
     FlowResult,
 )
-from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.const import CONF_PASSWORD, CONF_SCAN_INTERVAL, CONF_USERNAME
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.schema_config_entry_flow import (
@@ -28,8 +28,10 @@ from .const import (
     DEFAULT_APP_LOGI_URL,
     DEFAULT_APP_CLOUD_URL,
     DEFAULT_PW,
+    DEFAULT_SCAN_INTERVAL,
     DEFAULT_USER,
     DOMAIN,
+    MIN_SCAN_INTERVAL,
 )
 from .session_manager import SessionManager
 
@@ -40,6 +42,9 @@ STEP_LOG_DATA_SCHEMA = vol.Schema(
         vol.Required("verbose_device_logging", default=False): bool,
         vol.Required("verbose_session_logging", default=False): bool,
         vol.Required("verbose_setup_logging", default=False): bool,
+        vol.Required("collect_metrics", default=False): bool,
+        vol.Required("diagnostics_live_probe", default=False): bool,
+        vol.Required("capture_traffic", default=False): bool,
     }
 )
 
@@ -256,6 +261,12 @@ class TclHomeUnofficialOptionsFlowHandler(OptionsFlow):
                 vol.Required("app_login_url", default=data.app_login_url): str,
                 vol.Required("cloud_urls", default=data.cloud_urls): str,
                 vol.Required("app_id", default=data.app_id): str,
+                vol.Required(
+                    CONF_SCAN_INTERVAL,
+                    default=self.config_entry.options.get(
+                        CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=MIN_SCAN_INTERVAL)),
             }
         )
 
@@ -280,6 +291,15 @@ class TclHomeUnofficialOptionsFlowHandler(OptionsFlow):
                 vol.Required(
                     "verbose_setup_logging", default=data.verbose_setup_logging
                 ): bool,
+                vol.Required(
+                    "collect_metrics", default=data.collect_metrics
+                ): bool,
+                vol.Required(
+                    "diagnostics_live_probe", default=data.diagnostics_live_probe
+                ): bool,
+                vol.Required(
+                    "capture_traffic", default=data.capture_traffic
+                ): bool,
             }
         )
 
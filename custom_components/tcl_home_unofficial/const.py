@@ -15,8 +15,21 @@ def get_internal_settings_storege_key() -> str:
     """Get the storage key for a device."""
     return f"{DOMAIN}.internal_settings_storage"
 
+
+def get_device_shape_catalog_storege_key() -> str:
+    """Get the storage key for the discovered device shapes."""
+    return f"{DOMAIN}.device_shape_catalog_storage"
+
 DOMAIN = "tcl_home_unofficial"
 
+FAKE_DATA_INDEX_KEY = f"{DOMAIN}.fake_data_index"
+FAKE_DATA_CHECK_INTERVAL_SECONDS = 10
+
+DEVICE_SHAPE_CATALOG_KEY = f"{DOMAIN}.device_shape_catalog"
+
+DEVICE_STORAGE_CACHE_KEY = f"{DOMAIN}.device_storage_cache"
+DEVICE_STORAGE_SAVE_DELAY_SECONDS = 10
+
 
 DEFAULT_APP_LOGI_URL = "https://pa.account.tcl.com/account/login?clientId=54148614"
 DEFAULT_APP_CLOUD_URL = "https://prod-center.aws.tcljd.com/v3/global/cloud_url_get"
@@ -28,3 +41,17 @@ DEFAULT_PW = ""
 
 DEFAULT_SCAN_INTERVAL = 60
 MIN_SCAN_INTERVAL = 10
+
+DEFAULT_REQUEST_RATE_PER_SECOND = 2.0
+DEFAULT_REQUEST_BURST = 20
+COMMAND_RESERVED_TOKENS = 4
+REQUEST_BACKOFF_BASE_SECONDS = 5
+REQUEST_BACKOFF_MAX_SECONDS = 300
+
+TRAFFIC_CAPTURE_MAX_FILE_BYTES = 20 * 1024 * 1024
+TRAFFIC_CAPTURE_MAX_FILES = 10
+TRAFFIC_CAPTURE_FLUSH_EVERY_RECORDS = 50
+
+SERVICE_BULK_COMMAND = "bulk_command"
+BULK_COMMAND_DEFAULT_CONCURRENCY = 4
+BULK_COMMAND_MAX_CONCURRENCY = 10
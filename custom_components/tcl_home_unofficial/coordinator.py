@@ -1,10 +1,12 @@
 """."""
 
+import asyncio
 from datetime import timedelta  # noqa: I001
+import json
 import logging
 from typing import Any
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_SCAN_INTERVAL
@@ -13,16 +15,55 @@ from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, Upda
 
 from .aws_iot import AwsIot
 from .const import DEFAULT_SCAN_INTERVAL, DOMAIN
-from .device import Device
+from .device import Device, async_save_device_shape_catalog
+from .device_shape_catalog import DeviceShapeCatalog
 from .data_storage import get_stored_data
 from .config_entry import ConfigData
+from .shadow_diff import FlatShadow, diff_reported, get_section
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def get_storage_snapshot(storage: dict | None) -> str:
+    # entities mutate device.storage in place before refreshing, so compare a frozen copy
+    return json.dumps(storage, sort_keys=True, default=str)
+
+
+def detect_device_changes(prev: Device | None, device: Device) -> None:
+    """Mark whether anything an entity renders from differs from the previous poll."""
+    device.compared_to = prev
+    device.flat_shadow = FlatShadow(
+        device.aws_thing, previous=prev.flat_shadow if prev is not None else None
+    )
+    device.storage_snapshot = get_storage_snapshot(device.storage)
+    if prev is None:
+        device.shadow_diff = None
+        device.has_changes = True
+        return
+    device.shadow_diff = diff_reported(
+        prev.flat_shadow or prev.aws_thing, device.flat_shadow
+    )
+    device.has_changes = (
+        device.shadow_diff.has_changes
+        or prev.is_online != device.is_online
+        or prev.supported_features != device.supported_features
+        or get_section(prev.aws_thing, "state", "delta")
+        != get_section(device.aws_thing, "state", "delta")
+        or prev.extra_tcl_data != device.extra_tcl_data
+        or prev.storage_snapshot != device.storage_snapshot
+    )
+    # keep one generation only, otherwise every poll stays reachable
+    prev.compared_to = None
+
+
 @dataclass
 class IotDeviceCoordinatorData:
     devices: list[Device]
+    # every entity looks its device up on every update
+    devices_by_id: dict[str, Device] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.devices_by_id = {device.device_id: device for device in self.devices}
 
 
 class IotDeviceCoordinator(DataUpdateCoordinator):
@@ -31,12 +72,17 @@ class IotDeviceCoordinator(DataUpdateCoordinator):
     data: IotDeviceCoordinatorData
 
     def __init__(
-        self, hass: HomeAssistant, config_entry: ConfigEntry, aws_iot: AwsIot
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        aws_iot: AwsIot,
+        shape_catalog: DeviceShapeCatalog | None = None,
     ) -> None:
         """Initialize coordinator."""
 
         self.hass = hass
         self.aws_iot = aws_iot
+        self.shape_catalog = shape_catalog
         self.poll_interval = config_entry.options.get(
             CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
         )
@@ -48,6 +94,14 @@ class IotDeviceCoordinator(DataUpdateCoordinator):
             update_interval=timedelta(seconds=self.poll_interval),
         )
 
+    def set_poll_interval(self, poll_interval: int) -> None:
+        """Takes effect from the next scheduled refresh."""
+        if poll_interval == self.poll_interval:
+            return
+        _LOGGER.info("IotDeviceCoordinator poll interval: %ss", poll_interval)
+        self.poll_interval = poll_interval
+        self.update_interval = timedelta(seconds=poll_interval)
+
     def get_aws_iot(self) -> AwsIot:
         """Return the AwsIot instance."""
         return self.aws_iot
@@ -60,6 +114,11 @@ class IotDeviceCoordinator(DataUpdateCoordinator):
         """Fetch data"""
 
         devices = []
+        prev_devices = (
+            {device.device_id: device for device in self.data.devices}
+            if self.data is not None
+            else {}
+        )
         try:
             tcl_things = await self.aws_iot.get_all_things()
             for tcl_thing in tcl_things.data:
@@ -75,22 +134,37 @@ class IotDeviceCoordinator(DataUpdateCoordinator):
                     tcl_thing=tcl_thing,
                     aws_thing=aws_thing,
                     device_storage=storage,
-                    extra_tcl_data=extra_tcl_data
-                )                
+                    extra_tcl_data=extra_tcl_data,
+                    shape_catalog=self.shape_catalog,
+                )
+                detect_device_changes(prev_devices.get(d.device_id), d)
                 devices.append(d)
         except Exception as err:
             raise UpdateFailed(f"Error communicating with API: {err}") from err
 
+        if self.shape_catalog is not None:
+            await async_save_device_shape_catalog(self.hass, self.shape_catalog)
+
         return IotDeviceCoordinatorData(devices)
 
+    async def async_refresh_after_command(self, device_id: str) -> None:
+        """Confirmation read, delayed by how long the device usually takes to apply a command."""
+        await self.async_refresh_after_commands([device_id])
+
+    async def async_refresh_after_commands(self, device_ids: list[str]) -> None:
+        """One confirmation read for commands sent to several devices."""
+        command_tracker = self.aws_iot.get_command_tracker()
+        delay = max(
+            (command_tracker.get_confirmation_delay(device_id) for device_id in device_ids),
+            default=0.0,
+        )
+        if delay > 0:
+            await asyncio.sleep(delay)
+        await self.async_refresh()
+
     def get_device_by_id(self, device_id: str) -> Device | None:
         """Return device by device id."""
-        try:
-            return [
-                device for device in self.data.devices if device.device_id == device_id
-            ][0]
-        except IndexError:
-            return None
+        return self.data.devices_by_id.get(device_id)
 
     def set_device(self, device: Device) -> None:
         """Set device in coordinator data."""
@@ -100,3 +174,4 @@ class IotDeviceCoordinator(DataUpdateCoordinator):
                 break
         else:
             self.data.devices.append(device)
+        self.data.devices_by_id[device.device_id] = device
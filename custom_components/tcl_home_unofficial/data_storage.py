@@ -1,9 +1,18 @@
 """."""
 
+from dataclasses import dataclass
 from homeassistant.core import HomeAssistant
 import logging
 from homeassistant.helpers import storage
-from .const import DOMAIN, get_device_data_storege_key, get_internal_settings_storege_key
+from .const import (
+    DEVICE_STORAGE_CACHE_KEY,
+    DEVICE_STORAGE_SAVE_DELAY_SECONDS,
+    DOMAIN,
+    FAKE_DATA_INDEX_KEY,
+    get_device_data_storege_key,
+    get_device_shape_catalog_storege_key,
+    get_internal_settings_storege_key,
+)
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -40,48 +49,105 @@ async def set_internal_settings(
         "device_data_storage.set_stored_data %s - %s + %s", key, data, data_to_set
     )
     await data_storage.async_save(data=data_to_store)
+    # fakes_for_debug rebuilds its index from the new settings
+    hass.data.pop(FAKE_DATA_INDEX_KEY, None)
 
     return data_to_store
 
-async def get_stored_data(hass: HomeAssistant, device_id: str) -> dict[str, any] | None:
-    """Get stored data for a device."""
-    key = get_device_data_storege_key(device_id)
+async def get_device_shape_catalog_data(hass: HomeAssistant) -> dict[str, any] | None:
+    key = get_device_shape_catalog_storege_key()
     data_storage: storage.Store[dict] = storage.Store(hass=hass, version=1, key=key)
-    
-    data = await data_storage.async_load()
-    _LOGGER.debug("device_data_storage.get_stored_data %s - %s", key, data)
+    return await data_storage.async_load()
 
-    return data
+async def set_device_shape_catalog_data(hass: HomeAssistant, data: dict[str, any]) -> None:
+    key = get_device_shape_catalog_storege_key()
+    data_storage: storage.Store[dict] = storage.Store(hass=hass, version=1, key=key)
+    await data_storage.async_save(data=data)
+
+async def delete_device_shape_catalog_file(hass: HomeAssistant) -> None:
+    key = get_device_shape_catalog_storege_key()
+    data_storage: storage.Store[dict] = storage.Store(hass=hass, version=1, key=key)
+    await data_storage.async_remove()
+
+@dataclass
+class CachedDeviceStorage:
+    store: storage.Store
+    data: dict[str, any] | None
+
+
+def get_device_storage_cache(hass: HomeAssistant) -> dict[str, CachedDeviceStorage]:
+    return hass.data.setdefault(DEVICE_STORAGE_CACHE_KEY, {})
+
+
+async def get_cached_device_storage(hass: HomeAssistant, device_id: str) -> CachedDeviceStorage:
+    """The device storage document, read from disk only the first time."""
+    cache = get_device_storage_cache(hass)
+    cached = cache.get(device_id)
+    if cached is None:
+        key = get_device_data_storege_key(device_id)
+        data_storage: storage.Store[dict] = storage.Store(hass=hass, version=1, key=key)
+        data = await data_storage.async_load()
+        _LOGGER.debug("device_data_storage.get_stored_data %s - %s", key, data)
+        # a concurrent caller may have loaded it meanwhile, keep the first one
+        cached = cache.setdefault(device_id, CachedDeviceStorage(data_storage, data))
+    return cached
+
+
+async def get_stored_data(hass: HomeAssistant, device_id: str) -> dict[str, any] | None:
+    """Get stored data for a device.
+
+    This is the cached document itself, not a copy: changes made to it are
+    persisted by the next set_stored_data / schedule_save_stored_data.
+    """
+    cached = await get_cached_device_storage(hass, device_id)
+    return cached.data
 
 
 async def set_stored_data(
     hass: HomeAssistant, device_id: str, data_to_set: dict[str, any]
 ) -> dict[str, any] | None:
     """Set the stored data for a device. This will merge the values with the existing data."""
-    key = get_device_data_storege_key(device_id)
-    data_storage: storage.Store[dict] = storage.Store(hass=hass, version=1, key=key)
-    data = await data_storage.async_load()
-
-    data_to_store = {**data, **data_to_set} if data is not None else data_to_set
-
+    cached = await get_cached_device_storage(hass, device_id)
     _LOGGER.debug(
-        "device_data_storage.set_stored_data %s - %s + %s", key, data, data_to_set
+        "device_data_storage.set_stored_data %s - %s + %s", device_id, cached.data, data_to_set
     )
-    await data_storage.async_save(data=data_to_store)
+    if cached.data is None:
+        cached.data = data_to_set
+    elif cached.data is not data_to_set:
+        cached.data.update(data_to_set)
+    await cached.store.async_save(data=cached.data)
 
-    return data_to_store
+    return cached.data
+
+
+def schedule_save_stored_data(
+    hass: HomeAssistant, device_id: str, data: dict[str, any] | None = None
+) -> None:
+    """Persist the cached document of a device a few seconds later; repeated calls are coalesced.
+
+    data replaces the cached document, for one created by safe_set_value.
+    """
+    cached = get_device_storage_cache(hass).get(device_id)
+    if cached is None:
+        return
+    if data is not None:
+        cached.data = data
+    cached.store.async_delay_save(lambda: cached.data, DEVICE_STORAGE_SAVE_DELAY_SECONDS)
 
 
 async def delete_stored_data(hass: HomeAssistant, device_id: str) -> None:
     """Delete the stored data for a device."""
-    key = get_device_data_storege_key(device_id)
-    data_storage: storage.Store[dict] = storage.Store(hass=hass, version=1, key=key)
-
-    _LOGGER.debug("device_data_storage.delete_stored_data %s", key)
-    await data_storage.async_save(data=None)
+    cached = await get_cached_device_storage(hass, device_id)
+    _LOGGER.debug("device_data_storage.delete_stored_data %s", device_id)
+    cached.data = None
+    await cached.store.async_save(data=None)
 
 async def delete_device_stored_file(hass: HomeAssistant, device_id: str) -> None:
     """Delete the stored data file for a device."""
+    cached = get_device_storage_cache(hass).pop(device_id, None)
+    if cached is not None:
+        await cached.store.async_remove()
+        return
     key = get_device_data_storege_key(device_id)
     data_storage: storage.Store[dict] = storage.Store(hass=hass, version=1, key=key)
     await data_storage.async_remove()
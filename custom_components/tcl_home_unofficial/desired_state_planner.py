@@ -0,0 +1,95 @@
+"""Drop desired state keys the device already has before publishing.
+
+AwsIot keeps, per device, state.reported and state.delta of the last shadow
+it read and the keys it published since. A key is dropped from a desired
+state when its value equals the known one:
+- the value published since the last read, if any;
+- else the desired value, while it is in state.delta (not applied yet);
+- else the reported value.
+When no key is left the publish is skipped.
+
+Known state older than KNOWN_STATE_MAX_AGE_SECONDS is not used, so a change
+made with the remote or the app since the last poll cannot hide a command
+for long. Every action refreshes, so the known state is fresh after it.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import time
+
+from .shadow_diff import get_section
+
+KNOWN_STATE_MAX_AGE_SECONDS = 60
+
+
+@dataclass
+class KnownDeviceState:
+    reported: dict
+    delta: dict
+    read_at: float
+    pending: dict = field(default_factory=dict)
+
+    def get(self, key: str, default):
+        if key in self.pending:
+            return self.pending[key]
+        if key in self.delta:
+            return self.delta[key]
+        return self.reported.get(key, default)
+
+
+_UNKNOWN = object()
+
+
+class DesiredStatePlanner:
+    """."""
+
+    def __init__(self, max_age_seconds: float = KNOWN_STATE_MAX_AGE_SECONDS) -> None:
+        self.max_age_seconds = max_age_seconds
+        self.known_states: dict[str, KnownDeviceState] = {}
+
+    def observe_shadow(self, device_id: str, shadow: dict | None, now: float | None = None) -> None:
+        """A shadow was read: it replaces everything known about the device."""
+        if not shadow:
+            self.known_states.pop(device_id, None)
+            return
+        self.known_states[device_id] = KnownDeviceState(
+            reported=get_section(shadow, "state", "reported"),
+            delta=get_section(shadow, "state", "delta"),
+            read_at=time.monotonic() if now is None else now,
+        )
+
+    def observe_publish(self, device_id: str, desired_state: dict) -> None:
+        known_state = self.known_states.get(device_id)
+        if known_state is not None:
+            known_state.pending.update(desired_state)
+
+    def get_known_state(self, device_id: str, now: float | None = None) -> KnownDeviceState | None:
+        known_state = self.known_states.get(device_id)
+        if known_state is None:
+            return None
+        now = time.monotonic() if now is None else now
+        if now - known_state.read_at > self.max_age_seconds:
+            return None
+        return known_state
+
+    def plan(self, device_id: str, desired_state: dict, now: float | None = None) -> dict:
+        """The keys of desired_state that change something, all of them when the state is unknown."""
+        known_state = self.get_known_state(device_id, now)
+        if known_state is None:
+            return desired_state
+        return {
+            key: value
+            for key, value in desired_state.items()
+            if known_state.get(key, _UNKNOWN) != value
+        }
+
+    def snapshot(self) -> dict:
+        now = time.monotonic()
+        return {
+            device_id: {
+                "age_seconds": round(now - known_state.read_at, 1),
+                "pending": known_state.pending,
+            }
+            for device_id, known_state in self.known_states.items()
+        }
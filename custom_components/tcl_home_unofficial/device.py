@@ -6,13 +6,22 @@ import logging
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 
-from .const import DOMAIN
-from .data_storage import get_stored_data, safe_set_value, set_stored_data
-from .device_capabilities import DeviceCapabilityEnum, get_capabilities
-from .device_enums import (AirPurifierFanWindSpeedStrEnum,
+from .const import DEVICE_SHAPE_CATALOG_KEY, DOMAIN
+from .data_storage import (
+    get_device_shape_catalog_data,
+    get_stored_data,
+    safe_set_value,
+    set_device_shape_catalog_data,
+    set_stored_data,
+)
+from .device_capabilities import DeviceCapabilitySet, get_capabilities
+from .device_enums import (PORTABLE_WIND_4VALUE_SEED_CODECS,
+                           PORTABLE_WIND_SEED_CODECS,
+                           AirPurifierFanWindSpeedStrEnum,
                            AirPurifierWorkModeStrEnum, DehumidifierModeEnum,
-                           ModeEnum)
-from .device_features import DeviceFeatureEnum, getSupportedFeatures
+                           EnumCodec, ModeEnum)
+from .device_features import DeviceFeatureEnum, DeviceFeatureSet, getSupportedFeatures
+from .device_shape_catalog import DeviceShapeCatalog, load_builtin_shapes
 from .device_types import DeviceTypeEnum, calculateDeviceType
 from .tcl import GetThingsResponseData
 from .tcl_device_breeva import TCL_Breeva_DeviceData, get_stored_breeva_data
@@ -50,6 +59,7 @@ class Device:
         tcl_thing: GetThingsResponseData | None = None,
         device_storage: dict | None = None,
         extra_tcl_data: dict | None = None,
+        shape_catalog: DeviceShapeCatalog | None = None,
     ) -> None:
         self.device_id = "noId"
         self.product_key = None
@@ -59,12 +69,20 @@ class Device:
         self.firmware_version = "noVersion"
         self.has_aws_thing = "false"
         self.capabilities_str = ""
-        self.capabilities = []
-        self.supported_features = []
+        self.capabilities = DeviceCapabilitySet()
+        self.supported_features = DeviceFeatureSet()
         self.mode_enum_to_value_mapp = {}
         self.mode_value_to_enum_mapp = {}
         self.is_online = False
         self.extra_tcl_data = extra_tcl_data if extra_tcl_data is not None else {}
+        self.tcl_thing = tcl_thing
+        self.aws_thing = aws_thing
+        # set by the coordinator's change detection
+        self.has_changes = True
+        self.compared_to = None
+        self.shadow_diff = None
+        self.flat_shadow = None
+        self.storage_snapshot = None
         if tcl_thing is not None:
             self.is_online = tcl_thing.is_online
             self.product_key = tcl_thing.product_key
@@ -81,11 +99,20 @@ class Device:
                 if "state" in aws_thing:
                     if "reported" in aws_thing["state"]:
                         try:
-                            self.supported_features = getSupportedFeatures(
-                                self.device_type,
-                                aws_thing["state"]["reported"],
-                                self.storage,
-                            )
+                            if shape_catalog is not None:
+                                self.supported_features = shape_catalog.resolve(
+                                    self.device_type,
+                                    aws_thing["state"]["reported"],
+                                    self.storage,
+                                )
+                            else:
+                                self.supported_features = DeviceFeatureSet(
+                                    getSupportedFeatures(
+                                        self.device_type,
+                                        aws_thing["state"]["reported"],
+                                        self.storage,
+                                    )
+                                )
                         except Exception as e:
                             _LOGGER.error("Error while getSupportedFeatures for device %s: %s",self.device_id,str(e),)
                             raise e
@@ -168,9 +195,14 @@ class Device:
         else:
             self.data = None
 
+        # the codec variant of this device, so entities decode with one dict lookup
+        has_auto_mode = DeviceFeatureEnum.MODE_AC_AUTO in self.supported_features
+        self.portable_wind_seed_codec = PORTABLE_WIND_SEED_CODECS[has_auto_mode]
+        self.portable_wind_4value_seed_codec = PORTABLE_WIND_4VALUE_SEED_CODECS[has_auto_mode]
+
     capabilities_str: str
-    capabilities: list[DeviceCapabilityEnum]
-    supported_features: list[DeviceFeatureEnum]
+    capabilities: DeviceCapabilitySet
+    supported_features: DeviceFeatureSet
     device_id: int
     device_type: str
     device_type_str: str
@@ -182,6 +214,8 @@ class Device:
     storage: dict[str, any]
     mode_enum_to_value_mapp: dict[str, int]
     mode_value_to_enum_mapp: dict[int, str]
+    portable_wind_seed_codec: EnumCodec
+    portable_wind_4value_seed_codec: EnumCodec
     extra_tcl_data: dict
     data: (
         TCL_SplitAC_DeviceData
@@ -351,6 +385,25 @@ def toDeviceInfo(device: Device) -> DeviceInfo:
     )
 
 
+async def async_get_device_shape_catalog(hass: HomeAssistant) -> DeviceShapeCatalog:
+    """Load once per Home Assistant run: device_shapes.json, then the discovered shapes."""
+    catalog: DeviceShapeCatalog | None = hass.data.get(DEVICE_SHAPE_CATALOG_KEY)
+    if catalog is None:
+        catalog = DeviceShapeCatalog()
+        catalog.load(await hass.async_add_executor_job(load_builtin_shapes), discovered=False)
+        changed = catalog.load(await get_device_shape_catalog_data(hass), discovered=True)
+        if changed:
+            _LOGGER.info("DeviceShapeCatalog: features changed for %s stored shapes", changed)
+        hass.data[DEVICE_SHAPE_CATALOG_KEY] = catalog
+    return catalog
+
+
+async def async_save_device_shape_catalog(hass: HomeAssistant, catalog: DeviceShapeCatalog) -> None:
+    if catalog.dirty:
+        catalog.dirty = False
+        await set_device_shape_catalog_data(hass, catalog.discovered_as_dict())
+
+
 async def get_device_storage(hass: HomeAssistant, device: Device) -> None:
     if device.device_type == DeviceTypeEnum.SPLIT_AC_FRESH_AIR:
         return await get_stored_spit_ac_fresh_data(hass, device.device_id)
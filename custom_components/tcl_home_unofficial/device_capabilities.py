@@ -1,5 +1,7 @@
 from enum import IntEnum
 
+from .enum_bitset import EnumBitSet
+
 class DeviceCapabilityEnum(IntEnum):
     CAPABILITY_01 = 1
     CAPABILITY_02 = 2
@@ -53,12 +55,40 @@ class DeviceCapabilityEnum(IntEnum):
     CAPABILITY_50 = 50
 
 
-def get_capabilities(aws_capabilities: list[int]) -> list[DeviceCapabilityEnum]:    
-    return aws_capabilities
+class DeviceCapabilitySet(EnumBitSet):
+    """Frozen set of capabilities, the bit position is the capability number.
+
+    The shadow may report numbers DeviceCapabilityEnum does not know yet, those
+    are kept as plain ints.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def bit_of(cls, member) -> int:
+        if not isinstance(member, int) or member < 0:
+            raise ValueError(f"{member!r} is not a valid capability")
+        return 1 << member
+
+    @classmethod
+    def member_of(cls, position: int) -> DeviceCapabilityEnum | int:
+        try:
+            return DeviceCapabilityEnum(position)
+        except ValueError:
+            return position
 
+    def __contains__(self, member) -> bool:
+        return isinstance(member, int) and member >= 0 and bool(self.mask >> member & 1)
 
-def is_all_capabilities_implemented(capabilities: list[DeviceCapabilityEnum]) -> bool:
-    implemented_capabilities = [
+
+def get_capabilities(aws_capabilities: list[int]) -> DeviceCapabilitySet:
+    return DeviceCapabilitySet(
+        capability for capability in aws_capabilities if isinstance(capability, int) and capability >= 0
+    )
+
+
+IMPLEMENTED_CAPABILITIES = DeviceCapabilitySet(
+    [
         DeviceCapabilityEnum.CAPABILITY_02,
         DeviceCapabilityEnum.CAPABILITY_03,
         DeviceCapabilityEnum.CAPABILITY_SOFT_WIND,
@@ -84,4 +114,8 @@ def is_all_capabilities_implemented(capabilities: list[DeviceCapabilityEnum]) ->
         DeviceCapabilityEnum.CAPABILITY_43,
         DeviceCapabilityEnum.CAPABILITY_48,
     ]
-    return all(capability in capabilities for capability in implemented_capabilities)
+)
+
+
+def is_all_capabilities_implemented(capabilities: DeviceCapabilitySet) -> bool:
+    return IMPLEMENTED_CAPABILITIES <= capabilities
@@ -6,6 +6,27 @@ from enum import StrEnum
 _LOGGER = logging.getLogger(__name__)
 
 
+class EnumCodec:
+    """Shadow value <-> label tables for one select, built once at import."""
+
+    __slots__ = ("by_label", "by_value", "default", "enum", "options")
+
+    def __init__(
+        self, enum: type[StrEnum], by_value: dict[int, StrEnum], default: StrEnum | None = None
+    ) -> None:
+        self.enum = enum
+        self.by_value = by_value
+        self.by_label = {label: value for value, label in by_value.items()}
+        self.default = default
+        self.options = tuple(member.value for member in enum)
+
+    def decode(self, value: int | float) -> StrEnum | None:
+        return self.by_value.get(value, self.default)
+
+    def encode(self, label: str) -> int | None:
+        return self.by_label.get(label)
+
+
 class ModeEnum(StrEnum):
     COOL = "Cool"
     HEAT = "Heat"
@@ -33,28 +54,29 @@ class UpAndDownAirSupplyVectorEnum(StrEnum):
     NOT_SET = "Not set"
 
 
+UP_AND_DOWN_AIR_SUPPLY_VECTOR_CODEC = EnumCodec(
+    UpAndDownAirSupplyVectorEnum,
+    {
+        1: UpAndDownAirSupplyVectorEnum.UP_AND_DOWN_SWING,
+        2: UpAndDownAirSupplyVectorEnum.UPWARDS_SWING,
+        3: UpAndDownAirSupplyVectorEnum.DOWNWARDS_SWING,
+        8: UpAndDownAirSupplyVectorEnum.NOT_SET,
+        9: UpAndDownAirSupplyVectorEnum.TOP_FIX,
+        10: UpAndDownAirSupplyVectorEnum.UPPER_FIX,
+        11: UpAndDownAirSupplyVectorEnum.MIDDLE_FIX,
+        12: UpAndDownAirSupplyVectorEnum.LOWER_FIX,
+        13: UpAndDownAirSupplyVectorEnum.BOTTOM_FIX,
+    },
+)
+
+# verticalDirection / horizontalDirection values that make the vane swing
+SWING_DIRECTIONS = frozenset({1, 2, 3, 4})
+
+
 def getUpAndDownAirSupplyVector(
     vertical_direction: int | float,
 ) -> UpAndDownAirSupplyVectorEnum:
-    match vertical_direction:
-        case 1:
-            return UpAndDownAirSupplyVectorEnum.UP_AND_DOWN_SWING
-        case 2:
-            return UpAndDownAirSupplyVectorEnum.UPWARDS_SWING
-        case 3:
-            return UpAndDownAirSupplyVectorEnum.DOWNWARDS_SWING
-        case 8:
-            return UpAndDownAirSupplyVectorEnum.NOT_SET
-        case 9:
-            return UpAndDownAirSupplyVectorEnum.TOP_FIX
-        case 10:
-            return UpAndDownAirSupplyVectorEnum.UPPER_FIX
-        case 11:
-            return UpAndDownAirSupplyVectorEnum.MIDDLE_FIX
-        case 12:
-            return UpAndDownAirSupplyVectorEnum.LOWER_FIX
-        case 13:
-            return UpAndDownAirSupplyVectorEnum.BOTTOM_FIX
+    return UP_AND_DOWN_AIR_SUPPLY_VECTOR_CODEC.decode(vertical_direction)
 
 
 class LeftAndRightAirSupplyVectorEnum(StrEnum):
@@ -70,30 +92,27 @@ class LeftAndRightAirSupplyVectorEnum(StrEnum):
     NOT_SET = "Not set"
 
 
+LEFT_AND_RIGHT_AIR_SUPPLY_VECTOR_CODEC = EnumCodec(
+    LeftAndRightAirSupplyVectorEnum,
+    {
+        1: LeftAndRightAirSupplyVectorEnum.LEFT_AND_RIGHT_SWING,
+        2: LeftAndRightAirSupplyVectorEnum.LEFT_SWING,
+        3: LeftAndRightAirSupplyVectorEnum.MIDDLE_SWING,
+        4: LeftAndRightAirSupplyVectorEnum.RIGHT_SWING,
+        8: LeftAndRightAirSupplyVectorEnum.NOT_SET,
+        9: LeftAndRightAirSupplyVectorEnum.LEFT_FIX,
+        10: LeftAndRightAirSupplyVectorEnum.CENTER_LEFT_FIX,
+        11: LeftAndRightAirSupplyVectorEnum.MIDDLE_FIX,
+        12: LeftAndRightAirSupplyVectorEnum.CENTER_RIGHT_FIX,
+        13: LeftAndRightAirSupplyVectorEnum.RIGHT_FIX,
+    },
+)
+
+
 def getLeftAndRightAirSupplyVector(
     horizontal_direction: int | float,
 ) -> LeftAndRightAirSupplyVectorEnum:
-    match horizontal_direction:
-        case 1:
-            return LeftAndRightAirSupplyVectorEnum.LEFT_AND_RIGHT_SWING
-        case 2:
-            return LeftAndRightAirSupplyVectorEnum.LEFT_SWING
-        case 3:
-            return LeftAndRightAirSupplyVectorEnum.MIDDLE_SWING
-        case 4:
-            return LeftAndRightAirSupplyVectorEnum.RIGHT_SWING
-        case 8:
-            return LeftAndRightAirSupplyVectorEnum.NOT_SET
-        case 9:
-            return LeftAndRightAirSupplyVectorEnum.LEFT_FIX
-        case 10:
-            return LeftAndRightAirSupplyVectorEnum.CENTER_LEFT_FIX
-        case 11:
-            return LeftAndRightAirSupplyVectorEnum.MIDDLE_FIX
-        case 12:
-            return LeftAndRightAirSupplyVectorEnum.CENTER_RIGHT_FIX
-        case 13:
-            return LeftAndRightAirSupplyVectorEnum.RIGHT_FIX
+    return LEFT_AND_RIGHT_AIR_SUPPLY_VECTOR_CODEC.decode(horizontal_direction)
 
 
 class SleepModeEnum(StrEnum):
@@ -103,16 +122,19 @@ class SleepModeEnum(StrEnum):
     OFF = "off"
 
 
+SLEEP_MODE_CODEC = EnumCodec(
+    SleepModeEnum,
+    {
+        1: SleepModeEnum.STANDARD,
+        2: SleepModeEnum.ELDERLY,
+        3: SleepModeEnum.CHILD,
+        0: SleepModeEnum.OFF,
+    },
+)
+
+
 def getSleepMode(sleep: int | float) -> SleepModeEnum:
-    match sleep:
-        case 1:
-            return SleepModeEnum.STANDARD
-        case 2:
-            return SleepModeEnum.ELDERLY
-        case 3:
-            return SleepModeEnum.CHILD
-        case 0:
-            return SleepModeEnum.OFF
+    return SLEEP_MODE_CODEC.decode(sleep)
 
 
 class WindSeed7GearEnum(StrEnum):
@@ -126,26 +148,24 @@ class WindSeed7GearEnum(StrEnum):
     SPEED_6 = "6"
 
 
+WIND_SEED_7_GEAR_CODEC = EnumCodec(
+    WindSeed7GearEnum,
+    {
+        1: WindSeed7GearEnum.SPEED_1,
+        2: WindSeed7GearEnum.SPEED_2,
+        3: WindSeed7GearEnum.SPEED_3,
+        4: WindSeed7GearEnum.SPEED_4,
+        5: WindSeed7GearEnum.SPEED_5,
+        6: WindSeed7GearEnum.SPEED_6,
+        7: WindSeed7GearEnum.TURBO,
+        0: WindSeed7GearEnum.AUTO,
+    },
+    default=WindSeed7GearEnum.AUTO,
+)
+
+
 def getWindSeed7Gear(wind_speed_7_gear: int) -> WindSeed7GearEnum:
-    match wind_speed_7_gear:
-        case 1:
-            return WindSeed7GearEnum.SPEED_1
-        case 2:
-            return WindSeed7GearEnum.SPEED_2
-        case 3:
-            return WindSeed7GearEnum.SPEED_3
-        case 4:
-            return WindSeed7GearEnum.SPEED_4
-        case 5:
-            return WindSeed7GearEnum.SPEED_5
-        case 6:
-            return WindSeed7GearEnum.SPEED_6
-        case 7:
-            return WindSeed7GearEnum.TURBO
-        case 0:
-            return WindSeed7GearEnum.AUTO
-        case _:
-            return WindSeed7GearEnum.AUTO
+    return WIND_SEED_7_GEAR_CODEC.decode(wind_speed_7_gear)
 
 
 class WindSeedEnum(StrEnum):
@@ -159,22 +179,27 @@ class WindSeedEnum(StrEnum):
     AUTO = "Auto"
 
 
+# windSpeed alone; STRONG and MUTE also need turbo / silenceSwitch, see getWindSpeed
+WIND_SPEED_CODEC = EnumCodec(
+    WindSeedEnum,
+    {
+        6: WindSeedEnum.HIGH,
+        5: WindSeedEnum.MID_HIGH,
+        4: WindSeedEnum.MEDIUM,
+        3: WindSeedEnum.MID_LOW,
+        2: WindSeedEnum.LOW,
+        0: WindSeedEnum.AUTO,
+    },
+    default=WindSeedEnum.AUTO,
+)
+
+
 def getWindSpeed(wind_speed: int, turbo: int, silence_switch: int) -> WindSeedEnum:
-    match wind_speed:
-        case 6:
-            return WindSeedEnum.STRONG if turbo == 1 else WindSeedEnum.HIGH
-        case 5:
-            return WindSeedEnum.MID_HIGH
-        case 4:
-            return WindSeedEnum.MEDIUM
-        case 3:
-            return WindSeedEnum.MID_LOW
-        case 2:
-            return WindSeedEnum.MUTE if silence_switch == 1 else WindSeedEnum.LOW
-        case 0:
-            return WindSeedEnum.AUTO
-        case _:
-            return WindSeedEnum.AUTO
+    if wind_speed == 6 and turbo == 1:
+        return WindSeedEnum.STRONG
+    if wind_speed == 2 and silence_switch == 1:
+        return WindSeedEnum.MUTE
+    return WIND_SPEED_CODEC.decode(wind_speed)
 
 
 class PortableWindSeedEnum(StrEnum):
@@ -183,25 +208,30 @@ class PortableWindSeedEnum(StrEnum):
     AUTO = "Auto"
 
 
+# by has_auto_mode: without an auto mode the speeds shift down by one
+PORTABLE_WIND_SEED_CODECS = {
+    True: EnumCodec(
+        PortableWindSeedEnum,
+        {
+            2: PortableWindSeedEnum.HIGH,
+            1: PortableWindSeedEnum.LOW,
+            0: PortableWindSeedEnum.AUTO,
+        },
+        default=PortableWindSeedEnum.AUTO,
+    ),
+    False: EnumCodec(
+        PortableWindSeedEnum,
+        {
+            1: PortableWindSeedEnum.HIGH,
+            0: PortableWindSeedEnum.LOW,
+        },
+        default=PortableWindSeedEnum.LOW,
+    ),
+}
+
+
 def getPortableWindSeed(wind_speed: int, has_auto_mode: bool) -> PortableWindSeedEnum:
-    if has_auto_mode:
-        match wind_speed:
-            case 2:
-                return PortableWindSeedEnum.HIGH
-            case 1:
-                return PortableWindSeedEnum.LOW
-            case 0:
-                return PortableWindSeedEnum.AUTO
-            case _:
-                return PortableWindSeedEnum.AUTO
-    else:
-        match wind_speed:
-            case 1:
-                return PortableWindSeedEnum.HIGH
-            case 0:
-                return PortableWindSeedEnum.LOW
-            case _:
-                return PortableWindSeedEnum.LOW
+    return PORTABLE_WIND_SEED_CODECS[bool(has_auto_mode)].decode(wind_speed)
 
 
 class PortableWind4ValueSeedEnum(StrEnum):
@@ -211,31 +241,33 @@ class PortableWind4ValueSeedEnum(StrEnum):
     AUTO = "Auto"
 
 
+PORTABLE_WIND_4VALUE_SEED_CODECS = {
+    True: EnumCodec(
+        PortableWind4ValueSeedEnum,
+        {
+            3: PortableWind4ValueSeedEnum.HIGH,
+            2: PortableWind4ValueSeedEnum.MEDIUM,
+            1: PortableWind4ValueSeedEnum.LOW,
+            0: PortableWind4ValueSeedEnum.AUTO,
+        },
+        default=PortableWind4ValueSeedEnum.AUTO,
+    ),
+    False: EnumCodec(
+        PortableWind4ValueSeedEnum,
+        {
+            2: PortableWind4ValueSeedEnum.HIGH,
+            1: PortableWind4ValueSeedEnum.MEDIUM,
+            0: PortableWind4ValueSeedEnum.LOW,
+        },
+        default=PortableWind4ValueSeedEnum.LOW,
+    ),
+}
+
+
 def getPortableWind4ValueSeed(
     wind_speed: int, has_auto_mode: bool
 ) -> PortableWind4ValueSeedEnum:
-    if has_auto_mode:
-        match wind_speed:
-            case 3:
-                return PortableWind4ValueSeedEnum.HIGH
-            case 2:
-                return PortableWind4ValueSeedEnum.MEDIUM
-            case 1:
-                return PortableWind4ValueSeedEnum.LOW
-            case 0:
-                return PortableWind4ValueSeedEnum.AUTO
-            case _:
-                return PortableWind4ValueSeedEnum.AUTO
-    else:
-        match wind_speed:
-            case 2:
-                return PortableWind4ValueSeedEnum.HIGH
-            case 1:
-                return PortableWind4ValueSeedEnum.MEDIUM
-            case 0:
-                return PortableWind4ValueSeedEnum.LOW
-            case _:
-                return PortableWind4ValueSeedEnum.LOW
+    return PORTABLE_WIND_4VALUE_SEED_CODECS[bool(has_auto_mode)].decode(wind_speed)
 
 
 class WindowAcWindSeedEnum(StrEnum):
@@ -245,16 +277,20 @@ class WindowAcWindSeedEnum(StrEnum):
     AUTO = "Auto"
 
 
-def getWindowAcWindSeed(wind_speed: int) -> PortableWindSeedEnum:
-    match wind_speed:
-        case 2:
-            return WindowAcWindSeedEnum.SPEED_1
-        case 4:
-            return WindowAcWindSeedEnum.SPEED_2
-        case 6:
-            return WindowAcWindSeedEnum.SPEED_3
-        case _:
-            return WindowAcWindSeedEnum.AUTO
+WINDOW_AC_WIND_SEED_CODEC = EnumCodec(
+    WindowAcWindSeedEnum,
+    {
+        2: WindowAcWindSeedEnum.SPEED_1,
+        4: WindowAcWindSeedEnum.SPEED_2,
+        6: WindowAcWindSeedEnum.SPEED_3,
+        0: WindowAcWindSeedEnum.AUTO,
+    },
+    default=WindowAcWindSeedEnum.AUTO,
+)
+
+
+def getWindowAcWindSeed(wind_speed: int) -> WindowAcWindSeedEnum:
+    return WINDOW_AC_WIND_SEED_CODEC.decode(wind_speed)
 
 
 class TemperatureTypeEnum(StrEnum):
@@ -262,14 +298,18 @@ class TemperatureTypeEnum(StrEnum):
     CELSIUS = "Celsius"
 
 
+TEMPERATURE_TYPE_CODEC = EnumCodec(
+    TemperatureTypeEnum,
+    {
+        1: TemperatureTypeEnum.FAHRENHEIT,
+        0: TemperatureTypeEnum.CELSIUS,
+    },
+    default=TemperatureTypeEnum.CELSIUS,
+)
+
+
 def getTemperatureType(temperature_type: int) -> TemperatureTypeEnum:
-    match temperature_type:
-        case 1:
-            return TemperatureTypeEnum.FAHRENHEIT
-        case 0:
-            return TemperatureTypeEnum.CELSIUS
-        case _:
-            return TemperatureTypeEnum.CELSIUS
+    return TEMPERATURE_TYPE_CODEC.decode(temperature_type)
 
 
 class FreshAirEnum(StrEnum):
@@ -279,18 +319,20 @@ class FreshAirEnum(StrEnum):
     STRENGTH_3 = "3"
 
 
+FRESH_AIR_CODEC = EnumCodec(
+    FreshAirEnum,
+    {
+        1: FreshAirEnum.STRENGTH_1,
+        2: FreshAirEnum.STRENGTH_2,
+        3: FreshAirEnum.STRENGTH_3,
+        0: FreshAirEnum.AUTO,
+    },
+    default=FreshAirEnum.AUTO,
+)
+
+
 def getFreshAir(new_wind_strength: int) -> FreshAirEnum:
-    match new_wind_strength:
-        case 1:
-            return FreshAirEnum.STRENGTH_1
-        case 2:
-            return FreshAirEnum.STRENGTH_2
-        case 3:
-            return FreshAirEnum.STRENGTH_3
-        case 0:
-            return FreshAirEnum.AUTO
-        case _:
-            return FreshAirEnum.AUTO
+    return FRESH_AIR_CODEC.decode(new_wind_strength)
 
 
 class WindFeelingEnum(StrEnum):
@@ -301,20 +343,21 @@ class WindFeelingEnum(StrEnum):
     SURROUND = "Surround"
 
 
+WIND_FEELING_CODEC = EnumCodec(
+    WindFeelingEnum,
+    {
+        1: WindFeelingEnum.SOFT,
+        2: WindFeelingEnum.SHOWER,
+        3: WindFeelingEnum.CARPET,
+        4: WindFeelingEnum.SURROUND,
+        0: WindFeelingEnum.NONE,
+    },
+    default=WindFeelingEnum.NONE,
+)
+
+
 def getWindFeeling(soft_wind: int) -> WindFeelingEnum:
-    match soft_wind:
-        case 1:
-            return WindFeelingEnum.SOFT
-        case 2:
-            return WindFeelingEnum.SHOWER
-        case 3:
-            return WindFeelingEnum.CARPET
-        case 3:
-            return WindFeelingEnum.SURROUND
-        case 0:
-            return WindFeelingEnum.NONE
-        case _:
-            return WindFeelingEnum.NONE
+    return WIND_FEELING_CODEC.decode(soft_wind)
 
 
 class GeneratorModeEnum(StrEnum):
@@ -324,16 +367,19 @@ class GeneratorModeEnum(StrEnum):
     L3 = "L3 70%"
 
 
+GENERATOR_MODE_CODEC = EnumCodec(
+    GeneratorModeEnum,
+    {
+        1: GeneratorModeEnum.L1,
+        2: GeneratorModeEnum.L2,
+        3: GeneratorModeEnum.L3,
+        0: GeneratorModeEnum.NONE,
+    },
+)
+
+
 def getGeneratorMode(generator_mode: int) -> GeneratorModeEnum:
-    match generator_mode:
-        case 1:
-            return GeneratorModeEnum.L1
-        case 2:
-            return GeneratorModeEnum.L2
-        case 3:
-            return GeneratorModeEnum.L3
-        case 0:
-            return GeneratorModeEnum.NONE
+    return GENERATOR_MODE_CODEC.decode(generator_mode)
 
 
 class WindSpeedLowMediumHigh(StrEnum):
@@ -342,15 +388,19 @@ class WindSpeedLowMediumHigh(StrEnum):
     HIGH = "High"
 
 
-def getWindSpeedLowMediumHigh(windSpeed: int) -> GeneratorModeEnum:
-    match windSpeed:
-        case 0:
-            return WindSpeedLowMediumHigh.LOW
-        case 1:
-            return WindSpeedLowMediumHigh.MEDIUM
-        case 2:
-            return WindSpeedLowMediumHigh.HIGH
-    return GeneratorModeEnum.LOW
+WIND_SPEED_LOW_MEDIUM_HIGH_CODEC = EnumCodec(
+    WindSpeedLowMediumHigh,
+    {
+        0: WindSpeedLowMediumHigh.LOW,
+        1: WindSpeedLowMediumHigh.MEDIUM,
+        2: WindSpeedLowMediumHigh.HIGH,
+    },
+    default=WindSpeedLowMediumHigh.LOW,
+)
+
+
+def getWindSpeedLowMediumHigh(windSpeed: int) -> WindSpeedLowMediumHigh:
+    return WIND_SPEED_LOW_MEDIUM_HIGH_CODEC.decode(windSpeed)
 
 
 class AirPurifierFanWindSpeedEnum(StrEnum):
@@ -377,23 +427,30 @@ class AirPurifierWorkModeStrEnum(StrEnum):
     SLEEP = "Sleep"
 
 
-def getAirPurifierFanWindSpeed(windSpeed: int) -> AirPurifierFanWindSpeedEnum:
-    match windSpeed:
-        case 1:
-            return AirPurifierFanWindSpeedStrEnum.LOW
-        case 2:
-            return AirPurifierFanWindSpeedStrEnum.MEDIUM
-        case 3:
-            return AirPurifierFanWindSpeedStrEnum.HIGH
-    return AirPurifierFanWindSpeedStrEnum.LOW
-
-
-def getAirPurifierWorkMode(workMode: int) -> AirPurifierWorkModeEnum:
-    match workMode:
-        case 0:
-            return AirPurifierWorkModeStrEnum.AUTO
-        case 1:
-            return AirPurifierWorkModeStrEnum.SLEEP
-        case 2:
-            return AirPurifierWorkModeStrEnum.FAN
-    return AirPurifierWorkModeStrEnum.AUTO
+AIR_PURIFIER_FAN_WIND_SPEED_CODEC = EnumCodec(
+    AirPurifierFanWindSpeedStrEnum,
+    {
+        1: AirPurifierFanWindSpeedStrEnum.LOW,
+        2: AirPurifierFanWindSpeedStrEnum.MEDIUM,
+        3: AirPurifierFanWindSpeedStrEnum.HIGH,
+    },
+    default=AirPurifierFanWindSpeedStrEnum.LOW,
+)
+
+AIR_PURIFIER_WORK_MODE_CODEC = EnumCodec(
+    AirPurifierWorkModeStrEnum,
+    {
+        0: AirPurifierWorkModeStrEnum.AUTO,
+        1: AirPurifierWorkModeStrEnum.SLEEP,
+        2: AirPurifierWorkModeStrEnum.FAN,
+    },
+    default=AirPurifierWorkModeStrEnum.AUTO,
+)
+
+
+def getAirPurifierFanWindSpeed(windSpeed: int) -> AirPurifierFanWindSpeedStrEnum:
+    return AIR_PURIFIER_FAN_WIND_SPEED_CODEC.decode(windSpeed)
+
+
+def getAirPurifierWorkMode(workMode: int) -> AirPurifierWorkModeStrEnum:
+    return AIR_PURIFIER_WORK_MODE_CODEC.decode(workMode)
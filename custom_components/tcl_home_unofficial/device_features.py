@@ -3,8 +3,9 @@
 import logging
 from enum import StrEnum
 
-from .device_capabilities import DeviceCapabilityEnum
+from .device_capabilities import DeviceCapabilityEnum, get_capabilities
 from .device_types import DeviceTypeEnum
+from .enum_bitset import EnumBitSet
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -90,15 +91,41 @@ class DeviceFeatureEnum(StrEnum):
     USER_CONFIG_BEHAVIOR_SILENT_BEEP_WHEN_TURN_ON = "user_config.behavior.silent_beep_when_turn_on"
 
 
+# bit positions follow the declaration order; masks are never persisted
+FEATURES_BY_POSITION: tuple[DeviceFeatureEnum, ...] = tuple(DeviceFeatureEnum)
+
+
+class DeviceFeatureSet(EnumBitSet):
+    """Frozen set of DeviceFeatureEnum."""
+
+    __slots__ = ()
+
+    _bits = {feature: 1 << position for position, feature in enumerate(FEATURES_BY_POSITION)}
+
+    @classmethod
+    def member_of(cls, position: int) -> DeviceFeatureEnum:
+        return FEATURES_BY_POSITION[position]
+
+
 def has_property(aws_thing_state_reported: dict[str, any], propertyName: str) -> bool:
     return propertyName in aws_thing_state_reported
 
 
+def has_four_value_fan_speed(rn_probe_data: dict[str, any]) -> bool:
+    fan_speed_mapping = rn_probe_data.get("fan_speed_mapping", [])
+    return (
+        "FAN_SPEED_AUTO" in fan_speed_mapping
+        and "FAN_SPEED_LOW" in fan_speed_mapping
+        and ("FAN_SPEED_MED" in fan_speed_mapping or "FAN_SPEED_MEDIUM" in fan_speed_mapping)
+        and "FAN_SPEED_HIGH" in fan_speed_mapping
+    )
+
+
 def getSupportedFeatures(
     device_type: DeviceTypeEnum,aws_thing_state_reported: dict[str, any],device_storage: dict[str, any] | None = None,
 ) -> list[DeviceFeatureEnum]:
     try:
-        capabilities = aws_thing_state_reported.get("capabilities", [])
+        capabilities = get_capabilities(aws_thing_state_reported.get("capabilities", None) or [])
         has_power_consumption_data = False
         has_work_time_data = False
         has_rn_probe_data = False
@@ -372,13 +399,7 @@ def getSupportedFeatures(
                     features.append(DeviceFeatureEnum.SENSOR_WORK_TIME_DAILY)
 
                 if has_rn_probe_data:
-                    fan_speed_mapping = rn_probe_data.get("fan_speed_mapping", [])
-                    if (
-                        "FAN_SPEED_AUTO" in fan_speed_mapping
-                        and "FAN_SPEED_LOW" in fan_speed_mapping
-                        and ("FAN_SPEED_MED" in fan_speed_mapping or "FAN_SPEED_MEDIUM" in fan_speed_mapping)
-                        and "FAN_SPEED_HIGH" in fan_speed_mapping
-                    ):
+                    if has_four_value_fan_speed(rn_probe_data):
                         features.append(
                             DeviceFeatureEnum.SELECT_PORTABLE_WIND_4VALUE_SPEED
                         )
@@ -0,0 +1,64 @@
+"""Typed access to the user preferences kept in the device storage document.
+
+The document is held in memory (see data_storage.get_cached_device_storage),
+so reading preferences on the command path costs no I/O. Changes are written
+to the document and persisted with a debounced save.
+"""
+
+from homeassistant.core import HomeAssistant
+
+from .data_storage import get_stored_data, safe_get_value, safe_set_value, schedule_save_stored_data
+
+
+class DevicePreferences:
+    """."""
+
+    def __init__(self, hass: HomeAssistant, device_id: str, stored_data: dict | None) -> None:
+        self.hass = hass
+        self.device_id = device_id
+        self.stored_data = stored_data
+
+    @property
+    def silent_beep_when_turn_on(self) -> bool:
+        return safe_get_value(self.stored_data, "user_config.behavior.silent_beep_when_turn_on", False)
+
+    @property
+    def memorize_temp_by_mode(self) -> bool:
+        return safe_get_value(self.stored_data, "user_config.behavior.memorize_temp_by_mode", False)
+
+    @property
+    def memorize_fan_speed_by_mode(self) -> bool:
+        return safe_get_value(self.stored_data, "user_config.behavior.memorize_fan_speed_by_mode", False)
+
+    @property
+    def memorize_humidity_by_mode(self) -> bool:
+        return safe_get_value(self.stored_data, "user_config.behavior.memorize_humidity_by_mode", False)
+
+    def get_target_temperature(self, mode: str) -> int | float:
+        return self.stored_data["target_temperature"][mode]["value"]
+
+    def get_fan_speed(self, mode: str) -> str:
+        return self.stored_data["fan_speed"][mode]["value"]
+
+    def get_humidity(self, mode: str) -> int | float:
+        return self.stored_data["humidity"][mode]["value"]
+
+    def set_target_temperature(self, mode: str, value: int | float) -> None:
+        self.set_value(f"target_temperature.{mode}.value", value)
+
+    def set_fan_speed(self, mode: str, value: str) -> None:
+        self.set_value(f"fan_speed.{mode}.value", value)
+
+    def set_humidity(self, mode: str, value: int | float) -> None:
+        self.set_value(f"humidity.{mode}.value", value)
+
+    def set_value(self, path: str, value) -> None:
+        self.stored_data, need_save = safe_set_value(
+            self.stored_data, path, value, overwrite_if_exists=True
+        )
+        if need_save:
+            schedule_save_stored_data(self.hass, self.device_id, self.stored_data)
+
+
+async def get_device_preferences(hass: HomeAssistant, device_id: str) -> DevicePreferences:
+    return DevicePreferences(hass, device_id, await get_stored_data(hass, device_id))
@@ -20,6 +20,8 @@ import zipfile
 
 from homeassistant.helpers.httpx_client import get_async_client
 
+from .metrics import MetricOperationEnum
+from .request_governor import RequestPriorityEnum
 from .tcl import get_config
 from .fakes_for_debug import device_rn_probe_fetch_and_parse_config
 
@@ -149,14 +151,18 @@ async def fetch_and_parse_config(
             tokens = await session_manager.async_refresh_tokens()
             auth = await session_manager.async_get_auth_data(allowInvalid=True)
 
-            cfg = await get_config(
-                hass=hass,
-                cloud_url=cloud.data.cloud_url,
-                saas_token=tokens.data.saas_token,
-                country_abbr=(auth.user.country_abbr if auth and auth.user else None),
-                product_key=product_key,
-                verbose_logging=session_manager.is_verbose_device_logging(),
-            )
+            async with session_manager.get_request_governor().request(
+                RequestPriorityEnum.BACKGROUND
+            ):
+                with session_manager.get_metrics().measure(MetricOperationEnum.CONFIG_GET):
+                    cfg = await get_config(
+                        hass=hass,
+                        cloud_url=cloud.data.cloud_url,
+                        saas_token=tokens.data.saas_token,
+                        country_abbr=(auth.user.country_abbr if auth and auth.user else None),
+                        product_key=product_key,
+                        verbose_logging=session_manager.is_verbose_device_logging(),
+                    )
         if session_manager.is_verbose_device_logging():
             _LOGGER.info("device_rn_probe: get_config result: %s", cfg)
         if not cfg or cfg.data is None:
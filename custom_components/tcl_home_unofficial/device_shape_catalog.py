@@ -0,0 +1,263 @@
+"""Device shape -> supported features, resolved with a dictionary lookup.
+
+getSupportedFeatures depends only on the device type, the capabilities, which
+keys the shadow reports and four flags of the device storage. Together they
+are the device shape. The catalog maps shapes to a DeviceFeatureSet:
+- seeded from device_shapes.json, built from notes/ by
+  tools/build_shape_catalog.py. It lists shapes without storage flags; each
+  is added with every combination of the flags;
+- extended with the shapes seen at runtime, which are persisted.
+
+Features are recomputed for every known shape when the catalog is loaded, so
+entries written by an older version of getSupportedFeatures never go stale.
+
+Lookups go through a front cache keyed by plain tuples in document key order.
+Building and hashing those is about half the cost of getSupportedFeatures
+for a split AC. The canonical DeviceShape, with its frozensets, is only
+built when the document key order has not been seen before.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import hashlib
+import itertools
+import json
+import logging
+import os
+
+from .device_features import DeviceFeatureSet, getSupportedFeatures, has_four_value_fan_speed
+from .device_types import DeviceTypeEnum
+
+_LOGGER = logging.getLogger(__name__)
+
+DEVICE_SHAPE_CATALOG_VERSION = 1
+BUILTIN_SHAPES_PATH = os.path.join(os.path.dirname(__file__), "device_shapes.json")
+MAX_RAW_KEYS = 1024
+
+
+@dataclass(frozen=True)
+class DeviceShapeStorageFlags:
+    power_consumption: bool = False
+    work_time: bool = False
+    rn_probe: bool = False
+    rn_probe_four_value_fan_speed: bool = False
+
+
+@dataclass(frozen=True)
+class DeviceShape:
+    device_type: DeviceTypeEnum | None
+    capabilities: frozenset[int]
+    reported_keys: frozenset[str]
+    storage_flags: DeviceShapeStorageFlags
+
+    @property
+    def shape_id(self) -> str:
+        """Stable across processes, unlike hash()."""
+        return hashlib.sha1(json.dumps(self.as_dict()).encode("utf-8")).hexdigest()[:16]
+
+    def as_dict(
+        self, features: DeviceFeatureSet | None = None, with_storage_flags: bool = True
+    ) -> dict:
+        data = {
+            "device_type": self.device_type,
+            "capabilities": sorted(self.capabilities),
+            "reported_keys": sorted(self.reported_keys),
+        }
+        if with_storage_flags:
+            data["storage_flags"] = {
+                "power_consumption": self.storage_flags.power_consumption,
+                "work_time": self.storage_flags.work_time,
+                "rn_probe": self.storage_flags.rn_probe,
+                "rn_probe_four_value_fan_speed": self.storage_flags.rn_probe_four_value_fan_speed,
+            }
+        if features is not None:
+            data["features"] = sorted(features)
+        return data
+
+    def as_reported(self) -> dict:
+        """A stand-in shadow with this shape, for getSupportedFeatures."""
+        reported = dict.fromkeys(self.reported_keys)
+        if "capabilities" in reported:
+            reported["capabilities"] = sorted(self.capabilities)
+        return reported
+
+    def as_storage(self) -> dict:
+        """A stand-in device storage with these flags, for getSupportedFeatures."""
+        flags = self.storage_flags
+        fan_speed_mapping = []
+        if flags.rn_probe_four_value_fan_speed:
+            fan_speed_mapping = ["FAN_SPEED_AUTO", "FAN_SPEED_LOW", "FAN_SPEED_MEDIUM", "FAN_SPEED_HIGH"]
+        return {
+            "non_user_config": {
+                "power_consumption": {"enabled": flags.power_consumption},
+                "work_time": {"enabled": flags.work_time},
+                "rn_probe_data": {
+                    "is_success": flags.rn_probe,
+                    "data": {"fan_speed_mapping": fan_speed_mapping},
+                },
+            }
+        }
+
+
+def storage_flag_combinations() -> list[DeviceShapeStorageFlags]:
+    # rn probe: not run / failed, succeeded, succeeded with a four value fan speed mapping
+    rn_probe_variants = ((False, False), (True, False), (True, True))
+    return [
+        DeviceShapeStorageFlags(power_consumption, work_time, rn_probe, four_value)
+        for power_consumption, work_time, (rn_probe, four_value) in itertools.product(
+            (False, True), (False, True), rn_probe_variants
+        )
+    ]
+
+
+def get_storage_key(device_storage: dict | None) -> tuple[bool, bool, bool, bool]:
+    """The DeviceShapeStorageFlags fields, as a tuple."""
+    if device_storage is None:
+        return (False, False, False, False)
+    non_user_config = device_storage.get("non_user_config", {})
+    rn_probe_data = non_user_config.get("rn_probe_data", {})
+    rn_probe = rn_probe_data.get("is_success", False)
+    return (
+        non_user_config.get("power_consumption", {}).get("enabled", False),
+        non_user_config.get("work_time", {}).get("enabled", False),
+        rn_probe,
+        bool(rn_probe) and has_four_value_fan_speed(rn_probe_data.get("data", {})),
+    )
+
+
+def get_storage_flags(device_storage: dict | None) -> DeviceShapeStorageFlags:
+    return DeviceShapeStorageFlags(*get_storage_key(device_storage))
+
+
+def get_device_shape(
+    device_type: DeviceTypeEnum | None, aws_thing_state_reported: dict, device_storage: dict | None
+) -> DeviceShape:
+    return DeviceShape(
+        device_type=device_type,
+        capabilities=frozenset(aws_thing_state_reported.get("capabilities", None) or ()),
+        reported_keys=frozenset(aws_thing_state_reported),
+        storage_flags=get_storage_flags(device_storage),
+    )
+
+
+def shapes_from_dict(data: dict) -> list[DeviceShape]:
+    """The shape of a catalog entry, or one per storage flag combination when it has no flags."""
+    device_type = data.get("device_type")
+    device_type = DeviceTypeEnum(device_type) if device_type else None
+    capabilities = frozenset(data.get("capabilities", []))
+    reported_keys = frozenset(data.get("reported_keys", []))
+    if "storage_flags" in data:
+        flags = [DeviceShapeStorageFlags(**data["storage_flags"])]
+    else:
+        flags = storage_flag_combinations()
+    return [DeviceShape(device_type, capabilities, reported_keys, flag) for flag in flags]
+
+
+def compute_features(shape: DeviceShape) -> DeviceFeatureSet:
+    return DeviceFeatureSet(getSupportedFeatures(shape.device_type, shape.as_reported(), shape.as_storage()))
+
+
+class DeviceShapeCatalog:
+    """Frozen feature sets by device shape."""
+
+    def __init__(self) -> None:
+        self.features_by_shape: dict[DeviceShape, DeviceFeatureSet] = {}
+        # shapes that are not in device_shapes.json, these are persisted
+        self.discovered: set[DeviceShape] = set()
+        # (device_type, reported keys in document order, capabilities, storage key) -> features
+        self._by_raw_key: dict[tuple, DeviceFeatureSet] = {}
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def add(self, shape: DeviceShape, discovered: bool) -> DeviceFeatureSet:
+        features = compute_features(shape)
+        self.features_by_shape[shape] = features
+        if discovered and shape not in self.discovered:
+            self.discovered.add(shape)
+            self.dirty = True
+        return features
+
+    def load(self, data: dict | None, discovered: bool) -> int:
+        """Add the shapes of a catalog document; returns how many changed features."""
+        if not data or data.get("version") != DEVICE_SHAPE_CATALOG_VERSION:
+            return 0
+        changed = 0
+        dirty = self.dirty
+        for entry in data.get("shapes", []):
+            try:
+                shapes = shapes_from_dict(entry)
+            except (TypeError, ValueError) as e:
+                _LOGGER.warning("DeviceShapeCatalog: skipping invalid shape %s: %s", entry.get("shape_id"), e)
+                continue
+            for shape in shapes:
+                features = self.add(shape, discovered)
+                if "features" in entry and sorted(entry["features"]) != sorted(features):
+                    changed += 1
+        # rewrite stored entries computed by an older getSupportedFeatures
+        self.dirty = dirty or (discovered and changed > 0)
+        return changed
+
+    def resolve(
+        self, device_type: DeviceTypeEnum | None, aws_thing_state_reported: dict, device_storage: dict | None
+    ) -> DeviceFeatureSet:
+        raw_key = (
+            device_type,
+            tuple(aws_thing_state_reported),
+            tuple(aws_thing_state_reported.get("capabilities", None) or ()),
+            get_storage_key(device_storage),
+        )
+        features = self._by_raw_key.get(raw_key)
+        if features is not None:
+            self.hits += 1
+            return features
+
+        shape = get_device_shape(device_type, aws_thing_state_reported, device_storage)
+        features = self.features_by_shape.get(shape)
+        if features is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            features = DeviceFeatureSet(getSupportedFeatures(device_type, aws_thing_state_reported, device_storage))
+            self.features_by_shape[shape] = features
+            self.discovered.add(shape)
+            self.dirty = True
+            _LOGGER.info("DeviceShapeCatalog: new %s shape %s", device_type, shape.shape_id)
+        if len(self._by_raw_key) >= MAX_RAW_KEYS:
+            self._by_raw_key.clear()
+        self._by_raw_key[raw_key] = features
+        return features
+
+    def as_dict(self, shapes) -> dict:
+        return {
+            "version": DEVICE_SHAPE_CATALOG_VERSION,
+            "shapes": sorted(
+                (
+                    {"shape_id": shape.shape_id, **shape.as_dict(self.features_by_shape[shape])}
+                    for shape in shapes
+                ),
+                key=lambda entry: (entry["device_type"] or "", entry["shape_id"]),
+            ),
+        }
+
+    def discovered_as_dict(self) -> dict:
+        return self.as_dict(self.discovered)
+
+    def snapshot(self) -> dict:
+        return {
+            "shapes": len(self.features_by_shape),
+            "discovered": len(self.discovered),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def load_builtin_shapes(path: str = BUILTIN_SHAPES_PATH) -> dict | None:
+    """Read device_shapes.json (blocking, run it in the executor)."""
+    try:
+        with open(path, encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError) as e:
+        _LOGGER.warning("DeviceShapeCatalog: could not read %s: %s", path, e)
+        return None
@@ -1,5 +1,6 @@
 """Diagnostics for tcl_home_unofficial integration."""
 
+import asyncio
 from typing import Any
 
 from homeassistant.core import HomeAssistant
@@ -41,93 +42,152 @@ async def async_get_device_diagnostics(
     data= await get_diagnosics_data(hass, entry,device_id)
     return data
 
-async def get_diagnosics_data(hass: HomeAssistant, entry: New_NameConfigEntry, device_id:str | None) -> dict[str, Any]:
-    configData = asDict(sanitizeConfigData(convertToConfigData(entry)))
+def tcl_thing_as_dict(thing) -> dict:
+    return {
+        "device_id": thing.device_id,
+        "product_key": thing.product_key,
+        "platform": thing.platform,
+        "nick_name": thing.nick_name,
+        "device_name": thing.device_name,
+        "category": thing.category,
+        "type": thing.type,
+        "device_type": thing.device_type,
+        "firmware_version": thing.firmware_version,
+        "net_type": thing.net_type,
+        "is_online": thing.is_online,
+        "room": thing.room,
+    }
+
+
+def cloud_urls_as_dict(cloudUrls) -> dict:
+    if cloudUrls is None or cloudUrls.data is None:
+        return {}
+    return {
+        "sso_region": cloudUrls.data.sso_region,
+        "cloud_region": cloudUrls.data.cloud_region,
+        "sso_url": cloudUrls.data.sso_url,
+        "cloud_url": cloudUrls.data.cloud_url,
+        "icon_resource_url": cloudUrls.data.icon_resource_url,
+        "identity_pool_id": cloudUrls.data.identity_pool_id,
+        "upload_web_url": cloudUrls.data.upload_web_url,
+        "device_url": cloudUrls.data.device_url,
+        "cloud_url_emq": cloudUrls.data.cloud_url_emq,
+    }
+
+
+def get_running_coordinator(entry: New_NameConfigEntry):
+    runtime_data = getattr(entry, "runtime_data", None)
+    if runtime_data is None:
+        return None
+    return getattr(runtime_data, "coordinator", None)
+
 
-    aws_iot = AwsIot(
-        hass=hass,
-        config_entry=entry,
+async def fetch_shadows_concurrently(aws_iot: AwsIot, deviceIds: list[str]) -> list[dict]:
+    results = await asyncio.gather(
+        *[aws_iot.async_get_thing(deviceId) for deviceId in deviceIds],
+        return_exceptions=True,
     )
+    aws_things = []
+    for deviceId, result in zip(deviceIds, results):
+        if isinstance(result, Exception):
+            aws_things.append({"deviceId": deviceId, "error": str(result)})
+        else:
+            aws_things.append({"deviceId": deviceId, "reported": result.get("state", {}).get("reported", {})})
+    return aws_things
+
 
+async def get_diagnosics_data(hass: HomeAssistant, entry: New_NameConfigEntry, device_id:str | None) -> dict[str, Any]:
+    """Build diagnostics.
+
+    A loaded entry is described from the running coordinator's last poll and
+    its cached session, without calling the cloud. With the
+    diagnostics_live_probe option the running session re-reads get_things
+    and all shadows (concurrently). Only an entry that is not loaded (e.g.
+    setup failed) gets a fresh AwsIot session.
+    """
+    config = convertToConfigData(entry)
+    configData = asDict(sanitizeConfigData(config))
+
+    coordinator = get_running_coordinator(entry)
     aws_iot_init_success = False
     aws_iot_init_error = None
 
-    try:
-        await aws_iot.async_init()
+    if coordinator is not None:
+        aws_iot = coordinator.get_aws_iot()
         aws_iot_init_success = True
-    except Exception as e:
-        aws_iot_init_error = {"error": str(e)}
+        diagnostics_source = "live_probe" if config.diagnostics_live_probe else "coordinator_snapshot"
+    else:
+        diagnostics_source = "fresh_session"
+        aws_iot = AwsIot(
+            hass=hass,
+            config_entry=entry,
+        )
+        try:
+            await aws_iot.async_init()
+            aws_iot_init_success = True
+        except Exception as e:
+            aws_iot_init_error = {"error": str(e)}
 
     user_country_abbr = ""
     cloud_urls = {}
 
     if aws_iot_init_success:
         session_manager = aws_iot.get_session_manager()
-        authResult = await session_manager.async_get_auth_data(allowInvalid=True)
-        if authResult is not None and authResult.user is not None:
-            user_country_abbr = authResult.user.country_abbr
-        cloudUrls = await session_manager.async_force_cloud_urls()
-        if cloudUrls is not None and cloudUrls.data is not None:
-            cloud_urls = {
-                "sso_region": cloudUrls.data.sso_region,
-                "cloud_region": cloudUrls.data.cloud_region,
-                "sso_url": cloudUrls.data.sso_url,
-                "cloud_url": cloudUrls.data.cloud_url,
-                "icon_resource_url": cloudUrls.data.icon_resource_url,
-                "identity_pool_id": cloudUrls.data.identity_pool_id,
-                "upload_web_url": cloudUrls.data.upload_web_url,
-                "device_url": cloudUrls.data.device_url,
-                "cloud_url_emq": cloudUrls.data.cloud_url_emq,
-            }
-            cloudUrls.data
+        try:
+            authResult = session_manager.storageData.authData
+            if authResult is None:
+                authResult = await session_manager.async_get_auth_data(allowInvalid=True)
+            if authResult is not None and authResult.user is not None:
+                user_country_abbr = authResult.user.country_abbr
+            if diagnostics_source == "fresh_session":
+                cloud_urls = cloud_urls_as_dict(await session_manager.async_force_cloud_urls())
+            else:
+                cloud_urls = cloud_urls_as_dict(await session_manager.async_aws_cloud_urls())
+        except Exception as e:
+            cloud_urls = {"error": str(e)}
 
     tcl_things = []
     tcl_things_response_code = 0
     tcl_things_response_message = 0
     deviceIds = []
-    try:
-        all_things_response = await aws_iot.get_all_things()
-        tcl_things_response_code = all_things_response.code
-        tcl_things_response_message = all_things_response.message
-        for thing in all_things_response.data:
-            if device_id is None or thing.device_id == device_id:
-                deviceIds.append(thing.device_id)
-                tcl_things.append(
-                    {
-                        "device_id": thing.device_id,
-                        "product_key": thing.product_key,
-                        "platform": thing.platform,
-                        "nick_name": thing.nick_name,
-                        "device_name": thing.device_name,
-                        "category": thing.category,
-                        "type": thing.type,
-                        "device_type": thing.device_type,
-                        "firmware_version": thing.firmware_version,
-                        "net_type": thing.net_type,
-                        "is_online": thing.is_online,
-                        "room": thing.room,
-                    }
-                )
-    except Exception as e:
-        tcl_things = {"error": str(e)}
-
     aws_things = []
-    try:
-        for deviceId in deviceIds:            
-            if device_id is None or deviceId == device_id:
-                aws_thing = await aws_iot.async_get_thing(deviceId)
-                aws_things.append({"deviceId":deviceId,"reported":aws_thing.get("state", {}).get("reported", {})})
-    except Exception as e:
-        aws_things = {"error": str(e)}
+
+    if diagnostics_source == "coordinator_snapshot":
+        tcl_things_response_code = "coordinator_snapshot"
+        tcl_things_response_message = f"last_update_success: {coordinator.last_update_success}"
+        devices = coordinator.data.devices if coordinator.data is not None else []
+        for device in devices:
+            if device_id is not None and device.device_id != device_id:
+                continue
+            deviceIds.append(device.device_id)
+            if device.tcl_thing is not None:
+                tcl_things.append(tcl_thing_as_dict(device.tcl_thing))
+            if device.aws_thing is not None:
+                aws_things.append({"deviceId": device.device_id, "reported": device.aws_thing.get("state", {}).get("reported", {})})
+    else:
+        try:
+            all_things_response = await aws_iot.get_all_things()
+            tcl_things_response_code = all_things_response.code
+            tcl_things_response_message = all_things_response.message
+            for thing in all_things_response.data:
+                if device_id is None or thing.device_id == device_id:
+                    deviceIds.append(thing.device_id)
+                    tcl_things.append(tcl_thing_as_dict(thing))
+        except Exception as e:
+            tcl_things = {"error": str(e)}
+
+        try:
+            aws_things = await fetch_shadows_concurrently(aws_iot, deviceIds)
+        except Exception as e:
+            aws_things = {"error": str(e)}
     
     device_storages = []
     manual_state_dump_data = {}
     try:
         for deviceId in deviceIds:
-            if device_id is None or deviceId == device_id:
-                device_storage = await try_get_stored_data(hass, deviceId)
-                device_storage["deviceId"]=deviceId
-                device_storages.append(device_storage)
+            device_storage = await try_get_stored_data(hass, deviceId)
+            # the cached storage document itself: copy, do not tag it
+            device_storages.append({**(device_storage or {}), "deviceId": deviceId})
     except Exception as e:
         device_storages = {"error": str(e)}
 
@@ -138,6 +198,7 @@ async def get_diagnosics_data(hass: HomeAssistant, entry: New_NameConfigEntry, d
 
     return {
         "configData": configData,
+        "diagnostics_source": diagnostics_source,
         "regionData": {
             "user_country_abbr": user_country_abbr,
             "cloud_urls": cloud_urls,
@@ -154,8 +215,36 @@ async def get_diagnosics_data(hass: HomeAssistant, entry: New_NameConfigEntry, d
         },
         "device_storages": device_storages,
         "manual_state_dump_data": manual_state_dump_data,
+        "metrics": get_running_metrics(entry),
+        "request_governor": get_running_request_governor(entry),
+        "desired_state_planner": get_running_desired_state_planner(entry),
+        "command_tracker": get_running_command_tracker(entry),
     }
 
+def get_running_request_governor(entry: New_NameConfigEntry) -> dict:
+    try:
+        return entry.runtime_data.coordinator.get_aws_iot().get_request_governor().snapshot()
+    except Exception as e:
+        return {"error": str(e)}
+
+def get_running_desired_state_planner(entry: New_NameConfigEntry) -> dict:
+    try:
+        return entry.runtime_data.coordinator.get_aws_iot().get_desired_state_planner().snapshot()
+    except Exception as e:
+        return {"error": str(e)}
+
+def get_running_command_tracker(entry: New_NameConfigEntry) -> dict:
+    try:
+        return entry.runtime_data.coordinator.get_aws_iot().get_command_tracker().snapshot()
+    except Exception as e:
+        return {"error": str(e)}
+
+def get_running_metrics(entry: New_NameConfigEntry) -> dict:
+    try:
+        return entry.runtime_data.coordinator.get_aws_iot().get_metrics().snapshot()
+    except Exception as e:
+        return {"error": str(e)}
+
 async def try_get_stored_data(hass: HomeAssistant, device_id: str):    
     try:
         data = await get_stored_data(hass, device_id)
@@ -0,0 +1,66 @@
+"""Entity descriptions keyed by device feature.
+
+Each platform declares its entities as a tuple of descriptions (one feature
+can describe several entities). FeatureDescriptionRegistry indexes them once
+at import: expanding a device intersects its feature set with the registry's
+and looks the matching features up, and a handler finds the description of
+its feature with one dict lookup instead of a match block per call.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+from .device import Device
+from .device_features import DeviceFeatureEnum, DeviceFeatureSet
+from .device_types import DeviceTypeEnum
+
+
+@dataclass(frozen=True, kw_only=True)
+class FeatureEntityDescription:
+    feature: DeviceFeatureEnum
+    type: str
+    name: str
+    # only for / never for these device types, when set
+    device_types: frozenset[DeviceTypeEnum] | None = None
+    excluded_device_types: frozenset[DeviceTypeEnum] | None = None
+
+    def matches(self, device: Device) -> bool:
+        if self.device_types is not None and device.device_type not in self.device_types:
+            return False
+        if self.excluded_device_types is not None and device.device_type in self.excluded_device_types:
+            return False
+        return True
+
+
+DescriptionT = TypeVar("DescriptionT", bound=FeatureEntityDescription)
+
+
+class FeatureDescriptionRegistry(Generic[DescriptionT]):
+    """."""
+
+    def __init__(self, descriptions: Iterable[DescriptionT]) -> None:
+        by_feature: dict[DeviceFeatureEnum, list[DescriptionT]] = {}
+        for description in descriptions:
+            by_feature.setdefault(description.feature, []).append(description)
+        self.by_feature: dict[DeviceFeatureEnum, tuple[DescriptionT, ...]] = {
+            feature: tuple(items) for feature, items in by_feature.items()
+        }
+        self.features = DeviceFeatureSet(self.by_feature)
+
+    def for_device(self, device: Device) -> list[DescriptionT]:
+        """The descriptions of the entities a device gets."""
+        return [
+            description
+            for feature in device.supported_features & self.features
+            for description in self.by_feature[feature]
+            if description.matches(device)
+        ]
+
+    def get(self, device: Device, feature: DeviceFeatureEnum) -> DescriptionT | None:
+        for description in self.by_feature.get(feature, ()):
+            if description.matches(device):
+                return description
+        return None
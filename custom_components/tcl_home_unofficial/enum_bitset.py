@@ -0,0 +1,87 @@
+"""Immutable sets of enum members stored as one int bitmask.
+
+Each subclass maps a member to a bit position. Membership is one dict lookup
+and an AND, set operations and equality are int operations, so two sets
+are cheap to compare between polls.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+
+
+class EnumBitSet:
+    """Base class, see DeviceFeatureSet and DeviceCapabilitySet."""
+
+    __slots__ = ("mask",)
+
+    # member -> bit (1 << position), filled in by the subclass
+    _bits: dict = {}
+
+    def __init__(self, members: Iterable = ()) -> None:
+        mask = 0
+        for member in members:
+            mask |= self.bit_of(member)
+        self.mask = mask
+
+    @classmethod
+    def from_mask(cls, mask: int) -> EnumBitSet:
+        bitset = cls.__new__(cls)
+        bitset.mask = mask
+        return bitset
+
+    @classmethod
+    def bit_of(cls, member) -> int:
+        bit = cls._bits.get(member)
+        if bit is None:
+            raise ValueError(f"{member!r} is not a valid {cls.__name__} member")
+        return bit
+
+    @classmethod
+    def member_of(cls, position: int):
+        raise NotImplementedError
+
+    def __contains__(self, member) -> bool:
+        return bool(self.mask & self._bits.get(member, 0))
+
+    def __iter__(self) -> Iterator:
+        mask = self.mask
+        while mask:
+            low = mask & -mask
+            yield self.member_of(low.bit_length() - 1)
+            mask ^= low
+
+    def __len__(self) -> int:
+        return self.mask.bit_count()
+
+    def __bool__(self) -> bool:
+        return self.mask != 0
+
+    def __eq__(self, other) -> bool:
+        if type(other) is type(self):
+            return self.mask == other.mask
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((type(self), self.mask))
+
+    def __and__(self, other: EnumBitSet) -> EnumBitSet:
+        return self.from_mask(self.mask & other.mask)
+
+    def __or__(self, other: EnumBitSet) -> EnumBitSet:
+        return self.from_mask(self.mask | other.mask)
+
+    def __sub__(self, other: EnumBitSet) -> EnumBitSet:
+        return self.from_mask(self.mask & ~other.mask)
+
+    def __le__(self, other: EnumBitSet) -> bool:
+        return self.mask & ~other.mask == 0
+
+    def __ge__(self, other: EnumBitSet) -> bool:
+        return other.mask & ~self.mask == 0
+
+    def __reduce__(self):
+        return (type(self).from_mask, (self.mask,))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({sorted(self)!r})"
@@ -1,70 +1,136 @@
 """."""
+from dataclasses import dataclass, field
 import logging
+import os
+import time
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import storage
+
+from .const import (
+    FAKE_DATA_CHECK_INTERVAL_SECONDS,
+    FAKE_DATA_INDEX_KEY,
+    get_internal_settings_storege_key,
+)
 from .data_storage import get_internal_settings, safe_get_value
 from .tcl import GetThingsResponse, ConfigGetResponse
 
 _LOGGER = logging.getLogger(__name__)
 
-async def aws_iot_get_all_things(hass: HomeAssistant):
-    data={
-        "code":200,
-        "message":"fake data",
-    }
-    dataList=[]
-    internal_settings = await get_internal_settings(hass)
-    
+
+@dataclass
+class FakeDataIndex:
+    """The fake.data diagnostics dump, keyed by device_id.
+
+    Built once from the internal settings and rebuilt when the settings file
+    changes on disk (checked at most every FAKE_DATA_CHECK_INTERVAL_SECONDS)
+    or is written through set_internal_settings.
+    """
+
+    mtime: float | None = None
+    checked_at: float = 0
+    things: GetThingsResponse | None = None
+    reported_by_device_id: dict[str, dict] = field(default_factory=dict)
+    rn_probe_by_device_id: dict[str, dict] = field(default_factory=dict)
+
+
+def get_internal_settings_path(hass: HomeAssistant) -> str:
+    return hass.config.path(storage.STORAGE_DIR, get_internal_settings_storege_key())
+
+
+def get_file_mtime(path: str) -> float | None:
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def build_fake_data_index(internal_settings: dict | None, mtime: float | None) -> FakeDataIndex:
+    index = FakeDataIndex(mtime=mtime, checked_at=time.monotonic())
     diganostics = safe_get_value(internal_settings, "fake.data", {})
-    if "data" in diganostics:
-        counter = 1
-        for tcl_thing in diganostics.get("data", {}).get("tcl", {}).get("tcl_things", []):
-            _LOGGER.info("aws_iot_get_all_things adding fake device %s", tcl_thing)
-            dataList.append({
-                "deviceId":tcl_thing.get("device_id", "Fake_device_id_"+str(counter)),
-                "nickName": tcl_thing.get("nick_name", "Fake_nick_name_"+str(counter)),
-                "deviceName": tcl_thing.get("device_name", "Fake_device_name_"+str(counter)),
-                'productKey': tcl_thing.get("product_key", "Fake_product_key_"+str(counter)),
-                'platform': tcl_thing.get("platform", "Fake_platform_"+str(counter)),
-                "category": tcl_thing.get("category", "Fake_category_"+str(counter)),
-                "firmwareVersion": tcl_thing.get("firmware_version", "Fake_firmware_version_"+str(counter)),
-                "isOnline": tcl_thing.get("is_online",1),
-                "room": tcl_thing.get("room", "Fake_room_"+str(counter)),
-                "type": tcl_thing.get("type", 0),
-                "deviceType": tcl_thing.get("device_type", "Fake_device_type_"+str(counter)),
-                "netType": tcl_thing.get("net_type", 0),
-            })
-            counter+=1     
+    data = diganostics.get("data", {}) if "data" in diganostics else {}
 
-    data["data"]=dataList
+    dataList = []
+    counter = 1
+    for tcl_thing in data.get("tcl", {}).get("tcl_things", []):
+        dataList.append({
+            "deviceId":tcl_thing.get("device_id", "Fake_device_id_"+str(counter)),
+            "nickName": tcl_thing.get("nick_name", "Fake_nick_name_"+str(counter)),
+            "deviceName": tcl_thing.get("device_name", "Fake_device_name_"+str(counter)),
+            'productKey': tcl_thing.get("product_key", "Fake_product_key_"+str(counter)),
+            'platform': tcl_thing.get("platform", "Fake_platform_"+str(counter)),
+            "category": tcl_thing.get("category", "Fake_category_"+str(counter)),
+            "firmwareVersion": tcl_thing.get("firmware_version", "Fake_firmware_version_"+str(counter)),
+            "isOnline": tcl_thing.get("is_online",1),
+            "room": tcl_thing.get("room", "Fake_room_"+str(counter)),
+            "type": tcl_thing.get("type", 0),
+            "deviceType": tcl_thing.get("device_type", "Fake_device_type_"+str(counter)),
+            "netType": tcl_thing.get("net_type", 0),
+        })
+        counter+=1
+    index.things = GetThingsResponse({"code":200, "message":"fake data", "data":dataList})
 
-    return GetThingsResponse(data)
+    counter = 1
+    for aws_thing in data.get("aws_init", {}).get("aws_things", []):
+        aws_device_id = aws_thing.get("deviceId", "Fake_device_id_"+str(counter))
+        # first match wins, like the linear scan this replaces
+        index.reported_by_device_id.setdefault(aws_device_id, aws_thing.get("reported", {}))
+        counter+=1
+
+    counter = 1
+    for device_storage in data.get("device_storages", []):
+        storage_device_id = device_storage.get("deviceId", "Fake_device_id_"+str(counter))
+        index.rn_probe_by_device_id.setdefault(
+            storage_device_id,
+            safe_get_value(device_storage,"non_user_config.rn_probe_data.config_data",{}),
+        )
+        counter+=1
+
+    _LOGGER.info(
+        "Fake data index built: %s things, %s shadows, %s rn probe configs",
+        len(dataList),
+        len(index.reported_by_device_id),
+        len(index.rn_probe_by_device_id),
+    )
+    return index
+
+
+async def async_get_fake_data_index(hass: HomeAssistant) -> FakeDataIndex:
+    index: FakeDataIndex | None = hass.data.get(FAKE_DATA_INDEX_KEY)
+    now = time.monotonic()
+    if index is not None and now - index.checked_at < FAKE_DATA_CHECK_INTERVAL_SECONDS:
+        return index
+
+    path = get_internal_settings_path(hass)
+    mtime = await hass.async_add_executor_job(get_file_mtime, path)
+    if index is not None and index.mtime == mtime:
+        index.checked_at = now
+        return index
+
+    if index is not None:
+        _LOGGER.info("Fake data changed on disk, rebuilding index")
+    internal_settings = await get_internal_settings(hass)
+    index = build_fake_data_index(internal_settings, mtime)
+    hass.data[FAKE_DATA_INDEX_KEY] = index
+    return index
+
+
+async def aws_iot_get_all_things(hass: HomeAssistant):
+    index = await async_get_fake_data_index(hass)
+    return index.things
 
 async def aws_iot_get_thing(hass: HomeAssistant, device_id: str):
-    _LOGGER.info("aws_iot_get_thing (%s)", device_id)
+    _LOGGER.debug("aws_iot_get_thing (%s)", device_id)
+    index = await async_get_fake_data_index(hass)
+    reported = index.reported_by_device_id.get(device_id, {})
+    # copies: Device and the change detection must not share the cached dict
     data={
         "state":{
-            "desired":{},
-            "reported":{}
+            "desired":dict(reported),
+            "reported":dict(reported)
         }
     }
-   
-    internal_settings = await get_internal_settings(hass)
-    
-    diganostics = safe_get_value(internal_settings, "fake.data", {})
-    if "data" in diganostics:
-        counter = 1
-        for aws_thing in diganostics.get("data",{}).get("aws_init", {}).get("aws_things", []):
-            aws_device_id = aws_thing.get("deviceId", "Fake_device_id_"+str(counter))
-            _LOGGER.info("aws_thing - %s", aws_device_id)
-            if aws_device_id == device_id:
-                _LOGGER.info("aws_iot_get_thing found fake device %s", aws_device_id)
-                data["state"]["desired"] = aws_thing.get("reported", {})
-                data["state"]["reported"] = aws_thing.get("reported", {})
-                break
-            counter+=1        
-    
-    _LOGGER.info("aws_iot_get_thing data:(%s)", data)
+    _LOGGER.debug("aws_iot_get_thing data:(%s)", data)
     return data
 
 
@@ -75,17 +141,10 @@ async def device_rn_probe_fetch_and_parse_config(hass, device_id: str):
         "message":"fake data",
     }
     dataList=[]
-   
-    internal_settings = await get_internal_settings(hass)
-    diganostics = safe_get_value(internal_settings, "fake.data", {})
-    if "data" in diganostics:
-        counter = 1
-        for device_storage in diganostics.get("data", {}).get("device_storages", []):
-            storage_device_id = device_storage.get("deviceId", "Fake_device_id_"+str(counter))            
-            if storage_device_id == device_id:
-                dataList.append(safe_get_value(device_storage,"non_user_config.rn_probe_data.config_data",{}))                
-                break
-            counter+=1  
-    
-    data["data"]=dataList    
-    return ConfigGetResponse(data)
\ No newline at end of file
+
+    index = await async_get_fake_data_index(hass)
+    if device_id in index.rn_probe_by_device_id:
+        dataList.append(index.rn_probe_by_device_id[device_id])
+
+    data["data"]=dataList
+    return ConfigGetResponse(data)
@@ -14,6 +14,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .composite_operation import CompositeOperation
 from .config_entry import New_NameConfigEntry
 from .coordinator import IotDeviceCoordinator
 from .device import Device
@@ -166,28 +167,46 @@ class DeHumidifierHandler(TclEntityBase, HumidifierEntity):
 
     def refresh_device(self) -> None:
         self.device = self.coordinator.get_device_by_id(self.device.device_id)
+        self.refresh_handlers()
+
+    def refresh_handlers(self) -> None:
         self.iot_handler_power.refreshDevice(self.device)
         self.iot_handler_humidity.refreshDevice(self.device)
         self.iot_handler_mode.refreshDevice(self.device)
 
+    def update_attributes(self) -> None:
+        super().update_attributes()
+        self.refresh_handlers()
+        self._attr_is_on = self.is_on_fn(self.device)
+        self._attr_mode = map_mode_to_humidifier_mode(self.current_mode_fn(self.device))
+        self._attr_target_humidity = self.target_humidity_fn(self.device)
+        self._attr_current_humidity = self.current_humidity_fn(self.device)
+
+    def new_operation(self) -> CompositeOperation:
+        self.refresh_device()
+        return CompositeOperation(
+            hass=self.hass, coordinator=self.coordinator, device=self.device
+        )
+
     async def async_turn_on(self, **kwargs: Any) -> None:
-        await self.iot_handler_power.call_switch(1)
-        await self.coordinator.async_refresh()
+        operation = self.new_operation()
+        await operation.async_add_power(self.iot_handler_power, 1)
+        await operation.async_execute()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        await self.iot_handler_power.call_switch(0)
-        await self.coordinator.async_refresh()
+        operation = self.new_operation()
+        await operation.async_add_power(self.iot_handler_power, 0)
+        await operation.async_execute()
 
     async def async_set_humidity(self, humidity: int) -> None:
-        self.refresh_device()
-        await self.iot_handler_humidity.call_set_number(humidity)
-        await self.iot_handler_humidity.store_humidity(humidity)
-        await self.coordinator.async_refresh()
+        operation = self.new_operation()
+        await operation.async_add_humidity(self.iot_handler_humidity, humidity)
+        await operation.async_execute()
         self.async_write_ha_state()
 
     async def async_set_mode(self, mode: str) -> None:
-        self.refresh_device()
-        await self.iot_handler_mode.call_select_option(
-                map_humidifier_mode_to_tcl_mode(mode)
-            )
-        await self.coordinator.async_refresh()
+        operation = self.new_operation()
+        await operation.async_add_mode(
+            self.iot_handler_mode, map_humidifier_mode_to_tcl_mode(mode)
+        )
+        await operation.async_execute()
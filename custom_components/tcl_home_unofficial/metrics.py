@@ -0,0 +1,219 @@
+"""Per-operation latency and error telemetry for the cloud calls.
+
+A MetricsRecorder is owned by the SessionManager and shared with AwsIot.
+When metrics collection is disabled every measure() call returns a shared
+no-op object, so the instrumented code paths pay only a method call.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from enum import StrEnum
+import logging
+import math
+import threading
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_METRICS_WINDOW_SIZE = 200
+DEFAULT_METRICS_WINDOW_SECONDS = 900
+
+
+class MetricOperationEnum(StrEnum):
+    GET_THINGS = "get_things"
+    GET_THING_SHADOW = "get_thing_shadow"
+    PUBLISH = "publish"
+    ENERGY_CONSUMPTION = "energy_consumption"
+    WORK_TIME = "work_time"
+    AUTH = "auth"
+    REFRESH_TOKENS = "refresh_tokens"
+    AWS_CREDENTIALS = "aws_credentials"
+    CLOUD_URLS = "cloud_urls"
+    CONFIG_GET = "config_get"
+
+
+@dataclass
+class OperationSnapshot:
+    operation: str
+    count: int
+    errors: int
+    error_rate: float
+    p50_ms: float | None
+    p95_ms: float | None
+    p99_ms: float | None
+    window_count: int
+
+    def as_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "error_rate": self.error_rate,
+            "p50_ms": self.p50_ms,
+            "p95_ms": self.p95_ms,
+            "p99_ms": self.p99_ms,
+            "window_count": self.window_count,
+        }
+
+
+def percentile(sorted_values: list[float], pct: float) -> float | None:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = math.ceil(pct / 100 * len(sorted_values)) - 1
+    return sorted_values[max(0, min(len(sorted_values) - 1, rank))]
+
+
+class OperationStats:
+    """Lifetime counters plus a rolling window of (timestamp, duration_ms, failed)."""
+
+    def __init__(self, window_size: int, window_seconds: int) -> None:
+        self.count = 0
+        self.errors = 0
+        self.window_seconds = window_seconds
+        self.samples: deque[tuple[float, float, bool]] = deque(maxlen=window_size)
+
+    def add(self, timestamp: float, duration_ms: float, failed: bool) -> None:
+        self.count += 1
+        if failed:
+            self.errors += 1
+        self.samples.append((timestamp, duration_ms, failed))
+
+    def snapshot(self, operation: str, now: float) -> OperationSnapshot:
+        oldest = now - self.window_seconds
+        while self.samples and self.samples[0][0] < oldest:
+            self.samples.popleft()
+
+        durations = sorted(sample[1] for sample in self.samples)
+        window_errors = sum(1 for sample in self.samples if sample[2])
+        window_count = len(durations)
+        return OperationSnapshot(
+            operation=operation,
+            count=self.count,
+            errors=self.errors,
+            error_rate=round(window_errors / window_count, 4) if window_count else 0.0,
+            p50_ms=_round_ms(percentile(durations, 50)),
+            p95_ms=_round_ms(percentile(durations, 95)),
+            p99_ms=_round_ms(percentile(durations, 99)),
+            window_count=window_count,
+        )
+
+
+def _round_ms(value: float | None) -> float | None:
+    return None if value is None else round(value, 1)
+
+
+class _Measurement:
+    __slots__ = ("_recorder", "_operation", "_started", "failed")
+
+    def __init__(self, recorder: MetricsRecorder, operation: str) -> None:
+        self._recorder = recorder
+        self._operation = operation
+        self._started = 0.0
+        self.failed = False
+
+    def set_failed(self, failed: bool = True) -> None:
+        self.failed = failed
+
+    def __enter__(self) -> _Measurement:
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        duration_ms = (time.perf_counter() - self._started) * 1000
+        self._recorder.record(
+            self._operation, duration_ms, self.failed or exc_type is not None
+        )
+        return False
+
+
+class _NullMeasurement:
+    __slots__ = ()
+
+    def set_failed(self, failed: bool = True) -> None:
+        pass
+
+    def __enter__(self) -> _NullMeasurement:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+_NULL_MEASUREMENT = _NullMeasurement()
+
+
+class MetricsRecorder:
+    """Collect per-operation counts, error rates and latency percentiles."""
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        window_size: int = DEFAULT_METRICS_WINDOW_SIZE,
+        window_seconds: int = DEFAULT_METRICS_WINDOW_SECONDS,
+    ) -> None:
+        self.enabled = enabled
+        self.window_size = window_size
+        self.window_seconds = window_seconds
+        self._stats: dict[str, OperationStats] = {}
+        self._counters: dict[str, int] = {}
+        # get_thing and publish are measured on executor threads
+        self._lock = threading.Lock()
+
+    def measure(self, operation: str) -> _Measurement | _NullMeasurement:
+        if not self.enabled:
+            return _NULL_MEASUREMENT
+        return _Measurement(self, operation)
+
+    def record(self, operation: str, duration_ms: float, failed: bool) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            stats = self._stats.get(operation)
+            if stats is None:
+                stats = OperationStats(self.window_size, self.window_seconds)
+                self._stats[operation] = stats
+            stats.add(time.monotonic(), duration_ms, failed)
+
+    def increment(self, counter: str, value: int = 1) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[counter] = self._counters.get(counter, 0) + value
+
+    def get_counter(self, counter: str) -> int:
+        return self._counters.get(counter, 0)
+
+    def get_operation_snapshot(self, operation: str) -> OperationSnapshot | None:
+        with self._lock:
+            stats = self._stats.get(operation)
+            if stats is None:
+                return None
+            return stats.snapshot(operation, time.monotonic())
+
+    def snapshot(self) -> dict:
+        now = time.monotonic()
+        with self._lock:
+            operations = {
+                operation: stats.snapshot(operation, now).as_dict()
+                for operation, stats in self._stats.items()
+            }
+            counters = dict(self._counters)
+        return {
+            "enabled": self.enabled,
+            "window_size": self.window_size,
+            "window_seconds": self.window_seconds,
+            "operations": operations,
+            "counters": counters,
+        }
+
+    def set_enabled(self, enabled: bool) -> None:
+        if self.enabled != enabled:
+            _LOGGER.info("MetricsRecorder enabled: %s", enabled)
+        self.enabled = enabled
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats = {}
+            self._counters = {}
@@ -14,7 +14,7 @@ from .device import Device
 from .device_features import DeviceFeatureEnum
 from .device_types import DeviceTypeEnum
 from .device_enums import ModeEnum, DehumidifierModeEnum
-from .data_storage import set_stored_data, get_stored_data
+from .device_preferences import DevicePreferences, get_device_preferences
 from .tcl_entity_base import TclEntityBase
 
 _LOGGER = logging.getLogger(__name__)
@@ -37,37 +37,47 @@ class DesiredStateHandlerForNumber:
         self.device = device
 
     async def call_set_number(self, value: int | float) -> str:
+        desired_state = self.desired_state_for_number(value)
+        if desired_state is None:
+            return None
+        return await self.coordinator.get_aws_iot().async_set_desired_state(
+            self.device.device_id, desired_state
+        )
+
+    def desired_state_for_number(self, value: int | float) -> dict | None:
+        """None when the value is out of range."""
         match self.deviceFeature:
             case DeviceFeatureEnum.NUMBER_TARGET_TEMPERATURE:
-                return await self.NUMBER_TARGET_TEMPERATURE(value=value)
+                return self.desired_state_NUMBER_TARGET_TEMPERATURE(value=value)
             case DeviceFeatureEnum.NUMBER_TARGET_DEGREE:
-                return await self.NUMBER_TARGET_DEGREE(value=value)
+                return self.desired_state_NUMBER_TARGET_DEGREE(value=value)
             case DeviceFeatureEnum.NUMBER_DEHUMIDIFIER_HUMIDITY:
-                return await self.NUMBER_DEHUMIDIFIER_HUMIDITY(value=value)
+                return self.desired_state_NUMBER_DEHUMIDIFIER_HUMIDITY(value=value)
+        return None
 
     async def store_target_temp(self, value: int | float):
-        stored_data = await get_stored_data(self.hass, self.device.device_id)
+        preferences = await get_device_preferences(self.hass, self.device.device_id)
+        self.set_stored_target_temp(preferences, value)
+
+    def set_stored_target_temp(self, preferences: DevicePreferences, value: int | float) -> None:
         mode = self.device.mode_value_to_enum_mapp.get(
             self.device.data.work_mode, ModeEnum.AUTO
         )
-        # _LOGGER.info("Storing target temperature %s for mode %s in device storage %s",value,mode,self.device.device_id)
-        stored_data["target_temperature"][mode]["value"] = value
-        self.device.storage = stored_data
-        await set_stored_data(self.hass, self.device.device_id, stored_data)
-
+        preferences.set_target_temperature(mode, value)
+        self.device.storage = preferences.stored_data
 
     async def store_humidity(self, value: int | float):
-        stored_data = await get_stored_data(self.hass, self.device.device_id)
+        preferences = await get_device_preferences(self.hass, self.device.device_id)
+        self.set_stored_humidity(preferences, value)
+
+    def set_stored_humidity(self, preferences: DevicePreferences, value: int | float) -> None:
         mode = self.device.mode_value_to_enum_mapp.get(
             self.device.data.work_mode, DehumidifierModeEnum.DRY
         )
-        # _LOGGER.info("Storing target temperature %s for mode %s in device storage %s",value,mode,self.device.device_id)
-        stored_data["humidity"][mode]["value"] = value
-        self.device.storage = stored_data
-        await set_stored_data(self.hass, self.device.device_id, stored_data)
+        preferences.set_humidity(mode, value)
+        self.device.storage = preferences.stored_data
 
-    async def NUMBER_TARGET_TEMPERATURE(self, value: int | float):
-        # _LOGGER.info("Setting target temperature to %s %s", value, self.device)
+    def desired_state_NUMBER_TARGET_TEMPERATURE(self, value: int | float) -> dict | None:
         min_temp = self.device.data.lower_temperature_limit
         max_temp = self.device.data.upper_temperature_limit
 
@@ -78,17 +88,15 @@ class DesiredStateHandlerForNumber:
                 min_temp,
                 max_temp,
             )
-            return
+            return None
 
         desired_state = {"targetTemperature": value}
         if DeviceFeatureEnum.INTERNAL_SET_TFT_WITH_TT in self.device.supported_features:
             value_fahrenheit_to_set = celsius_to_fahrenheit(value)
             desired_state["targetFahrenheitTemp"] = value_fahrenheit_to_set
-        return await self.coordinator.get_aws_iot().async_set_desired_state(
-            self.device.device_id, desired_state
-        )
+        return desired_state
 
-    async def NUMBER_TARGET_DEGREE(self, value: int | float):
+    def desired_state_NUMBER_TARGET_DEGREE(self, value: int | float) -> dict | None:
         min_temp = self.device.data.lower_temperature_limit
         max_temp = self.device.data.upper_temperature_limit
 
@@ -99,19 +107,16 @@ class DesiredStateHandlerForNumber:
                 min_temp,
                 max_temp,
             )
-            return
+            return None
 
         value_celsius_to_set = value
         value_fahrenheit_to_set = celsius_to_fahrenheit(value)
-        desired_state = {
+        return {
             "targetCelsiusDegree": value_celsius_to_set,
             "targetFahrenheitDegree": value_fahrenheit_to_set,
         }
-        return await self.coordinator.get_aws_iot().async_set_desired_state(
-            self.device.device_id, desired_state
-        )
-        
-    async def NUMBER_DEHUMIDIFIER_HUMIDITY(self, value: int | float):
+
+    def desired_state_NUMBER_DEHUMIDIFIER_HUMIDITY(self, value: int | float) -> dict | None:
         min_temp = 1
         max_temp = 99
 
@@ -122,12 +127,9 @@ class DesiredStateHandlerForNumber:
                 min_temp,
                 max_temp,
             )
-            return
+            return None
 
-        desired_state = {"Humidity": value}
-        return await self.coordinator.get_aws_iot().async_set_desired_state(
-            self.device.device_id, desired_state
-        )
+        return {"Humidity": value}
 
 
 def is_allowed(device: Device) -> bool:
@@ -240,29 +242,23 @@ class TemperatureHandler(TclEntityBase, NumberEntity):
             "native_temp_step"
         ]
 
-    @property
-    def available(self) -> bool:
-        if self.device.is_online:
-            return self.available_fn(self.device)
-        return False
+    def update_attributes(self) -> None:
+        super().update_attributes()
+        self.iot_handler.refreshDevice(self.device)
+        self._attr_native_value = self.current_value_fn(self.device)
+        self._attr_available = bool(self.device.is_online) and self.available_fn(self.device)
 
     @property
     def device_class(self) -> str:
         return NumberDeviceClass.TEMPERATURE
 
-    @property
-    def native_value(self) -> int | float:
-        self.device = self.coordinator.get_device_by_id(self.device.device_id)
-        self.iot_handler.refreshDevice(self.device)
-        return self.current_value_fn(self.device)
-
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
         self.device = self.coordinator.get_device_by_id(self.device.device_id)
         self.iot_handler.refreshDevice(self.device)
         await self.iot_handler.call_set_number(value)
         await self.iot_handler.store_target_temp(value)
-        await self.coordinator.async_refresh()
+        await self.coordinator.async_refresh_after_command(self.device.device_id)
         self.async_write_ha_state()
 
 class HumidityHandler(TclEntityBase, NumberEntity):
@@ -300,27 +296,21 @@ class HumidityHandler(TclEntityBase, NumberEntity):
         self._attr_native_max_value = 99
         self._attr_native_step = 1
 
-    @property
-    def available(self) -> bool:
-        if self.device.is_online:
-            return self.available_fn(self.device)
-        return False
+    def update_attributes(self) -> None:
+        super().update_attributes()
+        self.iot_handler.refreshDevice(self.device)
+        self._attr_native_value = self.current_value_fn(self.device)
+        self._attr_available = bool(self.device.is_online) and self.available_fn(self.device)
 
     @property
     def device_class(self) -> str:
         return NumberDeviceClass.HUMIDITY
 
-    @property
-    def native_value(self) -> int | float:
-        self.device = self.coordinator.get_device_by_id(self.device.device_id)
-        self.iot_handler.refreshDevice(self.device)
-        return self.current_value_fn(self.device)
-
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
         self.device = self.coordinator.get_device_by_id(self.device.device_id)
         self.iot_handler.refreshDevice(self.device)
         await self.iot_handler.call_set_number(value)
         await self.iot_handler.store_humidity(value)
-        await self.coordinator.async_refresh()
+        await self.coordinator.async_refresh_after_command(self.device.device_id)
         self.async_write_ha_state()
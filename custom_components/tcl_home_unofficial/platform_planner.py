@@ -0,0 +1,144 @@
+"""Which platforms a config entry forwards to.
+
+Every platform module is imported and set up when forwarded, even when it
+creates no entity. The planner forwards only the platforms the discovered
+devices need: a platform per supported feature (from the feature's prefix),
+plus the ones every device gets. It may forward a platform that ends up
+without entities, never leave out one that has some.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+import logging
+
+from homeassistant.const import Platform
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .config_entry import New_NameConfigEntry
+from .device import Device
+from .device_features import DeviceFeatureEnum, DeviceFeatureSet
+
+_LOGGER = logging.getLogger(__name__)
+
+# declaration order, as forwarded before
+ALL_PLATFORMS: tuple[Platform, ...] = (
+    Platform.BINARY_SENSOR,
+    Platform.SENSOR,
+    Platform.SWITCH,
+    Platform.SELECT,
+    Platform.NUMBER,
+    Platform.BUTTON,
+    Platform.REMOTE,
+    Platform.CLIMATE,
+    Platform.HUMIDIFIER,
+    Platform.TEXT,
+)
+
+# online sensor, reload / reset buttons, diagnostic texts
+IMPLEMENTED_DEVICE_PLATFORMS = frozenset(
+    {Platform.BINARY_SENSOR, Platform.BUTTON, Platform.TEXT}
+)
+NON_IMPLEMENTED_DEVICE_PLATFORMS = frozenset(
+    {Platform.REMOTE, Platform.BUTTON, Platform.TEXT}
+)
+# the metrics sensors are created without any device
+METRICS_PLATFORMS = frozenset({Platform.SENSOR})
+
+FEATURE_PREFIX_PLATFORMS: dict[str, Platform] = {
+    "sensor": Platform.SENSOR,
+    "switch": Platform.SWITCH,
+    "user_config": Platform.SWITCH,
+    "select": Platform.SELECT,
+    "number": Platform.NUMBER,
+    "button": Platform.BUTTON,
+    "climate": Platform.CLIMATE,
+    "humidifier": Platform.HUMIDIFIER,
+    "diagnosic": Platform.TEXT,
+}
+FEATURE_PLATFORM_OVERRIDES: dict[DeviceFeatureEnum, Platform] = {
+    DeviceFeatureEnum.SENSOR_IS_ONLINE: Platform.BINARY_SENSOR,
+    DeviceFeatureEnum.SENSOR_DEHUMIDIFIER_WATER_BUCKET_FULL: Platform.BINARY_SENSOR,
+}
+
+
+def build_platform_features() -> dict[Platform, DeviceFeatureSet]:
+    features: dict[Platform, list[DeviceFeatureEnum]] = {}
+    for feature in DeviceFeatureEnum:
+        platform = FEATURE_PLATFORM_OVERRIDES.get(feature)
+        if platform is None:
+            platform = FEATURE_PREFIX_PLATFORMS.get(feature.value.split(".", 1)[0])
+        if platform is not None:
+            features.setdefault(platform, []).append(feature)
+    return {platform: DeviceFeatureSet(items) for platform, items in features.items()}
+
+
+PLATFORM_FEATURES: dict[Platform, DeviceFeatureSet] = build_platform_features()
+
+
+def get_required_platforms(
+    devices: Iterable[Device],
+    non_implemented_devices: Iterable[Device] = (),
+    collect_metrics: bool = False,
+) -> list[Platform]:
+    """The platforms to forward, in ALL_PLATFORMS order."""
+    required: set[Platform] = set(METRICS_PLATFORMS) if collect_metrics else set()
+    for device in devices:
+        required |= IMPLEMENTED_DEVICE_PLATFORMS
+        for platform, features in PLATFORM_FEATURES.items():
+            if platform not in required and device.supported_features & features:
+                required.add(platform)
+    for device in non_implemented_devices:
+        required |= NON_IMPLEMENTED_DEVICE_PLATFORMS
+    return [platform for platform in ALL_PLATFORMS if platform in required]
+
+
+def get_missing_platforms(
+    devices: Iterable[Device], forwarded: Iterable[Platform], collect_metrics: bool
+) -> list[Platform]:
+    """Platforms the polled devices need that were not forwarded."""
+    implemented = []
+    non_implemented = []
+    for device in devices:
+        (implemented if device.device_type is not None else non_implemented).append(device)
+    forwarded = set(forwarded)
+    return [
+        platform
+        for platform in get_required_platforms(implemented, non_implemented, collect_metrics)
+        if platform not in forwarded
+    ]
+
+
+def watch_for_missing_platforms(
+    hass: HomeAssistant, config_entry: New_NameConfigEntry
+) -> CALLBACK_TYPE:
+    """Reload the entry once a polled device needs a platform it did not forward.
+
+    Entities are built from the devices found at setup, so a new device type
+    (or a device whose features grew after it came online) gets its entities
+    by a reload, which plans the platforms again.
+    """
+    coordinator = config_entry.runtime_data.coordinator
+    scheduled = False
+
+    @callback
+    def _async_check_platforms() -> None:
+        nonlocal scheduled
+        if scheduled or coordinator.data is None:
+            return
+        missing = get_missing_platforms(
+            coordinator.data.devices,
+            config_entry.runtime_data.platforms,
+            coordinator.get_config_data().collect_metrics,
+        )
+        if not missing:
+            return
+        scheduled = True
+        _LOGGER.info(
+            "platform_planner: devices need platforms %s, reloading %s",
+            missing,
+            config_entry.entry_id,
+        )
+        hass.config_entries.async_schedule_reload(config_entry.entry_id)
+
+    return coordinator.async_add_listener(_async_check_platforms)
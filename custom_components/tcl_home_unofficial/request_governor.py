@@ -0,0 +1,174 @@
+"""Token-bucket request budget shared by every call to the TCL / AWS cloud.
+
+Priorities are implemented as token floors: a user command may take the last
+token in the bucket, polling must leave COMMAND_RESERVED_TOKENS behind, and
+background work (energy, work time, RN probes) must leave twice that. When a
+throttling or 5xx response is seen, polling and background requests are held
+back with an exponential, jittered backoff; user commands are never delayed
+by the backoff, only by the bucket itself.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from enum import IntEnum
+import logging
+import random
+import time
+
+from .const import (
+    COMMAND_RESERVED_TOKENS,
+    DEFAULT_REQUEST_BURST,
+    DEFAULT_REQUEST_RATE_PER_SECOND,
+    REQUEST_BACKOFF_BASE_SECONDS,
+    REQUEST_BACKOFF_MAX_SECONDS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+THROTTLING_ERROR_CODES = {
+    "ThrottlingException",
+    "TooManyRequestsException",
+    "RequestLimitExceeded",
+    "ServiceUnavailableException",
+    "InternalFailureException",
+}
+
+
+class RequestPriorityEnum(IntEnum):
+    COMMAND = 0
+    POLL = 1
+    BACKGROUND = 2
+
+
+def get_http_status_code(err: Exception) -> int | None:
+    """Status code of a TclServiceError or a botocore ClientError, if any."""
+    status_code = getattr(err, "status_code", None)
+    if status_code is not None:
+        return status_code
+    response = getattr(err, "response", None)
+    if isinstance(response, dict):
+        return response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+    return None
+
+
+def get_aws_error_code(err: Exception) -> str | None:
+    response = getattr(err, "response", None)
+    if isinstance(response, dict):
+        return response.get("Error", {}).get("Code")
+    return None
+
+
+def is_throttling_error(err: Exception) -> bool:
+    """Return True for 429 / 5xx responses and AWS throttling error codes."""
+    if get_aws_error_code(err) in THROTTLING_ERROR_CODES:
+        return True
+    status_code = get_http_status_code(err)
+    return status_code is not None and (status_code == 429 or status_code >= 500)
+
+
+class RequestGovernor:
+    """Token bucket with priority floors and throttling backoff."""
+
+    def __init__(
+        self,
+        rate_per_second: float = DEFAULT_REQUEST_RATE_PER_SECOND,
+        burst: int = DEFAULT_REQUEST_BURST,
+        command_reserved_tokens: int = COMMAND_RESERVED_TOKENS,
+        backoff_base_seconds: float = REQUEST_BACKOFF_BASE_SECONDS,
+        backoff_max_seconds: float = REQUEST_BACKOFF_MAX_SECONDS,
+    ) -> None:
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self.floors = {
+            RequestPriorityEnum.COMMAND: 0,
+            RequestPriorityEnum.POLL: min(burst - 1, command_reserved_tokens),
+            RequestPriorityEnum.BACKGROUND: min(burst - 1, command_reserved_tokens * 2),
+        }
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._backoff_seconds = 0.0
+        self._backoff_until = 0.0
+        self.granted = {priority.name: 0 for priority in RequestPriorityEnum}
+        self.waited_seconds = 0.0
+        self.throttled_count = 0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate_per_second)
+            self._updated = now
+
+    def _try_take(self, priority: RequestPriorityEnum, now: float) -> float:
+        """Take a token or return how long to sleep before trying again."""
+        self._refill(now)
+        if priority != RequestPriorityEnum.COMMAND and now < self._backoff_until:
+            return self._backoff_until - now
+        floor = self.floors[priority]
+        if self._tokens - 1 >= floor:
+            self._tokens -= 1
+            return 0
+        return (floor + 1 - self._tokens) / self.rate_per_second
+
+    async def acquire(
+        self, priority: RequestPriorityEnum = RequestPriorityEnum.POLL
+    ) -> None:
+        started = time.monotonic()
+        while True:
+            now = time.monotonic()
+            wait = self._try_take(priority, now)
+            if wait <= 0:
+                break
+            await asyncio.sleep(wait)
+        self.granted[priority.name] += 1
+        self.waited_seconds += time.monotonic() - started
+
+    def report_success(self) -> None:
+        if self._backoff_seconds:
+            _LOGGER.info("RequestGovernor: cloud recovered, backoff cleared")
+            self._backoff_seconds = 0.0
+            self._backoff_until = 0.0
+
+    def report_failure(self, err: Exception) -> None:
+        if not is_throttling_error(err):
+            return
+        self.throttled_count += 1
+        if self._backoff_seconds:
+            self._backoff_seconds = min(
+                self.backoff_max_seconds, self._backoff_seconds * 2
+            )
+        else:
+            self._backoff_seconds = self.backoff_base_seconds
+        delay = self._backoff_seconds * random.uniform(0.5, 1.0)
+        self._backoff_until = max(self._backoff_until, time.monotonic() + delay)
+        _LOGGER.warning(
+            "RequestGovernor: throttled by cloud (%s), backing off %.1fs", err, delay
+        )
+
+    @asynccontextmanager
+    async def request(self, priority: RequestPriorityEnum = RequestPriorityEnum.POLL):
+        await self.acquire(priority)
+        try:
+            yield
+        except Exception as err:
+            self.report_failure(err)
+            raise
+        self.report_success()
+
+    def snapshot(self) -> dict:
+        self._refill(time.monotonic())
+        return {
+            "rate_per_second": self.rate_per_second,
+            "burst": self.burst,
+            "tokens": round(self._tokens, 2),
+            "backoff_seconds": self._backoff_seconds,
+            "backoff_remaining_seconds": round(
+                max(0.0, self._backoff_until - time.monotonic()), 1
+            ),
+            "granted": dict(self.granted),
+            "waited_seconds": round(self.waited_seconds, 2),
+            "throttled_count": self.throttled_count,
+        }
@@ -1,6 +1,9 @@
 """."""
 
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
 import logging
+from typing import Any
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.core import HomeAssistant
@@ -8,789 +11,230 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .config_entry import New_NameConfigEntry
 from .coordinator import IotDeviceCoordinator
-from .data_storage import (get_stored_data, safe_get_value, safe_set_value,
-                           set_stored_data)
 from .device import Device, get_desired_state_for_mode_change
-from .device_enums import (AirPurifierFanWindSpeedStrEnum,
+from .device_enums import (AIR_PURIFIER_FAN_WIND_SPEED_CODEC,
+                           AIR_PURIFIER_WORK_MODE_CODEC, FRESH_AIR_CODEC,
+                           GENERATOR_MODE_CODEC,
+                           LEFT_AND_RIGHT_AIR_SUPPLY_VECTOR_CODEC,
+                           SLEEP_MODE_CODEC, SWING_DIRECTIONS,
+                           TEMPERATURE_TYPE_CODEC,
+                           UP_AND_DOWN_AIR_SUPPLY_VECTOR_CODEC,
+                           WIND_FEELING_CODEC, WIND_SEED_7_GEAR_CODEC,
+                           WIND_SPEED_CODEC, WIND_SPEED_LOW_MEDIUM_HIGH_CODEC,
+                           WINDOW_AC_WIND_SEED_CODEC,
+                           AirPurifierFanWindSpeedStrEnum,
                            AirPurifierWorkModeStrEnum, DehumidifierModeEnum,
-                           FreshAirEnum, GeneratorModeEnum,
-                           LeftAndRightAirSupplyVectorEnum, ModeEnum,
-                           PortableWind4ValueSeedEnum, PortableWindSeedEnum,
-                           SleepModeEnum, TemperatureTypeEnum,
-                           UpAndDownAirSupplyVectorEnum, WindFeelingEnum,
-                           WindowAcWindSeedEnum, WindSeed7GearEnum,
-                           WindSeedEnum, WindSpeedLowMediumHigh,
-                           getAirPurifierFanWindSpeed, getAirPurifierWorkMode,
-                           getFreshAir, getGeneratorMode,
-                           getLeftAndRightAirSupplyVector,
-                           getPortableWind4ValueSeed, getPortableWindSeed,
-                           getSleepMode, getTemperatureType,
-                           getUpAndDownAirSupplyVector, getWindFeeling,
-                           getWindowAcWindSeed, getWindSeed7Gear, getWindSpeed,
-                           getWindSpeedLowMediumHigh)
+                           EnumCodec, ModeEnum, PortableWind4ValueSeedEnum,
+                           PortableWindSeedEnum, WindFeelingEnum, WindSeedEnum,
+                           getWindSpeed)
 from .device_features import DeviceFeatureEnum
+from .device_preferences import DevicePreferences, get_device_preferences
 from .device_types import DeviceTypeEnum
+from .entity_descriptions import FeatureDescriptionRegistry, FeatureEntityDescription
 from .tcl_entity_base import TclEntityBase
 
 _LOGGER = logging.getLogger(__name__)
 
+BREEVA_DEVICE_TYPES = frozenset(
+    [
+        DeviceTypeEnum.AIR_PURIFIER_BREEVA_A2,
+        DeviceTypeEnum.AIR_PURIFIER_BREEVA_A3,
+        DeviceTypeEnum.AIR_PURIFIER_BREEVA_A5,
+    ]
+)
 
-class DesiredStateHandlerForSelect:
-    def __init__(
-        self,
-        hass: HomeAssistant,
-        coordinator: IotDeviceCoordinator,
-        deviceFeature: DeviceFeatureEnum,
-        device: Device,
-    ) -> None:
-        self.hass = hass
-        self.coordinator = coordinator
-        self.deviceFeature = deviceFeature
-        self.device = device
-
-    def refreshDevice(self, device: Device):
-        self.device = device
-
-    async def call_select_option(self, value: str) -> str:
-        _LOGGER.info(
-            "SelectHandler.async_select_option: %s - %s", value, self.deviceFeature
-        )
-        match self.deviceFeature:
-            case DeviceFeatureEnum.SELECT_SLEEP_MODE:
-                return await self.SELECT_SLEEP_MODE(value=value)
-            case DeviceFeatureEnum.SELECT_MODE:
-                return await self.SELECT_MODE(value=value)
-            case DeviceFeatureEnum.SELECT_DEHUMIDIFIER_WIND_SPEED_LOW_MEDIUM_HEIGH:
-                return await self.SELECT_DEHUMIDIFIER_WIND_SPEED_LOW_MEDIUM_HEIGH(
-                    value=value
-                )
-            case DeviceFeatureEnum.SELECT_WIND_SPEED:
-                if (
-                    self.device.device_type == DeviceTypeEnum.AIR_PURIFIER_BREEVA_A2
-                    or self.device.device_type == DeviceTypeEnum.AIR_PURIFIER_BREEVA_A3
-                    or self.device.device_type == DeviceTypeEnum.AIR_PURIFIER_BREEVA_A5
-                ):
-                    return await self.AIR_PURIFIER_BREEVA_FAN_WIND_SPEED(value=value)
-                else:
-                    return await self.SELECT_WIND_SPEED(value=value)
-            case DeviceFeatureEnum.SELECT_WIND_SPEED_7_GEAR:
-                return await self.SELECT_WIND_SPEED_7_GEAR(value=value)
-            case DeviceFeatureEnum.SELECT_PORTABLE_WIND_SPEED:
-                return await self.SELECT_PORTABLE_WIND_SPEED(value=value)
-            case DeviceFeatureEnum.SELECT_PORTABLE_WIND_4VALUE_SPEED:
-                return await self.SELECT_PORTABLE_WIND_4VALUE_SPEED(value=value)
-            case DeviceFeatureEnum.SELECT_WINDOW_AS_WIND_SPEED:
-                return await self.SELECT_WINDOW_AS_WIND_SPEED(value=value)
-            case DeviceFeatureEnum.SELECT_GENERATOR_MODE:
-                return await self.SELECT_GENERATOR_MODE(value=value)
-            case DeviceFeatureEnum.SELECT_WIND_FEELING:
-                return await self.SELECT_WIND_FEELING(value=value)
-            case DeviceFeatureEnum.SELECT_VERTICAL_DIRECTION:
-                return await self.SELECT_VERTICAL_DIRECTION(value=value)
-            case DeviceFeatureEnum.SELECT_HORIZONTAL_DIRECTION:
-                return await self.SELECT_HORIZONTAL_DIRECTION(value=value)
-            case DeviceFeatureEnum.SELECT_TEMPERATURE_TYPE:
-                return await self.SELECT_TEMPERATURE_TYPE(value=value)
-            case DeviceFeatureEnum.SELECT_FRESH_AIR:
-                return await self.SELECT_FRESH_AIR(value=value)
-            case DeviceFeatureEnum.SELECT_WORK_MODE:
-                return await self.SELECT_WORK_MODE(value=value)
-
-    def current_state(self) -> str:
-        match self.deviceFeature:
-            case DeviceFeatureEnum.SELECT_SLEEP_MODE:
-                return getSleepMode(self.device.data.sleep)
-            case DeviceFeatureEnum.SELECT_MODE:
-                if (
-                    DeviceFeatureEnum.INTERNAL_IS_DEHUMIDIFIER
-                    in self.device.supported_features
-                ):
-                    return self.device.mode_value_to_enum_mapp.get(
-                        self.device.data.work_mode, DehumidifierModeEnum.DRY
-                    )
-                else:
-                    default_ac_mode = (
-                        ModeEnum.AUTO
-                        if DeviceFeatureEnum.MODE_AC_AUTO
-                        in self.device.supported_features
-                        else ModeEnum.COOL
-                    )
-                    return self.device.mode_value_to_enum_mapp.get(
-                        self.device.data.work_mode, default_ac_mode
-                    )
-            case DeviceFeatureEnum.SELECT_WIND_SPEED:
-                if (
-                    self.device.device_type == DeviceTypeEnum.AIR_PURIFIER_BREEVA_A2
-                    or self.device.device_type == DeviceTypeEnum.AIR_PURIFIER_BREEVA_A3
-                    or self.device.device_type == DeviceTypeEnum.AIR_PURIFIER_BREEVA_A5
-                ):
-                    return getAirPurifierFanWindSpeed(self.device.data.wind_speed)
-                else:
-                    return getWindSpeed(
-                        wind_speed=self.device.data.wind_speed,
-                        turbo=self.device.data.turbo,
-                        silence_switch=self.device.data.silence_switch,
-                    )
-            case DeviceFeatureEnum.SELECT_DEHUMIDIFIER_WIND_SPEED_LOW_MEDIUM_HEIGH:
-                return getWindSpeedLowMediumHigh(self.device.data.wind_speed)
-            case DeviceFeatureEnum.SELECT_WIND_SPEED_7_GEAR:
-                return getWindSeed7Gear(self.device.data.wind_speed_7_gear)
-            case DeviceFeatureEnum.SELECT_WINDOW_AS_WIND_SPEED:
-                return getWindowAcWindSeed(self.device.data.wind_speed)
-            case DeviceFeatureEnum.SELECT_PORTABLE_WIND_SPEED:
-                return getPortableWindSeed(
-                    wind_speed=self.device.data.wind_speed,
-                    has_auto_mode=(
-                        DeviceFeatureEnum.MODE_AC_AUTO in self.device.supported_features
-                    ),
-                )
-            case DeviceFeatureEnum.SELECT_PORTABLE_WIND_4VALUE_SPEED:
-                return getPortableWind4ValueSeed(
-                    wind_speed=self.device.data.wind_speed,
-                    has_auto_mode=(
-                        DeviceFeatureEnum.MODE_AC_AUTO in self.device.supported_features
-                    ),
-                )
-            case DeviceFeatureEnum.SELECT_PORTABLE_WIND_4VALUE_SPEED:
-                return getPortableWind4ValueSeed(
-                    wind_speed=self.device.data.wind_speed,
-                    has_auto_mode=(
-                        DeviceFeatureEnum.MODE_AC_AUTO in self.device.supported_features
-                    ),
-                )
-            case DeviceFeatureEnum.SELECT_PORTABLE_WIND_4VALUE_SPEED:
-                return getPortableWind4ValueSeed(
-                    wind_speed=self.device.data.wind_speed,
-                    has_auto_mode=(
-                        DeviceFeatureEnum.MODE_AC_AUTO in self.device.supported_features
-                    ),
-                )
-            case DeviceFeatureEnum.SELECT_GENERATOR_MODE:
-                return getGeneratorMode(self.device.data.generator_mode)
-            case DeviceFeatureEnum.SELECT_FRESH_AIR:
-                return getFreshAir(self.device.data.new_wind_strength)
-            case DeviceFeatureEnum.SELECT_WIND_FEELING:
-                return getWindFeeling(self.device.data.soft_wind)
-            case DeviceFeatureEnum.SELECT_VERTICAL_DIRECTION:
-                return getUpAndDownAirSupplyVector(self.device.data.vertical_direction)
-            case DeviceFeatureEnum.SELECT_HORIZONTAL_DIRECTION:
-                return getLeftAndRightAirSupplyVector(
-                    self.device.data.horizontal_direction
-                )
-            case DeviceFeatureEnum.SELECT_TEMPERATURE_TYPE:
-                return getTemperatureType(self.device.data.temperature_type)
-            case DeviceFeatureEnum.SELECT_WORK_MODE:
-                return getAirPurifierWorkMode(self.device.data.work_mode)
-
-    def options_values(self) -> str:
-        match self.deviceFeature:
-            case DeviceFeatureEnum.SELECT_SLEEP_MODE:
-                return [e.value for e in SleepModeEnum]
-            case DeviceFeatureEnum.SELECT_MODE:
-                return self.device.get_supported_modes()
-            case DeviceFeatureEnum.SELECT_DEHUMIDIFIER_WIND_SPEED_LOW_MEDIUM_HEIGH:
-                return [e.value for e in WindSpeedLowMediumHigh]
-            case DeviceFeatureEnum.SELECT_WIND_SPEED:
-                if (
-                    self.device.device_type == DeviceTypeEnum.AIR_PURIFIER_BREEVA_A2
-                    or self.device.device_type == DeviceTypeEnum.AIR_PURIFIER_BREEVA_A3
-                    or self.device.device_type == DeviceTypeEnum.AIR_PURIFIER_BREEVA_A5
-                ):
-                    return [e.value for e in AirPurifierFanWindSpeedStrEnum]
-                else:
-                    return [e.value for e in WindSeedEnum]
-            case DeviceFeatureEnum.SELECT_WIND_SPEED_7_GEAR:
-                return [e.value for e in WindSeed7GearEnum]
-            case DeviceFeatureEnum.SELECT_PORTABLE_WIND_SPEED:
-                return [e.value for e in PortableWindSeedEnum]
-            case DeviceFeatureEnum.SELECT_PORTABLE_WIND_4VALUE_SPEED:
-                return [e.value for e in PortableWind4ValueSeedEnum]
-            case DeviceFeatureEnum.SELECT_WINDOW_AS_WIND_SPEED:
-                return [e.value for e in WindowAcWindSeedEnum]
-            case DeviceFeatureEnum.SELECT_GENERATOR_MODE:
-                return [e.value for e in GeneratorModeEnum]
-            case DeviceFeatureEnum.SELECT_FRESH_AIR:
-                return [e.value for e in FreshAirEnum]
-            case DeviceFeatureEnum.SELECT_WIND_FEELING:
-                return [e.value for e in WindFeelingEnum]
-            case DeviceFeatureEnum.SELECT_VERTICAL_DIRECTION:
-                return [e.value for e in UpAndDownAirSupplyVectorEnum]
-            case DeviceFeatureEnum.SELECT_HORIZONTAL_DIRECTION:
-                return [e.value for e in LeftAndRightAirSupplyVectorEnum]
-            case DeviceFeatureEnum.SELECT_TEMPERATURE_TYPE:
-                return [e.value for e in TemperatureTypeEnum]
-            case DeviceFeatureEnum.SELECT_WORK_MODE:
-                return [e.value for e in AirPurifierWorkModeStrEnum]
-
-    async def SELECT_SLEEP_MODE(self, value: SleepModeEnum):
-        desired_state = {}
-        match value:
-            case SleepModeEnum.STANDARD:
-                desired_state = {"sleep": 1}
-            case SleepModeEnum.ELDERLY:
-                desired_state = {"sleep": 2}
-            case SleepModeEnum.CHILD:
-                desired_state = {"sleep": 3}
-            case SleepModeEnum.OFF:
-                desired_state = {"sleep": 0}
-        return await self.coordinator.get_aws_iot().async_set_desired_state(
-            self.device.device_id, desired_state
-        )
-
-    async def SELECT_TEMPERATURE_TYPE(self, value: TemperatureTypeEnum):
-        desired_state = {}
-        match value:
-            case TemperatureTypeEnum.FAHRENHEIT:
-                desired_state = {"temperatureType": 1}
-            case TemperatureTypeEnum.CELSIUS:
-                desired_state = {"temperatureType": 0}
-        return await self.coordinator.get_aws_iot().async_set_desired_state(
-            self.device.device_id, desired_state
-        )
-
-    async def SELECT_MODE(self, value: ModeEnum):
-        stored_data = await get_stored_data(self.hass, self.device.device_id)
-        memorize_temp_by_mode = safe_get_value(
-            stored_data, "user_config.behavior.memorize_temp_by_mode", False
-        )
-        memorize_fan_speed_by_mode = safe_get_value(
-            stored_data, "user_config.behavior.memorize_fan_speed_by_mode", False
-        )
-        memorize_humidity_by_mode = safe_get_value(
-            stored_data, "user_config.behavior.memorize_humidity_by_mode", False
-        )
-
-        desired_state = {"workMode": self.device.mode_enum_to_value_mapp.get(value, 0)}
+# a mode change with memorize_fan_speed_by_mode restores the fan speed through
+# the last of these the device has
+MEMORIZED_FAN_SPEED_FEATURES = (
+    DeviceFeatureEnum.SELECT_WIND_SPEED,
+    DeviceFeatureEnum.SELECT_PORTABLE_WIND_SPEED,
+    DeviceFeatureEnum.SELECT_PORTABLE_WIND_4VALUE_SPEED,
+    DeviceFeatureEnum.SELECT_WIND_SPEED_7_GEAR,
+    DeviceFeatureEnum.SELECT_WINDOW_AS_WIND_SPEED,
+)
 
-        desired_state = get_desired_state_for_mode_change(
-            device=self.device,
-            stored_data=stored_data,
-            value=value,
-        )
 
-        if memorize_temp_by_mode:
-            saved_target_temperature = stored_data["target_temperature"][value]["value"]
-            desired_state["targetTemperature"] = saved_target_temperature
+def desired_state_for(codec: EnumCodec, key: str, value: str) -> dict:
+    """{key: shadow value} for a select option, or {} for an unknown option."""
+    encoded = codec.encode(value)
+    if encoded is None:
+        return {}
+    return {key: encoded}
 
-        if memorize_humidity_by_mode:
-            saved_humidity = stored_data["humidity"][value]["value"]
-            desired_state["Humidity"] = saved_humidity
 
-        if memorize_fan_speed_by_mode:
-            saved_fan_speed = stored_data["fan_speed"][value]["value"]
+def get_mode_or(default: str) -> Callable[[Device], str]:
+    """The current mode of a device, default for an unknown work mode."""
+    return lambda device: device.mode_value_to_enum_mapp.get(device.data.work_mode, default)
 
-            desired_state_override = {}
-            if DeviceFeatureEnum.SELECT_WIND_SPEED in self.device.supported_features:
-                desired_state_override = self.desired_state_SELECT_WIND_SPEED(
-                    saved_fan_speed
-                )
-            if (
-                DeviceFeatureEnum.SELECT_PORTABLE_WIND_SPEED
-                in self.device.supported_features
-            ):
-                desired_state_override = self.desired_state_SELECT_PORTABLE_WIND_SPEED(
-                    saved_fan_speed
-                )
-            if (
-                DeviceFeatureEnum.SELECT_PORTABLE_WIND_4VALUE_SPEED
-                in self.device.supported_features
-            ):
-                desired_state_override = (
-                    self.desired_state_SELECT_PORTABLE_WIND_4VALUE_SPEED(
-                        saved_fan_speed
-                    )
-                )
-            if (
-                DeviceFeatureEnum.SELECT_WIND_SPEED_7_GEAR
-                in self.device.supported_features
-            ):
-                desired_state_override = self.desired_state_SELECT_WIND_SPEED_7_GEAR(
-                    saved_fan_speed
-                )
-            if (
-                DeviceFeatureEnum.SELECT_WINDOW_AS_WIND_SPEED
-                in self.device.supported_features
-            ):
-                desired_state_override = self.desired_state_SELECT_WINDOW_AS_WIND_SPEED(
-                    saved_fan_speed
-                )
 
-            desired_state = {**desired_state, **desired_state_override}
-        return await self.coordinator.get_aws_iot().async_set_desired_state(
-            self.device.device_id, desired_state
-        )
+def get_ac_mode(device: Device) -> ModeEnum:
+    return device.mode_value_to_enum_mapp.get(
+        device.data.work_mode,
+        (
+            ModeEnum.AUTO
+            if DeviceFeatureEnum.MODE_AC_AUTO in device.supported_features
+            else ModeEnum.COOL
+        ),
+    )
 
-    def desired_state_SELECT_WIND_SPEED(self, value: WindSeedEnum):
-        desired_state = {}
-        match value:
-            case WindSeedEnum.STRONG:
-                desired_state = {
-                    "highTemperatureWind": 0,
-                    "turbo": 1,
-                    "silenceSwitch": 0,
-                    "windSpeed": 6,
-                }
-            case WindSeedEnum.HIGH:
-                desired_state = {
-                    "highTemperatureWind": 0,
-                    "turbo": 0,
-                    "silenceSwitch": 0,
-                    "windSpeed": 6,
-                }
-            case WindSeedEnum.MID_HIGH:
-                desired_state = {
-                    "highTemperatureWind": 0,
-                    "turbo": 0,
-                    "silenceSwitch": 0,
-                    "windSpeed": 5,
-                }
-            case WindSeedEnum.MEDIUM:
-                desired_state = {
-                    "highTemperatureWind": 0,
-                    "turbo": 0,
-                    "silenceSwitch": 0,
-                    "windSpeed": 4,
-                }
-            case WindSeedEnum.MID_LOW:
-                desired_state = {
-                    "highTemperatureWind": 0,
-                    "turbo": 0,
-                    "silenceSwitch": 0,
-                    "windSpeed": 3,
-                }
-            case WindSeedEnum.LOW:
-                desired_state = {
-                    "highTemperatureWind": 0,
-                    "turbo": 0,
-                    "silenceSwitch": 0,
-                    "windSpeed": 2,
-                }
-            case WindSeedEnum.MUTE:
-                desired_state = {
-                    "highTemperatureWind": 0,
-                    "turbo": 0,
-                    "silenceSwitch": 1,
-                    "windSpeed": 2,
-                }
-            case WindSeedEnum.AUTO:
-                desired_state = {
-                    "highTemperatureWind": 0,
-                    "turbo": 0,
-                    "silenceSwitch": 0,
-                    "windSpeed": 0,
-                }
-        return desired_state
 
-    async def SELECT_WIND_SPEED(self, value: WindSeedEnum):
-        stored_data = await get_stored_data(self.hass, self.device.device_id)
-        mode = self.device.mode_value_to_enum_mapp.get(
-            self.device.data.work_mode, ModeEnum.AUTO
-        )
-        stored_data, need_save = safe_set_value(
-            stored_data, "fan_speed." + mode + ".value", value, overwrite_if_exists=True
+def get_current_mode(device: Device) -> ModeEnum | DehumidifierModeEnum:
+    if DeviceFeatureEnum.INTERNAL_IS_DEHUMIDIFIER in device.supported_features:
+        return device.mode_value_to_enum_mapp.get(
+            device.data.work_mode, DehumidifierModeEnum.DRY
         )
-        if need_save:
-            await set_stored_data(self.hass, self.device.device_id, stored_data)
+    return get_ac_mode(device)
 
-        desired_state = self.desired_state_SELECT_WIND_SPEED(value)
-        return await self.coordinator.get_aws_iot().async_set_desired_state(
-            self.device.device_id, desired_state
-        )
 
-    async def AIR_PURIFIER_BREEVA_FAN_WIND_SPEED(
-        self, value: AirPurifierFanWindSpeedStrEnum
-    ):
-        stored_data = await get_stored_data(self.hass, self.device.device_id)
-        _LOGGER.info(
-            "AIR_PURIFIER_BREEVA_FAN_WIND_SPEED - stored_data: %s", stored_data
-        )
-        mode = self.device.mode_value_to_enum_mapp.get(
-            self.device.data.work_mode, AirPurifierFanWindSpeedStrEnum.LOW
-        )
-        stored_data, need_save = safe_set_value(
-            stored_data, "fan_speed." + mode + ".value", value, overwrite_if_exists=True
-        )
-        if need_save:
-            await set_stored_data(self.hass, self.device.device_id, stored_data)
-
-        desired_state = {}
-        _LOGGER.info("Setting AIR_PURIFIER_BREEVA_FAN_WIND_SPEED to %s", value)
-        match value:
-            case AirPurifierFanWindSpeedStrEnum.LOW:
-                desired_state = {"windSpeed": 1, "workMode": 2}
-            case AirPurifierFanWindSpeedStrEnum.MEDIUM:
-                desired_state = {"windSpeed": 2, "workMode": 2}
-            case AirPurifierFanWindSpeedStrEnum.HIGH:
-                desired_state = {"windSpeed": 3, "workMode": 2}
-        return await self.coordinator.get_aws_iot().async_set_desired_state(
-            self.device.device_id, desired_state
-        )
+DesiredStateFn = Callable[[Device, str, DevicePreferences], dict]
 
-    async def SELECT_WORK_MODE(self, value: AirPurifierWorkModeStrEnum):
-        stored_data = await get_stored_data(self.hass, self.device.device_id)
-        _LOGGER.info("SELECT_WORK_MODE - stored_data: %s", stored_data)
-        mode = self.device.mode_value_to_enum_mapp.get(
-            self.device.data.work_mode, AirPurifierWorkModeStrEnum.AUTO
-        )
-        stored_data, need_save = safe_set_value(
-            stored_data, "fan_speed." + mode + ".value", value, overwrite_if_exists=True
-        )
-        if need_save:
-            await set_stored_data(self.hass, self.device.device_id, stored_data)
-
-        desired_state = {}
-        _LOGGER.info("Setting SELECT_WORK_MODE to %s", value)
-        match value:
-            case AirPurifierWorkModeStrEnum.AUTO:
-                desired_state = {"workMode": 0}
-            case AirPurifierWorkModeStrEnum.SLEEP:
-                desired_state = {"windSpeed": 0, "workMode": 1}
-            case AirPurifierWorkModeStrEnum.FAN:
-                desired_state = {"windSpeed": 1, "workMode": 2}
-        return await self.coordinator.get_aws_iot().async_set_desired_state(
-            self.device.device_id, desired_state
-        )
 
-    def desired_state_SELECT_WIND_SPEED_7_GEAR(self, value: WindSeed7GearEnum):
-        desired_state = {}
-        match value:
-            case WindSeed7GearEnum.AUTO:
-                desired_state = {"windSpeedAutoSwitch": 1, "windSpeed7Gear": 0}
-            case WindSeed7GearEnum.TURBO:
-                desired_state = {"windSpeedAutoSwitch": 0, "windSpeed7Gear": 7}
-            case WindSeed7GearEnum.SPEED_1:
-                desired_state = {"windSpeedAutoSwitch": 0, "windSpeed7Gear": 1}
-            case WindSeed7GearEnum.SPEED_2:
-                desired_state = {"windSpeedAutoSwitch": 0, "windSpeed7Gear": 2}
-            case WindSeed7GearEnum.SPEED_3:
-                desired_state = {"windSpeedAutoSwitch": 0, "windSpeed7Gear": 3}
-            case WindSeed7GearEnum.SPEED_4:
-                desired_state = {"windSpeedAutoSwitch": 0, "windSpeed7Gear": 4}
-            case WindSeed7GearEnum.SPEED_5:
-                desired_state = {"windSpeedAutoSwitch": 0, "windSpeed7Gear": 5}
-            case WindSeed7GearEnum.SPEED_6:
-                desired_state = {"windSpeedAutoSwitch": 0, "windSpeed7Gear": 6}
-        return desired_state
+@dataclass(frozen=True, kw_only=True)
+class SelectDescription(FeatureEntityDescription):
+    """A select reading value_fn(device) through codec and writing {shadow_key: encoded}.
 
-    async def SELECT_WIND_SPEED_7_GEAR(self, value: WindSeed7GearEnum):
-        stored_data = await get_stored_data(self.hass, self.device.device_id)
-        mode = self.device.mode_value_to_enum_mapp.get(
-            self.device.data.work_mode, ModeEnum.AUTO
-        )
-        stored_data, need_save = safe_set_value(
-            stored_data, "fan_speed." + mode + ".value", value, overwrite_if_exists=True
-        )
-        if need_save:
-            await set_stored_data(self.hass, self.device.device_id, stored_data)
+    current_fn / options_fn / desired_state_fn replace the codec based
+    behaviour for the selects that do not map one shadow key.
+    """
 
-        desired_state = self.desired_state_SELECT_WIND_SPEED_7_GEAR(value)
-        return await self.coordinator.get_aws_iot().async_set_desired_state(
-            self.device.device_id, desired_state
-        )
+    icon: str
+    codec: EnumCodec | None = None
+    shadow_key: str | None = None
+    value_fn: Callable[[Device], Any] | None = None
+    current_fn: Callable[[Device], str] | None = None
+    options_fn: Callable[[Device], Sequence[str]] | None = None
+    desired_state_fn: DesiredStateFn | None = None
+    name_fn: Callable[[Device], str] | None = None
+    # set for the selects that are not always usable (DynamicSelectHandler)
+    available_fn: Callable[[Device], bool] | None = None
+    # set for the fan speeds: the mode their value is memorized for
+    fan_speed_mode_fn: Callable[[Device], str] | None = None
 
-    def desired_state_SELECT_DEHUMIDIFIER_WIND_SPEED_LOW_MEDIUM_HEIGH(
-        self, value: WindSpeedLowMediumHigh
-    ):
-        desired_state = {}
-        match value:
-            case WindSpeedLowMediumHigh.LOW:
-                desired_state = {"windSpeed": 0}
-            case WindSpeedLowMediumHigh.MEDIUM:
-                desired_state = {"windSpeed": 1}
-            case WindSpeedLowMediumHigh.HIGH:
-                desired_state = {"windSpeed": 2}
-        return desired_state
+    def get_name(self, device: Device) -> str:
+        return self.name if self.name_fn is None else self.name_fn(device)
 
-    async def SELECT_DEHUMIDIFIER_WIND_SPEED_LOW_MEDIUM_HEIGH(
-        self, value: WindSpeedLowMediumHigh
-    ):
-        stored_data = await get_stored_data(self.hass, self.device.device_id)
-        mode = self.device.mode_value_to_enum_mapp.get(
-            self.device.data.work_mode, ModeEnum.AUTO
-        )
-        stored_data, need_save = safe_set_value(
-            stored_data, "fan_speed." + mode + ".value", value, overwrite_if_exists=True
-        )
-        if need_save:
-            await set_stored_data(self.hass, self.device.device_id, stored_data)
+    def current_option(self, device: Device) -> str:
+        if self.current_fn is not None:
+            return self.current_fn(device)
+        return self.codec.decode(self.value_fn(device))
 
-        desired_state = (
-            self.desired_state_SELECT_DEHUMIDIFIER_WIND_SPEED_LOW_MEDIUM_HEIGH(value)
-        )
-        return await self.coordinator.get_aws_iot().async_set_desired_state(
-            self.device.device_id, desired_state
-        )
+    def options(self, device: Device) -> Sequence[str]:
+        if self.options_fn is not None:
+            return self.options_fn(device)
+        return self.codec.options
 
-    def desired_state_SELECT_PORTABLE_WIND_SPEED(self, value: PortableWindSeedEnum):
-        desired_state = {}
-        if DeviceFeatureEnum.MODE_AC_AUTO in self.device.supported_features:
-            match value:
-                case PortableWindSeedEnum.AUTO:
-                    desired_state = {"windSpeed": 0}
-                case PortableWindSeedEnum.LOW:
-                    desired_state = {"windSpeed": 1}
-                case PortableWindSeedEnum.HIGH:
-                    desired_state = {"windSpeed": 2}
-        else:
-            match value:
-                case PortableWindSeedEnum.LOW:
-                    desired_state = {"windSpeed": 0}
-                case PortableWindSeedEnum.HIGH:
-                    desired_state = {"windSpeed": 1}
+    def desired_state(self, device: Device, value: str, preferences: DevicePreferences) -> dict:
+        if self.desired_state_fn is not None:
+            return self.desired_state_fn(device, value, preferences)
+        return desired_state_for(self.codec, self.shadow_key, value)
 
-        return desired_state
 
-    async def SELECT_PORTABLE_WIND_SPEED(self, value: PortableWindSeedEnum):
-        stored_data = await get_stored_data(self.hass, self.device.device_id)
-        mode = self.device.mode_value_to_enum_mapp.get(
-            self.device.data.work_mode,
-            (
-                ModeEnum.AUTO
-                if DeviceFeatureEnum.MODE_AC_AUTO in self.device.supported_features
-                else ModeEnum.COOL
-            ),
-        )
-        stored_data, need_save = safe_set_value(
-            stored_data, "fan_speed." + mode + ".value", value, overwrite_if_exists=True
-        )
-        if need_save:
-            await set_stored_data(self.hass, self.device.device_id, stored_data)
-        desired_state = self.desired_state_SELECT_PORTABLE_WIND_SPEED(value)
-        return await self.coordinator.get_aws_iot().async_set_desired_state(
-            self.device.device_id, desired_state
-        )
+def desired_state_SELECT_MODE(
+    device: Device, value: ModeEnum, preferences: DevicePreferences
+) -> dict:
+    desired_state = get_desired_state_for_mode_change(
+        device=device,
+        stored_data=preferences.stored_data,
+        value=value,
+    )
 
-    def desired_state_SELECT_PORTABLE_WIND_4VALUE_SPEED(
-        self, value: PortableWind4ValueSeedEnum
-    ):
-        desired_state = {}
-        if DeviceFeatureEnum.MODE_AC_AUTO in self.device.supported_features:
-            match value:
-                case PortableWind4ValueSeedEnum.AUTO:
-                    desired_state = {"windSpeed": 0}
-                case PortableWind4ValueSeedEnum.LOW:
-                    desired_state = {"windSpeed": 1}
-                case PortableWind4ValueSeedEnum.MEDIUM:
-                    desired_state = {"windSpeed": 2}
-                case PortableWind4ValueSeedEnum.HIGH:
-                    desired_state = {"windSpeed": 3}
-        else:
-            match value:
-                case PortableWind4ValueSeedEnum.LOW:
-                    desired_state = {"windSpeed": 0}
-                case PortableWind4ValueSeedEnum.MEDIUM:
-                    desired_state = {"windSpeed": 1}
-                case PortableWind4ValueSeedEnum.HIGH:
-                    desired_state = {"windSpeed": 2}
+    if preferences.memorize_temp_by_mode:
+        desired_state["targetTemperature"] = preferences.get_target_temperature(value)
 
-        return desired_state
+    if preferences.memorize_humidity_by_mode:
+        desired_state["Humidity"] = preferences.get_humidity(value)
 
-    async def SELECT_PORTABLE_WIND_4VALUE_SPEED(
-        self, value: PortableWind4ValueSeedEnum
-    ):
-        stored_data = await get_stored_data(self.hass, self.device.device_id)
-        mode = self.device.mode_value_to_enum_mapp.get(
-            self.device.data.work_mode,
-            (
-                ModeEnum.AUTO
-                if DeviceFeatureEnum.MODE_AC_AUTO in self.device.supported_features
-                else ModeEnum.COOL
-            ),
-        )
-        stored_data, need_save = safe_set_value(
-            stored_data, "fan_speed." + mode + ".value", value, overwrite_if_exists=True
-        )
-        if need_save:
-            await set_stored_data(self.hass, self.device.device_id, stored_data)
-        desired_state = self.desired_state_SELECT_PORTABLE_WIND_4VALUE_SPEED(value)
-        return await self.coordinator.get_aws_iot().async_set_desired_state(
-            self.device.device_id, desired_state
-        )
+    if preferences.memorize_fan_speed_by_mode:
+        saved_fan_speed = preferences.get_fan_speed(value)
 
-    def desired_state_SELECT_WINDOW_AS_WIND_SPEED(self, value: WindowAcWindSeedEnum):
-        desired_state = {}
-        match value:
-            case WindowAcWindSeedEnum.AUTO:
-                desired_state = {"windSpeed": 0}
-            case WindowAcWindSeedEnum.SPEED_1:
-                desired_state = {"windSpeed": 2}
-            case WindowAcWindSeedEnum.SPEED_2:
-                desired_state = {"windSpeed": 4}
-            case WindowAcWindSeedEnum.SPEED_3:
-                desired_state = {"windSpeed": 6}
+        desired_state_override = {}
+        for feature in MEMORIZED_FAN_SPEED_FEATURES:
+            if feature in device.supported_features:
+                description = SELECT_DESCRIPTIONS.get(device, feature)
+                desired_state_override = description.desired_state(
+                    device, saved_fan_speed, preferences
+                )
 
+        desired_state = {**desired_state, **desired_state_override}
+    return desired_state
+
+
+WIND_SPEED_DESIRED_STATES: dict[WindSeedEnum, dict] = {
+    WindSeedEnum.STRONG: {"highTemperatureWind": 0, "turbo": 1, "silenceSwitch": 0, "windSpeed": 6},
+    WindSeedEnum.HIGH: {"highTemperatureWind": 0, "turbo": 0, "silenceSwitch": 0, "windSpeed": 6},
+    WindSeedEnum.MID_HIGH: {"highTemperatureWind": 0, "turbo": 0, "silenceSwitch": 0, "windSpeed": 5},
+    WindSeedEnum.MEDIUM: {"highTemperatureWind": 0, "turbo": 0, "silenceSwitch": 0, "windSpeed": 4},
+    WindSeedEnum.MID_LOW: {"highTemperatureWind": 0, "turbo": 0, "silenceSwitch": 0, "windSpeed": 3},
+    WindSeedEnum.LOW: {"highTemperatureWind": 0, "turbo": 0, "silenceSwitch": 0, "windSpeed": 2},
+    WindSeedEnum.MUTE: {"highTemperatureWind": 0, "turbo": 0, "silenceSwitch": 1, "windSpeed": 2},
+    WindSeedEnum.AUTO: {"highTemperatureWind": 0, "turbo": 0, "silenceSwitch": 0, "windSpeed": 0},
+}
+
+WORK_MODE_DESIRED_STATES: dict[AirPurifierWorkModeStrEnum, dict] = {
+    AirPurifierWorkModeStrEnum.AUTO: {"workMode": 0},
+    AirPurifierWorkModeStrEnum.SLEEP: {"windSpeed": 0, "workMode": 1},
+    AirPurifierWorkModeStrEnum.FAN: {"windSpeed": 1, "workMode": 2},
+}
+
+WIND_FEELING_DESIRED_STATES: dict[WindFeelingEnum, dict] = {
+    WindFeelingEnum.NONE: {"softWind": 0},
+    WindFeelingEnum.SOFT: {"horizontalDirection": 8, "softWind": 1},
+    WindFeelingEnum.SHOWER: {"horizontalDirection": 8, "softWind": 2, "verticalDirection": 9},
+    WindFeelingEnum.CARPET: {"horizontalDirection": 8, "softWind": 3, "verticalDirection": 13},
+    WindFeelingEnum.SURROUND: {"softWind": 4, "verticalDirection": 8},
+}
+
+
+def desired_state_from_table(table: dict[str, dict]) -> DesiredStateFn:
+    return lambda device, value, preferences: dict(table.get(value, {}))
+
+
+def desired_state_SELECT_WIND_SPEED_7_GEAR(
+    device: Device, value: str, preferences: DevicePreferences
+) -> dict:
+    wind_speed_7_gear = WIND_SEED_7_GEAR_CODEC.encode(value)
+    if wind_speed_7_gear is None:
+        return {}
+    return {
+        "windSpeedAutoSwitch": 1 if wind_speed_7_gear == 0 else 0,
+        "windSpeed7Gear": wind_speed_7_gear,
+    }
+
+
+def desired_state_AIR_PURIFIER_BREEVA_FAN_WIND_SPEED(
+    device: Device, value: str, preferences: DevicePreferences
+) -> dict:
+    desired_state = desired_state_for(AIR_PURIFIER_FAN_WIND_SPEED_CODEC, "windSpeed", value)
+    if desired_state:
+        desired_state["workMode"] = 2
+    return desired_state
+
+
+def desired_state_SELECT_FRESH_AIR(
+    device: Device, value: str, preferences: DevicePreferences
+) -> dict:
+    new_wind_strength = FRESH_AIR_CODEC.encode(value)
+    if new_wind_strength is None:
+        return {}
+    return {
+        "newWindAutoSwitch": 1 if new_wind_strength == 0 else 0,
+        "newWindStrength": new_wind_strength,
+    }
+
+
+def desired_state_for_direction(codec: EnumCodec, key: str, switch_key: str) -> DesiredStateFn:
+    """A direction, with the swing switch matching it on the devices that have one."""
+
+    def desired_state_fn(device: Device, value: str, preferences: DevicePreferences) -> dict:
+        desired_state = desired_state_for(codec, key, value)
+        if (
+            desired_state
+            and DeviceFeatureEnum.INTERNAL_HAS_SWING_SWITCH in device.supported_features
+        ):
+            desired_state[switch_key] = 1 if desired_state[key] in SWING_DIRECTIONS else 0
         return desired_state
 
-    async def SELECT_WINDOW_AS_WIND_SPEED(self, value: PortableWindSeedEnum):
-        stored_data = await get_stored_data(self.hass, self.device.device_id)
-        mode = self.device.mode_value_to_enum_mapp.get(
-            self.device.data.work_mode,
-            (ModeEnum.AUTO),
-        )
-        stored_data, need_save = safe_set_value(
-            stored_data, "fan_speed." + mode + ".value", value, overwrite_if_exists=True
-        )
-        if need_save:
-            await set_stored_data(self.hass, self.device.device_id, stored_data)
-        desired_state = self.desired_state_SELECT_WINDOW_AS_WIND_SPEED(value)
-        return await self.coordinator.get_aws_iot().async_set_desired_state(
-            self.device.device_id, desired_state
-        )
-
-    async def SELECT_GENERATOR_MODE(self, value: GeneratorModeEnum):
-        desired_state = {}
-        match value:
-            case GeneratorModeEnum.NONE:
-                desired_state = {"generatorMode": 0}
-            case GeneratorModeEnum.L1:
-                desired_state = {"generatorMode": 1}
-            case GeneratorModeEnum.L2:
-                desired_state = {"generatorMode": 2}
-            case GeneratorModeEnum.L3:
-                desired_state = {"generatorMode": 3}
-        return await self.coordinator.get_aws_iot().async_set_desired_state(
-            self.device.device_id, desired_state
-        )
-
-    async def SELECT_FRESH_AIR(self, value: FreshAirEnum):
-        desired_state = {}
-        match value:
-            case FreshAirEnum.AUTO:
-                desired_state = {"newWindAutoSwitch": 1, "newWindStrength": 0}
-            case FreshAirEnum.STRENGTH_1:
-                desired_state = {"newWindAutoSwitch": 0, "newWindStrength": 1}
-            case FreshAirEnum.STRENGTH_2:
-                desired_state = {"newWindAutoSwitch": 0, "newWindStrength": 2}
-            case FreshAirEnum.STRENGTH_3:
-                desired_state = {"newWindAutoSwitch": 0, "newWindStrength": 3}
-        return await self.coordinator.get_aws_iot().async_set_desired_state(
-            self.device.device_id, desired_state
-        )
-
-    async def SELECT_WIND_FEELING(self, value: WindFeelingEnum):
-        desired_state = {}
-        match value:
-            case WindFeelingEnum.NONE:
-                desired_state = {"softWind": 0}
-            case WindFeelingEnum.SOFT:
-                desired_state = {"horizontalDirection": 8, "softWind": 1}
-            case WindFeelingEnum.SHOWER:
-                desired_state = {
-                    "horizontalDirection": 8,
-                    "softWind": 2,
-                    "verticalDirection": 9,
-                }
-            case WindFeelingEnum.CARPET:
-                desired_state = {
-                    "horizontalDirection": 8,
-                    "softWind": 3,
-                    "verticalDirection": 13,
-                }
-            case WindFeelingEnum.SURROUND:
-                desired_state = {"softWind": 4, "verticalDirection": 8}
-        return await self.coordinator.get_aws_iot().async_set_desired_state(
-            self.device.device_id, desired_state
-        )
-
-    async def SELECT_VERTICAL_DIRECTION(self, value: UpAndDownAirSupplyVectorEnum):
-        desired_state = {}
-        has_swing_switch = (
-            DeviceFeatureEnum.INTERNAL_HAS_SWING_SWITCH
-            in self.device.supported_features
-        )
-
-        match value:
-            case UpAndDownAirSupplyVectorEnum.UP_AND_DOWN_SWING:
-                desired_state = {"verticalDirection": 1}
-                if has_swing_switch:
-                    desired_state["verticalSwitch"] = 1
-            case UpAndDownAirSupplyVectorEnum.UPWARDS_SWING:
-                desired_state = {"verticalDirection": 2}
-                if has_swing_switch:
-                    desired_state["verticalSwitch"] = 1
-            case UpAndDownAirSupplyVectorEnum.DOWNWARDS_SWING:
-                desired_state = {"verticalDirection": 3}
-                if has_swing_switch:
-                    desired_state["verticalSwitch"] = 1
-            case UpAndDownAirSupplyVectorEnum.TOP_FIX:
-                desired_state = {"verticalDirection": 9}
-                if has_swing_switch:
-                    desired_state["verticalSwitch"] = 0
-            case UpAndDownAirSupplyVectorEnum.UPPER_FIX:
-                desired_state = {"verticalDirection": 10}
-                if has_swing_switch:
-                    desired_state["verticalSwitch"] = 0
-            case UpAndDownAirSupplyVectorEnum.MIDDLE_FIX:
-                desired_state = {"verticalDirection": 11}
-                if has_swing_switch:
-                    desired_state["verticalSwitch"] = 0
-            case UpAndDownAirSupplyVectorEnum.LOWER_FIX:
-                desired_state = {"verticalDirection": 12}
-                if has_swing_switch:
-                    desired_state["verticalSwitch"] = 0
-            case UpAndDownAirSupplyVectorEnum.BOTTOM_FIX:
-                desired_state = {"verticalDirection": 13}
-                if has_swing_switch:
-                    desired_state["verticalSwitch"] = 0
-            case UpAndDownAirSupplyVectorEnum.NOT_SET:
-                desired_state = {"verticalDirection": 8}
-                if has_swing_switch:
-                    desired_state["verticalSwitch"] = 0
-        return await self.coordinator.get_aws_iot().async_set_desired_state(
-            self.device.device_id, desired_state
-        )
-
-    async def SELECT_HORIZONTAL_DIRECTION(self, value: LeftAndRightAirSupplyVectorEnum):
-        desired_state = {}
-        has_swing_switch = (
-            DeviceFeatureEnum.INTERNAL_HAS_SWING_SWITCH
-            in self.device.supported_features
-        )
-
-        match value:
-            case LeftAndRightAirSupplyVectorEnum.LEFT_AND_RIGHT_SWING:
-                desired_state = {"horizontalDirection": 1}
-                if has_swing_switch:
-                    desired_state["horizontalSwitch"] = 1
-            case LeftAndRightAirSupplyVectorEnum.LEFT_SWING:
-                desired_state = {"horizontalDirection": 2}
-                if has_swing_switch:
-                    desired_state["horizontalSwitch"] = 1
-            case LeftAndRightAirSupplyVectorEnum.MIDDLE_SWING:
-                desired_state = {"horizontalDirection": 3}
-                if has_swing_switch:
-                    desired_state["horizontalSwitch"] = 1
-            case LeftAndRightAirSupplyVectorEnum.RIGHT_SWING:
-                desired_state = {"horizontalDirection": 4}
-                if has_swing_switch:
-                    desired_state["horizontalSwitch"] = 1
-            case LeftAndRightAirSupplyVectorEnum.LEFT_FIX:
-                desired_state = {"horizontalDirection": 9}
-                if has_swing_switch:
-                    desired_state["horizontalSwitch"] = 0
-            case LeftAndRightAirSupplyVectorEnum.CENTER_LEFT_FIX:
-                desired_state = {"horizontalDirection": 10}
-                if has_swing_switch:
-                    desired_state["horizontalSwitch"] = 0
-            case LeftAndRightAirSupplyVectorEnum.MIDDLE_FIX:
-                desired_state = {"horizontalDirection": 11}
-                if has_swing_switch:
-                    desired_state["horizontalSwitch"] = 0
-            case LeftAndRightAirSupplyVectorEnum.CENTER_RIGHT_FIX:
-                desired_state = {"horizontalDirection": 12}
-                if has_swing_switch:
-                    desired_state["horizontalSwitch"] = 0
-            case LeftAndRightAirSupplyVectorEnum.RIGHT_FIX:
-                desired_state = {"horizontalDirection": 13}
-                if has_swing_switch:
-                    desired_state["horizontalSwitch"] = 0
-            case LeftAndRightAirSupplyVectorEnum.NOT_SET:
-                desired_state = {"horizontalDirection": 8}
-                if has_swing_switch:
-                    desired_state["horizontalSwitch"] = 0
-        return await self.coordinator.get_aws_iot().async_set_desired_state(
-            self.device.device_id, desired_state
-        )
+    return desired_state_fn
 
 
 def get_SELECT_VERTICAL_DIRECTION_name(device: Device) -> str:
@@ -926,6 +370,239 @@ def get_SELECT_PORTABLE_WIND_4VALUE_SPEED_available_fn(device: Device) -> str:
         return device.data.sleep != 1
 
 
+
+SELECT_DESCRIPTIONS: FeatureDescriptionRegistry[SelectDescription] = FeatureDescriptionRegistry(
+    [
+        SelectDescription(
+            feature=DeviceFeatureEnum.SELECT_MODE,
+            type="Mode",
+            name="Mode",
+            icon="mdi:set-none",
+            current_fn=get_current_mode,
+            options_fn=lambda device: device.get_supported_modes(),
+            desired_state_fn=desired_state_SELECT_MODE,
+        ),
+        SelectDescription(
+            feature=DeviceFeatureEnum.SELECT_WIND_SPEED,
+            excluded_device_types=BREEVA_DEVICE_TYPES,
+            type="WindSpeed",
+            name="Wind Speed",
+            icon="mdi:weather-windy",
+            current_fn=lambda device: getWindSpeed(
+                wind_speed=device.data.wind_speed,
+                turbo=device.data.turbo,
+                silence_switch=device.data.silence_switch,
+            ),
+            options_fn=lambda device: WIND_SPEED_CODEC.options,
+            desired_state_fn=desired_state_from_table(WIND_SPEED_DESIRED_STATES),
+            available_fn=get_SELECT_WIND_SPEED_available_fn,
+            fan_speed_mode_fn=get_mode_or(ModeEnum.AUTO),
+        ),
+        # If the power is on or the work mode is not 0 (Auto), show the wind speed select
+        # Otherwise, disable the wind speed select
+        SelectDescription(
+            feature=DeviceFeatureEnum.SELECT_WIND_SPEED,
+            device_types=BREEVA_DEVICE_TYPES,
+            type="WindSpeed",
+            name="Wind Speed",
+            icon="mdi:weather-windy",
+            codec=AIR_PURIFIER_FAN_WIND_SPEED_CODEC,
+            value_fn=lambda device: device.data.wind_speed,
+            desired_state_fn=desired_state_AIR_PURIFIER_BREEVA_FAN_WIND_SPEED,
+            available_fn=lambda device: (
+                get_AIR_PURIFIER_BREEVA_FAN_WIND_SPEED_available_fn(device)
+                if device.data.power_switch == 1
+                else False
+            ),
+            fan_speed_mode_fn=get_mode_or(AirPurifierFanWindSpeedStrEnum.LOW),
+        ),
+        SelectDescription(
+            feature=DeviceFeatureEnum.SELECT_WORK_MODE,
+            type="WorkMode",
+            name="Work Mode",
+            icon="mdi:air-filter",
+            codec=AIR_PURIFIER_WORK_MODE_CODEC,
+            value_fn=lambda device: device.data.work_mode,
+            desired_state_fn=desired_state_from_table(WORK_MODE_DESIRED_STATES),
+            available_fn=lambda device: (
+                get_WORK_MODE_available_fn(device)
+                if device.data.power_switch == 1
+                else False
+            ),
+            fan_speed_mode_fn=get_mode_or(AirPurifierWorkModeStrEnum.AUTO),
+        ),
+        SelectDescription(
+            feature=DeviceFeatureEnum.SELECT_WINDOW_AS_WIND_SPEED,
+            type="WindowAcWindSpeed",
+            name="Wind Speed",
+            icon="mdi:weather-windy",
+            codec=WINDOW_AC_WIND_SEED_CODEC,
+            shadow_key="windSpeed",
+            value_fn=lambda device: device.data.wind_speed,
+            fan_speed_mode_fn=get_mode_or(ModeEnum.AUTO),
+        ),
+        SelectDescription(
+            feature=DeviceFeatureEnum.SELECT_DEHUMIDIFIER_WIND_SPEED_LOW_MEDIUM_HEIGH,
+            type="Dehumidifier.WindSpeed.LowMediumHeigh",
+            name="Wind Speed",
+            icon="mdi:weather-windy",
+            codec=WIND_SPEED_LOW_MEDIUM_HIGH_CODEC,
+            shadow_key="windSpeed",
+            value_fn=lambda device: device.data.wind_speed,
+            fan_speed_mode_fn=get_mode_or(ModeEnum.AUTO),
+        ),
+        SelectDescription(
+            feature=DeviceFeatureEnum.SELECT_WIND_SPEED_7_GEAR,
+            type="WindSpeed7Gear",
+            name="Wind Speed",
+            icon="mdi:weather-windy",
+            codec=WIND_SEED_7_GEAR_CODEC,
+            value_fn=lambda device: device.data.wind_speed_7_gear,
+            desired_state_fn=desired_state_SELECT_WIND_SPEED_7_GEAR,
+            fan_speed_mode_fn=get_mode_or(ModeEnum.AUTO),
+        ),
+        SelectDescription(
+            feature=DeviceFeatureEnum.SELECT_PORTABLE_WIND_SPEED,
+            type="PortableWindSpeed",
+            name="Wind Speed",
+            icon="mdi:weather-windy",
+            current_fn=lambda device: device.portable_wind_seed_codec.decode(device.data.wind_speed),
+            options_fn=get_SELECT_PORTABLE_WIND_SPEED_options,
+            desired_state_fn=lambda device, value, preferences: desired_state_for(
+                device.portable_wind_seed_codec, "windSpeed", value
+            ),
+            available_fn=get_SELECT_PORTABLE_WIND_SPEED_available_fn,
+            fan_speed_mode_fn=get_ac_mode,
+        ),
+        SelectDescription(
+            feature=DeviceFeatureEnum.SELECT_PORTABLE_WIND_4VALUE_SPEED,
+            type="PortableWind4ValueSpeed",
+            name="Wind Speed",
+            icon="mdi:weather-windy",
+            current_fn=lambda device: device.portable_wind_4value_seed_codec.decode(
+                device.data.wind_speed
+            ),
+            options_fn=get_SELECT_PORTABLE_WIND_4VALUE_SPEED_options,
+            desired_state_fn=lambda device, value, preferences: desired_state_for(
+                device.portable_wind_4value_seed_codec, "windSpeed", value
+            ),
+            available_fn=get_SELECT_PORTABLE_WIND_4VALUE_SPEED_available_fn,
+            fan_speed_mode_fn=get_ac_mode,
+        ),
+        SelectDescription(
+            feature=DeviceFeatureEnum.SELECT_GENERATOR_MODE,
+            type="GeneratorMode",
+            name="Generator Mode",
+            icon="mdi:generator-portable",
+            codec=GENERATOR_MODE_CODEC,
+            shadow_key="generatorMode",
+            value_fn=lambda device: device.data.generator_mode,
+        ),
+        SelectDescription(
+            feature=DeviceFeatureEnum.SELECT_FRESH_AIR,
+            type="FreshAir",
+            name="Fresh Air Strength",
+            icon="mdi:window-open-variant",
+            codec=FRESH_AIR_CODEC,
+            value_fn=lambda device: device.data.new_wind_strength,
+            desired_state_fn=desired_state_SELECT_FRESH_AIR,
+            available_fn=get_SELECT_FRESH_AIR_available_fn,
+        ),
+        SelectDescription(
+            feature=DeviceFeatureEnum.SELECT_WIND_FEELING,
+            type="WindFeeling",
+            name="Wind Feeling",
+            icon="mdi:weather-dust",
+            codec=WIND_FEELING_CODEC,
+            value_fn=lambda device: device.data.soft_wind,
+            desired_state_fn=desired_state_from_table(WIND_FEELING_DESIRED_STATES),
+        ),
+        SelectDescription(
+            feature=DeviceFeatureEnum.SELECT_VERTICAL_DIRECTION,
+            type="UpAndDownAirSupplyVector",
+            name="Up and Down air supply",
+            name_fn=get_SELECT_VERTICAL_DIRECTION_name,
+            icon="mdi:swap-vertical",
+            codec=UP_AND_DOWN_AIR_SUPPLY_VECTOR_CODEC,
+            value_fn=lambda device: device.data.vertical_direction,
+            desired_state_fn=desired_state_for_direction(
+                UP_AND_DOWN_AIR_SUPPLY_VECTOR_CODEC, "verticalDirection", "verticalSwitch"
+            ),
+        ),
+        SelectDescription(
+            feature=DeviceFeatureEnum.SELECT_HORIZONTAL_DIRECTION,
+            type="LeftAndRightAirSupplyVector",
+            name="Left and Right air supply",
+            name_fn=get_SELECT_HORIZONTAL_DIRECTION_name,
+            icon="mdi:swap-horizontal",
+            codec=LEFT_AND_RIGHT_AIR_SUPPLY_VECTOR_CODEC,
+            value_fn=lambda device: device.data.horizontal_direction,
+            desired_state_fn=desired_state_for_direction(
+                LEFT_AND_RIGHT_AIR_SUPPLY_VECTOR_CODEC, "horizontalDirection", "horizontalSwitch"
+            ),
+        ),
+        SelectDescription(
+            feature=DeviceFeatureEnum.SELECT_SLEEP_MODE,
+            type="SleepMode",
+            name="Sleep Mode",
+            icon="mdi:sleep",
+            codec=SLEEP_MODE_CODEC,
+            shadow_key="sleep",
+            value_fn=lambda device: device.data.sleep,
+            available_fn=get_SELECT_SLEEP_MODE_available_fn,
+        ),
+        SelectDescription(
+            feature=DeviceFeatureEnum.SELECT_TEMPERATURE_TYPE,
+            type="TemperatureType",
+            name="Temperature Type",
+            icon="mdi:home-thermometer",
+            codec=TEMPERATURE_TYPE_CODEC,
+            shadow_key="temperatureType",
+            value_fn=lambda device: device.data.temperature_type,
+        ),
+    ]
+)
+
+
+class DesiredStateHandlerForSelect:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: IotDeviceCoordinator,
+        deviceFeature: DeviceFeatureEnum,
+        device: Device,
+    ) -> None:
+        self.hass = hass
+        self.coordinator = coordinator
+        self.deviceFeature = deviceFeature
+        self.device = device
+        self.description = SELECT_DESCRIPTIONS.get(device, deviceFeature)
+
+    def refreshDevice(self, device: Device):
+        self.device = device
+
+    async def call_select_option(self, value: str) -> str:
+        _LOGGER.info(
+            "SelectHandler.async_select_option: %s - %s", value, self.deviceFeature
+        )
+        preferences = await get_device_preferences(self.hass, self.device.device_id)
+        if self.description.fan_speed_mode_fn is not None:
+            preferences.set_fan_speed(self.description.fan_speed_mode_fn(self.device), value)
+        desired_state = self.desired_state(value, preferences)
+        return await self.coordinator.get_aws_iot().async_set_desired_state(
+            self.device.device_id, desired_state
+        )
+
+    def desired_state(self, value: str, preferences: DevicePreferences) -> dict:
+        return self.description.desired_state(self.device, value, preferences)
+
+    def current_state(self) -> str:
+        return self.description.current_option(self.device)
+
+    def options_values(self) -> Sequence[str]:
+        return self.description.options(self.device)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: New_NameConfigEntry,
@@ -941,270 +618,14 @@ async def async_setup_entry(
             device.device_type,
             device.supported_features,
         )
-        if DeviceFeatureEnum.SELECT_MODE in device.supported_features:
-            switches.append(
-                SelectHandler(
-                    hass=hass,
-                    coordinator=coordinator,
-                    device=device,
-                    deviceFeature=DeviceFeatureEnum.SELECT_MODE,
-                    type="Mode",
-                    name="Mode",
-                    icon_fn=lambda device: "mdi:set-none",
-                )
-            )
-
-        if (
-            device.device_type != DeviceTypeEnum.AIR_PURIFIER_BREEVA_A2
-            and device.device_type != DeviceTypeEnum.AIR_PURIFIER_BREEVA_A3
-            and device.device_type != DeviceTypeEnum.AIR_PURIFIER_BREEVA_A5
-        ):
-            if DeviceFeatureEnum.SELECT_WIND_SPEED in device.supported_features:
-                switches.append(
-                    DynamicSelectHandler(
-                        hass=hass,
-                        coordinator=coordinator,
-                        device=device,
-                        deviceFeature=DeviceFeatureEnum.SELECT_WIND_SPEED,
-                        type="WindSpeed",
-                        name="Wind Speed",
-                        icon_fn=lambda device: "mdi:weather-windy",
-                        options_values_fn=lambda device: [
-                            e.value for e in WindSeedEnum
-                        ],
-                        available_fn=lambda device: get_SELECT_WIND_SPEED_available_fn(
-                            device
-                        ),
-                    )
-                )
-        elif (
-            device.device_type == DeviceTypeEnum.AIR_PURIFIER_BREEVA_A2
-            or device.device_type == DeviceTypeEnum.AIR_PURIFIER_BREEVA_A3
-            or device.device_type == DeviceTypeEnum.AIR_PURIFIER_BREEVA_A5
-        ):
-            if DeviceFeatureEnum.SELECT_WIND_SPEED in device.supported_features:
-                # If the power is on or the work mode is not 0 (Auto), show the wind speed select
-                # Otherwise, disable the wind speed select
-                switches.append(
-                    DynamicSelectHandler(
-                        hass=hass,
-                        coordinator=coordinator,
-                        device=device,
-                        deviceFeature=DeviceFeatureEnum.SELECT_WIND_SPEED,
-                        type="WindSpeed",
-                        name="Wind Speed",
-                        icon_fn=lambda device: "mdi:weather-windy",
-                        options_values_fn=lambda device: [
-                            e.value for e in AirPurifierFanWindSpeedStrEnum
-                        ],
-                        available_fn=lambda device: (
-                            get_AIR_PURIFIER_BREEVA_FAN_WIND_SPEED_available_fn(device)
-                            if device.data.power_switch == 1
-                            else False
-                        ),
-                    )
-                )
-
-        if DeviceFeatureEnum.SELECT_WORK_MODE in device.supported_features:
-            switches.append(
-                DynamicSelectHandler(
-                    hass=hass,
-                    coordinator=coordinator,
-                    device=device,
-                    deviceFeature=DeviceFeatureEnum.SELECT_WORK_MODE,
-                    type="WorkMode",
-                    name="Work Mode",
-                    icon_fn=lambda device: "mdi:air-filter",
-                    options_values_fn=lambda device: [
-                        e.value for e in AirPurifierWorkModeStrEnum
-                    ],
-                    available_fn=lambda device: (
-                        get_WORK_MODE_available_fn(device)
-                        if device.data.power_switch == 1
-                        else False
-                    ),
-                )
-            )
-
-        if DeviceFeatureEnum.SELECT_WINDOW_AS_WIND_SPEED in device.supported_features:
-            switches.append(
-                SelectHandler(
-                    hass=hass,
-                    coordinator=coordinator,
-                    device=device,
-                    deviceFeature=DeviceFeatureEnum.SELECT_WINDOW_AS_WIND_SPEED,
-                    type="WindowAcWindSpeed",
-                    name="Wind Speed",
-                    icon_fn=lambda device: "mdi:weather-windy",
-                )
-            )
-
-        if (
-            DeviceFeatureEnum.SELECT_DEHUMIDIFIER_WIND_SPEED_LOW_MEDIUM_HEIGH
-            in device.supported_features
-        ):
-            switches.append(
-                SelectHandler(
-                    hass=hass,
-                    coordinator=coordinator,
-                    device=device,
-                    deviceFeature=DeviceFeatureEnum.SELECT_DEHUMIDIFIER_WIND_SPEED_LOW_MEDIUM_HEIGH,
-                    type="Dehumidifier.WindSpeed.LowMediumHeigh",
-                    name="Wind Speed",
-                    icon_fn=lambda device: "mdi:weather-windy",
-                )
-            )
-
-        if DeviceFeatureEnum.SELECT_WIND_SPEED_7_GEAR in device.supported_features:
-            switches.append(
-                SelectHandler(
-                    hass=hass,
-                    coordinator=coordinator,
-                    device=device,
-                    deviceFeature=DeviceFeatureEnum.SELECT_WIND_SPEED_7_GEAR,
-                    type="WindSpeed7Gear",
-                    name="Wind Speed",
-                    icon_fn=lambda device: "mdi:weather-windy",
-                )
-            )
-
-        if DeviceFeatureEnum.SELECT_PORTABLE_WIND_SPEED in device.supported_features:
+        for description in SELECT_DESCRIPTIONS.for_device(device):
+            entity_class = SelectHandler if description.available_fn is None else DynamicSelectHandler
             switches.append(
-                DynamicSelectHandler(
+                entity_class(
                     hass=hass,
                     coordinator=coordinator,
                     device=device,
-                    deviceFeature=DeviceFeatureEnum.SELECT_PORTABLE_WIND_SPEED,
-                    type="PortableWindSpeed",
-                    name="Wind Speed",
-                    icon_fn=lambda device: "mdi:weather-windy",
-                    options_values_fn=lambda device: get_SELECT_PORTABLE_WIND_SPEED_options(
-                        device
-                    ),
-                    available_fn=lambda device: get_SELECT_PORTABLE_WIND_SPEED_available_fn(
-                        device
-                    ),
-                )
-            )
-
-        if (
-            DeviceFeatureEnum.SELECT_PORTABLE_WIND_4VALUE_SPEED
-            in device.supported_features
-        ):
-            switches.append(
-                DynamicSelectHandler(
-                    hass=hass,
-                    coordinator=coordinator,
-                    device=device,
-                    deviceFeature=DeviceFeatureEnum.SELECT_PORTABLE_WIND_4VALUE_SPEED,
-                    type="PortableWind4ValueSpeed",
-                    name="Wind Speed",
-                    icon_fn=lambda device: "mdi:weather-windy",
-                    options_values_fn=lambda device: get_SELECT_PORTABLE_WIND_4VALUE_SPEED_options(
-                        device
-                    ),
-                    available_fn=lambda device: get_SELECT_PORTABLE_WIND_4VALUE_SPEED_available_fn(
-                        device
-                    ),
-                )
-            )
-
-        if DeviceFeatureEnum.SELECT_GENERATOR_MODE in device.supported_features:
-            switches.append(
-                SelectHandler(
-                    hass=hass,
-                    coordinator=coordinator,
-                    device=device,
-                    deviceFeature=DeviceFeatureEnum.SELECT_GENERATOR_MODE,
-                    type="GeneratorMode",
-                    name="Generator Mode",
-                    icon_fn=lambda device: "mdi:generator-portable",
-                )
-            )
-
-        if DeviceFeatureEnum.SELECT_FRESH_AIR in device.supported_features:
-            switches.append(
-                DynamicSelectHandler(
-                    hass=hass,
-                    coordinator=coordinator,
-                    device=device,
-                    deviceFeature=DeviceFeatureEnum.SELECT_FRESH_AIR,
-                    type="FreshAir",
-                    name="Fresh Air Strength",
-                    icon_fn=lambda device: "mdi:window-open-variant",
-                    options_values_fn=lambda device: [e.value for e in FreshAirEnum],
-                    available_fn=lambda device: get_SELECT_FRESH_AIR_available_fn(
-                        device
-                    ),
-                )
-            )
-
-        if DeviceFeatureEnum.SELECT_WIND_FEELING in device.supported_features:
-            switches.append(
-                SelectHandler(
-                    hass=hass,
-                    coordinator=coordinator,
-                    device=device,
-                    deviceFeature=DeviceFeatureEnum.SELECT_WIND_FEELING,
-                    type="WindFeeling",
-                    name="Wind Feeling",
-                    icon_fn=lambda device: "mdi:weather-dust",
-                )
-            )
-
-        if DeviceFeatureEnum.SELECT_VERTICAL_DIRECTION in device.supported_features:
-            switches.append(
-                SelectHandler(
-                    hass=hass,
-                    coordinator=coordinator,
-                    device=device,
-                    deviceFeature=DeviceFeatureEnum.SELECT_VERTICAL_DIRECTION,
-                    type="UpAndDownAirSupplyVector",
-                    name=get_SELECT_VERTICAL_DIRECTION_name(device),
-                    icon_fn=lambda device: "mdi:swap-vertical",
-                )
-            )
-
-        if DeviceFeatureEnum.SELECT_HORIZONTAL_DIRECTION in device.supported_features:
-            switches.append(
-                SelectHandler(
-                    hass=hass,
-                    coordinator=coordinator,
-                    device=device,
-                    deviceFeature=DeviceFeatureEnum.SELECT_HORIZONTAL_DIRECTION,
-                    type="LeftAndRightAirSupplyVector",
-                    name=get_SELECT_HORIZONTAL_DIRECTION_name(device),
-                    icon_fn=lambda device: "mdi:swap-horizontal",
-                )
-            )
-
-        if DeviceFeatureEnum.SELECT_SLEEP_MODE in device.supported_features:
-            switches.append(
-                DynamicSelectHandler(
-                    hass=hass,
-                    coordinator=coordinator,
-                    device=device,
-                    deviceFeature=DeviceFeatureEnum.SELECT_SLEEP_MODE,
-                    type="SleepMode",
-                    name="Sleep Mode",
-                    icon_fn=lambda device: "mdi:sleep",
-                    options_values_fn=lambda device: [e.value for e in SleepModeEnum],
-                    available_fn=lambda device: get_SELECT_SLEEP_MODE_available_fn(
-                        device
-                    ),
-                )
-            )
-
-        if DeviceFeatureEnum.SELECT_TEMPERATURE_TYPE in device.supported_features:
-            switches.append(
-                SelectHandler(
-                    hass=hass,
-                    coordinator=coordinator,
-                    device=device,
-                    deviceFeature=DeviceFeatureEnum.SELECT_TEMPERATURE_TYPE,
-                    type="TemperatureType",
-                    name="Temperature Type",
-                    icon_fn=lambda device: "mdi:home-thermometer",
+                    description=description,
                 )
             )
 
@@ -1217,73 +638,43 @@ class SelectHandler(TclEntityBase, SelectEntity):
         hass: HomeAssistant,
         coordinator: IotDeviceCoordinator,
         device: Device,
-        type: str,
-        name: str,
-        deviceFeature: DeviceFeatureEnum,
-        icon_fn: lambda device: str,
+        description: SelectDescription,
     ) -> None:
-        TclEntityBase.__init__(self, coordinator, type, name, device)
+        TclEntityBase.__init__(
+            self, coordinator, description.type, description.get_name(device), device
+        )
 
-        self.icon_fn = icon_fn
+        self.description = description
         self.iot_handler = DesiredStateHandlerForSelect(
             hass=hass,
             coordinator=coordinator,
-            deviceFeature=deviceFeature,
+            deviceFeature=description.feature,
             device=self.device,
         )
 
+        self._attr_icon = description.icon
         self._attr_current_option = self.iot_handler.current_state()
         self._attr_options = self.iot_handler.options_values()
 
-    @property
-    def icon(self):
-        return self.icon_fn(self.device)
+    def update_attributes(self) -> None:
+        super().update_attributes()
+        self.iot_handler.refreshDevice(self.device)
+        self._attr_current_option = self.iot_handler.current_state()
 
     @property
     def state(self):
-        self.device = self.coordinator.get_device_by_id(self.device.device_id)
-        self.iot_handler.refreshDevice(self.device)
-        return self.iot_handler.current_state()
+        return self._attr_current_option
 
     async def async_select_option(self, option: str) -> None:
         # _LOGGER.info("SelectHandler.async_select_option: %s", option)
         await self.iot_handler.call_select_option(option)
-        await self.coordinator.async_refresh()
+        await self.coordinator.async_refresh_after_command(self.device.device_id)
 
 
 class DynamicSelectHandler(SelectHandler, SelectEntity):
-    def __init__(
-        self,
-        hass: HomeAssistant,
-        coordinator: IotDeviceCoordinator,
-        device: Device,
-        type: str,
-        name: str,
-        deviceFeature: DeviceFeatureEnum,
-        icon_fn: lambda device: str,
-        options_values_fn: lambda device: list[str] | None,
-        available_fn: lambda device: bool,
-    ) -> None:
-        SelectHandler.__init__(
-            self,
-            coordinator=coordinator,
-            device=device,
-            type=type,
-            name=name,
-            deviceFeature=deviceFeature,
-            hass=hass,
-            icon_fn=icon_fn,
+    def update_attributes(self) -> None:
+        super().update_attributes()
+        self._attr_options = self.iot_handler.options_values()
+        self._attr_available = bool(self.device.is_online) and self.description.available_fn(
+            self.device
         )
-
-        self.available_fn = available_fn
-        self.options_values_fn = options_values_fn
-
-    @property
-    def options(self) -> list[str]:
-        return self.options_values_fn(self.device)
-
-    @property
-    def available(self) -> bool:
-        if self.device.is_online:
-            return self.available_fn(self.device)
-        return False
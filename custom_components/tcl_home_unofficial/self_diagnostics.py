@@ -1,111 +1,260 @@
-from homeassistant.core import HomeAssistant
+from dataclasses import dataclass, field
+import json
 import logging
+import os
+
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers import storage
-from .const import get_device_self_dignose_storege_key
+
+from .const import DOMAIN, get_device_self_dignose_storege_key
+from .shadow_diff import FlatShadow, diff_metadata, get_section
 
 _LOGGER = logging.getLogger(__name__)
 
+SELF_DIAGNOSTICS_COMPACT_EVERY_STEPS = 50
+
+SHADOW_SECTIONS = (
+    ("state", "desired"),
+    ("state", "reported"),
+    ("metadata", "desired"),
+    ("metadata", "reported"),
+)
+SHADOW_ROOT_KEYS = ("version", "timestamp")
+
+_MISSING = object()
+
+
+@dataclass
+class SelfDiagnosticsState:
+    """State of one device's log, shared by every SelfDiagnostics instance."""
+
+    loaded: bool = False
+    init_state: dict[str, any] | None = None
+    init_desc: str | None = None
+    prev_state: dict[str, any] | None = None
+    steps: list[any] = field(default_factory=list)
+    journal_steps: int = 0
+    prev_flat: FlatShadow | None = None
+
+
+def shadow_patch(prev: dict[str, any], current: dict[str, any]) -> dict[str, any]:
+    """Per-section set/unset of the top level keys that differ."""
+    patch = {}
+    for section, sub_section in SHADOW_SECTIONS:
+        prev_values = prev.get(section, {}).get(sub_section, {})
+        current_values = current.get(section, {}).get(sub_section, {})
+        changed = {
+            key: value
+            for key, value in current_values.items()
+            if prev_values.get(key, _MISSING) != value
+        }
+        removed = [key for key in prev_values if key not in current_values]
+        if changed or removed:
+            patch[f"{section}.{sub_section}"] = {"set": changed, "unset": removed}
+    root = {key: current[key] for key in SHADOW_ROOT_KEYS if key in current}
+    if root:
+        patch["root"] = root
+    return patch
+
+
+def apply_shadow_patch(prev: dict[str, any], patch: dict[str, any]) -> dict[str, any]:
+    state = {**prev, **patch.get("root", {})}
+    for section, sub_section in SHADOW_SECTIONS:
+        section_patch = patch.get(f"{section}.{sub_section}")
+        if section_patch is None:
+            continue
+        values = {**state.get(section, {}).get(sub_section, {}), **section_patch["set"]}
+        for key in section_patch["unset"]:
+            values.pop(key, None)
+        state[section] = {**state.get(section, {}), sub_section: values}
+    return state
+
+
+def read_journal(path: str) -> list[dict[str, any]]:
+    """Stream the journal back; a torn last line (crash mid-write) is dropped."""
+    records = []
+    if not os.path.exists(path):
+        return records
+    with open(path, encoding="utf-8") as journal:
+        for line in journal:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                _LOGGER.warning("SelfDiagnostics: skipping unreadable journal line in %s", path)
+    return records
+
+
+def append_journal(path: str, line: str) -> None:
+    with open(path, "a", encoding="utf-8") as journal:
+        journal.write(line + "\n")
+
+
+def remove_journal(path: str) -> None:
+    if os.path.exists(path):
+        os.remove(path)
+
 
 class SelfDiagnostics:
+    """Manual state dumps of a device.
+
+    The Store file holds a compacted snapshot (initState, prevState, steps).
+    Each addState appends one line with the step and a shadow patch to
+    `<key>.journal`, so recording a step costs O(size of the change).
+    Every SELF_DIAGNOSTICS_COMPACT_EVERY_STEPS steps the journal is folded
+    back into the Store file.
+    """
+
     def __init__(self, hass: HomeAssistant, device_id: str) -> None:
         self.hass = hass
         self.device_id = device_id
-        self.init_state: dict[str, any] | None = None
-        self.init_desc: str | None = None
-        self.prev_state: dict[str, any] | None = None
-        self.steps: list[any] = []
+        self.key = get_device_self_dignose_storege_key(device_id)
+        self.journal_path = hass.config.path(storage.STORAGE_DIR, f"{self.key}.journal")
+        self._store: storage.Store[dict] = storage.Store(
+            hass=hass, version=1, key=self.key
+        )
         self.ignored_properties = ["capabilities", "errorCode", "authFlag"]
 
+    @property
+    def state(self) -> SelfDiagnosticsState:
+        states = self.hass.data.setdefault(f"{DOMAIN}.self_diagnostics", {})
+        if self.device_id not in states:
+            states[self.device_id] = SelfDiagnosticsState()
+        return states[self.device_id]
+
+    async def async_load(self) -> SelfDiagnosticsState:
+        state = self.state
+        if state.loaded:
+            return state
+
+        stored = await self._store.async_load()
+        records = await self.hass.async_add_executor_job(read_journal, self.journal_path)
+        if stored is not None:
+            state.init_state = stored.get("initState", None)
+            state.init_desc = stored.get("initDesc", None)
+            state.prev_state = stored.get("prevState", None)
+            state.steps = stored.get("steps", None) or []
+
+        journal_steps = 0
+        if state.prev_state is not None:
+            for record in records:
+                # records already folded into the Store by an interrupted compaction
+                if record.get("seq", 0) < len(state.steps):
+                    continue
+                state.steps.append(record["step"])
+                state.prev_state = apply_shadow_patch(state.prev_state, record["patch"])
+                journal_steps += 1
+        state.journal_steps = journal_steps
+        state.loaded = True
+        return state
+
     async def get_stored_data(self) -> dict[str, any] | None:
-        key = get_device_self_dignose_storege_key(self.device_id)
-        data_storage: storage.Store[dict] = storage.Store(
-            hass=self.hass, version=1, key=key
-        )
-        data = await data_storage.async_load()
-        return data
+        state = await self.async_load()
+        if state.init_state is None:
+            return None
+        return {
+            "initState": state.init_state,
+            "initDesc": state.init_desc,
+            "prevState": state.prev_state,
+            "steps": state.steps,
+        }
 
     async def set_stored_data(self, data: dict[str, any]) -> dict[str, any] | None:
-        key = get_device_self_dignose_storege_key(self.device_id)
-        data_storage: storage.Store[dict] = storage.Store(
-            hass=self.hass, version=1, key=key
-        )
-
-        await data_storage.async_save(data=data)
+        await self._store.async_save(data=data)
 
     async def clearStorage(self):
         await self.set_stored_data(None)
+        await self.hass.async_add_executor_job(remove_journal, self.journal_path)
+        self.hass.data.setdefault(f"{DOMAIN}.self_diagnostics", {})[
+            self.device_id
+        ] = SelfDiagnosticsState(loaded=True)
+
+    async def async_compact(self) -> None:
+        state = self.state
+        await self.set_stored_data(
+            {
+                "initState": state.init_state,
+                "initDesc": state.init_desc,
+                "prevState": state.prev_state,
+                "steps": state.steps,
+            }
+        )
+        await self.hass.async_add_executor_job(remove_journal, self.journal_path)
+        state.journal_steps = 0
+
+    def build_step(
+        self, action_description: str, prev_state: dict[str, any], aws_thing: dict[str, any]
+    ) -> dict[str, any]:
+        ignored = frozenset(self.ignored_properties)
+        prev_flat = self.state.prev_flat
+        if prev_flat is None or prev_flat.shadow is not prev_state:
+            prev_flat = FlatShadow(prev_state, ignored)
+        flat = FlatShadow(aws_thing, ignored, previous=prev_flat)
+        desired_diff = diff_metadata(prev_flat, flat, "desired", ignored)
+        reported_diff = diff_metadata(prev_flat, flat, "reported", ignored)
+        self.state.prev_flat = flat
+        # only the keys that can be desired are tracked on the reported side
+        desired_keys = get_section(aws_thing, "metadata", "desired")
+        changed_desired_keys = desired_diff.changed_or_added()
+        changed_reported_keys = [
+            key for key in reported_diff.changed_or_added() if key in desired_keys
+        ]
+
+        step_data = {
+            "actionDescription": action_description,
+            "changedDesiredKeys": changed_desired_keys,
+            "changedReportedKeys": changed_reported_keys,
+            "changedDesiredData": {},
+            "changedReportedData": {},
+        }
+
+        prev_desired = get_section(prev_state, "state", "desired")
+        desired = get_section(aws_thing, "state", "desired")
+        for key in changed_desired_keys:
+            step_data["changedDesiredData"][key] = {
+                "from": prev_desired.get(key),
+                "to": desired.get(key),
+            }
+
+        prev_reported = get_section(prev_state, "state", "reported")
+        reported = get_section(aws_thing, "state", "reported")
+        for key in changed_reported_keys:
+            step_data["changedReportedData"][key] = {
+                "from": prev_reported.get(key),
+                "to": reported.get(key),
+            }
+        return step_data
 
     async def addState(
         self, action_description: str, aws_thing: dict[str, any]
     ) -> None:
-        is_first = False
-        if self.init_state is None:
-            stored = await self.get_stored_data()
-            if stored is not None:
-                self.init_state = stored.get("initState", None)
-                self.init_desc = stored.get("initDesc", None)
-                self.prev_state = stored.get("prevState", None)
-                self.steps = stored.get("steps", None)
-            else:
-                self.init_state = aws_thing
-                self.init_desc = action_description
-                is_first = True
+        state = await self.async_load()
+        is_first = state.init_state is None
 
         _LOGGER.info(
             "Adding self diagnostics state for action: %s (is_first:%s)",
             action_description,
             is_first,
         )
-        if not is_first:
-            metadata_desired = aws_thing["metadata"]["desired"]
-            metadata_reported = aws_thing["metadata"]["reported"]
-            prev_metadata_desired = self.prev_state["metadata"]["desired"]
-            prev_metadata_reported = self.prev_state["metadata"]["reported"]
-            changed_desired_keys = []
-            changed_reported_keys = []
-            for key, value in metadata_desired.items():
-                if key not in self.ignored_properties:
-                    ts_d = value.get("timestamp", None)
-                    ts_r = metadata_reported[key].get("timestamp", None)
-                    prev_ts_d = prev_metadata_desired[key].get("timestamp", None)
-                    prev_ts_r = prev_metadata_reported[key].get("timestamp", None)
-                    if ts_d != prev_ts_d:
-                        changed_desired_keys.append(key)
-                    if ts_r != prev_ts_r:
-                        changed_reported_keys.append(key)
-
-            step_data = {
-                "actionDescription": action_description,
-                "changedDesiredKeys": changed_desired_keys,
-                "changedReportedKeys": changed_reported_keys,
-                "changedDesiredData": {},
-                "changedReportedData": {},
-            }
+        if is_first:
+            state.init_state = aws_thing
+            state.init_desc = action_description
+            state.prev_state = aws_thing
+            state.steps = []
+            await self.async_compact()
+            return
 
-            for key in changed_desired_keys:
-                currentData = aws_thing["state"]["desired"][key]
-                prevData = self.prev_state["state"]["desired"][key]
-                step_data["changedDesiredData"][key] = {
-                    "from": prevData,
-                    "to": currentData,
-                }
-
-            for key in changed_reported_keys:
-                currentData = aws_thing["state"]["reported"][key]
-                prevData = self.prev_state["state"]["reported"][key]
-                step_data["changedReportedData"][key] = {
-                    "from": prevData,
-                    "to": currentData,
-                }
-
-            self.steps.append(step_data)
-
-        self.prev_state = aws_thing
-        await self.set_stored_data(
-            {
-                "initState": self.init_state,
-                "initDesc": self.init_desc,
-                "prevState": aws_thing,
-                "steps": self.steps,
-            }
+        step_data = self.build_step(action_description, state.prev_state, aws_thing)
+        record = {
+            "seq": len(state.steps),
+            "step": step_data,
+            "patch": shadow_patch(state.prev_state, aws_thing),
+        }
+        await self.hass.async_add_executor_job(
+            append_journal, self.journal_path, json.dumps(record)
         )
+        state.steps.append(step_data)
+        state.prev_state = aws_thing
+        state.journal_steps += 1
+
+        if state.journal_steps >= SELF_DIAGNOSTICS_COMPACT_EVERY_STEPS:
+            await self.async_compact()
@@ -1,242 +1,66 @@
 """Interfaces with the Integration 101 Template api sensors."""
+from collections.abc import Callable
+from dataclasses import dataclass
 import logging
+import time
+from typing import Any
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity,SensorStateClass
-from homeassistant.const import UnitOfEnergy, UnitOfTemperature, UnitOfTime, PERCENTAGE
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory, UnitOfEnergy, UnitOfTemperature, UnitOfTime, PERCENTAGE
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .config_entry import New_NameConfigEntry
+from .const import DOMAIN
 from .coordinator import IotDeviceCoordinator
 from .device import Device
 from .device_features import DeviceFeatureEnum
+from .entity_descriptions import FeatureDescriptionRegistry, FeatureEntityDescription
+from .metrics import MetricOperationEnum
+from .sensor_filter import SensorWriteFilter, get_sensor_write_filter
 from .tcl_entity_base import TclEntityBase
 _LOGGER = logging.getLogger(__name__)
-async def async_setup_entry(
-    hass: HomeAssistant,
-    config_entry: New_NameConfigEntry,
-    async_add_entities: AddEntitiesCallback,
-):
-    """Set up the Sensors."""
-    coordinator = config_entry.runtime_data.coordinator
-    sensors = []
-    for device in config_entry.devices:
-        if DeviceFeatureEnum.SENSOR_CURRENT_TEMPERATURE in device.supported_features:
-            sensors.append(
-                TemperatureSensor(
-                    coordinator=coordinator,
-                    device=device,
-                    type="CurrentTemperature",
-                    name="Current Temperature",
-                    value_fn=lambda device: device.data.current_temperature,
-                )
-            )
-        if DeviceFeatureEnum.SENSOR_INTERNAL_UNIT_COIL_TEMPERATURE in device.supported_features:
-            sensors.append(
-                TemperatureSensor(
-                    coordinator=coordinator,
-                    device=device,
-                    type="InternalUnitCoilTemperature",
-                    name="Internal Unit Coil Temperature",
-                    value_fn=lambda device: device.data.internal_unit_coil_temperature,
-                )
-            )
-        if DeviceFeatureEnum.SENSOR_EXTERNAL_UNIT_COIL_TEMPERATURE in device.supported_features:
-            sensors.append(
-                TemperatureSensor(
-                    coordinator=coordinator,
-                    device=device,
-                    type="ExternalUnitCoilTemperature",
-                    name="External Unit Coil Temperature",
-                    value_fn=lambda device: device.data.external_unit_coil_temperature,
-                )
-            )
-        if DeviceFeatureEnum.SENSOR_EXTERNAL_UNIT_TEMPERATURE in device.supported_features:
-            sensors.append(
-                TemperatureSensor(
-                    coordinator=coordinator,
-                    device=device,
-                    type="ExternalUnitTemperature",
-                    name="External Unit Temperature",
-                    value_fn=lambda device: device.data.external_unit_temperature,
-                )
-            )
-        if DeviceFeatureEnum.SENSOR_EXTERNAL_UNIT_EXHAUST_TEMPERATURE in device.supported_features:
-            sensors.append(
-                TemperatureSensor(
-                    coordinator=coordinator,
-                    device=device,
-                    type="ExternalUnitExhaustTemperature",
-                    name="External Unit Exhaust Temperature",
-                    value_fn=lambda device: device.data.external_unit_exhaust_temperature,
-                )
-            )
-        if DeviceFeatureEnum.SENSOR_DEHUMIDIFIER_ENV_HUMIDITY in device.supported_features:
-            sensors.append(
-                HumiditySensor(
-                    coordinator=coordinator,
-                    device=device,
-                    type="DehumidifierEnvHumidity",
-                    name="Environment Humidity",
-                    value_fn=lambda device: device.data.env_humidity,
-                )
-            )
-        if DeviceFeatureEnum.SENSOR_FRESH_AIR_TVOC in device.supported_features:
-            sensors.append(
-                VolatileOrganicCompoundsSensor(
-                    coordinator=coordinator,
-                    device=device,
-                    type="TVOC.Value",
-                    name="TVOC Value",
-                    value_fn=lambda device: device.data.tvoc_value,
-                )
-            )
-            sensors.append(
-                IntNumberSensor(
-                    coordinator=coordinator,
-                    device=device,
-                    type="TVOC.Level",
-                    name="TVOC Level",
-                    device_classification=None,
-                    state_classification=SensorStateClass.MEASUREMENT,
-                    icon_fn=lambda device: "mdi:dots-hexagon",
-                    native_unit_of_measurement="",
-                    value_fn=lambda device: device.data.tvoc_level,
-                )
-            )
-        
-        if DeviceFeatureEnum.SENSOR_SPLIT_AC_TVOC_VALUE in device.supported_features:
-            sensors.append(
-                VolatileOrganicCompoundsSensor(
-                    coordinator=coordinator,
-                    device=device,
-                    type="SplitAC.TVOC.Value",
-                    name="TVOC Value",
-                    value_fn=lambda device: device.data.sensor_TVOC_value,
-                )
-            )
-        
-        if DeviceFeatureEnum.SENSOR_SPLIT_AC_TVOC_LEVEL in device.supported_features:
-            sensors.append(
-                IntNumberSensor(
-                    coordinator=coordinator,
-                    device=device,
-                    type="SplitAC.TVOC.Level",
-                    name="TVOC Level",
-                    device_classification=None,
-                    state_classification=SensorStateClass.MEASUREMENT,
-                    icon_fn=lambda device: "mdi:dots-hexagon",
-                    native_unit_of_measurement="",
-                    value_fn=lambda device: device.data.sensor_TVOC_level,
-                )
-            )
 
-        if DeviceFeatureEnum.SENSOR_PM25_SENSOR_LEVEL in device.supported_features:            
-            sensors.append(
-                IntNumberSensor(
-                    coordinator=coordinator,
-                    device=device,
-                    type="PM25.Level",
-                    name="PM25 Level",
-                    device_classification=None,
-                    state_classification=SensorStateClass.MEASUREMENT,
-                    icon_fn=lambda device: "mdi:dots-hexagon",
-                    native_unit_of_measurement="",
-                    value_fn=lambda device: device.data.pm25_sensor_level,
-                )
-            )
-        if DeviceFeatureEnum.SENSOR_VOC_SENSOR_LEVEL in device.supported_features:            
-            sensors.append(
-                IntNumberSensor(
-                    coordinator=coordinator,
-                    device=device,
-                    type="TVOC.SENSOR.Level",
-                    name="TVOC Level",
-                    device_classification=None,
-                    state_classification=SensorStateClass.MEASUREMENT,
-                    icon_fn=lambda device: "mdi:dots-hexagon",
-                    native_unit_of_measurement="",
-                    value_fn=lambda device: device.data.voc_sensor_level,
-                )
-            )
-        if DeviceFeatureEnum.SENSOR_POWER_CONSUMPTION_DAILY in device.supported_features:
-            sensors.append(
-                EnergyConsumptionSensor(
-                    coordinator=coordinator,
-                    device=device,
-                    type="TodayEnergyConsumption",
-                    name="Today Energy Consumption",
-                    value_fn=lambda device: round(device.extra_tcl_data.get("today_total_electricity",0),2),
-                )
-            )
-            sensors.append(
-                EnergyConsumptionSensor(
-                    coordinator=coordinator,
-                    device=device,
-                    type="YesterdayEnergyConsumption",
-                    name="Yesterday Energy Consumption",
-                    value_fn=lambda device: round(device.extra_tcl_data.get("yesterday_total_electricity",0),2),
-                )
-            )
-        if DeviceFeatureEnum.SENSOR_WORK_TIME_DAILY in device.supported_features:            
-            sensors.append(
-                IntNumberSensor(
-                    coordinator=coordinator,
-                    device=device,
-                    type="TodayWorkTime",
-                    name="Today Work Time",
-                    device_classification=SensorDeviceClass.DURATION,
-                    state_classification=SensorStateClass.TOTAL_INCREASING,
-                    native_unit_of_measurement=UnitOfTime.HOURS,
-                    icon_fn=lambda device: "mdi:clock-time-eight-outline",
-                    value_fn=lambda device: round((device.extra_tcl_data.get("today_work_time",0)/60),2),
-                )
-            )
-            sensors.append(
-                IntNumberSensor(
-                    coordinator=coordinator,
-                    device=device,
-                    type="YesterdayWorkTime",
-                    name="Yesterday Work Time",
-                    device_classification=SensorDeviceClass.DURATION,
-                    state_classification=SensorStateClass.TOTAL_INCREASING,
-                    native_unit_of_measurement=UnitOfTime.HOURS,
-                    icon_fn=lambda device: "mdi:clock-time-eight-outline",
-                    value_fn=lambda device: round((device.extra_tcl_data.get("yesterday_work_time",0)/60),2),
-                )
-            )
 
-        if DeviceFeatureEnum.SENSOR_FILTER_LIFETIME in device.supported_features:
-            sensors.append(
-                IntNumberSensor(
-                    coordinator=coordinator,
-                    device=device,
-                    type="FilterLifeTime",
-                    name="Filter Life Time",
-                    device_classification=SensorDeviceClass.DURATION,
-                    state_classification=SensorStateClass.MEASUREMENT,
-                    native_unit_of_measurement=UnitOfTime.HOURS,
-                    icon_fn=lambda device: "mdi:filter-check",
-                    value_fn=lambda device: device.data.filter_life_time,
-                )
-            )
-        
-        if DeviceFeatureEnum.SENSOR_PM25_SENSOR_VALUE in device.supported_features:
-            sensors.append(
-                IntNumberSensor(
-                    coordinator=coordinator,
-                    device=device,
-                    type="PM25SensorValue",
-                    name="PM2.5 Sensor Value",
-                    device_classification=SensorDeviceClass.PM25,
-                    state_classification=SensorStateClass.MEASUREMENT,
-                    native_unit_of_measurement="µg/m³",
-                    icon_fn=lambda device: "mdi:air-filter",
-                    value_fn=lambda device: device.data.pm25_sensor_value,
-                )
-            )
+class FilteredSensor(TclEntityBase, SensorEntity):
+    """A sensor whose new values are written only when its write filter lets them through."""
 
-    async_add_entities(sensors)
-class TemperatureSensor(TclEntityBase, SensorEntity):
+    write_filter: SensorWriteFilter | None = None
+
+    def read_value(self) -> int | float:
+        return float(self.value_fn(self.device))
+
+    def update_attributes(self) -> None:
+        super().update_attributes()
+        value = self.read_value()
+        if self.write_filter is None:
+            self._attr_native_value = value
+            return
+        if self.write_filter.accept(value, time.monotonic()):
+            self._attr_native_value = value
+        self._attr_extra_state_attributes = {"suppressed_writes": self.write_filter.suppressed}
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        if self.write_filter is None:
+            TclEntityBase._handle_coordinator_update(self)
+            return
+        device = self.coordinator.get_device_by_id(self.device.device_id)
+        if device is None:
+            TclEntityBase._handle_coordinator_update(self)
+            return
+        self.device = device
+        written = (self._attr_available, self._attr_native_value)
+        suppressed = self.write_filter.suppressed
+        self.refresh_attributes()
+        if (self._attr_available, self._attr_native_value) != written:
+            self.async_write_ha_state()
+        elif self.write_filter.suppressed != suppressed:
+            self.coordinator.get_aws_iot().get_metrics().increment("sensor_writes_suppressed")
+
+
+class TemperatureSensor(FilteredSensor):
     def __init__(
         self,
         coordinator: IotDeviceCoordinator,
@@ -244,23 +68,21 @@ class TemperatureSensor(TclEntityBase, SensorEntity):
         type: str,
         name: str,
         value_fn,
+        write_filter: SensorWriteFilter | None = None,
     ) -> None:
         TclEntityBase.__init__(self, coordinator, type, name, device)
         self.value_fn = value_fn
+        self.write_filter = write_filter
     @property
     def device_class(self) -> str:
         return SensorDeviceClass.TEMPERATURE
     @property
-    def native_value(self) -> int | float:
-        self.device = self.coordinator.get_device_by_id(self.device.device_id)
-        return float(self.value_fn(self.device))
-    @property
     def native_unit_of_measurement(self) -> str | None:
         return UnitOfTemperature.CELSIUS
     @property
     def state_class(self) -> str | None:
         return SensorStateClass.MEASUREMENT
-class HumiditySensor(TclEntityBase, SensorEntity):
+class HumiditySensor(FilteredSensor):
     def __init__(
         self,
         coordinator: IotDeviceCoordinator,
@@ -268,23 +90,21 @@ class HumiditySensor(TclEntityBase, SensorEntity):
         type: str,
         name: str,
         value_fn,
+        write_filter: SensorWriteFilter | None = None,
     ) -> None:
         TclEntityBase.__init__(self, coordinator, type, name, device)
         self.value_fn = value_fn
+        self.write_filter = write_filter
     @property
     def device_class(self) -> str:
         return SensorDeviceClass.HUMIDITY
     @property
-    def native_value(self) -> int | float:
-        self.device = self.coordinator.get_device_by_id(self.device.device_id)
-        return float(self.value_fn(self.device))
-    @property
     def native_unit_of_measurement(self) -> str | None:
         return PERCENTAGE
     @property
     def state_class(self) -> str | None:
         return SensorStateClass.MEASUREMENT
-class VolatileOrganicCompoundsSensor(TclEntityBase, SensorEntity):
+class VolatileOrganicCompoundsSensor(FilteredSensor):
     def __init__(
         self,
         coordinator: IotDeviceCoordinator,
@@ -292,9 +112,11 @@ class VolatileOrganicCompoundsSensor(TclEntityBase, SensorEntity):
         type: str,
         name: str,
         value_fn,
+        write_filter: SensorWriteFilter | None = None,
     ) -> None:
         TclEntityBase.__init__(self, coordinator, type, name, device)
         self.value_fn = value_fn
+        self.write_filter = write_filter
         
         self.CONCENTRATION_MICROGRAMS_PER_CUBIC_METER = "µg/m³"
         self.CONCENTRATION_MILLIGRAMS_PER_CUBIC_METER = "mg/m³"
@@ -306,10 +128,6 @@ class VolatileOrganicCompoundsSensor(TclEntityBase, SensorEntity):
     def device_class(self) -> str:
         return SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS
     @property
-    def native_value(self) -> int | float:
-        self.device = self.coordinator.get_device_by_id(self.device.device_id)
-        return float(self.value_fn(self.device))
-    @property
     def native_unit_of_measurement(self) -> str | None:
         #??? don't know the unit of measurement we only know the value
         return self.CONCENTRATION_MICROGRAMS_PER_CUBIC_METER
@@ -320,7 +138,7 @@ class VolatileOrganicCompoundsSensor(TclEntityBase, SensorEntity):
     @property
     def icon(self):
         return "mdi:dots-hexagon"
-class IntNumberSensor(TclEntityBase, SensorEntity):
+class IntNumberSensor(FilteredSensor):
     def __init__(
         self,
         coordinator: IotDeviceCoordinator,
@@ -332,23 +150,24 @@ class IntNumberSensor(TclEntityBase, SensorEntity):
         device_classification: str,
         state_classification: str,
         native_unit_of_measurement: str,
+        write_filter: SensorWriteFilter | None = None,
     ) -> None:
         TclEntityBase.__init__(self, coordinator, type, name, device)
         self.value_fn = value_fn
+        self.write_filter = write_filter
         self.state_classification=state_classification
         self.device_classification=device_classification
         self.icon_fn = icon_fn
         self.input_native_unit_of_measurement=native_unit_of_measurement
-    @property
-    def icon(self):
-        return self.icon_fn(self.device)
-    
+
+    def update_attributes(self) -> None:
+        super().update_attributes()
+        self._attr_icon = self.icon_fn(self.device)
+
     @property
     def device_class(self) -> str:
         return self.device_classification
-    @property
-    def native_value(self) -> int | float:
-        self.device = self.coordinator.get_device_by_id(self.device.device_id)
+    def read_value(self) -> int | float:
         return int(self.value_fn(self.device))
     @property
     def native_unit_of_measurement(self) -> str | None:
@@ -370,16 +189,364 @@ class EnergyConsumptionSensor(TclEntityBase, SensorEntity):
     ) -> None:
         TclEntityBase.__init__(self, coordinator, type, name, device)
         self.value_fn = value_fn
+    def update_attributes(self) -> None:
+        super().update_attributes()
+        self._attr_native_value = float(self.value_fn(self.device))
     @property
     def device_class(self) -> str:
         return SensorDeviceClass.ENERGY
     @property
-    def native_value(self) -> int | float:
-        self.device = self.coordinator.get_device_by_id(self.device.device_id)
-        return float(self.value_fn(self.device))
-    @property
     def native_unit_of_measurement(self) -> str | None:
         return UnitOfEnergy.KILO_WATT_HOUR
     @property
     def state_class(self) -> str | None:
         return SensorStateClass.TOTAL_INCREASING
+
+
+class MetricsLatencySensor(CoordinatorEntity, SensorEntity):
+    """p95 latency of one cloud operation, with counts and error rate as attributes."""
+
+    def __init__(
+        self,
+        coordinator: IotDeviceCoordinator,
+        config_entry: New_NameConfigEntry,
+        operation: MetricOperationEnum,
+    ) -> None:
+        super().__init__(coordinator)
+        self.operation = operation
+        self.metrics = coordinator.get_aws_iot().get_metrics()
+        self.entry_id = config_entry.entry_id
+        self._attr_has_entity_name = True
+        self._attr_name = f"Metrics {operation} p95 latency"
+        self._attr_unique_id = f"{DOMAIN}-Metrics.{operation}-{config_entry.entry_id}"
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_device_class = SensorDeviceClass.DURATION
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+        self._attr_icon = "mdi:timer-outline"
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        return DeviceInfo(
+            name="TCL Home cloud",
+            manufacturer="TCL",
+            model="Cloud connection",
+            identifiers={(DOMAIN, f"TCL-cloud-{self.entry_id}")},
+        )
+
+    def update_attributes(self) -> None:
+        snapshot = self.metrics.get_operation_snapshot(self.operation)
+        if snapshot is None:
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = {"count": 0, "errors": 0, "error_rate": 0.0}
+        else:
+            self._attr_native_value = snapshot.p95_ms
+            self._attr_extra_state_attributes = snapshot.as_dict()
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.update_attributes()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self.update_attributes()
+        self.async_write_ha_state()
+
+
+class CommandLatencySensor(TclEntityBase, SensorEntity):
+    """p50 time between publishing a command and the device reporting it."""
+
+    needs_device_data = False
+
+    def __init__(self, coordinator: IotDeviceCoordinator, device: Device) -> None:
+        TclEntityBase.__init__(self, coordinator, "CommandLatency", "Command latency", device)
+        self.command_tracker = coordinator.get_aws_iot().get_command_tracker()
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_device_class = SensorDeviceClass.DURATION
+        self._attr_native_unit_of_measurement = UnitOfTime.SECONDS
+        self._attr_icon = "mdi:timer-sync-outline"
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        # acknowledgements change without the device state changing
+        device = self.coordinator.get_device_by_id(self.device.device_id)
+        if device is None:
+            # dropped out of get_all_things: keep the last known device
+            self._attr_available = False
+            self.async_write_ha_state()
+            return
+        self.device = device
+        self.update_attributes()
+        self.async_write_ha_state()
+
+    @property
+    def state_class(self) -> str | None:
+        return SensorStateClass.MEASUREMENT
+
+    def update_attributes(self) -> None:
+        super().update_attributes()
+        stats = self.command_tracker.get_stats(self.device.device_id)
+        self._attr_native_value = stats.percentile(50)
+        self._attr_extra_state_attributes = {
+            **stats.as_dict(),
+            "confirmation_delay_s": self.command_tracker.get_confirmation_delay(self.device.device_id),
+        }
+
+
+class CommandTimeoutsSensor(TclEntityBase, SensorEntity):
+    """Commands the device did not report within COMMAND_TIMEOUT_SECONDS."""
+
+    needs_device_data = False
+
+    def __init__(self, coordinator: IotDeviceCoordinator, device: Device) -> None:
+        TclEntityBase.__init__(self, coordinator, "CommandTimeouts", "Command timeouts", device)
+        self.command_tracker = coordinator.get_aws_iot().get_command_tracker()
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_icon = "mdi:timer-alert-outline"
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        device = self.coordinator.get_device_by_id(self.device.device_id)
+        if device is None:
+            self._attr_available = False
+            self.async_write_ha_state()
+            return
+        self.device = device
+        self.update_attributes()
+        self.async_write_ha_state()
+
+    @property
+    def state_class(self) -> str | None:
+        return SensorStateClass.TOTAL_INCREASING
+
+    def update_attributes(self) -> None:
+        super().update_attributes()
+        self._attr_native_value = self.command_tracker.get_stats(self.device.device_id).timed_out
+
+
+@dataclass(frozen=True, kw_only=True)
+class SensorDescription(FeatureEntityDescription):
+    """A device sensor; icon_fn, device_class, state_class and unit are the IntNumberSensor ones."""
+
+    sensor_class: type[FilteredSensor] | type[EnergyConsumptionSensor]
+    value_fn: Callable[[Device], Any]
+    # write through the feature's SENSOR_FILTER_DEFAULTS filter
+    filtered: bool = False
+    icon_fn: Callable[[Device], str] | None = None
+    device_class: SensorDeviceClass | None = None
+    state_class: SensorStateClass | None = None
+    unit: str | None = None
+
+    def create(self, coordinator: IotDeviceCoordinator, device: Device) -> SensorEntity:
+        kwargs = {}
+        if self.filtered:
+            kwargs["write_filter"] = get_sensor_write_filter(self.feature)
+        if self.icon_fn is not None:
+            kwargs["icon_fn"] = self.icon_fn
+            kwargs["device_classification"] = self.device_class
+            kwargs["state_classification"] = self.state_class
+            kwargs["native_unit_of_measurement"] = self.unit
+        return self.sensor_class(
+            coordinator=coordinator,
+            device=device,
+            type=self.type,
+            name=self.name,
+            value_fn=self.value_fn,
+            **kwargs,
+        )
+
+
+SENSOR_DESCRIPTIONS: FeatureDescriptionRegistry[SensorDescription] = FeatureDescriptionRegistry(
+    [
+        SensorDescription(
+            feature=DeviceFeatureEnum.SENSOR_CURRENT_TEMPERATURE,
+            type="CurrentTemperature",
+            name="Current Temperature",
+            sensor_class=TemperatureSensor,
+            value_fn=lambda device: device.data.current_temperature,
+        ),
+        SensorDescription(
+            feature=DeviceFeatureEnum.SENSOR_INTERNAL_UNIT_COIL_TEMPERATURE,
+            type="InternalUnitCoilTemperature",
+            name="Internal Unit Coil Temperature",
+            sensor_class=TemperatureSensor,
+            value_fn=lambda device: device.data.internal_unit_coil_temperature,
+            filtered=True,
+        ),
+        SensorDescription(
+            feature=DeviceFeatureEnum.SENSOR_EXTERNAL_UNIT_COIL_TEMPERATURE,
+            type="ExternalUnitCoilTemperature",
+            name="External Unit Coil Temperature",
+            sensor_class=TemperatureSensor,
+            value_fn=lambda device: device.data.external_unit_coil_temperature,
+            filtered=True,
+        ),
+        SensorDescription(
+            feature=DeviceFeatureEnum.SENSOR_EXTERNAL_UNIT_TEMPERATURE,
+            type="ExternalUnitTemperature",
+            name="External Unit Temperature",
+            sensor_class=TemperatureSensor,
+            value_fn=lambda device: device.data.external_unit_temperature,
+            filtered=True,
+        ),
+        SensorDescription(
+            feature=DeviceFeatureEnum.SENSOR_EXTERNAL_UNIT_EXHAUST_TEMPERATURE,
+            type="ExternalUnitExhaustTemperature",
+            name="External Unit Exhaust Temperature",
+            sensor_class=TemperatureSensor,
+            value_fn=lambda device: device.data.external_unit_exhaust_temperature,
+            filtered=True,
+        ),
+        SensorDescription(
+            feature=DeviceFeatureEnum.SENSOR_DEHUMIDIFIER_ENV_HUMIDITY,
+            type="DehumidifierEnvHumidity",
+            name="Environment Humidity",
+            sensor_class=HumiditySensor,
+            value_fn=lambda device: device.data.env_humidity,
+            filtered=True,
+        ),
+        SensorDescription(
+            feature=DeviceFeatureEnum.SENSOR_FRESH_AIR_TVOC,
+            type="TVOC.Value",
+            name="TVOC Value",
+            sensor_class=VolatileOrganicCompoundsSensor,
+            value_fn=lambda device: device.data.tvoc_value,
+            filtered=True,
+        ),
+        SensorDescription(
+            feature=DeviceFeatureEnum.SENSOR_FRESH_AIR_TVOC,
+            type="TVOC.Level",
+            name="TVOC Level",
+            sensor_class=IntNumberSensor,
+            value_fn=lambda device: device.data.tvoc_level,
+            icon_fn=lambda device: "mdi:dots-hexagon",
+            state_class=SensorStateClass.MEASUREMENT,
+            unit="",
+        ),
+        SensorDescription(
+            feature=DeviceFeatureEnum.SENSOR_SPLIT_AC_TVOC_VALUE,
+            type="SplitAC.TVOC.Value",
+            name="TVOC Value",
+            sensor_class=VolatileOrganicCompoundsSensor,
+            value_fn=lambda device: device.data.sensor_TVOC_value,
+            filtered=True,
+        ),
+        SensorDescription(
+            feature=DeviceFeatureEnum.SENSOR_SPLIT_AC_TVOC_LEVEL,
+            type="SplitAC.TVOC.Level",
+            name="TVOC Level",
+            sensor_class=IntNumberSensor,
+            value_fn=lambda device: device.data.sensor_TVOC_level,
+            icon_fn=lambda device: "mdi:dots-hexagon",
+            state_class=SensorStateClass.MEASUREMENT,
+            unit="",
+        ),
+        SensorDescription(
+            feature=DeviceFeatureEnum.SENSOR_PM25_SENSOR_LEVEL,
+            type="PM25.Level",
+            name="PM25 Level",
+            sensor_class=IntNumberSensor,
+            value_fn=lambda device: device.data.pm25_sensor_level,
+            icon_fn=lambda device: "mdi:dots-hexagon",
+            state_class=SensorStateClass.MEASUREMENT,
+            unit="",
+        ),
+        SensorDescription(
+            feature=DeviceFeatureEnum.SENSOR_VOC_SENSOR_LEVEL,
+            type="TVOC.SENSOR.Level",
+            name="TVOC Level",
+            sensor_class=IntNumberSensor,
+            value_fn=lambda device: device.data.voc_sensor_level,
+            icon_fn=lambda device: "mdi:dots-hexagon",
+            state_class=SensorStateClass.MEASUREMENT,
+            unit="",
+        ),
+        SensorDescription(
+            feature=DeviceFeatureEnum.SENSOR_POWER_CONSUMPTION_DAILY,
+            type="TodayEnergyConsumption",
+            name="Today Energy Consumption",
+            sensor_class=EnergyConsumptionSensor,
+            value_fn=lambda device: round(device.extra_tcl_data.get("today_total_electricity",0),2),
+        ),
+        SensorDescription(
+            feature=DeviceFeatureEnum.SENSOR_POWER_CONSUMPTION_DAILY,
+            type="YesterdayEnergyConsumption",
+            name="Yesterday Energy Consumption",
+            sensor_class=EnergyConsumptionSensor,
+            value_fn=lambda device: round(device.extra_tcl_data.get("yesterday_total_electricity",0),2),
+        ),
+        SensorDescription(
+            feature=DeviceFeatureEnum.SENSOR_WORK_TIME_DAILY,
+            type="TodayWorkTime",
+            name="Today Work Time",
+            sensor_class=IntNumberSensor,
+            value_fn=lambda device: round((device.extra_tcl_data.get("today_work_time",0)/60),2),
+            icon_fn=lambda device: "mdi:clock-time-eight-outline",
+            device_class=SensorDeviceClass.DURATION,
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            unit=UnitOfTime.HOURS,
+        ),
+        SensorDescription(
+            feature=DeviceFeatureEnum.SENSOR_WORK_TIME_DAILY,
+            type="YesterdayWorkTime",
+            name="Yesterday Work Time",
+            sensor_class=IntNumberSensor,
+            value_fn=lambda device: round((device.extra_tcl_data.get("yesterday_work_time",0)/60),2),
+            icon_fn=lambda device: "mdi:clock-time-eight-outline",
+            device_class=SensorDeviceClass.DURATION,
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            unit=UnitOfTime.HOURS,
+        ),
+        SensorDescription(
+            feature=DeviceFeatureEnum.SENSOR_FILTER_LIFETIME,
+            type="FilterLifeTime",
+            name="Filter Life Time",
+            sensor_class=IntNumberSensor,
+            value_fn=lambda device: device.data.filter_life_time,
+            icon_fn=lambda device: "mdi:filter-check",
+            device_class=SensorDeviceClass.DURATION,
+            state_class=SensorStateClass.MEASUREMENT,
+            unit=UnitOfTime.HOURS,
+        ),
+        SensorDescription(
+            feature=DeviceFeatureEnum.SENSOR_PM25_SENSOR_VALUE,
+            type="PM25SensorValue",
+            name="PM2.5 Sensor Value",
+            sensor_class=IntNumberSensor,
+            value_fn=lambda device: device.data.pm25_sensor_value,
+            filtered=True,
+            icon_fn=lambda device: "mdi:air-filter",
+            device_class=SensorDeviceClass.PM25,
+            state_class=SensorStateClass.MEASUREMENT,
+            unit="µg/m³",
+        ),
+    ]
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: New_NameConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+):
+    """Set up the Sensors."""
+    coordinator = config_entry.runtime_data.coordinator
+    sensors = []
+    for device in config_entry.devices:
+        for description in SENSOR_DESCRIPTIONS.for_device(device):
+            sensors.append(description.create(coordinator, device))
+
+    if coordinator.get_config_data().collect_metrics:
+        for device in config_entry.devices:
+            sensors.append(CommandLatencySensor(coordinator=coordinator, device=device))
+            sensors.append(CommandTimeoutsSensor(coordinator=coordinator, device=device))
+        for operation in MetricOperationEnum:
+            sensors.append(
+                MetricsLatencySensor(
+                    coordinator=coordinator,
+                    config_entry=config_entry,
+                    operation=operation,
+                )
+            )
+
+    async_add_entities(sensors)
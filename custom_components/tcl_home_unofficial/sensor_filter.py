@@ -0,0 +1,87 @@
+"""Deadband and minimum interval filters for noisy sensors.
+
+Coil / exhaust temperatures, TVOC, PM2.5 and the dehumidifier environment
+humidity change by a step on most polls, and each written state is a
+recorder row. A SensorWriteFilter lets a new value through only when:
+- at least min_interval_seconds passed since the last written value, and
+- it differs from the last written value by more than the deadband
+  (absolute, or relative to the last written value),
+or when it differs at all and max_interval_seconds passed, so a small drift
+is not hidden forever. The values not written are counted, each distinct
+value once however many polls it is held back for.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .device_features import DeviceFeatureEnum
+
+
+@dataclass(frozen=True)
+class SensorFilterConfig:
+    deadband: float = 0.0
+    # deadband is a fraction of the last written value
+    relative: bool = False
+    min_interval_seconds: float = 0.0
+    max_interval_seconds: float = 3600.0
+
+
+COIL_TEMPERATURE_FILTER = SensorFilterConfig(deadband=1.0, min_interval_seconds=300)
+OUTDOOR_TEMPERATURE_FILTER = SensorFilterConfig(deadband=0.5, min_interval_seconds=120)
+HUMIDITY_FILTER = SensorFilterConfig(deadband=1.0, min_interval_seconds=120)
+AIR_QUALITY_FILTER = SensorFilterConfig(deadband=0.1, relative=True, min_interval_seconds=120)
+
+SENSOR_FILTER_DEFAULTS: dict[DeviceFeatureEnum, SensorFilterConfig] = {
+    DeviceFeatureEnum.SENSOR_INTERNAL_UNIT_COIL_TEMPERATURE: COIL_TEMPERATURE_FILTER,
+    DeviceFeatureEnum.SENSOR_EXTERNAL_UNIT_COIL_TEMPERATURE: COIL_TEMPERATURE_FILTER,
+    DeviceFeatureEnum.SENSOR_EXTERNAL_UNIT_EXHAUST_TEMPERATURE: COIL_TEMPERATURE_FILTER,
+    DeviceFeatureEnum.SENSOR_EXTERNAL_UNIT_TEMPERATURE: OUTDOOR_TEMPERATURE_FILTER,
+    DeviceFeatureEnum.SENSOR_DEHUMIDIFIER_ENV_HUMIDITY: HUMIDITY_FILTER,
+    DeviceFeatureEnum.SENSOR_FRESH_AIR_TVOC: AIR_QUALITY_FILTER,
+    DeviceFeatureEnum.SENSOR_SPLIT_AC_TVOC_VALUE: AIR_QUALITY_FILTER,
+    DeviceFeatureEnum.SENSOR_PM25_SENSOR_VALUE: AIR_QUALITY_FILTER,
+}
+
+
+class SensorWriteFilter:
+    """The filter state of one sensor entity."""
+
+    def __init__(self, config: SensorFilterConfig) -> None:
+        self.config = config
+        self.value: int | float | None = None
+        self.written_at: float | None = None
+        self.suppressed = 0
+        self.suppressed_value: int | float | None = None
+
+    def is_suppressed(self, value: int | float, elapsed: float) -> bool:
+        if elapsed < self.config.min_interval_seconds:
+            return True
+        threshold = self.config.deadband
+        if self.config.relative:
+            threshold *= abs(self.value)
+        return abs(value - self.value) <= threshold and elapsed < self.config.max_interval_seconds
+
+    def accept(self, value: int | float | None, now: float) -> bool:
+        """True when value is to be written; it becomes the last written value."""
+        if self.written_at is not None:
+            if value == self.value:
+                return False
+            if (
+                value is not None
+                and self.value is not None
+                and self.is_suppressed(value, now - self.written_at)
+            ):
+                if value != self.suppressed_value:
+                    self.suppressed += 1
+                    self.suppressed_value = value
+                return False
+        self.value = value
+        self.written_at = now
+        self.suppressed_value = None
+        return True
+
+
+def get_sensor_write_filter(feature: DeviceFeatureEnum) -> SensorWriteFilter | None:
+    config = SENSOR_FILTER_DEFAULTS.get(feature)
+    return None if config is None else SensorWriteFilter(config)
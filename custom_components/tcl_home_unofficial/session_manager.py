@@ -8,6 +8,8 @@ from homeassistant.helpers import storage
 
 from .config_entry import ConfigData, New_NameConfigEntry, convertToConfigData
 from .const import DOMAIN
+from .metrics import MetricOperationEnum, MetricsRecorder
+from .request_governor import RequestGovernor, RequestPriorityEnum
 from .tcl import (
     CloudUrlsResponse,
     DoAccountAuthResponse,
@@ -53,6 +55,14 @@ class SessionManager:
             awsCredentialsData=None,
             cloudUrlsData=None,
         )
+        self.metrics = MetricsRecorder(enabled=self.configData.collect_metrics)
+        self.governor = RequestGovernor()
+
+    def get_metrics(self) -> MetricsRecorder:
+        return self.metrics
+
+    def get_request_governor(self) -> RequestGovernor:
+        return self.governor
 
     def is_verbose_device_logging(self) -> bool:
         return self.configData.verbose_device_logging
@@ -66,6 +76,10 @@ class SessionManager:
     def get_config_data(self) -> ConfigData:
         return self.configData
 
+    def set_config_data(self, configData: ConfigData) -> None:
+        """Options changed without a reload (see RELOAD_REQUIRED_FIELDS)."""
+        self.configData = configData
+
     async def get_aws_region(self) -> str:
         cloud_urls = await self.async_aws_cloud_urls()
         return cloud_urls.data.cloud_region
@@ -135,13 +149,16 @@ class SessionManager:
     ) -> DoAccountAuthResponse:
         if self.is_verbose_session_logging():
             _LOGGER.info("SessionManager.async_force_get_auth_data")
-        authData = await do_account_auth(
-            hass=self.hass,
-            username=self.configData.username,
-            password=self.configData.password,
-            login_url=self.configData.app_login_url,
-            verbose_logging=self.is_verbose_session_logging(),
-        )
+        async with self.governor.request(RequestPriorityEnum.COMMAND):
+            with self.metrics.measure(MetricOperationEnum.AUTH) as measurement:
+                authData = await do_account_auth(
+                    hass=self.hass,
+                    username=self.configData.username,
+                    password=self.configData.password,
+                    login_url=self.configData.app_login_url,
+                    verbose_logging=self.is_verbose_session_logging(),
+                )
+                measurement.set_failed(authData is None)
 
         self.storageData.authData = authData
         await self._store.async_save(data=self.storageData)
@@ -182,14 +199,17 @@ class SessionManager:
         authData = await self.async_get_auth_data()
         cloud_urls = await self.async_aws_cloud_urls()
 
-        refreshTokensData = await refreshTokens(
-            hass=self.hass,
-            refresh_tokens_url=cloud_urls.data.cloud_url,
-            username=authData.user.username,
-            accessToken=authData.token,
-            appId=self.configData.app_id,
-            verbose_logging=self.is_verbose_session_logging(),
-        )
+        async with self.governor.request(RequestPriorityEnum.COMMAND):
+            with self.metrics.measure(MetricOperationEnum.REFRESH_TOKENS) as measurement:
+                refreshTokensData = await refreshTokens(
+                    hass=self.hass,
+                    refresh_tokens_url=cloud_urls.data.cloud_url,
+                    username=authData.user.username,
+                    accessToken=authData.token,
+                    appId=self.configData.app_id,
+                    verbose_logging=self.is_verbose_session_logging(),
+                )
+                measurement.set_failed(refreshTokensData is None)
 
         self.storageData.refreshTokensData = refreshTokensData
         await self._store.async_save(data=self.storageData)
@@ -238,12 +258,15 @@ class SessionManager:
         refreshTokensData = await self.async_refresh_tokens()
         aws_region = await self.get_aws_region()
 
-        awsCredentials = await get_aws_credentials(
-            hass=self.hass,
-            aws_region=aws_region,
-            cognitoToken=refreshTokensData.data.cognito_token,
-            verbose_logging=self.is_verbose_session_logging(),
-        )
+        async with self.governor.request(RequestPriorityEnum.COMMAND):
+            with self.metrics.measure(MetricOperationEnum.AWS_CREDENTIALS) as measurement:
+                awsCredentials = await get_aws_credentials(
+                    hass=self.hass,
+                    aws_region=aws_region,
+                    cognitoToken=refreshTokensData.data.cognito_token,
+                    verbose_logging=self.is_verbose_session_logging(),
+                )
+                measurement.set_failed(awsCredentials is None)
 
         self.storageData.awsCredentialsData = awsCredentials
         await self._store.async_save(data=self.storageData)
@@ -278,13 +301,16 @@ class SessionManager:
             _LOGGER.info("SessionManager.async_force_cloud_urls")
         authData = await self.async_get_auth_data()
 
-        cloudUrls = await get_cloud_urls(
-            hass=self.hass,
-            cloud_urls=self.configData.cloud_urls,
-            username=authData.user.username,
-            token=authData.token,
-            verbose_logging=self.is_verbose_session_logging(),
-        )
+        async with self.governor.request(RequestPriorityEnum.COMMAND):
+            with self.metrics.measure(MetricOperationEnum.CLOUD_URLS) as measurement:
+                cloudUrls = await get_cloud_urls(
+                    hass=self.hass,
+                    cloud_urls=self.configData.cloud_urls,
+                    username=authData.user.username,
+                    token=authData.token,
+                    verbose_logging=self.is_verbose_session_logging(),
+                )
+                measurement.set_failed(cloudUrls is None)
 
         self.storageData.cloudUrlsData = cloudUrls
         await self._store.async_save(data=self.storageData)
@@ -0,0 +1,203 @@
+"""Shadow document diffing.
+
+A shadow section (state.reported, metadata.desired, ...) is flattened once
+into two parallel tuples sorted by key: the keys and a comparable value per
+key (the metadata timestamp, or the state value itself). Two flattened
+sections are then diffed with a single merge pass, so a missing key on
+either side is reported as added/removed instead of raising KeyError.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class FlatSection:
+    keys: tuple[str, ...] = ()
+    values: tuple = ()
+    # keys in document order, lets the next document skip the sort
+    raw_keys: tuple[str, ...] = ()
+
+
+@dataclass
+class ShadowDiff:
+    added: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def changed_or_added(self) -> list[str]:
+        """Keys whose value is new or different, in key order."""
+        return sorted(self.changed + self.added)
+
+    def as_dict(self) -> dict:
+        return {"added": self.added, "removed": self.removed, "changed": self.changed}
+
+
+EMPTY_FLAT_SECTION = FlatSection()
+
+
+def get_section(shadow: dict | None, section: str, sub_section: str) -> dict:
+    if not shadow:
+        return {}
+    return (shadow.get(section) or {}).get(sub_section) or {}
+
+
+def _sorted_keys(
+    values: dict, ignored: frozenset[str], like: FlatSection | None
+) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    raw_keys = tuple(values)
+    if like is not None and like.raw_keys == raw_keys:
+        return like.keys, raw_keys
+    if ignored:
+        return tuple(sorted(values.keys() - ignored)), raw_keys
+    return tuple(sorted(raw_keys)), raw_keys
+
+
+def flatten_values(
+    values: dict,
+    ignored: frozenset[str] = frozenset(),
+    like: FlatSection | None = None,
+) -> FlatSection:
+    """Flatten a state section: key -> value."""
+    if not values:
+        return EMPTY_FLAT_SECTION
+    keys, raw_keys = _sorted_keys(values, ignored, like)
+    return FlatSection(keys, tuple([values[key] for key in keys]), raw_keys)
+
+
+def flatten_timestamps(
+    metadata: dict,
+    ignored: frozenset[str] = frozenset(),
+    like: FlatSection | None = None,
+) -> FlatSection:
+    """Flatten a metadata section: key -> timestamp."""
+    if not metadata:
+        return EMPTY_FLAT_SECTION
+    keys, raw_keys = _sorted_keys(metadata, ignored, like)
+    try:
+        timestamps = [metadata[key]["timestamp"] for key in keys]
+    except (KeyError, TypeError):
+        # nested objects (e.g. authFlag) carry per-field metadata
+        timestamps = [
+            metadata[key].get("timestamp") if isinstance(metadata[key], dict) else metadata[key]
+            for key in keys
+        ]
+    return FlatSection(keys, tuple(timestamps), raw_keys)
+
+
+class FlatShadow:
+    """A shadow document with its sections flattened on first use.
+
+    Keep the FlatShadow of the previous document around (e.g. on the Device)
+    and each document is flattened only once across consecutive diffs. Passing
+    it as `previous` also reuses its sorted key order when the key order of
+    the new document is unchanged, which is the normal case between polls.
+    """
+
+    def __init__(
+        self,
+        shadow: dict | None,
+        ignored: frozenset[str] = frozenset(),
+        previous: FlatShadow | None = None,
+    ) -> None:
+        self.shadow = shadow
+        self.ignored = ignored
+        self._sections: dict[tuple[str, str], FlatSection] = {}
+        # only the previous sections are kept, not the previous document
+        self._hints: dict[tuple[str, str], FlatSection] = {}
+        if previous is not None and previous.ignored == ignored:
+            self._hints = previous._sections
+
+    def section(self, section: str, sub_section: str) -> FlatSection:
+        cache_key = (section, sub_section)
+        flat = self._sections.get(cache_key)
+        if flat is None:
+            like = self._hints.get(cache_key)
+            values = get_section(self.shadow, section, sub_section)
+            if section == "metadata":
+                flat = flatten_timestamps(values, self.ignored, like)
+            else:
+                flat = flatten_values(values, self.ignored, like)
+            self._sections[cache_key] = flat
+        return flat
+
+
+def as_flat_shadow(shadow, ignored: frozenset[str]) -> FlatShadow:
+    if isinstance(shadow, FlatShadow) and shadow.ignored == ignored:
+        return shadow
+    if isinstance(shadow, FlatShadow):
+        shadow = shadow.shadow
+    return FlatShadow(shadow, ignored)
+
+
+def merge_diff(prev: FlatSection, current: FlatSection) -> ShadowDiff:
+    """Single merge pass over two key-sorted sections."""
+    diff = ShadowDiff()
+    if prev.keys == current.keys:
+        if prev.values != current.values:
+            diff.changed = [
+                key
+                for key, prev_value, value in zip(current.keys, prev.values, current.values)
+                if prev_value != value
+            ]
+        return diff
+
+    prev_keys, prev_values = prev.keys, prev.values
+    keys, values = current.keys, current.values
+    i = j = 0
+    prev_len, cur_len = len(prev_keys), len(keys)
+    while i < prev_len and j < cur_len:
+        prev_key = prev_keys[i]
+        key = keys[j]
+        if prev_key == key:
+            if prev_values[i] != values[j]:
+                diff.changed.append(key)
+            i += 1
+            j += 1
+        elif prev_key < key:
+            diff.removed.append(prev_key)
+            i += 1
+        else:
+            diff.added.append(key)
+            j += 1
+    diff.removed.extend(prev_keys[i:])
+    diff.added.extend(keys[j:])
+    return diff
+
+
+def diff_sections(
+    prev: FlatShadow, current: FlatShadow, section: str, sub_section: str
+) -> ShadowDiff:
+    return merge_diff(prev.section(section, sub_section), current.section(section, sub_section))
+
+
+def diff_reported(
+    prev_shadow: dict | FlatShadow | None,
+    shadow: dict | FlatShadow | None,
+    ignored: frozenset[str] = frozenset(),
+) -> ShadowDiff:
+    return diff_sections(
+        as_flat_shadow(prev_shadow, ignored),
+        as_flat_shadow(shadow, ignored),
+        "state",
+        "reported",
+    )
+
+
+def diff_metadata(
+    prev_shadow: dict | FlatShadow | None,
+    shadow: dict | FlatShadow | None,
+    sub_section: str,
+    ignored: frozenset[str] = frozenset(),
+) -> ShadowDiff:
+    return diff_sections(
+        as_flat_shadow(prev_shadow, ignored),
+        as_flat_shadow(shadow, ignored),
+        "metadata",
+        sub_section,
+    )
@@ -1,5 +1,7 @@
 """Switch setup for our Integration."""
 
+from collections.abc import Callable
+from dataclasses import dataclass
 import logging
 from typing import Any
 
@@ -10,16 +12,25 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .config_entry import New_NameConfigEntry
 from .coordinator import IotDeviceCoordinator
-from .data_storage import (get_stored_data, safe_get_value, safe_set_value,
-                           set_stored_data)
+from .data_storage import safe_get_value, safe_set_value, set_stored_data
 from .device import Device
 from .device_enums import ModeEnum
-from .device_features import DeviceFeatureEnum
+from .device_features import DeviceFeatureEnum, DeviceFeatureSet
+from .device_preferences import DevicePreferences, get_device_preferences
 from .device_types import DeviceTypeEnum
+from .entity_descriptions import FeatureDescriptionRegistry, FeatureEntityDescription
 from .tcl_entity_base import TclEntityBase
 
 _LOGGER = logging.getLogger(__name__)
 
+ECO_RESETS_WIND_FEATURES = DeviceFeatureSet(
+    [
+        DeviceFeatureEnum.INTERNAL_HAS_TURBO_PROPERTY,
+        DeviceFeatureEnum.INTERNAL_HAS_HIGHTEMPERATUREWIND_PROPERTY,
+        DeviceFeatureEnum.INTERNAL_HAS_SILENCESWITCH_PROPERTY,
+    ]
+)
+
 
 def get_SWITCH_DRYING_name(device: Device) -> str:
     if device.device_type == DeviceTypeEnum.SPLIT_AC_FRESH_AIR:
@@ -27,6 +38,316 @@ def get_SWITCH_DRYING_name(device: Device) -> str:
     return "Drying Switch"
 
 
+def get_mode(device: Device) -> ModeEnum:
+    return device.mode_value_to_enum_mapp.get(device.data.work_mode, ModeEnum.AUTO)
+
+
+def is_powered_on(device: Device) -> bool:
+    return device.data.power_switch != 0
+
+
+def is_SWITCH_DRYING_allowed(device: Device) -> bool:
+    if get_mode(device) in (ModeEnum.HEAT, ModeEnum.AUTO, ModeEnum.FAN):
+        return False
+    if DeviceFeatureEnum.SWITCH_8_C_HEATING in device.supported_features:
+        if device.data.eight_add_hot == 1:
+            return False
+    return True
+
+
+def is_SWITCH_ECO_allowed(device: Device) -> bool:
+    return get_mode(device) not in (ModeEnum.FAN, ModeEnum.DEHUMIDIFICATION, ModeEnum.AUTO)
+
+
+def desired_state_SWITCH_POWER(device: Device, value: int, preferences: DevicePreferences) -> dict:
+    desired_state = {"powerSwitch": value}
+    if preferences.silent_beep_when_turn_on:
+        desired_state["beepSwitch"] = 0
+    return desired_state
+
+
+def desired_state_SWITCH_ECO(device: Device, value: int, preferences: DevicePreferences) -> dict:
+    desired_state = {"ECO": value}
+    if ECO_RESETS_WIND_FEATURES <= device.supported_features:
+        desired_state["highTemperatureWind"] = 0
+        desired_state["silenceSwitch"] = 0
+        desired_state["windSpeed"] = 0
+    return desired_state
+
+
+def desired_state_SWITCH_SLEEP(device: Device, value: int, preferences: DevicePreferences) -> dict:
+    desired_state = {"sleep": value}
+    if device.device_type == DeviceTypeEnum.PORTABLE_AC:
+        desired_state["windSpeed"] = 1 if value == 1 else 2
+    return desired_state
+
+
+def desired_state_SWITCH_FRESH_AIR(device: Device, value: int, preferences: DevicePreferences) -> dict:
+    desired_state = {"newWindSwitch": value}
+    if value == 1:
+        desired_state["selfClean"] = 0
+    return desired_state
+
+
+@dataclass(frozen=True, kw_only=True)
+class SwitchDescription(FeatureEntityDescription):
+    """A switch writing {shadow_key: 0 | 1}, or desired_state_fn when it sets more keys."""
+
+    shadow_key: str
+    icon_fn: Callable[[Device], str]
+    is_on_fn: Callable[[Device], bool | None]
+    desired_state_fn: Callable[[Device, int, DevicePreferences], dict] | None = None
+    # set for the switches that are not always usable (DynamicSwitchHandler)
+    available_fn: Callable[[Device], bool] | None = None
+
+    def desired_state(self, device: Device, value: int, preferences: DevicePreferences) -> dict:
+        if self.desired_state_fn is not None:
+            return self.desired_state_fn(device, value, preferences)
+        return {self.shadow_key: value}
+
+
+SWITCH_DESCRIPTIONS: FeatureDescriptionRegistry[SwitchDescription] = FeatureDescriptionRegistry(
+    [
+        SwitchDescription(
+            feature=DeviceFeatureEnum.SWITCH_POWER,
+            type="Power",
+            name="Power Switch",
+            shadow_key="powerSwitch",
+            icon_fn=lambda device: (
+                "mdi:power-plug"
+                if device.data.power_switch == 1
+                else "mdi:power-plug-off"
+            ),
+            is_on_fn=lambda device: device.data.power_switch,
+            desired_state_fn=desired_state_SWITCH_POWER,
+        ),
+        # If the power switch is off, shield switch cannot be changed
+        # The TCL app has this disabled - but still loads the last known state
+        # This is close enough to the behavior without writing a whole new switch class
+        # When power is on, it'll load the last known state - so if shield was on, it'll be on
+        SwitchDescription(
+            feature=DeviceFeatureEnum.SWITCH_SHIELD_SWITCH,
+            type="ShieldSwitch",
+            name="Shield Switch",
+            shadow_key="shieldSwitch",
+            icon_fn=lambda device: (
+                "mdi:shield-check" if device.data.shield_switch == 1
+                else "mdi:shield-off"
+            ),
+            is_on_fn=lambda device: device.data.shield_switch,
+            available_fn=is_powered_on,
+        ),
+        SwitchDescription(
+            feature=DeviceFeatureEnum.SWITCH_ANION,
+            type="AnionSwitch",
+            name="Anion Switch",
+            shadow_key="anionSwitch",
+            icon_fn=lambda device: "mdi:atom-variant",
+            is_on_fn=lambda device: device.data.anion_switch,
+            available_fn=lambda device: True,
+        ),
+        SwitchDescription(
+            feature=DeviceFeatureEnum.SWITCH_PANEL_LIGHT_AUTO_OFF,
+            type="PanelLightAutoOffSwitch",
+            name="Panel Light Auto Off Switch",
+            shadow_key="panelLightAutoOFF",
+            icon_fn=lambda device: (
+                "mdi:lightbulb-outline"
+                if device.data.panel_light_auto_off == 1
+                else "mdi:lightbulb-off-outline"
+            ),
+            is_on_fn=lambda device: device.data.panel_light_auto_off,
+            available_fn=is_powered_on,
+        ),
+        SwitchDescription(
+            feature=DeviceFeatureEnum.SWITCH_SCREEN_SWITCH,
+            type="ScreenSwitch",
+            name="Screen Switch",
+            shadow_key="screenSwitch",
+            icon_fn=lambda device: (
+                "mdi:lightbulb-outline"
+                if device.data.screen_switch == 1
+                else "mdi:lightbulb-off-outline"
+            ),
+            is_on_fn=lambda device: device.data.screen_switch,
+            available_fn=is_powered_on,
+        ),
+        SwitchDescription(
+            feature=DeviceFeatureEnum.SWITCH_CHILD_LOCK_SWITCH,
+            type="ChildLockSwitch",
+            name="Child Lock Switch",
+            shadow_key="childLockSwitch",
+            icon_fn=lambda device: "mdi:human-child",
+            is_on_fn=lambda device: device.data.child_lock_switch,
+            available_fn=is_powered_on,
+        ),
+        SwitchDescription(
+            feature=DeviceFeatureEnum.SWITCH_BEEP,
+            type="BeepMode",
+            name="Beep Mode Switch",
+            shadow_key="beepSwitch",
+            icon_fn=lambda device: (
+                "mdi:volume-high"
+                if device.data.beep_switch == 1
+                else "mdi:volume-off"
+            ),
+            is_on_fn=lambda device: device.data.beep_switch,
+        ),
+        SwitchDescription(
+            feature=DeviceFeatureEnum.SWITCH_ECO,
+            type="ECO",
+            name="ECO Switch",
+            shadow_key="ECO",
+            icon_fn=lambda device: (
+                "mdi:leaf" if device.data.eco == 1 else "mdi:leaf-off"
+            ),
+            is_on_fn=lambda device: device.data.eco,
+            desired_state_fn=desired_state_SWITCH_ECO,
+            available_fn=is_SWITCH_ECO_allowed,
+        ),
+        SwitchDescription(
+            feature=DeviceFeatureEnum.SWITCH_AI_ECO,
+            type="aiECO",
+            name="AI ECO Switch",
+            shadow_key="AIECOSwitch",
+            icon_fn=lambda device: (
+                "mdi:leaf" if device.data.ai_eco == 1 else "mdi:leaf-off"
+            ),
+            is_on_fn=lambda device: device.data.ai_eco,
+            desired_state_fn=lambda device, value, preferences: {
+                "eightAddHot": 0,
+                "AIECOSwitch": value,
+            },
+            available_fn=is_SWITCH_ECO_allowed,
+        ),
+        SwitchDescription(
+            feature=DeviceFeatureEnum.SWITCH_8_C_HEATING,
+            type="8CHeating",
+            name="8 °C Heating",
+            shadow_key="eightAddHot",
+            icon_fn=lambda device: "mdi:numeric-8-circle-outline",
+            is_on_fn=lambda device: device.data.eight_add_hot,
+            available_fn=lambda device: get_mode(device) == ModeEnum.HEAT,
+        ),
+        SwitchDescription(
+            feature=DeviceFeatureEnum.SWITCH_HEALTHY,
+            type="Healthy",
+            name="Healthy Switch",
+            shadow_key="healthy",
+            icon_fn=lambda device: (
+                "mdi:heart" if device.data.healthy == 1 else "mdi:heart-off"
+            ),
+            is_on_fn=lambda device: device.data.healthy,
+        ),
+        SwitchDescription(
+            feature=DeviceFeatureEnum.SWITCH_DRYING,
+            type="Drying",
+            name="Drying Switch",
+            shadow_key="antiMoldew",
+            icon_fn=lambda device: (
+                "mdi:opacity"
+                if device.data.anti_moldew == 1
+                else "mdi:water-off-outline"
+            ),
+            is_on_fn=lambda device: device.data.anti_moldew,
+            available_fn=is_SWITCH_DRYING_allowed,
+        ),
+        SwitchDescription(
+            feature=DeviceFeatureEnum.SWITCH_SCREEN,
+            type="DiplayLight",
+            name="Diplay Light Switch",
+            shadow_key="screen",
+            icon_fn=lambda device: (
+                "mdi:lightbulb-outline"
+                if device.data.screen == 1
+                else "mdi:lightbulb-off-outline"
+            ),
+            is_on_fn=lambda device: device.data.screen,
+        ),
+        SwitchDescription(
+            feature=DeviceFeatureEnum.SWITCH_LIGHT_SENSE,
+            type="LightSense",
+            name="Light Sense",
+            shadow_key="lightSense",
+            icon_fn=lambda device: "mdi:theme-light-dark",
+            is_on_fn=lambda device: device.data.light_sense,
+        ),
+        SwitchDescription(
+            feature=DeviceFeatureEnum.SWITCH_SWING_WIND,
+            type="SwingWind",
+            name="Up and down wind",
+            shadow_key="swingWind",
+            icon_fn=lambda device: "mdi:swap-vertical",
+            is_on_fn=lambda device: device.data.swing_wind,
+        ),
+        SwitchDescription(
+            feature=DeviceFeatureEnum.SWITCH_SLEEP,
+            type="Sleep",
+            name="Sleep",
+            shadow_key="sleep",
+            icon_fn=lambda device: "mdi:sleep",
+            is_on_fn=lambda device: device.data.sleep,
+            desired_state_fn=desired_state_SWITCH_SLEEP,
+            available_fn=lambda device: get_mode(device) != ModeEnum.FAN,
+        ),
+        SwitchDescription(
+            feature=DeviceFeatureEnum.SWITCH_SOFT_WIND,
+            type="SoftWind",
+            name="Soft Wind",
+            shadow_key="softWind",
+            icon_fn=lambda device: "mdi:weather-dust",
+            is_on_fn=lambda device: device.data.soft_wind,
+            available_fn=lambda device: get_mode(device) == ModeEnum.COOL,
+        ),
+        SwitchDescription(
+            feature=DeviceFeatureEnum.SWITCH_FRESH_AIR,
+            type="FreshAir",
+            name="Fresh Air",
+            shadow_key="newWindSwitch",
+            icon_fn=lambda device: (
+                "mdi:window-open-variant"
+                if device.data.new_wind_switch == 1
+                else "mdi:window-closed-variant"
+            ),
+            is_on_fn=lambda device: device.data.new_wind_switch,
+            desired_state_fn=desired_state_SWITCH_FRESH_AIR,
+            available_fn=lambda device: get_mode(device) != ModeEnum.DEHUMIDIFICATION,
+        ),
+    ]
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class ConfigSwitchDescription(FeatureEntityDescription):
+    """A switch over a user_config flag of the device storage; type is the config path."""
+
+
+CONFIG_SWITCH_DESCRIPTIONS: FeatureDescriptionRegistry[ConfigSwitchDescription] = FeatureDescriptionRegistry(
+    [
+        ConfigSwitchDescription(
+            feature=DeviceFeatureEnum.USER_CONFIG_BEHAVIOR_MEMORIZE_TEMP_BY_MODE,
+            type="user_config.behavior.memorize_temp_by_mode",
+            name="Save temp by mode",
+        ),
+        ConfigSwitchDescription(
+            feature=DeviceFeatureEnum.USER_CONFIG_BEHAVIOR_MEMORIZE_FAN_SPEED_BY_MODE,
+            type="user_config.behavior.memorize_fan_speed_by_mode",
+            name="Save fan speed by mode",
+        ),
+        ConfigSwitchDescription(
+            feature=DeviceFeatureEnum.USER_CONFIG_BEHAVIOR_SILENT_BEEP_WHEN_TURN_ON,
+            type="user_config.behavior.silent_beep_when_turn_on",
+            name="Silent beep when turn on",
+        ),
+        ConfigSwitchDescription(
+            feature=DeviceFeatureEnum.USER_CONFIG_BEHAVIOR_MEMORIZE_HUMIDITY_BY_MODE,
+            type="user_config.behavior.memorize_humidity_by_mode",
+            name="Save humidity by mode",
+        ),
+    ]
+)
+
+
 class DesiredStateHandlerForSwitch:
     def __init__(
         self,
@@ -39,263 +360,25 @@ class DesiredStateHandlerForSwitch:
         self.coordinator = coordinator
         self.deviceFeature = deviceFeature
         self.device = device
+        self.description = SWITCH_DESCRIPTIONS.get(device, deviceFeature)
 
     def refreshDevice(self, device: Device):
         self.device = device
 
     async def call_switch(self, value: int) -> str:
-        match self.deviceFeature:
-            case DeviceFeatureEnum.SWITCH_POWER:
-                return await self.SWITCH_POWER(value=value)
-            case DeviceFeatureEnum.SWITCH_HEALTHY:
-                return await self.SWITCH_HEALTHY(value=value)
-            case DeviceFeatureEnum.SWITCH_BEEP:
-                return await self.SWITCH_BEEP(value=value)
-            case DeviceFeatureEnum.SWITCH_ECO:
-                return await self.SWITCH_ECO(value=value)
-            case DeviceFeatureEnum.SWITCH_DRYING:
-                return await self.SWITCH_DRYING(value=value)
-            case DeviceFeatureEnum.SWITCH_SCREEN:
-                return await self.SWITCH_SCREEN(value=value)
-            case DeviceFeatureEnum.SWITCH_LIGHT_SENSE:
-                return await self.SWITCH_LIGHT_SENSE(value=value)
-            case DeviceFeatureEnum.SWITCH_SWING_WIND:
-                return await self.SWITCH_SWING_WIND(value=value)
-            case DeviceFeatureEnum.SWITCH_SLEEP:
-                return await self.SWITCH_SLEEP(value=value)
-            case DeviceFeatureEnum.SWITCH_AI_ECO:
-                return await self.SWITCH_AI_ECO(value=value)
-            case DeviceFeatureEnum.SWITCH_8_C_HEATING:
-                return await self.SWITCH_8_C_HEATING(value=value)
-            case DeviceFeatureEnum.SWITCH_SOFT_WIND:
-                return await self.SWITCH_SOFT_WIND(value=value)
-            case DeviceFeatureEnum.SWITCH_FRESH_AIR:
-                return await self.SWITCH_FRESH_AIR(value=value)
-            case DeviceFeatureEnum.SWITCH_SHIELD_SWITCH:
-                return await self.SWITCH_SHIELD_SWITCH(value=value)
-            case DeviceFeatureEnum.SWITCH_ANION:
-                return await self.SWITCH_ANION(value=value)
-            case DeviceFeatureEnum.SWITCH_PANEL_LIGHT_AUTO_OFF:
-                return await self.SWITCH_PANEL_LIGHT_AUTO_OFF(value=value)
-            case DeviceFeatureEnum.SWITCH_CHILD_LOCK_SWITCH:
-                return await self.SWITCH_CHILD_LOCK_SWITCH(value=value)
-            case DeviceFeatureEnum.SWITCH_SCREEN_SWITCH:
-                return await self.SWITCH_SCREEN_SWITCH(value=value)
-
-    def is_allowed(self) -> bool:
-        mode = self.device.mode_value_to_enum_mapp.get(
-            self.device.data.work_mode, ModeEnum.AUTO
-        )
-        match self.deviceFeature:
-            case DeviceFeatureEnum.SWITCH_DRYING:
-                if (
-                    mode == ModeEnum.HEAT
-                    or mode == ModeEnum.AUTO
-                    or mode == ModeEnum.FAN
-                ):
-                    return False
-                if (
-                    DeviceFeatureEnum.SWITCH_8_C_HEATING
-                    in self.device.supported_features
-                ):
-                    if self.device.data.eight_add_hot == 1:
-                        return False
-                return True
-            case DeviceFeatureEnum.SWITCH_SOFT_WIND:
-                if mode != ModeEnum.COOL:
-                    return False
-                return True
-            case DeviceFeatureEnum.SWITCH_8_C_HEATING:
-                if mode == ModeEnum.HEAT:
-                    return True
-                else:
-                    return False
-            case DeviceFeatureEnum.SWITCH_SLEEP:
-                if mode == ModeEnum.FAN:
-                    return False
-                else:
-                    return True
-            case DeviceFeatureEnum.SWITCH_ECO:
-                if (
-                    mode == ModeEnum.FAN
-                    or mode == ModeEnum.DEHUMIDIFICATION
-                    or mode == ModeEnum.AUTO
-                ):
-                    return False
-                else:
-                    return True
-            case DeviceFeatureEnum.SWITCH_FRESH_AIR:
-                if mode == ModeEnum.DEHUMIDIFICATION:
-                    return False
-                else:
-                    return True
-            case DeviceFeatureEnum.SWITCH_AI_ECO:
-                if (
-                    mode == ModeEnum.FAN
-                    or mode == ModeEnum.DEHUMIDIFICATION
-                    or mode == ModeEnum.AUTO
-                ):
-                    return False
-                else:
-                    return True
-            # If the power switch is off, shield switch cannot be changed
-            # The TCL app has this disabled - but still loads the last known state
-            # This is close enough to the behavior without writing a whole new switch class
-            # When power is on, it'll load the last known state - so if shield was on, it'll be on
-            case DeviceFeatureEnum.SWITCH_SHIELD_SWITCH:
-                if self.device.data.power_switch == 0:
-                    return False
-                return True
-            case DeviceFeatureEnum.SWITCH_ANION:
-                return True
-            case DeviceFeatureEnum.SWITCH_PANEL_LIGHT_AUTO_OFF:
-                if self.device.data.power_switch == 0:
-                    return False
-                return True
-            case DeviceFeatureEnum.SWITCH_SCREEN_SWITCH:
-                if self.device.data.power_switch == 0:
-                    return False
-                return True
-            case DeviceFeatureEnum.SWITCH_CHILD_LOCK_SWITCH:
-                if self.device.data.power_switch == 0:
-                    return False
-                return True
-            case _:
-                return True
-
-    async def SWITCH_POWER(self, value: int):
-        stored_data = await get_stored_data(self.hass, self.device.device_id)
-        silent_beep_when_turn_on = safe_get_value(
-            stored_data, "user_config.behavior.silent_beep_when_turn_on", False
-        )
-        desired_state = {"powerSwitch": value}
-        if silent_beep_when_turn_on:
-            desired_state["beepSwitch"] = 0
-        return await self.coordinator.get_aws_iot().async_set_desired_state(
-            self.device.device_id, desired_state
-        )
-
-    async def SWITCH_SHIELD_SWITCH(self, value: int):     
-        desired_state = {"shieldSwitch": value}
-        return await self.coordinator.get_aws_iot().async_set_desired_state(
-            self.device.device_id, desired_state
-        )
-    
-    async def SWITCH_ANION(self, value: int):        
-        desired_state = {"anionSwitch": value}
-        return await self.coordinator.get_aws_iot().async_set_desired_state(
-            self.device.device_id, desired_state
-        )
-    
-    async def SWITCH_PANEL_LIGHT_AUTO_OFF(self, value: int):        
-        desired_state = {"panelLightAutoOFF": value}
-        return await self.coordinator.get_aws_iot().async_set_desired_state(
-            self.device.device_id, desired_state
-        )
-    
-    async def SWITCH_CHILD_LOCK_SWITCH(self, value: int):        
-        desired_state = {"childLockSwitch": value}
-        return await self.coordinator.get_aws_iot().async_set_desired_state(
-            self.device.device_id, desired_state
-        )
-    
-    async def SWITCH_SCREEN_SWITCH(self, value: int):        
-        desired_state = {"screenSwitch": value}
-        return await self.coordinator.get_aws_iot().async_set_desired_state(
-            self.device.device_id, desired_state
-        )
-
-    async def SWITCH_BEEP(self, value: int):
-        desired_state = {"beepSwitch": value}
-        return await self.coordinator.get_aws_iot().async_set_desired_state(
-            self.device.device_id, desired_state
-        )
-
-    async def SWITCH_ECO(self, value: int):
-        desired_state = {"ECO": value}
-
-        if (
-            DeviceFeatureEnum.INTERNAL_HAS_TURBO_PROPERTY
-            in self.device.supported_features
-            and DeviceFeatureEnum.INTERNAL_HAS_HIGHTEMPERATUREWIND_PROPERTY
-            in self.device.supported_features
-            and DeviceFeatureEnum.INTERNAL_HAS_SILENCESWITCH_PROPERTY
-            in self.device.supported_features
-        ):
-            desired_state["highTemperatureWind"] = 0
-            desired_state["highTemperatureWind"] = 0
-            desired_state["silenceSwitch"] = 0
-            desired_state["windSpeed"] = 0
-
-        return await self.coordinator.get_aws_iot().async_set_desired_state(
-            self.device.device_id, desired_state
-        )
-
-    async def SWITCH_AI_ECO(self, value: int):
-        desired_state = {"eightAddHot": 0, "AIECOSwitch": value}
-
-        return await self.coordinator.get_aws_iot().async_set_desired_state(
-            self.device.device_id, desired_state
-        )
-
-    async def SWITCH_8_C_HEATING(self, value: int):
-        desired_state = {"eightAddHot": value}
-
-        return await self.coordinator.get_aws_iot().async_set_desired_state(
-            self.device.device_id, desired_state
-        )
-
-    async def SWITCH_HEALTHY(self, value: int):
-        desired_state = {"healthy": value}
-        return await self.coordinator.get_aws_iot().async_set_desired_state(
-            self.device.device_id, desired_state
-        )
-
-    async def SWITCH_DRYING(self, value: int):
-        desired_state = {"antiMoldew": value}
-        return await self.coordinator.get_aws_iot().async_set_desired_state(
-            self.device.device_id, desired_state
-        )
-
-    async def SWITCH_SCREEN(self, value: int):
-        desired_state = {"screen": value}
-        return await self.coordinator.get_aws_iot().async_set_desired_state(
-            self.device.device_id, desired_state
-        )
-
-    async def SWITCH_LIGHT_SENSE(self, value: int):
-        desired_state = {"lightSense": value}
-        return await self.coordinator.get_aws_iot().async_set_desired_state(
-            self.device.device_id, desired_state
-        )
-
-    async def SWITCH_SWING_WIND(self, value: int):
-        desired_state = {"swingWind": value}
-        return await self.coordinator.get_aws_iot().async_set_desired_state(
-            self.device.device_id, desired_state
-        )
-
-    async def SWITCH_SLEEP(self, value: int):
-        desired_state = {"sleep": value}
-        if self.device.device_type == DeviceTypeEnum.PORTABLE_AC:
-            desired_state["windSpeed"] = 1 if value == 1 else 2
+        preferences = await get_device_preferences(self.hass, self.device.device_id)
+        desired_state = self.desired_state(value, preferences)
         return await self.coordinator.get_aws_iot().async_set_desired_state(
             self.device.device_id, desired_state
         )
 
-    async def SWITCH_SOFT_WIND(self, value: int):
-        desired_state = {"softWind": value}
-        return await self.coordinator.get_aws_iot().async_set_desired_state(
-            self.device.device_id, desired_state
-        )
+    def desired_state(self, value: int, preferences: DevicePreferences) -> dict:
+        return self.description.desired_state(self.device, value, preferences)
 
-    async def SWITCH_FRESH_AIR(self, value: int):
-        desired_state = {"newWindSwitch": value}
-        if value == 1:
-            desired_state["selfClean"] = 0
-        return await self.coordinator.get_aws_iot().async_set_desired_state(
-            self.device.device_id, desired_state
-        )
+    def is_allowed(self) -> bool:
+        if self.description.available_fn is None:
+            return True
+        return self.description.available_fn(self.device)
 
 
 async def async_setup_entry(
@@ -307,354 +390,25 @@ async def async_setup_entry(
     coordinator = config_entry.runtime_data.coordinator
     switches = []
     for device in config_entry.devices:
-        if DeviceFeatureEnum.SWITCH_POWER in device.supported_features:
-            switches.append(
-                SwitchHandler(
-                    hass=hass,
-                    coordinator=coordinator,
-                    device=device,
-                    deviceFeature=DeviceFeatureEnum.SWITCH_POWER,
-                    type="Power",
-                    name="Power Switch",
-                    icon_fn=lambda device: (
-                        "mdi:power-plug"
-                        if device.data.power_switch == 1
-                        else "mdi:power-plug-off"
-                    ),
-                    is_on_fn=lambda device: device.data.power_switch,
-                )
-            )
-
-        if DeviceFeatureEnum.SWITCH_SHIELD_SWITCH in device.supported_features:
-            switches.append(
-                DynamicSwitchHandler(
-                    hass=hass,
-                    coordinator=coordinator,
-                    device=device,
-                    deviceFeature=DeviceFeatureEnum.SWITCH_SHIELD_SWITCH,
-                    type="ShieldSwitch",
-                    name="Shield Switch",
-                    icon_fn=lambda device: (
-                        "mdi:shield-check" if device.data.shield_switch == 1 
-                        else "mdi:shield-off"
-                    ),
-                    is_on_fn=lambda device: device.data.shield_switch,
-                )
-            )
-
-        if DeviceFeatureEnum.SWITCH_ANION in device.supported_features:
-            switches.append(
-                DynamicSwitchHandler(
-                    hass=hass,
-                    coordinator=coordinator,
-                    device=device,
-                    deviceFeature=DeviceFeatureEnum.SWITCH_ANION,
-                    type="AnionSwitch",
-                    name="Anion Switch",
-                    icon_fn=lambda device: (
-                        "mdi:atom-variant" if device.data.anion_switch == 1 
-                        else "mdi:atom-variant"
-                    ),
-                    is_on_fn=lambda device: device.data.anion_switch,
-                )
-            )
-
-        if DeviceFeatureEnum.SWITCH_PANEL_LIGHT_AUTO_OFF in device.supported_features:
-            switches.append(
-                DynamicSwitchHandler(
-                    hass=hass,
-                    coordinator=coordinator,
-                    device=device,
-                    deviceFeature=DeviceFeatureEnum.SWITCH_PANEL_LIGHT_AUTO_OFF,
-                    type="PanelLightAutoOffSwitch",
-                    name="Panel Light Auto Off Switch",
-                    icon_fn=lambda device: (
-                        "mdi:lightbulb-outline"
-                        if device.data.panel_light_auto_off == 1
-                        else "mdi:lightbulb-off-outline"
-                    ),
-                    is_on_fn=lambda device: device.data.panel_light_auto_off,
-                )
-            )
-
-        if DeviceFeatureEnum.SWITCH_SCREEN_SWITCH in device.supported_features:
-            switches.append(
-                DynamicSwitchHandler(
-                    hass=hass,
-                    coordinator=coordinator,
-                    device=device,
-                    deviceFeature=DeviceFeatureEnum.SWITCH_SCREEN_SWITCH,
-                    type="ScreenSwitch",
-                    name="Screen Switch",
-                    icon_fn=lambda device: (
-                        "mdi:lightbulb-outline"
-                        if device.data.screen_switch == 1
-                        else "mdi:lightbulb-off-outline"
-                    ),
-                    is_on_fn=lambda device: device.data.screen_switch,
-                )
-            )
-
-        if DeviceFeatureEnum.SWITCH_CHILD_LOCK_SWITCH in device.supported_features:
-            switches.append(
-                DynamicSwitchHandler(
-                    hass=hass,
-                    coordinator=coordinator,
-                    device=device,
-                    deviceFeature=DeviceFeatureEnum.SWITCH_CHILD_LOCK_SWITCH,
-                    type="ChildLockSwitch",
-                    name="Child Lock Switch",
-                    icon_fn=lambda device: (
-                        "mdi:human-child" if device.data.child_lock_switch == 1 
-                        else "mdi:human-child"
-                    ),
-                    is_on_fn=lambda device: device.data.child_lock_switch,
-                )
-            )
-
-        if DeviceFeatureEnum.SWITCH_BEEP in device.supported_features:
-            switches.append(
-                SwitchHandler(
-                    hass=hass,
-                    coordinator=coordinator,
-                    device=device,
-                    deviceFeature=DeviceFeatureEnum.SWITCH_BEEP,
-                    type="BeepMode",
-                    name="Beep Mode Switch",
-                    icon_fn=lambda device: (
-                        "mdi:volume-high"
-                        if device.data.beep_switch == 1
-                        else "mdi:volume-off"
-                    ),
-                    is_on_fn=lambda device: device.data.beep_switch,
-                )
-            )
-
-        if DeviceFeatureEnum.SWITCH_ECO in device.supported_features:
-            switches.append(
-                DynamicSwitchHandler(
-                    hass=hass,
-                    coordinator=coordinator,
-                    device=device,
-                    deviceFeature=DeviceFeatureEnum.SWITCH_ECO,
-                    type="ECO",
-                    name="ECO Switch",
-                    icon_fn=lambda device: (
-                        "mdi:leaf" if device.data.eco == 1 else "mdi:leaf-off"
-                    ),
-                    is_on_fn=lambda device: device.data.eco,
-                )
-            )
-
-        if DeviceFeatureEnum.SWITCH_AI_ECO in device.supported_features:
-            switches.append(
-                DynamicSwitchHandler(
-                    hass=hass,
-                    coordinator=coordinator,
-                    device=device,
-                    deviceFeature=DeviceFeatureEnum.SWITCH_AI_ECO,
-                    type="aiECO",
-                    name="AI ECO Switch",
-                    icon_fn=lambda device: (
-                        "mdi:leaf" if device.data.ai_eco == 1 else "mdi:leaf-off"
-                    ),
-                    is_on_fn=lambda device: device.data.ai_eco,
-                )
-            )
-
-        if DeviceFeatureEnum.SWITCH_8_C_HEATING in device.supported_features:
-            switches.append(
-                DynamicSwitchHandler(
-                    hass=hass,
-                    coordinator=coordinator,
-                    device=device,
-                    deviceFeature=DeviceFeatureEnum.SWITCH_8_C_HEATING,
-                    type="8CHeating",
-                    name="8 °C Heating",
-                    icon_fn=lambda device: "mdi:numeric-8-circle-outline",
-                    is_on_fn=lambda device: device.data.eight_add_hot,
-                )
-            )
-
-        if DeviceFeatureEnum.SWITCH_HEALTHY in device.supported_features:
-            switches.append(
-                SwitchHandler(
-                    hass=hass,
-                    coordinator=coordinator,
-                    device=device,
-                    deviceFeature=DeviceFeatureEnum.SWITCH_HEALTHY,
-                    type="Healthy",
-                    name="Healthy Switch",
-                    icon_fn=lambda device: (
-                        "mdi:heart" if device.data.healthy == 1 else "mdi:heart-off"
-                    ),
-                    is_on_fn=lambda device: device.data.healthy,
-                )
-            )
-
-        if DeviceFeatureEnum.SWITCH_DRYING in device.supported_features:
-            switches.append(
-                DynamicSwitchHandler(
-                    hass=hass,
-                    coordinator=coordinator,
-                    device=device,
-                    deviceFeature=DeviceFeatureEnum.SWITCH_DRYING,
-                    type="Drying",
-                    name="Drying Switch",
-                    icon_fn=lambda device: (
-                        "mdi:opacity"
-                        if device.data.anti_moldew == 1
-                        else "mdi:water-off-outline"
-                    ),
-                    is_on_fn=lambda device: device.data.anti_moldew,
-                )
-            )
-
-        if DeviceFeatureEnum.SWITCH_SCREEN in device.supported_features:
-            switches.append(
-                SwitchHandler(
-                    hass=hass,
-                    coordinator=coordinator,
-                    device=device,
-                    deviceFeature=DeviceFeatureEnum.SWITCH_SCREEN,
-                    type="DiplayLight",
-                    name="Diplay Light Switch",
-                    icon_fn=lambda device: (
-                        "mdi:lightbulb-outline"
-                        if device.data.screen == 1
-                        else "mdi:lightbulb-off-outline"
-                    ),
-                    is_on_fn=lambda device: device.data.screen,
-                )
-            )
-
-        if DeviceFeatureEnum.SWITCH_LIGHT_SENSE in device.supported_features:
-            switches.append(
-                SwitchHandler(
-                    hass=hass,
-                    coordinator=coordinator,
-                    device=device,
-                    deviceFeature=DeviceFeatureEnum.SWITCH_LIGHT_SENSE,
-                    type="LightSense",
-                    name="Light Sense",
-                    icon_fn=lambda device: "mdi:theme-light-dark",
-                    is_on_fn=lambda device: device.data.light_sense,
-                )
-            )
-
-        if DeviceFeatureEnum.SWITCH_SWING_WIND in device.supported_features:
-            switches.append(
-                SwitchHandler(
-                    hass=hass,
-                    coordinator=coordinator,
-                    device=device,
-                    deviceFeature=DeviceFeatureEnum.SWITCH_SWING_WIND,
-                    type="SwingWind",
-                    name="Up and down wind",
-                    icon_fn=lambda device: "mdi:swap-vertical",
-                    is_on_fn=lambda device: device.data.swing_wind,
-                )
-            )
-
-        if DeviceFeatureEnum.SWITCH_SLEEP in device.supported_features:
-            switches.append(
-                DynamicSwitchHandler(
-                    hass=hass,
-                    coordinator=coordinator,
-                    device=device,
-                    deviceFeature=DeviceFeatureEnum.SWITCH_SLEEP,
-                    type="Sleep",
-                    name="Sleep",
-                    icon_fn=lambda device: "mdi:sleep",
-                    is_on_fn=lambda device: device.data.sleep,
-                )
-            )
-
-        if DeviceFeatureEnum.SWITCH_SOFT_WIND in device.supported_features:
-            switches.append(
-                DynamicSwitchHandler(
-                    hass=hass,
-                    coordinator=coordinator,
-                    device=device,
-                    deviceFeature=DeviceFeatureEnum.SWITCH_SOFT_WIND,
-                    type="SoftWind",
-                    name="Soft Wind",
-                    icon_fn=lambda device: "mdi:weather-dust",
-                    is_on_fn=lambda device: device.data.soft_wind,
-                )
-            )
-
-        if DeviceFeatureEnum.SWITCH_FRESH_AIR in device.supported_features:
-            switches.append(
-                DynamicSwitchHandler(
-                    hass=hass,
-                    coordinator=coordinator,
-                    device=device,
-                    deviceFeature=DeviceFeatureEnum.SWITCH_FRESH_AIR,
-                    type="FreshAir",
-                    name="Fresh Air",
-                    icon_fn=lambda device: (
-                        "mdi:window-open-variant"
-                        if device.data.new_wind_switch == 1
-                        else "mdi:window-closed-variant"
-                    ),
-                    is_on_fn=lambda device: device.data.new_wind_switch,
-                )
-            )
-
-        if (
-            DeviceFeatureEnum.USER_CONFIG_BEHAVIOR_MEMORIZE_TEMP_BY_MODE
-            in device.supported_features
-        ):
-            switches.append(
-                ConfigSwitchHandler(
-                    hass=hass,
-                    coordinator=coordinator,
-                    device=device,
-                    config_path="user_config.behavior.memorize_temp_by_mode",
-                    name="Save temp by mode",
-                )
-            )
-
-        if (
-            DeviceFeatureEnum.USER_CONFIG_BEHAVIOR_MEMORIZE_FAN_SPEED_BY_MODE
-            in device.supported_features
-        ):
-            switches.append(
-                ConfigSwitchHandler(
-                    hass=hass,
-                    coordinator=coordinator,
-                    device=device,
-                    config_path="user_config.behavior.memorize_fan_speed_by_mode",
-                    name="Save fan speed by mode",
-                )
-            )
-
-        if (
-            DeviceFeatureEnum.USER_CONFIG_BEHAVIOR_SILENT_BEEP_WHEN_TURN_ON
-            in device.supported_features
-        ):
+        for description in SWITCH_DESCRIPTIONS.for_device(device):
+            entity_class = SwitchHandler if description.available_fn is None else DynamicSwitchHandler
             switches.append(
-                ConfigSwitchHandler(
+                entity_class(
                     hass=hass,
                     coordinator=coordinator,
                     device=device,
-                    config_path="user_config.behavior.silent_beep_when_turn_on",
-                    name="Silent beep when turn on",
+                    description=description,
                 )
             )
 
-        if (
-            DeviceFeatureEnum.USER_CONFIG_BEHAVIOR_MEMORIZE_HUMIDITY_BY_MODE
-            in device.supported_features
-        ):
+        for description in CONFIG_SWITCH_DESCRIPTIONS.for_device(device):
             switches.append(
                 ConfigSwitchHandler(
                     hass=hass,
                     coordinator=coordinator,
                     device=device,
-                    config_path="user_config.behavior.memorize_humidity_by_mode",
-                    name="Save humidity by mode",
+                    config_path=description.type,
+                    name=description.name,
                 )
             )
 
@@ -667,19 +421,14 @@ class SwitchHandler(TclEntityBase, SwitchEntity):
         hass: HomeAssistant,
         coordinator: IotDeviceCoordinator,
         device: Device,
-        type: str,
-        name: str,
-        deviceFeature: DeviceFeatureEnum,
-        icon_fn: lambda device: str,
-        is_on_fn: lambda device: bool | None,
+        description: SwitchDescription,
     ) -> None:
-        TclEntityBase.__init__(self, coordinator, type, name, device)
-        self.icon_fn = icon_fn
-        self.is_on_fn = is_on_fn
+        TclEntityBase.__init__(self, coordinator, description.type, description.name, device)
+        self.description = description
         self.iot_handler = DesiredStateHandlerForSwitch(
             hass=hass,
             coordinator=coordinator,
-            deviceFeature=deviceFeature,
+            deviceFeature=description.feature,
             device=self.device,
         )
 
@@ -687,26 +436,25 @@ class SwitchHandler(TclEntityBase, SwitchEntity):
     def device_class(self) -> str:
         return SwitchDeviceClass.SWITCH
 
-    @property
-    def icon(self):
-        return self.icon_fn(self.device)
-
-    @property
-    def is_on(self) -> bool | None:
-        self.device = self.coordinator.get_device_by_id(self.device.device_id)
+    def update_attributes(self) -> None:
+        super().update_attributes()
         self.iot_handler.refreshDevice(self.device)
-        return self.is_on_fn(self.device)
+        self._attr_icon = self.description.icon_fn(self.device)
+        self._attr_is_on = self.description.is_on_fn(self.device)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         await self.iot_handler.call_switch(1)
-        await self.coordinator.async_refresh()
+        await self.coordinator.async_refresh_after_command(self.device.device_id)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         await self.iot_handler.call_switch(0)
-        await self.coordinator.async_refresh()
+        await self.coordinator.async_refresh_after_command(self.device.device_id)
 
 
 class ConfigSwitchHandler(TclEntityBase, SwitchEntity):
+    # reads the device storage only
+    needs_device_data = False
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -719,19 +467,15 @@ class ConfigSwitchHandler(TclEntityBase, SwitchEntity):
         self.hass = hass
         self.config_path = config_path
         self._attr_entity_category = EntityCategory.CONFIG
+        self._attr_icon = "mdi:cog"
 
     @property
     def device_class(self) -> str:
         return SwitchDeviceClass.SWITCH
 
-    @property
-    def icon(self):
-        return "mdi:cog"
-
-    @property
-    def is_on(self) -> bool | None:
-        self.device = self.coordinator.get_device_by_id(self.device.device_id)
-        return safe_get_value(self.device.storage, self.config_path, False)
+    def update_attributes(self) -> None:
+        super().update_attributes()
+        self._attr_is_on = safe_get_value(self.device.storage, self.config_path, False)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         self.device = self.coordinator.get_device_by_id(self.device.device_id)
@@ -757,33 +501,6 @@ class ConfigSwitchHandler(TclEntityBase, SwitchEntity):
 
 
 class DynamicSwitchHandler(SwitchHandler, SwitchEntity):
-    def __init__(
-        self,
-        hass: HomeAssistant,
-        coordinator: IotDeviceCoordinator,
-        device: Device,
-        type: str,
-        name: str,
-        deviceFeature: DeviceFeatureEnum,
-        icon_fn: lambda device: str,
-        is_on_fn: lambda device: bool | None,
-    ) -> None:
-        SwitchHandler.__init__(
-            self,
-            coordinator=coordinator,
-            device=device,
-            type=type,
-            name=name,
-            deviceFeature=deviceFeature,
-            hass=hass,
-            icon_fn=icon_fn,
-            is_on_fn=is_on_fn,
-        )
-
-    @property
-    def available(self) -> bool:
-        if self.device.is_online:
-            self.device = self.coordinator.get_device_by_id(self.device.device_id)
-            self.iot_handler.refreshDevice(self.device)
-            return self.iot_handler.is_allowed()
-        return False
+    def update_attributes(self) -> None:
+        super().update_attributes()
+        self._attr_available = bool(self.device.is_online) and self.iot_handler.is_allowed()
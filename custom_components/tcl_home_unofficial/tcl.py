@@ -11,9 +11,20 @@ import jwt
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.httpx_client import get_async_client
 
+from .metrics import MetricOperationEnum
+from .traffic_capture import get_traffic_recorder, record_exchange
+
 _LOGGER = logging.getLogger(__name__)
 
 
+class TclServiceError(Exception):
+    """Non-200 response from the TCL cloud."""
+
+    def __init__(self, message: str, status_code: int) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+
 def getValue(data: dict, keys: list[str]) -> str:
     """Get value from dictionary with fallback."""
     value = None
@@ -303,6 +314,36 @@ class GetEnergyConsumptioneResponse:
     message: str
     data: GetEnergyConsumptioneResponseData    
 
+async def _send_request(
+    hass: HomeAssistant,
+    operation: MetricOperationEnum,
+    method: str,
+    url: str,
+    headers: dict,
+    payload: dict | None = None,
+):
+    """Send one request to the TCL cloud, recording it when traffic capture is on."""
+    httpx_client = get_async_client(hass)
+    started = time.perf_counter()
+    try:
+        if method == "GET":
+            response = await httpx_client.get(url, headers=headers, timeout=15)
+        else:
+            response = await httpx_client.post(url, json=payload, headers=headers, timeout=15)
+    except Exception as e:
+        record_exchange(hass, "tcl", operation, method, url, headers, payload, None, None, started, e)
+        raise
+    if get_traffic_recorder(hass) is not None:
+        try:
+            response_body = response.json()
+        except ValueError:
+            response_body = response.text
+        record_exchange(
+            hass, "tcl", operation, method, url, headers, payload, response.status_code, response_body, started
+        )
+    return response
+
+
 async def do_account_auth(
     hass: HomeAssistant,
     username: str,
@@ -334,8 +375,7 @@ async def do_account_auth(
         "content-type": "application/json; charset=UTF-8",
     }
 
-    httpx_client = get_async_client(hass)
-    response = await httpx_client.post(login_url, json=payload, headers=headers, timeout=15)
+    response = await _send_request(hass, MetricOperationEnum.AUTH, "POST", login_url, headers, payload)
 
     response_obj = response.json()
     if verbose_logging:
@@ -364,8 +404,7 @@ async def get_cloud_urls(
         "content-type": "application/json; charset=UTF-8",
     }
 
-    httpx_client = get_async_client(hass)
-    response = await httpx_client.post(cloud_urls, json=payload, headers=headers, timeout=15)
+    response = await _send_request(hass, MetricOperationEnum.CLOUD_URLS, "POST", cloud_urls, headers, payload)
     response_obj = response.json()
     if verbose_logging:
         _LOGGER.info("TCL-Service.get_cloud_urls response: %s", response_obj)
@@ -398,8 +437,7 @@ async def refreshTokens(
         "accept-encoding": "gzip, deflate, br",
     }
 
-    httpx_client = get_async_client(hass)
-    response = await httpx_client.post(url, json=payload, headers=headers, timeout=15)
+    response = await _send_request(hass, MetricOperationEnum.REFRESH_TOKENS, "POST", url, headers, payload)
     response_obj = response.json()
     if verbose_logging:
         _LOGGER.info("TCL-Service.refreshTokens response: %s", response_obj)
@@ -431,8 +469,7 @@ async def get_aws_credentials(
         "content-type": "application/x-amz-json-1.1",
     }
 
-    httpx_client = get_async_client(hass)
-    response = await httpx_client.post(url, json=payload, headers=headers, timeout=15)
+    response = await _send_request(hass, MetricOperationEnum.AWS_CREDENTIALS, "POST", url, headers, payload)
     response_obj = response.json()
     if verbose_logging:
         _LOGGER.info("TCL-Service.get_aws_credentials response: %s", response_obj)
@@ -472,11 +509,11 @@ async def get_things(
         "accept-encoding": "gzip, deflate, br",
     }    
 
-    httpx_client = get_async_client(hass)
-
-    response = await httpx_client.post(url, json={}, headers=headers, timeout=15)
+    response = await _send_request(hass, MetricOperationEnum.GET_THINGS, "POST", url, headers, {})
     if response.status_code != 200:
-        raise Exception("Error at get_things: " + response.text)
+        raise TclServiceError(
+            "Error at get_things: " + response.text, response.status_code
+        )
     response_obj = response.json()
     # _LOGGER.info("TCL-Service.get_things: %s", response_obj)
     if verbose_logging:
@@ -522,11 +559,11 @@ async def get_work_time(
         "accesstoken": saas_token,        
     }    
 
-    httpx_client = get_async_client(hass)
-
-    response = await httpx_client.get(url, headers=headers, timeout=15)
+    response = await _send_request(hass, MetricOperationEnum.WORK_TIME, "GET", url, headers)
     if response.status_code != 200:
-        raise Exception("Error at get_work_time: " + response.text)
+        raise TclServiceError(
+            "Error at get_work_time: " + response.text, response.status_code
+        )
     response_obj = response.json()
     # _LOGGER.info("TCL-Service.get_work_time: %s", response_obj)
     if verbose_logging:
@@ -572,11 +609,11 @@ async def get_energy_consumption(
         "accesstoken": saas_token,   
     }    
 
-    httpx_client = get_async_client(hass)
-
-    response = await httpx_client.get(url, headers=headers, timeout=15)
+    response = await _send_request(hass, MetricOperationEnum.ENERGY_CONSUMPTION, "GET", url, headers)
     if response.status_code != 200:
-        raise Exception("Error at get_energy_consumption: " + response.text)
+        raise TclServiceError(
+            "Error at get_energy_consumption: " + response.text, response.status_code
+        )
     response_obj = response.json()
     # _LOGGER.info("TCL-Service.get_energy_consumption: %s", response_obj)
     if verbose_logging:
@@ -637,8 +674,7 @@ async def get_config(
         "accept-encoding": "gzip, deflate, br",
     }
 
-    httpx_client = get_async_client(hass)
-    response = await httpx_client.post(url, json=payload, headers=headers, timeout=15)
+    response = await _send_request(hass, MetricOperationEnum.CONFIG_GET, "POST", url, headers, payload)
     if response.status_code != 200:
         if verbose_logging:
             _LOGGER.error(
@@ -7,7 +7,7 @@ from homeassistant.core import HomeAssistant
 from .calculations import try_get_value
 from .data_storage import get_stored_data, safe_set_value, set_stored_data,setup_common_init_values
 from .device_enums import DehumidifierModeEnum
-from .device_features import DeviceFeatureEnum
+from .device_features import DeviceFeatureSet
 
 
 @dataclass
@@ -52,7 +52,7 @@ async def get_stored_dehumidifier_dem_data(
     return stored_data
 
 
-def handle_dehumidifier_dem_mode_change(desired_state:dict, value:DehumidifierModeEnum, supported_features: list[DeviceFeatureEnum], stored_data: dict) -> dict:
+def handle_dehumidifier_dem_mode_change(desired_state:dict, value:DehumidifierModeEnum, supported_features: DeviceFeatureSet, stored_data: dict) -> dict:
     match value:
         case DehumidifierModeEnum.DRY:
             pass
@@ -8,7 +8,7 @@ from .calculations import celsius_to_fahrenheit
 from .calculations import try_get_value
 from .data_storage import get_stored_data, safe_set_value, set_stored_data,setup_common_init_values
 from .device_enums import ModeEnum
-from .device_features import DeviceFeatureEnum
+from .device_features import DeviceFeatureSet
 
 
 @dataclass
@@ -72,7 +72,7 @@ async def get_stored_portable_ac_data(
     return stored_data
 
 
-def handle_portable_ac_mode_change(desired_state:dict, value:ModeEnum, supported_features: list[DeviceFeatureEnum], stored_data: dict) -> dict:
+def handle_portable_ac_mode_change(desired_state:dict, value:ModeEnum, supported_features: DeviceFeatureSet, stored_data: dict) -> dict:
     match value:
         case ModeEnum.AUTO:
             desired_state["sleep"] = 0
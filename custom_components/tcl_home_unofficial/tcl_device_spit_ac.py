@@ -7,7 +7,7 @@ from homeassistant.core import HomeAssistant
 from .calculations import try_get_value
 from .data_storage import get_stored_data, safe_set_value, set_stored_data,setup_common_init_values
 from .device_enums import ModeEnum
-from .device_features import DeviceFeatureEnum
+from .device_features import DeviceFeatureEnum, DeviceFeatureSet
 
 
 @dataclass
@@ -110,7 +110,7 @@ async def get_stored_spit_ac_data(
         await set_stored_data(hass, device_id, stored_data)
     return stored_data
 
-def handle_split_ac_mode_change(desired_state:dict, value:ModeEnum, supported_features: list[DeviceFeatureEnum], stored_data: dict) -> dict:
+def handle_split_ac_mode_change(desired_state:dict, value:ModeEnum, supported_features: DeviceFeatureSet, stored_data: dict) -> dict:
     match value:
         case ModeEnum.AUTO:
             if (DeviceFeatureEnum.INTERNAL_HAS_TURBO_PROPERTY in supported_features):
@@ -7,7 +7,7 @@ from homeassistant.core import HomeAssistant
 from .calculations import try_get_value
 from .data_storage import get_stored_data, safe_set_value, set_stored_data,setup_common_init_values
 from .device_enums import ModeEnum
-from .device_features import DeviceFeatureEnum
+from .device_features import DeviceFeatureSet
 
 
 @dataclass
@@ -82,7 +82,7 @@ async def get_stored_window_ac_data(
 def handle_window_ac_mode_change(
     desired_state: dict,
     value: ModeEnum,
-    supported_features: list[DeviceFeatureEnum],
+    supported_features: DeviceFeatureSet,
     stored_data: dict,
 ) -> dict:
     match value:
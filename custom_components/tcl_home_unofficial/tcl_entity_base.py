@@ -11,6 +11,9 @@ from .device import Device, toDeviceInfo
 
 
 class TclEntityBase(CoordinatorEntity):
+    # False on entities whose attributes do not read the device's shadow data
+    needs_device_data = True
+
     def __init__(
         self, coordinator: IotDeviceCoordinator, type: str, name: str, device: Device
     ) -> None:
@@ -21,9 +24,49 @@ class TclEntityBase(CoordinatorEntity):
         self._attr_has_entity_name = True
         self._attr_unique_id = f"{DOMAIN}-{type}-{device.device_id}"
 
+    def update_attributes(self) -> None:
+        """Set the _attr_* fields the state is rendered from, from self.device.
+
+        Called when the entity is added and when its device changed, so
+        writing the state only reads fields.
+        """
+        self._attr_available = self.device.is_online == 1
+
+    def refresh_attributes(self) -> None:
+        """update_attributes, unless the device has no shadow data to read.
+
+        An offline device is built without its shadow (data is None): the
+        entity keeps its last values and turns unavailable.
+        """
+        if self.needs_device_data and (
+            self.device.is_online != 1 or self.device.data is None
+        ):
+            self._attr_available = False
+            return
+        self.update_attributes()
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.device = self.coordinator.get_device_by_id(self.device.device_id) or self.device
+        self.refresh_attributes()
+
     @callback
     def _handle_coordinator_update(self) -> None:
-        self.device = self.coordinator.get_device_by_id(self.device.device_id)
+        device = self.coordinator.get_device_by_id(self.device.device_id)
+        skip_write = (
+            device is not None
+            and not device.has_changes
+            and device.compared_to is self.device
+        )
+        if skip_write:
+            self.device = device
+            return
+        if device is None:
+            # dropped out of get_all_things: keep the last known device
+            self._attr_available = False
+        else:
+            self.device = device
+            self.refresh_attributes()
         self.async_write_ha_state()
 
     @property
@@ -44,7 +87,8 @@ class TclEntityBase(CoordinatorEntity):
 
     @property
     def available(self) -> bool:
-        return self.device.is_online == 1
+        # CoordinatorEntity.available does not read _attr_available
+        return self._attr_available
 
 
 class TclNonPollingEntityBase(Entity):
@@ -237,12 +237,10 @@ class TextOutEntity(TclEntityBase, TextEntity):
         self.counter = 0
         self.selfDiagnostics = SelfDiagnostics(hass=hass, device_id=device.device_id)
         self._attr_entity_registry_enabled_default = enabled
-        
 
-    @property
-    def native_value(self) -> str | None:
-        self.device = self.coordinator.get_device_by_id(self.device.device_id)
-        return self.value_function(self.device)
+    def update_attributes(self) -> None:
+        super().update_attributes()
+        self._attr_native_value = self.value_function(self.device)
 
    
     async def async_set_value(self, value: str) -> None:
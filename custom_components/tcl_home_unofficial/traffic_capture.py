@@ -0,0 +1,229 @@
+"""Record cloud traffic for offline replay (tools/replay_capture.py).
+
+Every request made by tcl.py and every shadow read / publish made by
+AwsIot is written as one JSON line: operation, url, redacted request,
+status, redacted response (the shadow document for shadow reads) and the
+elapsed time. Lines go to gzip files that rotate by size; the writing is
+done on a background thread so neither the event loop nor the executor
+waits on disk.
+"""
+
+from __future__ import annotations
+
+import datetime
+import gzip
+import json
+import logging
+import os
+import queue
+import threading
+import time
+
+from .const import (
+    DOMAIN,
+    TRAFFIC_CAPTURE_FLUSH_EVERY_RECORDS,
+    TRAFFIC_CAPTURE_MAX_FILE_BYTES,
+    TRAFFIC_CAPTURE_MAX_FILES,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+TRAFFIC_CAPTURE_KEY = f"{DOMAIN}.traffic_capture"
+TRAFFIC_CAPTURE_VERSION = 1
+REDACTED = "**REDACTED**"
+
+# compared lower-case, anywhere in a request / response / header mapping
+REDACTED_KEYS = {
+    "accesskeyid",
+    "access_key_id",
+    "accesstoken",
+    "authorization",
+    "cognito_id",
+    "cognito_token",
+    "cognitoid",
+    "cognitotoken",
+    "identityid",
+    "logins",
+    "nonce",
+    "password",
+    "refresh_token",
+    "refreshtoken",
+    "saas_token",
+    "saastoken",
+    "secret_key",
+    "secretkey",
+    "session_token",
+    "sessiontoken",
+    "sign",
+    "ssoid",
+    "ssotoken",
+    "token",
+    "userid",
+    "username",
+    "x-amz-security-token",
+}
+
+
+def redact(value):
+    if isinstance(value, dict):
+        return {
+            key: REDACTED if str(key).lower() in REDACTED_KEYS else redact(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [redact(item) for item in value]
+    return value
+
+
+class TrafficRecorder:
+    """Append-only, size-rotated, gzip JSON-lines capture."""
+
+    def __init__(
+        self,
+        directory: str,
+        max_file_bytes: int = TRAFFIC_CAPTURE_MAX_FILE_BYTES,
+        max_files: int = TRAFFIC_CAPTURE_MAX_FILES,
+    ) -> None:
+        self.directory = directory
+        self.max_file_bytes = max_file_bytes
+        self.max_files = max_files
+        self.started = time.monotonic()
+        self.recorded = 0
+        self.dropped = 0
+        self._queue: queue.Queue[dict | None] = queue.Queue(maxsize=10000)
+        self._file = None
+        self._file_bytes = 0
+        self._file_index = 0
+        self._thread = threading.Thread(
+            target=self._run, name=f"{DOMAIN}-traffic-capture", daemon=True
+        )
+        self._thread.start()
+
+    def record(self, record: dict) -> None:
+        """Queue a record; safe to call from the event loop and executor threads."""
+        record["offset"] = round(time.monotonic() - self.started, 4)
+        record["ts"] = time.time()
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join(timeout=5)
+
+    def _open_next_file(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        os.makedirs(self.directory, exist_ok=True)
+        stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        self._file_index += 1
+        path = os.path.join(self.directory, f"capture-{stamp}-{self._file_index:03d}.jsonl.gz")
+        self._file = gzip.open(path, "wt", encoding="utf-8")
+        self._file_bytes = 0
+        self._write_line(
+            {"type": "header", "version": TRAFFIC_CAPTURE_VERSION, "ts": time.time()}
+        )
+        self._prune()
+
+    def _prune(self) -> None:
+        files = sorted(
+            name for name in os.listdir(self.directory) if name.startswith("capture-")
+        )
+        for name in files[: max(0, len(files) - self.max_files)]:
+            os.remove(os.path.join(self.directory, name))
+
+    def _write_line(self, record: dict) -> None:
+        line = json.dumps(record, default=str) + "\n"
+        self._file.write(line)
+        self._file_bytes += len(line)
+
+    def _run(self) -> None:
+        pending = 0
+        while True:
+            record = self._queue.get()
+            if record is None:
+                break
+            try:
+                if self._file is None or self._file_bytes >= self.max_file_bytes:
+                    self._open_next_file()
+                self._write_line(record)
+                self.recorded += 1
+                pending += 1
+                # sync flush so a crash loses at most a few records, and the
+                # file stays readable while it is being written
+                if pending >= TRAFFIC_CAPTURE_FLUSH_EVERY_RECORDS or self._queue.empty():
+                    self._file.flush()
+                    pending = 0
+            except OSError as e:
+                self.dropped += 1
+                _LOGGER.error("TrafficRecorder: writing capture failed: %s", e)
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def snapshot(self) -> dict:
+        return {
+            "directory": self.directory,
+            "recorded": self.recorded,
+            "dropped": self.dropped,
+            "queued": self._queue.qsize(),
+        }
+
+
+def get_traffic_recorder(hass) -> TrafficRecorder | None:
+    if hass is None:
+        return None
+    return hass.data.get(TRAFFIC_CAPTURE_KEY)
+
+
+def start_traffic_capture(hass) -> TrafficRecorder:
+    recorder = get_traffic_recorder(hass)
+    if recorder is None:
+        recorder = TrafficRecorder(hass.config.path(f"{DOMAIN}_captures"))
+        hass.data[TRAFFIC_CAPTURE_KEY] = recorder
+        _LOGGER.info("Traffic capture started: %s", recorder.directory)
+    return recorder
+
+
+async def async_stop_traffic_capture(hass) -> None:
+    recorder = hass.data.pop(TRAFFIC_CAPTURE_KEY, None)
+    if recorder is not None:
+        await hass.async_add_executor_job(recorder.close)
+        _LOGGER.info("Traffic capture stopped: %s", recorder.snapshot())
+
+
+def record_exchange(
+    hass,
+    source: str,
+    operation: str,
+    method: str,
+    url: str,
+    request_headers: dict | None,
+    request_payload,
+    status: int | None,
+    response,
+    started: float,
+    error: Exception | None = None,
+) -> None:
+    """Record one request/response; a no-op unless capture is running."""
+    recorder = get_traffic_recorder(hass)
+    if recorder is None:
+        return
+    recorder.record(
+        {
+            "type": "exchange",
+            "source": source,
+            "operation": str(operation),
+            "method": method,
+            "url": url,
+            "request": {
+                "headers": redact(dict(request_headers or {})),
+                "payload": redact(request_payload),
+            },
+            "status": status,
+            "response": redact(response),
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 3),
+            "error": None if error is None else f"{type(error).__name__}: {error}",
+        }
+    )
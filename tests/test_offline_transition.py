@@ -0,0 +1,109 @@
+"""Entities of a device that goes offline turn unavailable and keep their values.
+
+Runs the coordinator poll and the entity updates through the harness of
+benchmarks/poll_path.py, on a fleet with one device per notes/ template.
+"""
+
+import asyncio
+import importlib.util
+import pathlib
+import sys
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent
+POLL_PATH_PATH = REPO_ROOT / "benchmarks" / "poll_path.py"
+# the platforms whose entities follow the coordinator
+POLLED_PLATFORMS = {
+    "binary_sensor",
+    "sensor",
+    "switch",
+    "select",
+    "number",
+    "button",
+    "climate",
+    "humidifier",
+    "text",
+}
+
+
+def load_poll_path():
+    # loaded by path: benchmarks/ is not a package
+    spec = importlib.util.spec_from_file_location("poll_path", POLL_PATH_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["poll_path"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def platform_of(entity) -> str:
+    return type(entity).__module__.rsplit(".", 1)[-1]
+
+
+async def run_offline_transition() -> tuple[list, dict, dict]:
+    poll_path = load_poll_path()
+    simulator = poll_path.load_simulator()
+    integration = poll_path.load_integration()
+    templates = simulator.load_note_templates(simulator.NOTES_DIR)
+    cloud = simulator.SimulatedCloud(
+        simulator.SimulatorConfig(
+            port=0, devices=len(templates), drift_rate=0, report_delay_seconds=0
+        ),
+        templates,
+    )
+    storages = {device_id: poll_path.make_storage() for device_id in cloud.devices}
+
+    async def get_stored_data(hass, device_id):
+        return storages[device_id]
+
+    async def save_shape_catalog(hass, catalog):
+        catalog.dirty = False
+
+    IotDeviceCoordinator = integration.coordinator.IotDeviceCoordinator
+    coordinator = IotDeviceCoordinator.__new__(IotDeviceCoordinator)
+    coordinator.hass = None
+    coordinator.aws_iot = poll_path.StubAwsIot(integration, cloud)
+    coordinator.shape_catalog = integration.device_shape_catalog.DeviceShapeCatalog()
+    coordinator.data = None
+
+    hass = SimpleNamespace(data={})
+    counter = poll_path.WriteCounter()
+    with (
+        patch.object(integration.coordinator, "get_stored_data", get_stored_data),
+        patch.object(integration.coordinator, "async_save_device_shape_catalog", save_shape_catalog),
+    ):
+        await poll_path.poll(coordinator, [])
+        config_entry = SimpleNamespace(
+            entry_id="test",
+            devices=[device for device in coordinator.data.devices if device.device_type is not None],
+            non_implemented_devices=[],
+            runtime_data=SimpleNamespace(coordinator=coordinator),
+        )
+        entities, failed = await poll_path.build_entities(config_entry, hass)
+        assert failed == []
+        entities = [entity for entity in entities if hasattr(entity, "refresh_attributes")]
+        for entity in entities:
+            entity.hass = hass
+            counter.bind(entity)
+            entity.refresh_attributes()
+        await poll_path.poll(coordinator, entities)
+        online = {id(entity): entity.available for entity in entities}
+
+        for device in cloud.devices.values():
+            device.tcl_thing["isOnline"] = 0
+        await poll_path.poll(coordinator, entities)
+        assert counter.render_errors == 0
+    return entities, online, {id(entity): entity.available for entity in entities}
+
+
+def test_offline_transition() -> None:
+    entities, online, offline = asyncio.run(run_offline_transition())
+
+    assert {platform_of(entity) for entity in entities} >= POLLED_PLATFORMS
+    for entity in entities:
+        if entity.needs_device_data and online[id(entity)]:
+            assert offline[id(entity)] is False, entity.unique_id
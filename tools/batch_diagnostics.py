@@ -0,0 +1,290 @@
+#!/usr/bin/python3
+"""Catalog device shapes across a directory of diagnostics downloads.
+
+generate_notes_from_diagnostics.py prints one dump; this reads many at once.
+Every *.json / *.json.gz under the given paths is parsed in a worker process
+that keeps only the device shapes of the dump and drops the document, so the
+parent holds shapes, never whole dumps, and at most --workers * 2 files are
+in flight.
+
+A shape is (device_name, capabilities, reported key set). Identical shapes
+from any number of dumps are grouped into one catalog entry with the count,
+firmware versions, product keys and the files they came from. For each shape
+the features getSupportedFeatures gives it (without device storage, so power
+consumption / work time / rn probe features are not included) go into the
+feature matrix.
+
+Outputs, with --out DIR:
+  catalog.json         the deduplicated shapes
+  feature_matrix.csv   one row per shape, one column per feature
+
+usage:
+  python3 tools/batch_diagnostics.py ~/Downloads/diagnostics
+  python3 tools/batch_diagnostics.py ~/Downloads/diagnostics --out /tmp/shapes --workers 8
+  python3 tools/batch_diagnostics.py a.json b.json.gz --max-file-mb 20
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import argparse
+import csv
+import gzip
+import hashlib
+import importlib
+import importlib.util
+import json
+import logging
+import os
+import pathlib
+import sys
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+_LOGGER = logging.getLogger("batch_diagnostics")
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent
+PACKAGE_NAME = "tcl_home_unofficial"
+PACKAGE_DIR = REPO_ROOT / "custom_components" / PACKAGE_NAME
+MAX_EXAMPLE_FILES = 5
+
+_feature_modules = None
+
+
+def load_feature_modules():
+    """device_types and device_features, without running the package __init__ (it imports homeassistant)."""
+    global _feature_modules  # noqa: PLW0603
+    if _feature_modules is None:
+        spec = importlib.util.spec_from_file_location(
+            PACKAGE_NAME,
+            PACKAGE_DIR / "__init__.py",
+            submodule_search_locations=[str(PACKAGE_DIR)],
+        )
+        sys.modules[PACKAGE_NAME] = importlib.util.module_from_spec(spec)
+        _feature_modules = (
+            importlib.import_module(f"{PACKAGE_NAME}.device_types"),
+            importlib.import_module(f"{PACKAGE_NAME}.device_features"),
+        )
+    return _feature_modules
+
+
+def diagnostics_files(paths: list[pathlib.Path]) -> list[pathlib.Path]:
+    files = []
+    for path in paths:
+        if path.is_dir():
+            files.extend(
+                sorted(
+                    file
+                    for file in path.rglob("*")
+                    if file.is_file() and file.name.endswith((".json", ".json.gz"))
+                )
+            )
+        else:
+            files.append(path)
+    return files
+
+
+def read_dump(path: pathlib.Path, max_bytes: int) -> dict:
+    opener = gzip.open if path.name.endswith(".gz") else open
+    with opener(path, "rb") as file:
+        content = file.read(max_bytes + 1)
+    if len(content) > max_bytes:
+        raise ValueError(f"larger than {max_bytes // (1024 * 1024)} MiB")
+    return json.loads(content)
+
+
+def shape_id(device_name: str, capabilities: tuple, reported_keys: tuple) -> str:
+    text = json.dumps([device_name, capabilities, reported_keys])
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:12]
+
+
+def extract_shapes(data: dict) -> list[dict]:
+    """One shape per device of a dump's "data" section."""
+    device_types, device_features = load_feature_modules()
+    tcl_things = data.get("tcl", {}).get("tcl_things", [])
+    aws_things = data.get("aws_init", {}).get("aws_things", [])
+    if not isinstance(tcl_things, list):
+        tcl_things = []
+    if not isinstance(aws_things, list):
+        aws_things = []
+    tcl_by_id = {thing.get("device_id"): thing for thing in tcl_things}
+
+    shapes = []
+    for index, aws_thing in enumerate(aws_things):
+        reported = aws_thing.get("reported")
+        if not isinstance(reported, dict):
+            continue
+        tcl_thing = tcl_by_id.get(aws_thing.get("deviceId"))
+        if tcl_thing is None and index < len(tcl_things):
+            # device ids masked by hand: dumps list both in the same order
+            tcl_thing = tcl_things[index]
+        tcl_thing = tcl_thing or {}
+        device_name = tcl_thing.get("device_name") or ""
+        capabilities = tuple(sorted(reported.get("capabilities") or []))
+        reported_keys = tuple(sorted(reported))
+        device_type = device_types.calculateDeviceType(device_name)
+        features = device_features.getSupportedFeatures(device_type, reported, None) or []
+        shapes.append(
+            {
+                "shape_id": shape_id(device_name, capabilities, reported_keys),
+                "device_name": device_name,
+                "device_type": None if device_type is None else str(device_type),
+                "capabilities": list(capabilities),
+                "reported_keys": list(reported_keys),
+                "features": sorted(str(feature) for feature in features),
+                "firmware_version": tcl_thing.get("firmware_version"),
+                "product_key": tcl_thing.get("product_key"),
+            }
+        )
+    return shapes
+
+
+def process_file(path: str, max_bytes: int) -> tuple[str, list[dict], str | None]:
+    """Worker: parse one dump and return only its shapes."""
+    try:
+        dump = read_dump(pathlib.Path(path), max_bytes)
+        data = dump.get("data", dump) if isinstance(dump, dict) else {}
+        return path, extract_shapes(data), None
+    except Exception as e:  # noqa: BLE001
+        return path, [], f"{type(e).__name__}: {e}"
+
+
+class ShapeCatalog:
+    """Shapes grouped by shape_id."""
+
+    def __init__(self) -> None:
+        self.shapes: dict[str, dict] = {}
+        self.files = 0
+        self.failed: dict[str, str] = {}
+
+    def add(self, path: str, shapes: list[dict]) -> None:
+        self.files += 1
+        for shape in shapes:
+            entry = self.shapes.get(shape["shape_id"])
+            if entry is None:
+                entry = {
+                    **{key: shape[key] for key in ("shape_id", "device_name", "device_type")},
+                    "count": 0,
+                    "capabilities": shape["capabilities"],
+                    "reported_keys": shape["reported_keys"],
+                    "features": shape["features"],
+                    "firmware_versions": [],
+                    "product_keys": [],
+                    "files": [],
+                }
+                self.shapes[shape["shape_id"]] = entry
+            entry["count"] += 1
+            for key, value in (
+                ("firmware_versions", shape["firmware_version"]),
+                ("product_keys", shape["product_key"]),
+            ):
+                if value and value not in entry[key]:
+                    entry[key].append(value)
+            if len(entry["files"]) < MAX_EXAMPLE_FILES and path not in entry["files"]:
+                entry["files"].append(path)
+
+    def sorted_shapes(self) -> list[dict]:
+        return sorted(self.shapes.values(), key=lambda entry: (entry["device_name"], -entry["count"]))
+
+    def as_dict(self) -> dict:
+        return {
+            "files": self.files,
+            "failed": self.failed,
+            "devices": sum(entry["count"] for entry in self.shapes.values()),
+            "shapes": self.sorted_shapes(),
+        }
+
+    def write_feature_matrix(self, path: pathlib.Path) -> None:
+        shapes = self.sorted_shapes()
+        features = sorted({feature for entry in shapes for feature in entry["features"]})
+        with open(path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(["shape_id", "device_name", "count", *features])
+            for entry in shapes:
+                supported = set(entry["features"])
+                writer.writerow(
+                    [
+                        entry["shape_id"],
+                        entry["device_name"],
+                        entry["count"],
+                        *("x" if feature in supported else "" for feature in features),
+                    ]
+                )
+
+
+def build_catalog(files: list[pathlib.Path], workers: int, max_bytes: int) -> ShapeCatalog:
+    catalog = ShapeCatalog()
+    pending = set()
+    remaining = iter(files)
+    # recycle workers so one huge dump does not keep its peak memory around
+    with ProcessPoolExecutor(max_workers=workers, max_tasks_per_child=50) as executor:
+        while True:
+            for path in remaining:
+                pending.add(executor.submit(process_file, str(path), max_bytes))
+                if len(pending) >= workers * 2:
+                    break
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path, shapes, error = future.result()
+                if error is not None:
+                    catalog.failed[path] = error
+                    _LOGGER.warning("%s: %s", path, error)
+                else:
+                    catalog.add(path, shapes)
+    return catalog
+
+
+def print_catalog(catalog: ShapeCatalog) -> None:
+    summary = catalog.as_dict()
+    _LOGGER.info(
+        "%s files (%s failed), %s devices, %s distinct shapes",
+        summary["files"],
+        len(summary["failed"]),
+        summary["devices"],
+        len(summary["shapes"]),
+    )
+    for entry in summary["shapes"]:
+        _LOGGER.info(
+            "  %s  %-22s x%-4s caps:%-3s keys:%-4s features:%-3s fw:%s",
+            entry["shape_id"],
+            entry["device_name"] or "?",
+            entry["count"],
+            len(entry["capabilities"]),
+            len(entry["reported_keys"]),
+            len(entry["features"]),
+            ",".join(entry["firmware_versions"]),
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", type=pathlib.Path, nargs="+", help="diagnostics files or directories")
+    parser.add_argument("--out", type=pathlib.Path, help="write catalog.json and feature_matrix.csv here")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--max-file-mb", type=int, default=50, help="skip dumps larger than this")
+    parser.add_argument("--json", action="store_true", help="print the catalog as JSON only")
+    args = parser.parse_args()
+
+    files = diagnostics_files(args.paths)
+    if not files:
+        _LOGGER.error("No diagnostics files found in %s", ", ".join(map(str, args.paths)))
+        return 1
+    catalog = build_catalog(files, max(1, args.workers), args.max_file_mb * 1024 * 1024)
+
+    if args.out:
+        args.out.mkdir(parents=True, exist_ok=True)
+        with open(args.out / "catalog.json", "w", encoding="utf-8") as file:
+            json.dump(catalog.as_dict(), file, indent=2)
+        catalog.write_feature_matrix(args.out / "feature_matrix.csv")
+    if args.json:
+        print(json.dumps(catalog.as_dict(), indent=2))
+    else:
+        print_catalog(catalog)
+        if args.out:
+            _LOGGER.info("Wrote %s and %s", args.out / "catalog.json", args.out / "feature_matrix.csv")
+    return 0 if not catalog.failed else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
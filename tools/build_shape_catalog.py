@@ -0,0 +1,107 @@
+#!/usr/bin/python3
+"""Build custom_components/tcl_home_unofficial/device_shapes.json.
+
+The shipped device shape catalog (see device_shape_catalog.py): every device
+shape (device type, capabilities, reported keys) known from notes/*.txt, and
+optionally from diagnostics downloads. The integration adds each one with
+every combination of the device storage flags and computes its features when
+it loads the catalog. Shapes seen only at runtime are added by the
+integration itself.
+
+usage:
+  python3 tools/build_shape_catalog.py
+  python3 tools/build_shape_catalog.py --diagnostics ~/Downloads/tcl_home.json
+  python3 tools/build_shape_catalog.py --check      # exit 1 when the file is out of date
+"""
+
+import argparse
+import importlib
+import importlib.util
+import json
+import logging
+import pathlib
+import sys
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+_LOGGER = logging.getLogger("build_shape_catalog")
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent
+PACKAGE_NAME = "tcl_home_unofficial"
+PACKAGE_DIR = REPO_ROOT / "custom_components" / PACKAGE_NAME
+SIMULATOR_PATH = REPO_ROOT / "tools" / "cloud_simulator.py"
+OUTPUT_PATH = PACKAGE_DIR / "device_shapes.json"
+
+
+def load_simulator():
+    # loaded by path: tools/ is not a package
+    spec = importlib.util.spec_from_file_location("cloud_simulator", SIMULATOR_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["cloud_simulator"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_shape_catalog_module():
+    # the package __init__ imports homeassistant: register the package without running it
+    spec = importlib.util.spec_from_file_location(
+        PACKAGE_NAME,
+        PACKAGE_DIR / "__init__.py",
+        submodule_search_locations=[str(PACKAGE_DIR)],
+    )
+    sys.modules[PACKAGE_NAME] = importlib.util.module_from_spec(spec)
+    return (
+        importlib.import_module(f"{PACKAGE_NAME}.device_shape_catalog"),
+        importlib.import_module(f"{PACKAGE_NAME}.device_types"),
+    )
+
+
+def build(templates, shape_catalog, device_types) -> dict:
+    entries = {}
+    for template in templates:
+        device_type = device_types.calculateDeviceType(template.tcl_thing.get("device_name") or "")
+        if device_type is None:
+            _LOGGER.info("  skipping %s: not implemented by the integration", template.name)
+            continue
+        shape = shape_catalog.get_device_shape(device_type, template.reported, None)
+        entry = entries.setdefault(
+            shape.shape_id,
+            {"shape_id": shape.shape_id, "sources": [], **shape.as_dict(with_storage_flags=False)},
+        )
+        entry["sources"].append(template.name)
+        _LOGGER.info("  %s: %s %s", template.name, device_type, shape.shape_id)
+    return {
+        "version": shape_catalog.DEVICE_SHAPE_CATALOG_VERSION,
+        "shapes": sorted(entries.values(), key=lambda entry: (entry["device_type"], entry["sources"])),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--notes", type=pathlib.Path, help="notes directory (default: notes/)")
+    parser.add_argument("--diagnostics", type=pathlib.Path, nargs="*", default=[], help="diagnostics downloads to add")
+    parser.add_argument("--output", type=pathlib.Path, default=OUTPUT_PATH)
+    parser.add_argument("--check", action="store_true", help="only compare with the existing file")
+    args = parser.parse_args()
+
+    simulator = load_simulator()
+    shape_catalog, device_types = load_shape_catalog_module()
+    templates = simulator.load_note_templates(args.notes) if args.notes else simulator.load_note_templates()
+    for path in args.diagnostics:
+        templates.extend(simulator.load_diagnostics_templates(path))
+
+    data = build(templates, shape_catalog, device_types)
+    content = json.dumps(data, indent=1) + "\n"
+    if args.check:
+        current = args.output.read_text(encoding="utf-8") if args.output.exists() else ""
+        if current != content:
+            _LOGGER.error("%s is out of date, run tools/build_shape_catalog.py", args.output)
+            return 1
+        _LOGGER.info("%s is up to date (%d shapes)", args.output, len(data["shapes"]))
+        return 0
+    args.output.write_text(content, encoding="utf-8")
+    _LOGGER.info("Wrote %d shapes to %s", len(data["shapes"]), args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
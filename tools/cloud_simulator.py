@@ -0,0 +1,857 @@
+#!/usr/bin/python3
+"""Local stand-in for the TCL cloud and the AWS IoT shadow service.
+
+Serves, from one HTTP port:
+  TCL account login, cloud_url_get, refresh_tokens, get_things, work-time,
+  power-consumption and config/get
+  Cognito GetCredentialsForIdentity
+  IoT data plane GetThingShadow and Publish (shadow update topic), with
+  shadow versioning, metadata timestamps and delta
+
+Tokens and AWS credentials expire after the configured TTLs and are checked
+on every request, so the integration's refresh / client rebuild paths run as
+they do against the real cloud. Latency, 5xx errors and throttling can be
+injected per endpoint. Devices are synthesized from notes/*.txt (or from a
+diagnostics download) and the fleet can be scaled to any size.
+
+usage:
+  python3 tools/cloud_simulator.py --devices 200
+  python3 tools/cloud_simulator.py --devices 500 --latency-ms 80 --jitter-ms 40 \\
+      --fault get_shadow:throttle=0.05 --fault publish:error=0.02,latency=400
+  python3 tools/cloud_simulator.py --diagnostics ~/Downloads/tcl_home.json
+
+Point Home Assistant at it:
+  config flow: app_login_url = <base>/account/login?clientId=54148614
+               cloud_urls    = <base>/v3/global/cloud_url_get
+  environment: AWS_ENDPOINT_URL_IOT_DATA_PLANE=<base>
+  Cognito:     the integration builds its URL from the AWS region; run Home
+               Assistant in-process with redirect_cognito(tcl, <base>) applied
+
+Control endpoints while running:
+  GET  /_sim/stats            request counters per endpoint and outcome
+  POST /_sim/faults           {"get_things": {"error": 0.5}} replaces fault rules
+  POST /_sim/expire_tokens    revoke every issued token / credential
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import logging
+import pathlib
+import random
+import re
+import secrets
+import sys
+import threading
+import time
+from unittest.mock import patch
+from urllib.parse import parse_qs, unquote, urlsplit
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+_LOGGER = logging.getLogger("cloud_simulator")
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent
+NOTES_DIR = REPO_ROOT / "notes"
+
+ENDPOINTS = (
+    "login",
+    "cloud_urls",
+    "refresh_tokens",
+    "aws_credentials",
+    "get_things",
+    "work_time",
+    "energy",
+    "config_get",
+    "get_shadow",
+    "publish",
+)
+IOT_ENDPOINTS = {"aws_credentials", "get_shadow", "publish"}
+
+# notes file name prefix -> tcl_thing.device_name understood by device_types.py
+NOTE_DEVICE_NAMES = (
+    ("split_ac_fresh_air", "Split AC Fresh air"),
+    ("split_ac", "Split AC"),
+    ("portable_ac", "Portable AC"),
+    ("window_ac", "Window AC"),
+    ("duct_ac", "Duct"),
+    ("dehumidifier", "Dehumidifier DEM"),
+)
+COGNITO_URL_PREFIX = "https://cognito-identity."
+SHADOW_UPDATE_TOPIC = re.compile(r"^\$aws/things/(?P<device_id>[^/]+)/shadow/update$")
+
+
+def make_jwt(claims: dict) -> str:
+    """Unsigned-looking JWT; the integration never verifies signatures."""
+
+    def encode(part: dict) -> str:
+        raw = json.dumps(part, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+    signature = base64.urlsafe_b64encode(secrets.token_bytes(16)).rstrip(b"=").decode("ascii")
+    return f"{encode({'alg': 'HS256', 'typ': 'JWT'})}.{encode(claims)}.{signature}"
+
+
+@dataclass
+class FaultRule:
+    latency_ms: float = 0
+    jitter_ms: float = 0
+    error: float = 0
+    throttle: float = 0
+
+
+def parse_fault_rule(text: str, base: FaultRule) -> tuple[str, FaultRule]:
+    """`get_shadow:throttle=0.1,latency=200` -> ("get_shadow", FaultRule)."""
+    endpoint, _, spec = text.partition(":")
+    if endpoint not in ENDPOINTS:
+        raise ValueError(f"unknown endpoint {endpoint!r}, expected one of {ENDPOINTS}")
+    rule = FaultRule(**asdict(base))
+    for item in filter(None, spec.split(",")):
+        name, _, value = item.partition("=")
+        name = {"latency": "latency_ms", "jitter": "jitter_ms"}.get(name, name)
+        if not hasattr(rule, name):
+            raise ValueError(f"unknown fault setting {name!r}")
+        setattr(rule, name, float(value))
+    return endpoint, rule
+
+
+@dataclass
+class SimulatorConfig:
+    host: str = "127.0.0.1"
+    port: int = 8765
+    devices: int = 10
+    region: str = "us-east-1"
+    seed: int = 1
+    token_ttl_seconds: int = 3600
+    credentials_ttl_seconds: int = 3600
+    # time between a publish and the device reporting the new state
+    report_delay_seconds: float = 1.0
+    # chance per shadow read that a sensor value (currentTemperature, ...) moves
+    drift_rate: float = 0.1
+    offline_rate: float = 0.0
+    default_fault: FaultRule = field(default_factory=FaultRule)
+    faults: dict[str, FaultRule] = field(default_factory=dict)
+
+    def get_fault(self, endpoint: str) -> FaultRule:
+        return self.faults.get(endpoint, self.default_fault)
+
+
+@dataclass
+class DeviceTemplate:
+    name: str
+    tcl_thing: dict
+    reported: dict
+
+
+def _json_objects(text: str) -> list[dict]:
+    """Every JSON object embedded in a free-form notes file."""
+    text = re.sub(r",(\s*[}\]])", r"\1", text)
+    decoder = json.JSONDecoder()
+    objects = []
+    index = text.find("{")
+    while index != -1:
+        try:
+            value, end = decoder.raw_decode(text, index)
+        except ValueError:
+            index = text.find("{", index + 1)
+            continue
+        if isinstance(value, dict):
+            objects.append(value)
+        index = text.find("{", end)
+    return objects
+
+
+def _reported_candidates(value: dict) -> list[dict]:
+    candidates = [value]
+    for nested in (value.get("reported"), (value.get("state") or {}).get("reported")):
+        if isinstance(nested, dict):
+            candidates.append(nested)
+    return candidates
+
+
+def _note_device_name(file_name: str) -> str:
+    for prefix, device_name in NOTE_DEVICE_NAMES:
+        if file_name.startswith(prefix):
+            return device_name
+    return "Split AC"
+
+
+def load_note_templates(notes_dir: pathlib.Path = NOTES_DIR) -> list[DeviceTemplate]:
+    templates = []
+    for path in sorted(notes_dir.glob("*.txt")):
+        tcl_thing = None
+        reported = None
+        for value in _json_objects(path.read_text(encoding="utf-8")):
+            if "device_id" in value and "category" in value:
+                tcl_thing = tcl_thing or value
+                continue
+            # the reported state is the biggest property bag in the file
+            for candidate in _reported_candidates(value):
+                if "powerSwitch" in candidate and len(candidate) > len(reported or {}):
+                    reported = candidate
+        if reported is None:
+            continue
+        tcl_thing = dict(tcl_thing or {})
+        tcl_thing.setdefault("device_name", _note_device_name(path.stem))
+        tcl_thing.setdefault("category", "AC")
+        templates.append(DeviceTemplate(path.stem, tcl_thing, reported))
+    return templates
+
+
+def load_diagnostics_templates(path: pathlib.Path) -> list[DeviceTemplate]:
+    """Same input as the fakes_for_debug `fake.data` setting."""
+    data = json.loads(path.read_text(encoding="utf-8")).get("data", {})
+    tcl_things = data.get("tcl", {}).get("tcl_things", [])
+    aws_things = data.get("aws_init", {}).get("aws_things", [])
+    templates = []
+    for index, tcl_thing in enumerate(tcl_things):
+        reported = aws_things[index].get("reported", {}) if index < len(aws_things) else {}
+        templates.append(
+            DeviceTemplate(tcl_thing.get("device_name", f"device{index}"), tcl_thing, reported)
+        )
+    return templates
+
+
+class SimulatedDevice:
+    """One thing: its get_things entry and its shadow document."""
+
+    def __init__(self, device_id: str, template: DeviceTemplate, index: int, online: bool) -> None:
+        now = int(time.time())
+        self.device_id = device_id
+        self.template = template.name
+        self.tcl_thing = {
+            "deviceId": device_id,
+            "productKey": template.tcl_thing.get("product_key", f"sim{template.name}"),
+            "platform": template.tcl_thing.get("platform", "TCLIOT"),
+            "nickName": f"{template.name} {index}",
+            "deviceName": template.tcl_thing.get("device_name"),
+            "category": template.tcl_thing.get("category", "AC"),
+            "type": template.tcl_thing.get("type", 0),
+            "deviceType": template.tcl_thing.get("device_type", ""),
+            "firmwareVersion": template.tcl_thing.get("firmware_version", "SIM-1.0"),
+            "netType": template.tcl_thing.get("net_type", 1),
+            "isOnline": 1 if online else 0,
+            "room": template.tcl_thing.get("room", "Simulator"),
+        }
+        reported = json.loads(json.dumps(template.reported))
+        self.desired = {key: value for key, value in reported.items() if key != "errorCode"}
+        self.reported = reported
+        self.metadata_desired = {key: {"timestamp": now} for key in self.desired}
+        self.metadata_reported = {key: {"timestamp": now} for key in self.reported}
+        self.version = 1
+        self.pending: list[tuple[float, dict]] = []
+
+    @property
+    def is_online(self) -> bool:
+        return self.tcl_thing["isOnline"] == 1
+
+    def _report(self, values: dict, now: float) -> None:
+        timestamp = int(now)
+        for key, value in values.items():
+            self.reported[key] = value
+            self.metadata_reported[key] = {"timestamp": timestamp}
+        self.version += 1
+
+    def settle(self, now: float, rng: random.Random, drift_rate: float) -> None:
+        """Apply the desired states whose report delay has passed, then drift."""
+        if not self.is_online:
+            return
+        while self.pending and self.pending[0][0] <= now:
+            _, values = self.pending.pop(0)
+            self._report(values, now)
+        if drift_rate and rng.random() < drift_rate:
+            for key in ("currentTemperature", "indoorHumidity", "humidity"):
+                if isinstance(self.reported.get(key), (int, float)):
+                    self._report({key: self.reported[key] + rng.choice((-1, 1))}, now)
+                    break
+
+    def update_desired(self, desired: dict, now: float, report_delay: float) -> None:
+        timestamp = int(now)
+        for key, value in desired.items():
+            if value is None:
+                # AWS shadow semantics: null removes the key
+                self.desired.pop(key, None)
+                self.metadata_desired.pop(key, None)
+            else:
+                self.desired[key] = value
+                self.metadata_desired[key] = {"timestamp": timestamp}
+        self.version += 1
+        reportable = {key: value for key, value in desired.items() if value is not None}
+        if reportable:
+            self.pending.append((now + report_delay, reportable))
+
+    def document(self, now: float) -> dict:
+        delta = {
+            key: value
+            for key, value in self.desired.items()
+            if self.reported.get(key) != value
+        }
+        state = {"desired": dict(self.desired), "reported": dict(self.reported)}
+        if delta:
+            state["delta"] = delta
+        return {
+            "state": state,
+            "metadata": {
+                "desired": dict(self.metadata_desired),
+                "reported": dict(self.metadata_reported),
+            },
+            "version": self.version,
+            "timestamp": int(now),
+        }
+
+
+@dataclass
+class SimResponse:
+    status: int
+    body: dict
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+class SimulatedCloud:
+    """All simulator state; endpoint methods are called from handler threads."""
+
+    def __init__(self, config: SimulatorConfig, templates: list[DeviceTemplate]) -> None:
+        if not templates:
+            raise ValueError("no device templates")
+        self.config = config
+        self.base_url = f"http://{config.host}:{config.port}"
+        self.rng = random.Random(config.seed)
+        self.lock = threading.Lock()
+        self.tokens: dict[str, float] = {}
+        self.stats: Counter[str] = Counter()
+        self.devices: dict[str, SimulatedDevice] = {}
+        for index in range(config.devices):
+            template = templates[index % len(templates)]
+            device_id = f"sim{index:05d}"
+            online = self.rng.random() >= config.offline_rate
+            self.devices[device_id] = SimulatedDevice(device_id, template, index, online)
+
+    # tokens
+
+    def issue_token(self, ttl: int, claims: dict | None = None, jwt: bool = True) -> tuple[str, int]:
+        expires_at = int(time.time()) + ttl
+        if jwt:
+            token = make_jwt({**(claims or {}), "jti": secrets.token_hex(8)})
+        else:
+            token = secrets.token_urlsafe(32)
+        with self.lock:
+            self.tokens[token] = expires_at
+        return token, expires_at
+
+    def is_valid_token(self, token: str | None) -> bool:
+        with self.lock:
+            expires_at = self.tokens.get(token or "")
+        return expires_at is not None and expires_at > time.time()
+
+    def expire_tokens(self) -> int:
+        with self.lock:
+            count = len(self.tokens)
+            self.tokens.clear()
+        return count
+
+    # faults
+
+    def inject(self, endpoint: str) -> SimResponse | None:
+        """Sleep for the configured latency, then maybe return a failure."""
+        rule = self.config.get_fault(endpoint)
+        delay_ms = rule.latency_ms + (rule.jitter_ms * self.rng.random() if rule.jitter_ms else 0)
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000)
+        roll = self.rng.random()
+        if roll < rule.throttle:
+            if endpoint in IOT_ENDPOINTS:
+                return SimResponse(
+                    429,
+                    {"message": "Rate exceeded"},
+                    {"x-amzn-ErrorType": "ThrottlingException"},
+                )
+            return SimResponse(429, {"code": 429, "message": "Too Many Requests"})
+        if roll < rule.throttle + rule.error:
+            if endpoint in IOT_ENDPOINTS:
+                return SimResponse(
+                    500,
+                    {"message": "Injected failure"},
+                    {"x-amzn-ErrorType": "InternalFailureException"},
+                )
+            return SimResponse(500, {"code": 500, "message": "Injected failure"})
+        return None
+
+    # TCL account / cloud
+
+    def login(self, body: dict) -> SimResponse:
+        username = body.get("username") or "simulator"
+        ttl = self.config.token_ttl_seconds
+        token, expires_at = self.issue_token(ttl, {"sub": username, "exp": int(time.time()) + ttl})
+        refresh_token, _ = self.issue_token(ttl * 24, {"sub": username, "exp": expires_at + ttl * 23})
+        return SimResponse(
+            200,
+            {
+                "status": 1,
+                "token": token,
+                "refreshtoken": refresh_token,
+                "user": {"username": username, "nickname": username, "countryAbbr": "US"},
+            },
+        )
+
+    def cloud_urls(self, body: dict) -> SimResponse:
+        if not self.is_valid_token(body.get("ssoToken")):
+            return SimResponse(401, {"code": 401, "message": "invalid ssoToken"})
+        return SimResponse(
+            200,
+            {
+                "code": 0,
+                "message": "success",
+                "data": {
+                    "sso_region": self.config.region,
+                    "cloud_region": self.config.region,
+                    "sso_url": self.base_url,
+                    "cloud_url": self.base_url,
+                    "device_url": self.base_url,
+                    "icon_resource_url": self.base_url,
+                    "identity_pool_id": f"{self.config.region}:simulator",
+                    "upload_web_url": self.base_url,
+                    "cloud_url_emq": self.base_url,
+                    "new_struct": 1,
+                },
+            },
+        )
+
+    def refresh_tokens(self, body: dict) -> SimResponse:
+        if not self.is_valid_token(body.get("ssoToken")):
+            return SimResponse(401, {"code": 401, "message": "invalid ssoToken"})
+        ttl = self.config.token_ttl_seconds
+        expires_at = int(time.time()) + ttl
+        identity_id = f"{self.config.region}:{body.get('userId', 'simulator')}"
+        saas_token, _ = self.issue_token(ttl, {"expiredDate": expires_at})
+        cognito_token, _ = self.issue_token(ttl, {"sub": identity_id, "exp": expires_at})
+        return SimResponse(
+            200,
+            {
+                "code": 0,
+                "message": "success",
+                "data": {
+                    "saasToken": saas_token,
+                    "cognitoToken": cognito_token,
+                    "cognitoId": identity_id,
+                    "mqttEndpoint": f"{self.config.host}:{self.config.port}",
+                },
+            },
+        )
+
+    def aws_credentials(self, body: dict) -> SimResponse:
+        logins = body.get("Logins") or {}
+        if not self.is_valid_token(logins.get("cognito-identity.amazonaws.com")):
+            return SimResponse(
+                400,
+                {"__type": "NotAuthorizedException", "message": "Invalid login token"},
+            )
+        session_token, expires_at = self.issue_token(
+            self.config.credentials_ttl_seconds, jwt=False
+        )
+        return SimResponse(
+            200,
+            {
+                "IdentityId": body.get("IdentityId"),
+                "Credentials": {
+                    "AccessKeyId": "ASIASIMULATOR" + secrets.token_hex(4).upper(),
+                    "Expiration": expires_at,
+                    "SecretKey": secrets.token_urlsafe(30),
+                    "SessionToken": session_token,
+                },
+            },
+        )
+
+    def get_things(self, saas_token: str | None) -> SimResponse:
+        if not self.is_valid_token(saas_token):
+            return SimResponse(401, {"code": 401, "message": "token expired"})
+        with self.lock:
+            things = [dict(device.tcl_thing) for device in self.devices.values()]
+        return SimResponse(200, {"code": 0, "message": "success", "data": things})
+
+    def _daily_series(self, device_id: str, query: str, value_key: str, scale: float) -> list[dict]:
+        week = parse_qs(query).get("week", [""])[0]
+        first, _, last = week.partition("-")
+        try:
+            start = datetime.datetime.strptime(first, "%Y%m%d").date()
+            end = datetime.datetime.strptime(last or first, "%Y%m%d").date()
+        except ValueError:
+            start = end = datetime.date.today()
+        rng = random.Random(f"{device_id}{value_key}{start}")
+        days = []
+        day = start
+        while day <= end:
+            days.append({"date": day.isoformat(), value_key: round(rng.random() * scale, 3)})
+            day += datetime.timedelta(days=1)
+        return days
+
+    def work_time(self, saas_token: str | None, device_id: str, query: str) -> SimResponse:
+        if not self.is_valid_token(saas_token):
+            return SimResponse(401, {"code": 401, "message": "token expired"})
+        if device_id not in self.devices:
+            return SimResponse(200, {"code": 10003, "message": "device not found", "data": {}})
+        details = [
+            {**day, "aiWorkTime": 0}
+            for day in self._daily_series(device_id, query, "workTime", 1440)
+        ]
+        total = round(sum(day["workTime"] for day in details), 3)
+        return SimResponse(
+            200,
+            {
+                "code": 0,
+                "message": "SUCCESS",
+                "data": {
+                    "deviceId": device_id,
+                    "date": "",
+                    "currentTotalWorkTime": {"date": "", "workTime": total, "aiWorkTime": 0},
+                    "beforeTotalWorkTime": {},
+                    "workTimeDetails": details,
+                    "timeZone": "UTC",
+                    "timeOffset": "UTC+00:00",
+                },
+            },
+        )
+
+    def energy(self, saas_token: str | None, device_id: str, query: str) -> SimResponse:
+        if not self.is_valid_token(saas_token):
+            return SimResponse(401, {"code": 401, "message": "token expired"})
+        if device_id not in self.devices:
+            return SimResponse(200, {"code": 10003, "message": "device not found", "data": {}})
+        details = [
+            {**day, "aiConsumption": 0}
+            for day in self._daily_series(device_id, query, "consumption", 12)
+        ]
+        total = round(sum(day["consumption"] for day in details), 3)
+        return SimResponse(
+            200,
+            {
+                "code": 0,
+                "message": "SUCCESS",
+                "data": {
+                    "deviceId": device_id,
+                    "date": parse_qs(query).get("week", [""])[0],
+                    "currStatisticsRes": {
+                        "offlineElectricity": 0,
+                        "totalElectricity": total,
+                        "onlineElectricity": total,
+                        "aiElectricity": 0,
+                    },
+                    "beforeStatisticsRes": {},
+                    "consumptionDetails": details,
+                    "timeZone": "UTC",
+                    "timeOffset": "UTC+00:00",
+                },
+            },
+        )
+
+    def config_get(self, saas_token: str | None, body: dict) -> SimResponse:
+        if not self.is_valid_token(saas_token):
+            return SimResponse(401, {"code": 401, "message": "token expired"})
+        product_key = body.get("productKey")
+        with self.lock:
+            entries = [
+                {
+                    "deviceId": device.device_id,
+                    "productKey": device.tcl_thing["productKey"],
+                    "TSLVersion": "",
+                    "minSdkVersion": "5.4.2",
+                }
+                for device in self.devices.values()
+                if product_key is None or device.tcl_thing["productKey"] == product_key
+            ]
+        return SimResponse(200, {"code": 0, "message": "success", "data": entries})
+
+    # IoT data plane
+
+    def _iot_denied(self, session_token: str | None) -> SimResponse | None:
+        if self.is_valid_token(session_token):
+            return None
+        return SimResponse(
+            403,
+            {"message": "The security token included in the request is expired"},
+            {"x-amzn-ErrorType": "ExpiredTokenException"},
+        )
+
+    def get_shadow(self, session_token: str | None, device_id: str) -> SimResponse:
+        denied = self._iot_denied(session_token)
+        if denied is not None:
+            return denied
+        now = time.time()
+        with self.lock:
+            device = self.devices.get(device_id)
+            if device is None:
+                return SimResponse(
+                    404,
+                    {"message": f"No shadow exists with name: '{device_id}'"},
+                    {"x-amzn-ErrorType": "ResourceNotFoundException"},
+                )
+            device.settle(now, self.rng, self.config.drift_rate)
+            document = device.document(now)
+        return SimResponse(200, document)
+
+    def publish(self, session_token: str | None, topic: str, payload: bytes) -> SimResponse:
+        denied = self._iot_denied(session_token)
+        if denied is not None:
+            return denied
+        match = SHADOW_UPDATE_TOPIC.match(topic)
+        if match is None:
+            self.stats["publish.other_topic"] += 1
+            return SimResponse(200, {})
+        try:
+            message = json.loads(payload or b"{}")
+        except ValueError:
+            return SimResponse(
+                400, {"message": "Payload is not valid JSON"},
+                {"x-amzn-ErrorType": "InvalidRequestException"},
+            )
+        desired = (message.get("state") or {}).get("desired") or {}
+        now = time.time()
+        with self.lock:
+            device = self.devices.get(match["device_id"])
+            if device is not None:
+                device.settle(now, self.rng, 0)
+                device.update_desired(desired, now, self.config.report_delay_seconds)
+        return SimResponse(200, {})
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return {
+                "devices": len(self.devices),
+                "online": sum(1 for device in self.devices.values() if device.is_online),
+                "tokens": len(self.tokens),
+                "requests": dict(sorted(self.stats.items())),
+                "faults": {name: asdict(rule) for name, rule in self.config.faults.items()},
+            }
+
+
+class SimulatorRequestHandler(BaseHTTPRequestHandler):
+    server_version = "TclCloudSimulator/1.0"
+    protocol_version = "HTTP/1.1"
+    cloud: SimulatedCloud
+
+    def log_message(self, format, *args):  # noqa: A002
+        _LOGGER.debug("%s - %s", self.address_string(), format % args)
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _send(self, response: SimResponse) -> None:
+        body = json.dumps(response.body).encode("utf-8")
+        self.send_response(response.status)
+        content_type = "application/json"
+        if self.headers.get("X-Amz-Target"):
+            content_type = "application/x-amz-json-1.1"
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in response.headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _route(self, method: str) -> tuple[str, callable] | None:
+        cloud = self.cloud
+        url = urlsplit(self.path)
+        path = url.path
+        saas_token = self.headers.get("accesstoken")
+        session_token = self.headers.get("X-Amz-Security-Token")
+
+        def json_body() -> dict:
+            try:
+                return json.loads(self._read_body() or b"{}")
+            except ValueError:
+                return {}
+
+        if method == "POST":
+            if path == "/account/login":
+                return "login", lambda: cloud.login(json_body())
+            if path == "/v3/global/cloud_url_get":
+                return "cloud_urls", lambda: cloud.cloud_urls(json_body())
+            if path == "/v3/auth/refresh_tokens":
+                return "refresh_tokens", lambda: cloud.refresh_tokens(json_body())
+            if path == "/" and "GetCredentialsForIdentity" in self.headers.get("X-Amz-Target", ""):
+                return "aws_credentials", lambda: cloud.aws_credentials(json_body())
+            if path == "/v3/user/get_things":
+                return "get_things", lambda: cloud.get_things(saas_token)
+            if path == "/v3/config/get":
+                return "config_get", lambda: cloud.config_get(saas_token, json_body())
+            if path.startswith("/topics/"):
+                topic = unquote(path[len("/topics/") :])
+                return "publish", lambda: cloud.publish(session_token, topic, self._read_body())
+        if method == "GET":
+            match = re.match(r"^/things/(?P<device_id>[^/]+)/shadow$", path)
+            if match:
+                device_id = unquote(match["device_id"])
+                return "get_shadow", lambda: cloud.get_shadow(session_token, device_id)
+            match = re.match(r"^/v3/ac/(?P<device_id>[^/]+)/work-time/info", path)
+            if match:
+                device_id = match["device_id"]
+                return "work_time", lambda: cloud.work_time(saas_token, device_id, url.query)
+            match = re.match(r"^/v3/ac/(?P<device_id>[^/]+)/power/consumption/info", path)
+            if match:
+                device_id = match["device_id"]
+                return "energy", lambda: cloud.energy(saas_token, device_id, url.query)
+        return None
+
+    def _handle_control(self, method: str) -> bool:
+        path = urlsplit(self.path).path
+        if not path.startswith("/_sim/"):
+            return False
+        cloud = self.cloud
+        if method == "GET" and path == "/_sim/stats":
+            self._send(SimResponse(200, cloud.snapshot()))
+        elif method == "POST" and path == "/_sim/expire_tokens":
+            self._read_body()
+            self._send(SimResponse(200, {"expired": cloud.expire_tokens()}))
+        elif method == "POST" and path == "/_sim/faults":
+            try:
+                rules = json.loads(self._read_body() or b"{}")
+                faults = {
+                    name: FaultRule(**rule) for name, rule in rules.items() if name in ENDPOINTS
+                }
+            except (TypeError, ValueError, AttributeError) as e:
+                self._send(SimResponse(400, {"message": f"invalid fault rules: {e}"}))
+                return True
+            cloud.config.faults = faults
+            self._send(SimResponse(200, cloud.snapshot()))
+        else:
+            self._send(SimResponse(404, {"message": "unknown control endpoint"}))
+        return True
+
+    def _dispatch(self, method: str) -> None:
+        if self._handle_control(method):
+            return
+        route = self._route(method)
+        if route is None:
+            self._read_body()
+            self.cloud.stats["unknown"] += 1
+            self._send(SimResponse(404, {"code": 404, "message": f"no route {method} {self.path}"}))
+            return
+        endpoint, call = route
+        failure = self.cloud.inject(endpoint)
+        if failure is not None:
+            self._read_body()
+            response = failure
+        else:
+            response = call()
+        with self.cloud.lock:
+            self.cloud.stats[f"{endpoint}.{response.status}"] += 1
+        self._send(response)
+
+    def do_GET(self) -> None:  # noqa: N802
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:  # noqa: N802
+        self._dispatch("POST")
+
+
+class SimulatorServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # hundreds of devices are polled concurrently
+    request_queue_size = 1024
+
+
+def start_simulator(
+    config: SimulatorConfig, templates: list[DeviceTemplate] | None = None
+) -> tuple[SimulatorServer, SimulatedCloud]:
+    """Start serving on a background thread (port 0 picks a free port)."""
+    server = SimulatorServer((config.host, config.port), SimulatorRequestHandler)
+    config.port = server.server_address[1]
+    cloud = SimulatedCloud(config, templates or load_note_templates())
+    server.RequestHandlerClass = type(
+        "BoundSimulatorRequestHandler", (SimulatorRequestHandler,), {"cloud": cloud}
+    )
+    threading.Thread(target=server.serve_forever, name="cloud-simulator", daemon=True).start()
+    return server, cloud
+
+
+def redirect_cognito(tcl_module, base_url: str):
+    """Patch the integration's tcl module so GetCredentialsForIdentity reaches the simulator.
+
+    Returns the patcher: use it as a context manager or start() it.
+    """
+    send_request = tcl_module._send_request
+
+    async def _send_request(hass, operation, method, url, headers, payload=None):
+        if url.startswith(COGNITO_URL_PREFIX):
+            url = f"{base_url}/"
+        return await send_request(hass, operation, method, url, headers, payload)
+
+    return patch.object(tcl_module, "_send_request", _send_request)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--devices", type=int, default=10)
+    parser.add_argument("--notes", type=pathlib.Path, default=NOTES_DIR)
+    parser.add_argument("--diagnostics", type=pathlib.Path, help="diagnostics download to clone devices from")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--token-ttl", type=int, default=3600, help="seconds")
+    parser.add_argument("--credentials-ttl", type=int, default=3600, help="seconds")
+    parser.add_argument("--report-delay", type=float, default=1.0, help="seconds")
+    parser.add_argument("--drift-rate", type=float, default=0.1)
+    parser.add_argument("--offline-rate", type=float, default=0.0)
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--throttle-rate", type=float, default=0)
+    parser.add_argument(
+        "--fault",
+        action="append",
+        default=[],
+        metavar="ENDPOINT:KEY=VALUE,...",
+        help=f"per endpoint override, endpoints: {', '.join(ENDPOINTS)}",
+    )
+    args = parser.parse_args()
+
+    default_fault = FaultRule(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error=args.error_rate,
+        throttle=args.throttle_rate,
+    )
+    try:
+        faults = dict(parse_fault_rule(text, default_fault) for text in args.fault)
+    except ValueError as e:
+        parser.error(str(e))
+    config = SimulatorConfig(
+        host=args.host,
+        port=args.port,
+        devices=args.devices,
+        seed=args.seed,
+        token_ttl_seconds=args.token_ttl,
+        credentials_ttl_seconds=args.credentials_ttl,
+        report_delay_seconds=args.report_delay,
+        drift_rate=args.drift_rate,
+        offline_rate=args.offline_rate,
+        default_fault=default_fault,
+        faults=faults,
+    )
+    if args.diagnostics:
+        templates = load_diagnostics_templates(args.diagnostics)
+    else:
+        templates = load_note_templates(args.notes)
+    server, cloud = start_simulator(config, templates)
+
+    base = cloud.base_url
+    _LOGGER.info("TCL cloud simulator: %d devices from %d templates on %s", config.devices, len(templates), base)
+    _LOGGER.info("  app_login_url = %s/account/login?clientId=54148614", base)
+    _LOGGER.info("  cloud_urls    = %s/v3/global/cloud_url_get", base)
+    _LOGGER.info("  redirect_cognito(tcl, %r)", base)
+    _LOGGER.info("  export AWS_ENDPOINT_URL_IOT_DATA_PLANE=%s", base)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,334 @@
+#!/usr/bin/python3
+"""Summarize and replay traffic captured with the "capture_traffic" option.
+
+Captures are the capture-*.jsonl.gz files written to
+<config>/tcl_home_unofficial_captures/ (see traffic_capture.py).
+
+summary  per operation counts, errors and latency (p50 / p95 / max), and
+         the slowest requests with their offset into the capture.
+serve    the cloud simulator (tools/cloud_simulator.py) with the data
+         endpoints answered from the capture: get_things, shadow reads,
+         work-time, power consumption and config/get return the recorded
+         responses, per device in recorded order, after the recorded
+         latency divided by --speed. Login, token refresh and AWS
+         credentials are issued fresh by the simulator, since the
+         capture has them redacted. Publishes are accepted and counted.
+         Point Home Assistant (and so AwsIot) at it as for the simulator
+         to reproduce a latency spike, or to benchmark a change against
+         real traffic.
+
+usage:
+  python3 tools/replay_capture.py summary ~/.homeassistant/tcl_home_unofficial_captures
+  python3 tools/replay_capture.py summary capture-20261019-101500-001.jsonl.gz --spikes 20
+  python3 tools/replay_capture.py serve ~/.homeassistant/tcl_home_unofficial_captures --speed 10
+  python3 tools/replay_capture.py serve capture.jsonl.gz --speed 0 --loop
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections import defaultdict, deque
+import gzip
+import importlib.util
+import json
+import logging
+import pathlib
+import re
+import sys
+import time
+import zlib
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+_LOGGER = logging.getLogger("replay_capture")
+
+SIMULATOR_PATH = pathlib.Path(__file__).resolve().parent / "cloud_simulator.py"
+
+# capture operation (MetricOperationEnum value) -> simulator endpoint
+REPLAYED_OPERATIONS = {
+    "get_things": "get_things",
+    "get_thing_shadow": "get_shadow",
+    "work_time": "work_time",
+    "energy_consumption": "energy",
+    "config_get": "config_get",
+}
+SHADOW_URL = re.compile(r"things/(?P<device_id>[^/]+)/shadow")
+AC_URL = re.compile(r"/v3/ac/(?P<device_id>[^/]+)/")
+AWS_ERROR_CODE = re.compile(r"\((?P<code>\w+)\)")
+
+
+def load_simulator():
+    # loaded by path: tools/ is not a package
+    spec = importlib.util.spec_from_file_location("cloud_simulator", SIMULATOR_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["cloud_simulator"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def capture_files(paths: list[pathlib.Path]) -> list[pathlib.Path]:
+    files = []
+    for path in paths:
+        if path.is_dir():
+            files.extend(sorted(path.glob("capture-*.jsonl.gz")))
+        else:
+            files.append(path)
+    return files
+
+
+def read_capture_file(path: pathlib.Path) -> list[dict]:
+    """Exchange records of one file; a file still being written is read up to its last full line."""
+    records = []
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if record.get("type") == "exchange":
+                    records.append(record)
+    except (EOFError, gzip.BadGzipFile, zlib.error) as e:
+        _LOGGER.warning("%s: truncated capture (%s), read %d records", path.name, e, len(records))
+    return records
+
+
+def load_capture(paths: list[pathlib.Path]) -> list[dict]:
+    records = []
+    for path in capture_files(paths):
+        records.extend(read_capture_file(path))
+    # files of one session continue each other; offsets restart per session
+    records.sort(key=lambda record: record.get("ts", 0))
+    return records
+
+
+def percentile(sorted_values: list[float], pct: float) -> float | None:
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def replay_key(record: dict) -> str:
+    """The device (or product) a recorded response belongs to."""
+    operation = record.get("operation")
+    url = record.get("url") or ""
+    if operation == "get_thing_shadow":
+        match = SHADOW_URL.search(url)
+        return match["device_id"] if match else ""
+    if operation in ("work_time", "energy_consumption"):
+        match = AC_URL.search(url)
+        return match["device_id"] if match else ""
+    if operation == "config_get":
+        payload = (record.get("request") or {}).get("payload") or {}
+        return payload.get("productKey") or ""
+    return ""
+
+
+def summarize(records: list[dict], spikes: int) -> dict:
+    by_operation: dict[str, list[dict]] = defaultdict(list)
+    for record in records:
+        by_operation[record.get("operation", "?")].append(record)
+
+    operations = {}
+    for operation, items in sorted(by_operation.items()):
+        elapsed = sorted(record.get("elapsed_ms") or 0 for record in items)
+        operations[operation] = {
+            "count": len(items),
+            "errors": sum(1 for record in items if record.get("error")),
+            "p50_ms": percentile(elapsed, 50),
+            "p95_ms": percentile(elapsed, 95),
+            "max_ms": elapsed[-1] if elapsed else None,
+        }
+
+    slowest = sorted(records, key=lambda record: record.get("elapsed_ms") or 0, reverse=True)
+    duration = records[-1]["ts"] - records[0]["ts"] if records else 0
+    return {
+        "records": len(records),
+        "duration_s": round(duration, 1),
+        "operations": operations,
+        "slowest": [
+            {
+                "operation": record.get("operation"),
+                "url": record.get("url"),
+                "elapsed_ms": record.get("elapsed_ms"),
+                "offset_s": record.get("offset"),
+                "status": record.get("status"),
+                "error": record.get("error"),
+            }
+            for record in slowest[:spikes]
+        ],
+    }
+
+
+def print_summary(summary: dict) -> None:
+    print(f"{summary['records']} exchanges over {summary['duration_s']} s")
+    print(f"{'operation':<20} {'count':>7} {'errors':>7} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}")
+    for operation, row in summary["operations"].items():
+        print(
+            f"{operation:<20} {row['count']:>7} {row['errors']:>7} "
+            f"{row['p50_ms'] or 0:>9.1f} {row['p95_ms'] or 0:>9.1f} {row['max_ms'] or 0:>9.1f}"
+        )
+    if summary["slowest"]:
+        print("\nslowest:")
+        for row in summary["slowest"]:
+            outcome = row["error"] or row["status"]
+            print(f"  {row['elapsed_ms']:>9.1f} ms  +{row['offset_s']} s  {row['operation']}  {row['url']}  {outcome}")
+
+
+def make_replay_cloud(simulator):
+    class ReplayCloud(simulator.SimulatedCloud):
+        """SimulatedCloud whose data endpoints answer from a capture."""
+
+        def __init__(self, config, records: list[dict], speed: float, loop: bool) -> None:
+            config.devices = 0
+            super().__init__(config, [simulator.DeviceTemplate("replay", {}, {})])
+            self.speed = speed
+            self.loop = loop
+            self.recorded: dict[tuple[str, str], list[dict]] = defaultdict(list)
+            for record in records:
+                endpoint = REPLAYED_OPERATIONS.get(record.get("operation"))
+                if endpoint is not None:
+                    self.recorded[(endpoint, replay_key(record))].append(record)
+            self.queues = {key: deque(items) for key, items in self.recorded.items()}
+
+        def next_record(self, endpoint: str, key: str) -> dict | None:
+            with self.lock:
+                queue = self.queues.get((endpoint, key))
+                if queue is None:
+                    return None
+                if len(queue) > 1:
+                    return queue.popleft()
+                if self.loop:
+                    self.queues[(endpoint, key)] = deque(self.recorded[(endpoint, key)])
+                # the last response keeps being served
+                return queue[0]
+
+        def replay(self, endpoint: str, key: str):
+            record = self.next_record(endpoint, key)
+            if record is None:
+                self.stats[f"{endpoint}.not_captured"] += 1
+                return simulator.SimResponse(
+                    404,
+                    {"code": 404, "message": f"nothing captured for {endpoint} {key}"},
+                    {"x-amzn-ErrorType": "ResourceNotFoundException"},
+                )
+            if self.speed > 0:
+                time.sleep((record.get("elapsed_ms") or 0) / 1000 / self.speed)
+            error = record.get("error")
+            if error is None:
+                return simulator.SimResponse(record.get("status") or 200, record.get("response") or {})
+            headers = {}
+            match = AWS_ERROR_CODE.search(error)
+            if match:
+                headers["x-amzn-ErrorType"] = match["code"]
+            return simulator.SimResponse(record.get("status") or 502, {"message": error}, headers)
+
+        def get_things(self, saas_token):
+            if not self.is_valid_token(saas_token):
+                return simulator.SimResponse(401, {"code": 401, "message": "token expired"})
+            return self.replay("get_things", "")
+
+        def work_time(self, saas_token, device_id, query):
+            if not self.is_valid_token(saas_token):
+                return simulator.SimResponse(401, {"code": 401, "message": "token expired"})
+            return self.replay("work_time", device_id)
+
+        def energy(self, saas_token, device_id, query):
+            if not self.is_valid_token(saas_token):
+                return simulator.SimResponse(401, {"code": 401, "message": "token expired"})
+            return self.replay("energy", device_id)
+
+        def config_get(self, saas_token, body):
+            if not self.is_valid_token(saas_token):
+                return simulator.SimResponse(401, {"code": 401, "message": "token expired"})
+            return self.replay("config_get", body.get("productKey") or "")
+
+        def get_shadow(self, session_token, device_id):
+            denied = self._iot_denied(session_token)
+            if denied is not None:
+                return denied
+            return self.replay("get_shadow", device_id)
+
+        def publish(self, session_token, topic, payload):
+            denied = self._iot_denied(session_token)
+            if denied is not None:
+                return denied
+            return simulator.SimResponse(200, {})
+
+        def snapshot(self) -> dict:
+            snapshot = super().snapshot()
+            with self.lock:
+                snapshot["remaining"] = {
+                    f"{endpoint} {key}".strip(): len(queue)
+                    for (endpoint, key), queue in sorted(self.queues.items())
+                }
+            return snapshot
+
+    return ReplayCloud
+
+
+def serve(args) -> int:
+    records = load_capture(args.paths)
+    if not records:
+        _LOGGER.error("no exchanges found in %s", ", ".join(map(str, args.paths)))
+        return 1
+    simulator = load_simulator()
+    config = simulator.SimulatorConfig(host=args.host, port=args.port)
+    server = simulator.SimulatorServer((config.host, config.port), simulator.SimulatorRequestHandler)
+    config.port = server.server_address[1]
+    cloud = make_replay_cloud(simulator)(config, records, args.speed, args.loop)
+    server.RequestHandlerClass = type(
+        "BoundReplayRequestHandler", (simulator.SimulatorRequestHandler,), {"cloud": cloud}
+    )
+
+    base = cloud.base_url
+    _LOGGER.info(
+        "Replaying %d exchanges (%d devices/keys) at %s on %s",
+        len(records),
+        len(cloud.recorded),
+        f"{args.speed}x" if args.speed > 0 else "no delay",
+        base,
+    )
+    _LOGGER.info("  app_login_url = %s/account/login?clientId=54148614", base)
+    _LOGGER.info("  cloud_urls    = %s/v3/global/cloud_url_get", base)
+    _LOGGER.info("  redirect_cognito(tcl, %r)", base)
+    _LOGGER.info("  export AWS_ENDPOINT_URL_IOT_DATA_PLANE=%s", base)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    summary_parser = commands.add_parser("summary", help="latency per operation and the slowest requests")
+    summary_parser.add_argument("paths", type=pathlib.Path, nargs="+", help="capture files or directories")
+    summary_parser.add_argument("--spikes", type=int, default=10, help="slowest requests to list")
+    summary_parser.add_argument("--json", action="store_true", help="print JSON only")
+
+    serve_parser = commands.add_parser("serve", help="serve the capture through the cloud simulator")
+    serve_parser.add_argument("paths", type=pathlib.Path, nargs="+", help="capture files or directories")
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8765)
+    serve_parser.add_argument("--speed", type=float, default=1.0, help="latency divisor, 0 serves without delay")
+    serve_parser.add_argument("--loop", action="store_true", help="start over when a device runs out of responses")
+
+    args = parser.parse_args()
+    if args.command == "serve":
+        return serve(args)
+
+    summary = summarize(load_capture(args.paths), args.spikes)
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print_summary(summary)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())